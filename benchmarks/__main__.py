@@ -0,0 +1,36 @@
+"""
+Benchmark runner, boots Django before loading the benchmark module.
+
+    python -m benchmarks <name> [options]
+
+where ``<name>`` is the suffix of a ``bench_<name>.py`` module of this package.
+"""
+
+import importlib
+import os
+import sys
+from pathlib import Path
+
+import django
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+
+def main() -> None:
+    if len(sys.argv) < 2:
+        names = sorted(
+            p.stem[len("bench_") :] for p in Path(__file__).parent.glob("bench_*.py")
+        )
+        sys.exit(f"usage: python -m benchmarks <{'|'.join(names)}> [options]")
+
+    sys.path.insert(0, str(ROOT_DIR / "src"))
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "exalt_hexarch.settings")
+    django.setup()
+
+    name = sys.argv.pop(1)
+    sys.argv[0] = f"benchmarks {name}"
+    importlib.import_module(f"benchmarks.bench_{name}").main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+End-of-day balance snapshots: the nightly pass, and the historical
+balances it serves.
+
+    python -m benchmarks balance_snapshots --accounts 1000 --transactions 100
+
+Each account gets ``--transactions`` postings over the last 30 days, none
+of them with a running balance. "snapshot pass" takes the snapshot of
+every account for one day, first replayed back from the live balances,
+then following from the day before. "balance at" is a balance 20 days back
+through the API service: "replay" reads every posting since from the live
+balance, "snapshot" the last snapshot before it and the postings of part
+of a day.
+"""
+
+import argparse
+import datetime as dt
+import time
+from decimal import Decimal
+from typing import Any
+
+from bank_app.application.adapter.persistence.entity.bank_account_entity import (
+    BankAccountEntity,
+)
+from bank_app.application.adapter.persistence.repository.balance_snapshot_repository import (  # noqa: E501
+    BalanceSnapshotRepository,
+)
+from bank_app.application.service.account_statement import AccountStatementService
+from benchmarks.bench_statement_reuse import statement_service
+from benchmarks.common import benchmark_database, measure, report, seed, summarize
+
+
+def snapshot_pass(day: dt.date, accounts: int) -> list[Any]:
+    start = time.perf_counter()
+    written = BalanceSnapshotRepository.take_snapshots(day)
+    elapsed = time.perf_counter() - start
+    if written != accounts:
+        raise SystemExit(f"{written} snapshots written for {accounts} accounts")
+    return [elapsed * 1000, accounts / elapsed]
+
+
+def balance_at(
+    service: AccountStatementService,
+    entity: BankAccountEntity,
+    timestamp: dt.datetime,
+    repeat: int,
+) -> dict[str, float]:
+    return summarize(
+        measure(
+            lambda: service.get_balance_at(entity.entity_id, timestamp),
+            repeat=repeat,
+        )
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--accounts", type=int, default=1000)
+    parser.add_argument(
+        "--transactions", type=int, default=100, help="postings per account"
+    )
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    with benchmark_database():
+        now = dt.datetime.now(dt.timezone.utc)
+        entities = [
+            BankAccountEntity.objects.create(
+                balance=Decimal("0.00"), overdraft_amount=Decimal("100.00")
+            )
+            for _ in range(args.accounts)
+        ]
+        for entity in entities:
+            seed(entity.entity_id, args.transactions, now, days=30)
+
+        timestamp = now - dt.timedelta(days=20)
+        day = timestamp.date() - dt.timedelta(days=1)
+        passes = [
+            [
+                "replayed",
+                *snapshot_pass(day - dt.timedelta(days=1), args.accounts),
+            ],
+            ["from the day before", *snapshot_pass(day, args.accounts)],
+        ]
+
+        entity = entities[0]
+        replay = balance_at(statement_service(), entity, timestamp, args.repeat)
+        snapshot_service = statement_service(
+            balance_snapshot_repository=BalanceSnapshotRepository()
+        )
+        snapshot = balance_at(snapshot_service, entity, timestamp, args.repeat)
+        if (
+            snapshot_service.get_balance_at(entity.entity_id, timestamp).balance
+            != statement_service().get_balance_at(entity.entity_id, timestamp).balance
+        ):
+            raise SystemExit("both paths disagree")
+
+    report(
+        f"Snapshot pass over {args.accounts} accounts",
+        ["closing balances", "ms", "accounts/s"],
+        passes,
+    )
+    report(
+        f"Balance 20 days back, {args.transactions} postings over 30 days",
+        ["path", "p50 ms", "p99 ms"],
+        [
+            ["replay", replay["median_us"] / 1000, replay["p99_us"] / 1000],
+            ["snapshot", snapshot["median_us"] / 1000, snapshot["p99_us"] / 1000],
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
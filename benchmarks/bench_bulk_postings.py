@@ -0,0 +1,106 @@
+"""
+Postings per second through the per-call deposit endpoint against the bulk
+endpoint, JSON array and NDJSON.
+
+    python -m benchmarks bulk_postings --accounts 100 --lines 1000 5000
+
+A bulk request pays the DRF, injection and transaction overhead once, locks
+its accounts with one IN query per account type and writes them back with
+one bulk UPDATE, plus a bulk INSERT of the ledger rows.
+"""
+
+import argparse
+import json
+import random
+import time
+from decimal import Decimal
+
+from django.test.utils import setup_test_environment
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from bank_app.application.adapter.persistence.entity.bank_account_entity import (
+    BankAccountEntity,
+)
+from bank_app.application.adapter.persistence.entity.booklet_account_entity import (
+    BookletAccountEntity,
+)
+from benchmarks.common import benchmark_database, report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--accounts", type=int, default=100, help="per type")
+    parser.add_argument("--lines", type=int, nargs="+", default=[1_000, 5_000])
+    parser.add_argument("--single", type=int, default=500, help="per-call postings")
+    args = parser.parse_args()
+
+    setup_test_environment()
+    client = APIClient()
+    bulk_url = reverse("postings-bulk")
+    rows = []
+    with benchmark_database():
+        accounts = BankAccountEntity.objects.bulk_create(
+            BankAccountEntity(
+                balance=Decimal("1000.00"), overdraft_amount=Decimal("100.00")
+            )
+            for _ in range(args.accounts)
+        )
+        booklets = BookletAccountEntity.objects.bulk_create(
+            BookletAccountEntity(
+                balance=Decimal("0.00"), deposit_limit=Decimal("100000000.00")
+            )
+            for _ in range(args.accounts)
+        )
+
+        deposit_url = reverse("bank-account-deposit")
+        start = time.perf_counter()
+        for _ in range(args.single):
+            account = random.choice(accounts)
+            client.post(
+                deposit_url,
+                {"account_number": str(account.account_number), "amount": "1.00"},
+                format="json",
+            )
+        single_rate = args.single / (time.perf_counter() - start)
+        rows.append(["per-call deposit", 1, single_rate, 1.0])
+
+        for lines in args.lines:
+            postings = []
+            for _ in range(lines):
+                if random.random() < 0.5:
+                    number = random.choice(accounts).account_number
+                    account_type = "CURRENT_ACCOUNT"
+                else:
+                    number = random.choice(booklets).account_number
+                    account_type = "BOOKLET_ACCOUNT"
+                postings.append(
+                    {
+                        "account_number": str(number),
+                        "account_type": account_type,
+                        "transaction_type": "DEPOSIT",
+                        "amount": "1.00",
+                    }
+                )
+            ndjson = "\n".join(json.dumps(posting) for posting in postings)
+            for label, body, content_type in (
+                ("bulk, JSON array", json.dumps(postings), "application/json"),
+                ("bulk, NDJSON", ndjson, "application/x-ndjson"),
+            ):
+                start = time.perf_counter()
+                response = client.post(bulk_url, body, content_type=content_type)
+                elapsed = time.perf_counter() - start
+                if response.status_code != 200:
+                    raise SystemExit(f"{label}: {response.status_code}")
+                rate = lines / elapsed
+                rows.append([label, lines, rate, rate / single_rate])
+
+    report(
+        f"Deposits over {args.accounts} accounts of each type",
+        ["endpoint", "lines/request", "postings/s", "speed-up"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
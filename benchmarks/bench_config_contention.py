@@ -0,0 +1,161 @@
+"""
+Overdraft updates racing deposits on the same hot account.
+
+    python -m benchmarks config_contention --updaters 4 --depositors 4
+
+Updates are read-modify-write with a compare-and-swap save, run in a unit
+of work like the API does: one that lost the race against a deposit retries
+on fresh state (jittered backoff, shared retry budget) instead of writing
+back the balance it read. The run fails if
+a deposit was lost.
+"""
+
+import argparse
+import random
+import threading
+import time
+from collections import Counter
+from decimal import Decimal
+from uuid import UUID
+
+from django.db import OperationalError, connection
+
+from bank_app.application.adapter.persistence.entity.bank_account_entity import (
+    BankAccountEntity,
+)
+from bank_app.application.domain.exceptions import ConcurrentUpdateException
+from bank_app.application.service.bank_acount_overdraft import (
+    BankAccountOverdraftService,
+)
+from bank_app.application.util.retry import retry_on_conflict
+from benchmarks.common import benchmark_database, report, summarize
+from exalt_hexarch.containers import Container
+
+
+@retry_on_conflict()
+def set_overdraft_amount(
+    service: BankAccountOverdraftService, account_number: UUID, amount: Decimal
+) -> None:
+    # what in_unit_of_work does around the view
+    with Container.unit_of_work():
+        service.set_overdraft_amount(account_number, amount)
+
+
+def run_updater(
+    account_number: UUID,
+    operations: int,
+    durations: list[float],
+    outcomes: Counter[str],
+) -> None:
+    service = Container().bank_account_overdraft_service()
+    try:
+        for _ in range(operations):
+            start = time.perf_counter()
+            try:
+                set_overdraft_amount(
+                    service, account_number, Decimal(random.randint(100, 900))
+                )
+                outcomes["updated"] += 1
+            except ConcurrentUpdateException:
+                outcomes["conflict"] += 1
+            except OperationalError:
+                outcomes["database error"] += 1
+            durations.append(time.perf_counter() - start)
+    finally:
+        connection.close()
+
+
+def run_depositor(
+    account_number: UUID, operations: int, outcomes: Counter[str]
+) -> None:
+    service = Container().bank_account_service()
+    try:
+        for _ in range(operations):
+            try:
+                service.deposit_money(account_number, Decimal("1.00"))
+                outcomes["deposited"] += 1
+            except OperationalError:
+                outcomes["database error"] += 1
+    finally:
+        connection.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--updaters", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--depositors", type=int, default=4)
+    parser.add_argument("--operations", type=int, default=200, help="per thread")
+    args = parser.parse_args()
+
+    # sqlite takes its write lock up front instead of failing the upgrade
+    connection.settings_dict["OPTIONS"]["transaction_mode"] = "IMMEDIATE"
+    budget = set_overdraft_amount.retry_budget  # type: ignore[attr-defined]
+    rows = []
+    with benchmark_database(on_disk=True):
+        for updaters in args.updaters:
+            account = BankAccountEntity.objects.create(
+                balance=Decimal("0.00"), overdraft_amount=Decimal("100.00")
+            )
+            durations: list[float] = []
+            outcomes: Counter[str] = Counter()
+            retries, exhausted = budget.retries, budget.exhausted
+            workers = [
+                threading.Thread(
+                    target=run_updater,
+                    args=(account.account_number, args.operations, durations, outcomes),
+                )
+                for _ in range(updaters)
+            ] + [
+                threading.Thread(
+                    target=run_depositor,
+                    args=(account.account_number, args.operations, outcomes),
+                )
+                for _ in range(args.depositors)
+            ]
+            start = time.perf_counter()
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            elapsed = time.perf_counter() - start
+
+            account.refresh_from_db()
+            if account.balance != Decimal(outcomes["deposited"]):
+                raise SystemExit(
+                    f"lost deposits: balance {account.balance} after "
+                    f"{outcomes['deposited']} deposits of 1.00"
+                )
+            summary = summarize(durations)
+            rows.append(
+                [
+                    updaters,
+                    outcomes["updated"] / elapsed,
+                    outcomes["deposited"] / elapsed,
+                    summary["median_us"] / 1000,
+                    summary["p99_us"] / 1000,
+                    budget.retries - retries,
+                    outcomes["conflict"],
+                    budget.exhausted - exhausted,
+                    outcomes["database error"],
+                ]
+            )
+
+    report(
+        f"Overdraft updates against {args.depositors} depositors on one account",
+        [
+            "updaters",
+            "updates/s",
+            "deposits/s",
+            "p50 ms",
+            "p99 ms",
+            "retries",
+            "conflicts",
+            "budget out",
+            "db errors",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Bytes sent to the database per account save, writing every column against
+writing only the fields assigned since the account was loaded.
+
+    python -m benchmarks dirty_saves --saves 500
+
+Each save loads the account, applies one change and saves it: a deposit
+(the read-modify-write posting path), a new overdraft amount, or nothing.
+"full" forgets what changed so every column is written as before; "dirty"
+writes the changed columns plus the version, and skips a save with no
+change entirely. Bytes are the SQL text plus the rendered parameters of
+the statements issued by the save, not the load.
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from django.db import connection
+
+from bank_app.application.adapter.persistence.entity.bank_account_entity import (
+    BankAccountEntity,
+)
+from bank_app.application.adapter.persistence.repository.bank_account_repository import (  # noqa: E501
+    BankAccountRepository,
+)
+from bank_app.application.domain.model.bank_account import BankAccount
+from benchmarks.common import benchmark_database, report, summarize
+
+CHANGES: dict[str, Callable[[BankAccount, int], Any]] = {
+    "deposit": lambda account, index: account.deposit(Decimal("1.00")),
+    "overdraft": lambda account, index: account.set_overdraft_amount(
+        Decimal(100 + index % 500)
+    ),
+    "none": lambda account, index: None,
+}
+
+
+class WriteCounter:
+    def __init__(self) -> None:
+        self.statements = 0
+        self.bytes = 0
+
+    def __call__(
+        self,
+        execute: Callable[..., Any],
+        sql: str,
+        params: Any,
+        many: bool,
+        context: dict[str, Any],
+    ) -> Any:
+        self.statements += 1
+        self.bytes += len(sql.encode()) + sum(
+            len(str(param).encode()) for param in params or ()
+        )
+        return execute(sql, params, many, context)
+
+
+def run(
+    account_number: UUID,
+    change: Callable[[BankAccount, int], Any],
+    full: bool,
+    saves: int,
+) -> list[float]:
+    counter = WriteCounter()
+    durations = []
+    for index in range(saves):
+        account = BankAccountRepository.get_by_bank_account_number(account_number)
+        if full:
+            account._changed_fields = None
+        change(account, index)
+        start = time.perf_counter()
+        with connection.execute_wrapper(counter):
+            BankAccountRepository.save(account)
+        durations.append(time.perf_counter() - start)
+    summary = summarize(durations)
+    return [
+        counter.statements / saves,
+        counter.bytes / saves,
+        summary["median_us"],
+        summary["p99_us"],
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--saves", type=int, default=500)
+    args = parser.parse_args()
+
+    rows = []
+    with benchmark_database():
+        for name, change in CHANGES.items():
+            account = BankAccountEntity.objects.create(
+                balance=Decimal("0.00"), overdraft_amount=Decimal("100.00")
+            )
+            full = run(account.account_number, change, True, args.saves)
+            dirty = run(account.account_number, change, False, args.saves)
+            rows.append([name, "full", *full, ""])
+            saved = 1 - dirty[1] / full[1]
+            rows.append([name, "dirty", *dirty, f"{saved:.0%}"])
+
+    report(
+        f"Account saves ({args.saves} each)",
+        ["change", "write", "stmts/save", "bytes/save", "p50 us", "p99 us", "saved"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
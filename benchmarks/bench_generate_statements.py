@@ -0,0 +1,128 @@
+"""
+Month-end statements of every account: one use case call per account,
+which is what the script looping over the statement endpoint cost, then
+the generate_statements command in this process and on a pool.
+
+    python -m benchmarks generate_statements --accounts 5000 --workers 1 4
+
+The database is a sqlite file so that the workers can share it; sqlite
+takes one writer at a time, a server database lets the inserts overlap as
+well. Every run starts without statements.
+"""
+
+import argparse
+import datetime as dt
+import tempfile
+import time
+from decimal import Decimal
+from functools import partial
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+
+from bank_app.application.adapter.persistence.entity.account_statement_entity import (
+    MonthlyStatementEntity,
+    TransactionEntity,
+)
+from bank_app.application.adapter.persistence.entity.bank_account_entity import (
+    BankAccountEntity,
+)
+from bank_app.application.adapter.persistence.entity.booklet_account_entity import (
+    BookletAccountEntity,
+)
+from bank_app.application.util.util import AccountType
+from benchmarks.bench_statement_reuse import statement_service
+from benchmarks.common import benchmark_database, report
+
+
+def seed(accounts: int, transactions: int, period_end: dt.datetime) -> None:
+    bank_accounts = BankAccountEntity.objects.bulk_create(
+        BankAccountEntity(balance=Decimal("100.00"), overdraft_amount=Decimal("0.00"))
+        for _ in range(accounts - accounts // 4)
+    )
+    BookletAccountEntity.objects.bulk_create(
+        BookletAccountEntity(
+            balance=Decimal("100.00"), deposit_limit=Decimal("5000.00")
+        )
+        for _ in range(accounts // 4)
+    )
+    TransactionEntity.objects.bulk_create(
+        (
+            TransactionEntity(
+                account_id=account.entity_id,
+                transaction_type="DEPOSIT",
+                amount=Decimal("1.00"),
+            )
+            for account in bank_accounts
+            for _ in range(transactions)
+        ),
+        batch_size=5000,
+    )
+    # auto_now dated them now, which is after the period
+    TransactionEntity.objects.update(transaction_date=period_end - dt.timedelta(days=1))
+
+
+def per_request(period_end: dt.datetime) -> int:
+    service = statement_service()
+    count = 0
+    for model, account_type in (
+        (BankAccountEntity, AccountType.CURRENT_ACCOUNT),
+        (BookletAccountEntity, AccountType.BOOKLET_ACCOUNT),
+    ):
+        for account_id in model.objects.values_list("entity_id", flat=True):
+            service.generate_monthly_statement(account_id, account_type, period_end)
+            count += 1
+    return count
+
+
+def command(period_end: dt.datetime, workers: int, chunk_size: int) -> int:
+    with tempfile.TemporaryDirectory() as directory:
+        call_command(
+            "generate_statements",
+            f"--period-end={period_end.isoformat()}",
+            f"--workers={workers}",
+            f"--chunk-size={chunk_size}",
+            f"--checkpoint={Path(directory) / 'checkpoint.json'}",
+            stdout=StringIO(),
+        )
+    return MonthlyStatementEntity.objects.count()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--accounts", type=int, default=5000)
+    parser.add_argument("--transactions", type=int, default=20, help="per bank account")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--chunk-size", type=int, default=500)
+    args = parser.parse_args()
+
+    rows = []
+    with benchmark_database(on_disk=True):
+        period_end = dt.datetime.now(dt.timezone.utc)
+        seed(args.accounts, args.transactions, period_end)
+        runs = [("per request", partial(per_request, period_end))] + [
+            (
+                f"command, {workers} workers",
+                partial(command, period_end, workers, args.chunk_size),
+            )
+            for workers in args.workers
+        ]
+        for name, run in runs:
+            MonthlyStatementEntity.objects.all().delete()
+            start = time.perf_counter()
+            written = run()
+            elapsed = time.perf_counter() - start
+            if written != args.accounts:
+                raise SystemExit(f"{name} wrote {written} statements")
+            rows.append([name, elapsed, args.accounts / elapsed])
+
+    report(
+        f"Statements of {args.accounts} accounts",
+        ["path", "seconds", "accounts/s"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
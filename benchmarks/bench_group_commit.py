@@ -0,0 +1,103 @@
+"""
+Throughput against latency of concurrent deposits, committed one by one
+and through the group committer for several window sizes.
+
+    python -m benchmarks group_commit --threads 16 --windows 0 1 2 5
+
+A window of 0 disables group commit. Each thread deposits on its own
+account, so the cost compared is the commit, not lock waits on a row.
+"""
+
+import argparse
+import threading
+import time
+from decimal import Decimal
+from uuid import UUID
+
+from django.db import connection
+from django.test import override_settings
+
+from bank_app.application.adapter.persistence import group_commit
+from bank_app.application.adapter.persistence.entity.bank_account_entity import (
+    BankAccountEntity,
+)
+from benchmarks.common import benchmark_database, report, summarize
+from exalt_hexarch.containers import Container
+
+
+def run_worker(account_number: UUID, deposits: int, durations: list[float]) -> None:
+    service = Container().bank_account_service()
+    try:
+        for _ in range(deposits):
+            start = time.perf_counter()
+            service.deposit_money(account_number, Decimal("1.00"))
+            durations.append(time.perf_counter() - start)
+    finally:
+        connection.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--deposits", type=int, default=100, help="per thread")
+    parser.add_argument("--windows", type=float, nargs="+", default=[0, 1, 2, 5])
+    parser.add_argument("--max-batch", type=int, default=64)
+    args = parser.parse_args()
+
+    # sqlite takes its write lock up front instead of failing the upgrade
+    connection.settings_dict["OPTIONS"]["transaction_mode"] = "IMMEDIATE"
+    rows = []
+    with benchmark_database(on_disk=True):
+        for window in args.windows:
+            accounts = BankAccountEntity.objects.bulk_create(
+                BankAccountEntity(
+                    balance=Decimal("0.00"), overdraft_amount=Decimal("100.00")
+                )
+                for _ in range(args.threads)
+            )
+            options = {
+                "ENABLED": window > 0,
+                "WINDOW_MS": window,
+                "MAX_BATCH": args.max_batch,
+            }
+            durations: list[float] = []
+            with override_settings(GROUP_COMMIT=options):
+                workers = [
+                    threading.Thread(
+                        target=run_worker,
+                        args=(account.account_number, args.deposits, durations),
+                    )
+                    for account in accounts
+                ]
+                start = time.perf_counter()
+                for worker in workers:
+                    worker.start()
+                for worker in workers:
+                    worker.join()
+                elapsed = time.perf_counter() - start
+                committer = group_commit.get_group_committer()
+                avg_batch = committer.stats()["avg_batch"] if committer else 1.0
+                if committer:
+                    committer.stop()
+                    group_commit._committer = None
+
+            summary = summarize(durations)
+            rows.append(
+                [
+                    f"{window} ms" if window else "off",
+                    len(durations) / elapsed,
+                    summary["median_us"] / 1000,
+                    summary["p99_us"] / 1000,
+                    avg_batch,
+                ]
+            )
+
+    report(
+        f"Deposits from {args.threads} threads",
+        ["window", "deposits/s", "p50 ms", "p99 ms", "avg batch"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
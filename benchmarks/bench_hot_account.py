@@ -0,0 +1,104 @@
+"""
+Concurrent deposits on a single hot account, with the balance on one row
+and spread over several balance stripes.
+
+    python -m benchmarks hot_account --threads 8 --stripes 0 1 2 4 8
+
+With 0 stripes every deposit updates the bank_account row and waits for
+the previous one to commit. With N stripes deposits pick one of N rows, so
+on a database locking rows (PostgreSQL) throughput grows with N until
+something else saturates. sqlite locks the whole database on write, so
+here the numbers only show what striping costs, not what it buys. The run
+fails if the balance read back is not what was deposited.
+"""
+
+import argparse
+import threading
+import time
+from decimal import Decimal
+from uuid import UUID
+
+from django.db import connection
+
+from bank_app.application.adapter.persistence.entity.bank_account_entity import (
+    BankAccountEntity,
+)
+from bank_app.application.adapter.persistence.repository.bank_account_repository import (  # noqa: E501
+    BankAccountRepository,
+)
+from benchmarks.common import benchmark_database, report, summarize
+from exalt_hexarch.containers import Container
+
+
+def run_worker(account_number: UUID, deposits: int, durations: list[float]) -> None:
+    service = Container().bank_account_service()
+    try:
+        for _ in range(deposits):
+            start = time.perf_counter()
+            service.deposit_money(account_number, Decimal("1.00"))
+            durations.append(time.perf_counter() - start)
+    finally:
+        connection.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--deposits", type=int, default=100, help="per thread")
+    parser.add_argument("--stripes", type=int, nargs="+", default=[0, 1, 2, 4, 8])
+    args = parser.parse_args()
+
+    # sqlite takes its write lock up front instead of failing the upgrade
+    connection.settings_dict["OPTIONS"]["transaction_mode"] = "IMMEDIATE"
+    rows = []
+    with benchmark_database(on_disk=True):
+        for stripes in args.stripes:
+            account = BankAccountEntity.objects.create(
+                balance=Decimal("0.00"), overdraft_amount=Decimal("100.00")
+            )
+            BankAccountRepository.stripe_account(account.account_number, stripes)
+            durations: list[float] = []
+            workers = [
+                threading.Thread(
+                    target=run_worker,
+                    args=(account.account_number, args.deposits, durations),
+                )
+                for _ in range(args.threads)
+            ]
+            start = time.perf_counter()
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            elapsed = time.perf_counter() - start
+
+            expected = Decimal(args.threads * args.deposits)
+            balance = BankAccountRepository.get_by_bank_account_number(
+                account.account_number
+            ).balance
+            if balance != expected:
+                raise SystemExit(f"balance is {balance}, {expected} was deposited")
+            BankAccountRepository.consolidate_stripes(account.account_number)
+            account.refresh_from_db()
+            if account.balance != expected:
+                raise SystemExit(f"consolidation left a balance of {account.balance}")
+
+            summary = summarize(durations)
+            rows.append(
+                [
+                    stripes or "off",
+                    len(durations) / elapsed,
+                    summary["median_us"] / 1000,
+                    summary["p99_us"] / 1000,
+                ]
+            )
+
+    report(
+        f"Deposits on one account from {args.threads} threads",
+        ["stripes", "deposits/s", "p50 ms", "p99 ms"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
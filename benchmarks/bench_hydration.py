@@ -0,0 +1,178 @@
+"""
+Objects per second when reading transactions and bank accounts into
+domain objects.
+
+    python -m benchmarks hydration --rows 5000
+
+"model" is how the repositories used to read: one Django model instance
+per row, then the attrs constructor with its validation. "rows" is how
+they read now: ``values_list`` tuples handed to ``hydrate``. "in memory"
+times the domain constructors alone on rows already fetched, to separate
+what the ORM costs from what validation costs.
+"""
+
+import argparse
+import datetime as dt
+from decimal import Decimal
+from typing import Any
+
+from bank_app.application.adapter.persistence.entity.account_statement_entity import (
+    TransactionEntity,
+)
+from bank_app.application.adapter.persistence.entity.bank_account_entity import (
+    BankAccountEntity,
+)
+from bank_app.application.adapter.persistence.repository.bank_account_repository import (  # noqa: E501
+    BankAccountRepository,
+)
+from bank_app.application.adapter.persistence.repository.transaction_repository import (
+    TransactionRepository,
+)
+from bank_app.application.domain.domain_models import AccountIdentity
+from bank_app.application.domain.model.account_statement import (
+    Transaction,
+    TransactionIdentity,
+)
+from bank_app.application.domain.model.bank_account import BankAccount
+from benchmarks.common import benchmark_database, measure, report, summarize
+
+
+def transaction_from_model(entity: TransactionEntity) -> Transaction:
+    return Transaction(
+        entity_id=TransactionIdentity(entity.entity_id),
+        account_id=AccountIdentity(entity.account_id),
+        transaction_type=entity.transaction_type,
+        account_type=entity.account_type,
+        amount=entity.amount,
+        transaction_date=entity.transaction_date,
+        sequence=entity.sequence,
+        balance_after=entity.balance_after,
+    )
+
+
+def bank_account_from_model(entity: BankAccountEntity) -> BankAccount:
+    return BankAccount(
+        entity_id=AccountIdentity(entity.entity_id),
+        account_number=entity.account_number,
+        balance=entity.balance,
+        overdraft_amount=entity.overdraft_amount,
+        is_allow_overdraft=entity.is_allow_overdraft,
+        is_active=entity.is_active,
+        created_at=entity.created_at,
+        updated_at=entity.updated_at,
+        version=entity.version,
+    )
+
+
+def transaction_from_values(row: tuple[Any, ...]) -> Transaction:
+    return Transaction(TransactionIdentity(row[0]), AccountIdentity(row[1]), *row[2:])
+
+
+def bank_account_from_values(row: tuple[Any, ...]) -> BankAccount:
+    return BankAccount(AccountIdentity(row[0]), *row[1:])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    rows = []
+    with benchmark_database():
+        account = BankAccountEntity.objects.create(
+            balance=Decimal("0.00"), overdraft_amount=Decimal("100.00")
+        )
+        now = dt.datetime.now(dt.timezone.utc)
+        TransactionEntity.objects.bulk_create(
+            TransactionEntity(
+                account_id=account.entity_id,
+                account_type="CURRENT_ACCOUNT",
+                transaction_type="DEPOSIT",
+                amount=Decimal("1.00"),
+                transaction_date=now,
+                sequence=sequence,
+                balance_after=Decimal(sequence),
+            )
+            for sequence in range(1, args.rows + 1)
+        )
+        BankAccountEntity.objects.bulk_create(
+            BankAccountEntity(
+                balance=Decimal(index), overdraft_amount=Decimal("100.00")
+            )
+            for index in range(args.rows - 1)
+        )
+
+        transactions = TransactionEntity.objects.filter(account_id=account.entity_id)
+        accounts = BankAccountEntity.objects.all()
+        transaction_rows = list(
+            transactions.values_list(*TransactionRepository.COLUMNS)
+        )
+        account_rows = list(accounts.values_list(*BankAccountRepository.COLUMNS))
+        cases = [
+            (
+                "Transaction",
+                "model",
+                lambda: [transaction_from_model(e) for e in transactions.iterator()],
+            ),
+            (
+                "Transaction",
+                "rows",
+                lambda: TransactionRepository._to_domain_list(transactions),
+            ),
+            (
+                "Transaction",
+                "in memory, __init__",
+                lambda: [transaction_from_values(r) for r in transaction_rows],
+            ),
+            (
+                "Transaction",
+                "in memory, hydrate",
+                lambda: [TransactionRepository.from_row(r) for r in transaction_rows],
+            ),
+            (
+                "BankAccount",
+                "model",
+                lambda: [bank_account_from_model(e) for e in accounts.iterator()],
+            ),
+            (
+                "BankAccount",
+                "rows",
+                lambda: [
+                    BankAccountRepository.from_row(r)
+                    for r in accounts.values_list(
+                        *BankAccountRepository.COLUMNS
+                    ).iterator()
+                ],
+            ),
+            (
+                "BankAccount",
+                "in memory, __init__",
+                lambda: [bank_account_from_values(r) for r in account_rows],
+            ),
+            (
+                "BankAccount",
+                "in memory, hydrate",
+                lambda: [BankAccountRepository.from_row(r) for r in account_rows],
+            ),
+        ]
+        for model, path, build in cases:
+            summary = summarize(measure(build, repeat=args.repeat))
+            rows.append(
+                [
+                    model,
+                    path,
+                    args.rows / (summary["median_us"] / 1e6),
+                    summary["median_us"] / 1000,
+                ]
+            )
+
+    report(
+        f"Hydrating {args.rows} rows",
+        ["model", "path", "objects/s", "p50 ms"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
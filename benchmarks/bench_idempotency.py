@@ -0,0 +1,76 @@
+"""
+Latency of a fresh deposit against a retry replayed from the in-process
+cache and a retry replayed from the idempotency table.
+
+    python -m benchmarks idempotency --repeat 2000
+
+A replay never touches the account row, it costs a cache lookup or a
+single indexed read of the idempotency table.
+"""
+
+import argparse
+from decimal import Decimal
+from uuid import uuid4
+
+from django.test.utils import setup_test_environment
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from bank_app.application.adapter.api.idempotency import get_idempotency_store
+from bank_app.application.adapter.persistence.entity.bank_account_entity import (
+    BankAccountEntity,
+)
+from benchmarks.common import benchmark_database, measure, report, summarize
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=2_000)
+    args = parser.parse_args()
+
+    setup_test_environment()
+    client = APIClient()
+    url = reverse("bank-account-deposit")
+    store = get_idempotency_store()
+
+    with benchmark_database():
+        account = BankAccountEntity.objects.create(
+            balance=Decimal("0.00"), overdraft_amount=Decimal("100.00")
+        )
+        data = {"account_number": str(account.account_number), "amount": "1.00"}
+        replayed_key = str(uuid4())
+        client.post(url, data, format="json", HTTP_IDEMPOTENCY_KEY=replayed_key)
+
+        def post(key: str) -> None:
+            client.post(url, data, format="json", HTTP_IDEMPOTENCY_KEY=key)
+
+        def replay_from_table() -> None:
+            store.clear_cache()
+            post(replayed_key)
+
+        rows = [
+            [
+                "no key",
+                *summarize(
+                    measure(lambda: client.post(url, data, format="json"), args.repeat)
+                ).values(),
+            ],
+            [
+                "fresh key",
+                *summarize(measure(lambda: post(str(uuid4())), args.repeat)).values(),
+            ],
+            [
+                "replay, cached",
+                *summarize(measure(lambda: post(replayed_key), args.repeat)).values(),
+            ],
+            [
+                "replay, table",
+                *summarize(measure(replay_from_table, args.repeat)).values(),
+            ],
+        ]
+
+    report("Deposit request latency (microseconds)", ["request", "p50", "p99"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""
+Lookup latency of the repository queries as the tables grow.
+
+    python -m benchmarks lookup_indexes --sizes 10000 100000 1000000 10000000
+
+With the indexes of migration 0008 every lookup is an index seek, so the
+median latency must stay flat while the row count grows by orders of
+magnitude. The query plan of each lookup is printed for the largest size.
+"""
+
+import argparse
+import datetime as dt
+import random
+from decimal import Decimal
+from uuid import UUID, uuid4
+
+from bank_app.application.adapter.persistence.entity.account_statement_entity import (
+    MonthlyStatementEntity,
+    TransactionEntity,
+)
+from bank_app.application.adapter.persistence.entity.bank_account_entity import (
+    BankAccountEntity,
+)
+from bank_app.application.adapter.persistence.repository.bank_account_repository import (  # noqa: E501
+    BankAccountRepository,
+)
+from bank_app.application.adapter.persistence.repository.transaction_repository import (
+    TransactionRepository,
+)
+from bank_app.application.domain.domain_models import AccountIdentity
+from benchmarks.common import benchmark_database, measure, report, summarize
+
+BATCH_SIZE = 10_000
+TRANSACTIONS_PER_ACCOUNT = 10
+
+
+def grow_tables(
+    current: int, target: int, account_numbers: list[UUID], account_ids: list[UUID]
+) -> None:
+    """Insert accounts, ledger rows and statements until ``target`` rows"""
+    now = dt.datetime.now(tz=dt.timezone.utc)
+    for start in range(current, target, BATCH_SIZE):
+        size = min(BATCH_SIZE, target - start)
+        accounts = [
+            BankAccountEntity(
+                account_number=uuid4(),
+                balance=Decimal("100.00"),
+                overdraft_amount=Decimal("100.00"),
+                is_active=index % 10 != 0,
+            )
+            for index in range(size)
+        ]
+        BankAccountEntity.objects.bulk_create(accounts)
+        account_numbers.extend(a.account_number for a in accounts)
+        account_ids.extend(a.entity_id for a in accounts)
+
+        owners = accounts[: size // TRANSACTIONS_PER_ACCOUNT]
+        TransactionEntity.objects.bulk_create(
+            TransactionEntity(
+                account_id=owner.entity_id,
+                transaction_type="DEPOSIT",
+                amount=Decimal("10.00"),
+            )
+            for owner in owners
+            for _ in range(TRANSACTIONS_PER_ACCOUNT)
+        )
+        MonthlyStatementEntity.objects.bulk_create(
+            MonthlyStatementEntity(
+                account_id=owner.entity_id,
+                account_type="CURRENT_ACCOUNT",
+                account_number=owner.account_number,
+                period_start=now - dt.timedelta(days=30),
+                period_end=now,
+                opening_balance=Decimal("0.00"),
+                closing_balance=Decimal("100.00"),
+                transactions_until=now,
+            )
+            for owner in owners
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--repeat", type=int, default=500)
+    args = parser.parse_args()
+
+    rows = []
+    plans: dict[str, str] = {}
+    end = dt.datetime.now(tz=dt.timezone.utc) + dt.timedelta(days=1)
+    start = end - dt.timedelta(days=31)
+    with benchmark_database():
+        account_numbers: list[UUID] = []
+        account_ids: list[UUID] = []
+        current = 0
+        for size in sorted(args.sizes):
+            grow_tables(current, size, account_numbers, account_ids)
+            current = size
+
+            by_number = summarize(
+                measure(
+                    lambda: BankAccountRepository.get_by_bank_account_number(
+                        random.choice(account_numbers)
+                    ),
+                    args.repeat,
+                )
+            )
+            by_date_range = summarize(
+                measure(
+                    lambda: TransactionRepository.get_by_account_id_and_date_range(
+                        AccountIdentity(random.choice(account_ids)), start, end
+                    ),
+                    args.repeat,
+                )
+            )
+            statements = summarize(
+                measure(
+                    lambda: list(
+                        MonthlyStatementEntity.objects.filter(
+                            account_number=random.choice(account_numbers)
+                        ).order_by("-period_end")[:1]
+                    ),
+                    args.repeat,
+                )
+            )
+            rows.append(
+                [
+                    size,
+                    by_number["median_us"],
+                    by_number["p99_us"],
+                    by_date_range["median_us"],
+                    by_date_range["p99_us"],
+                    statements["median_us"],
+                    statements["p99_us"],
+                ]
+            )
+
+        plans = {
+            "account by number": BankAccountEntity.objects.filter(
+                account_number=account_numbers[0]
+            ).explain(),
+            "ledger by account and period": TransactionEntity.objects.filter(
+                account_id=account_ids[0], transaction_date__gte=start
+            )
+            .order_by("-transaction_date")
+            .explain(),
+            "latest statement": MonthlyStatementEntity.objects.filter(
+                account_number=account_numbers[0]
+            )
+            .order_by("-period_end")
+            .explain(),
+            "active accounts": BankAccountEntity.objects.filter(is_active=True)
+            .order_by("entity_id")
+            .explain(),
+        }
+
+    report(
+        "Repository lookup latency (microseconds)",
+        [
+            "rows",
+            "by number p50",
+            "p99",
+            "ledger range p50",
+            "p99",
+            "statement p50",
+            "p99",
+        ],
+        rows,
+    )
+    report(
+        "Query plans at the largest size",
+        ["lookup", "plan"],
+        [[name, plan.replace("\n", " | ")] for name, plan in plans.items()],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Bytes per domain object, measured with tracemalloc.
+
+    python -m benchmarks memory --instances 100000
+
+Every instance of a model shares the same field values, so the figure is
+what the object itself costs, not its Decimals and UUIDs. "slotted" is
+the model as declared; "with __dict__" is a bare subclass of it, which
+gets the instance dictionary every entity carried while the bases of the
+hierarchy declared no ``__slots__``.
+"""
+
+import argparse
+import datetime as dt
+import gc
+import tracemalloc
+from decimal import Decimal
+from typing import Any
+from uuid import uuid4
+
+from bank_app.application.domain.domain_models import AccountIdentity
+from bank_app.application.domain.model.account_statement import (
+    MonthlyStatement,
+    MonthlyStatementIdentity,
+    Transaction,
+    TransactionIdentity,
+)
+from bank_app.application.domain.model.bank_account import BankAccount
+from bank_app.application.domain.model.booklet_account import BookletAccount
+from benchmarks.common import report
+
+
+def field_values() -> dict[type, tuple[Any, ...]]:
+    uuid = uuid4()
+    now = dt.datetime.now()
+    return {
+        BankAccount: (
+            AccountIdentity(uuid),
+            uuid,
+            Decimal("10.00"),
+            Decimal("100.00"),
+            True,
+            True,
+            now,
+            now,
+            0,
+        ),
+        BookletAccount: (
+            AccountIdentity(uuid),
+            uuid,
+            Decimal("10.00"),
+            Decimal("5000.00"),
+            True,
+            now,
+            now,
+            0,
+        ),
+        Transaction: (
+            TransactionIdentity(uuid),
+            AccountIdentity(uuid),
+            "CURRENT_ACCOUNT",
+            "DEPOSIT",
+            Decimal("10.00"),
+            now,
+            1,
+            Decimal("10.00"),
+        ),
+        MonthlyStatement: (
+            MonthlyStatementIdentity(uuid),
+            uuid,
+            "CURRENT_ACCOUNT",
+            uuid,
+            now,
+            now,
+            now,
+            Decimal("0.00"),
+            Decimal("10.00"),
+            [],
+        ),
+    }
+
+
+def bytes_per_instance(model: type, values: tuple[Any, ...], instances: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [model(*values) for _ in range(instances)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # the list holding them is not part of the objects
+    list_bytes = objects.__sizeof__()
+    return (after - before - list_bytes) / instances
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--instances", type=int, default=100_000)
+    args = parser.parse_args()
+
+    rows = []
+    for model, values in field_values().items():
+        with_dict = type(f"{model.__name__}WithDict", (model,), {})
+        slotted = bytes_per_instance(model, values, args.instances)
+        unslotted = bytes_per_instance(with_dict, values, args.instances)
+        rows.append(
+            [model.__name__, slotted, unslotted, f"{1 - slotted / unslotted:.0%}"]
+        )
+
+    report(
+        f"Bytes per instance ({args.instances} instances)",
+        ["model", "slotted", "with __dict__", "saved"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
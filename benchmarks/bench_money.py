@@ -0,0 +1,111 @@
+"""
+Money arithmetic as Decimal, as Money objects and as plain integer cents.
+
+    python -m benchmarks money --postings 100000
+
+"replay" folds postings into a running balance, as the ledger does one
+posting at a time. "totals" sums the deposits of a statement period, as
+``TransactionStream`` does over the cents of its transactions. "zero" is the
+``Decimal("0.00")`` the balance helpers parsed on every call, against the
+shared ``ZERO``. Every path must reach the same figure.
+"""
+
+import argparse
+import itertools
+import random
+from array import array
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any
+
+from bank_app.application.domain.model.money import ZERO, Money, to_amount, to_cents
+from benchmarks.common import measure, report, summarize
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def replay_decimal(amounts: list[Decimal]) -> Decimal:
+    balance = ZERO
+    for amount in amounts:
+        balance += amount
+    return balance
+
+
+def replay_money(amounts: list[Money]) -> Decimal:
+    balance = Money(0)
+    for amount in amounts:
+        balance += amount
+    return balance.to_decimal()
+
+
+def replay_cents(amounts: "array[int]") -> Decimal:
+    balance = 0
+    for cents in amounts:
+        balance += cents
+    return Money(balance).to_decimal()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--postings", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    generator = random.Random(0)
+    decimals = [
+        Decimal(generator.randrange(-100_000, 100_000)).scaleb(-2)
+        for _ in range(args.postings)
+    ]
+    cents = array("q", map(to_cents, decimals))
+    monies = [Money(c) for c in cents]
+    deposits = array("b", (c > 0 for c in cents))
+
+    cases: list[tuple[str, str, Callable[[], Any]]] = [
+        ("replay", "Decimal", lambda: replay_decimal(decimals)),
+        ("replay", "Money", lambda: replay_money(monies)),
+        ("replay", "int cents", lambda: replay_cents(cents)),
+        (
+            "totals",
+            "Decimal",
+            lambda: sum(itertools.compress(decimals, deposits), ZERO),
+        ),
+        (
+            "totals",
+            "Money.sum",
+            lambda: Money.sum(itertools.compress(cents, deposits)).to_decimal(),
+        ),
+        ("convert", "to_cents", lambda: list(map(to_cents, decimals))),
+        ("convert", "to_amount", lambda: list(map(to_amount, cents))),
+        (
+            "zero",
+            'Decimal("0.00")',
+            lambda: [max(Decimal("0.00"), amount) for amount in decimals],
+        ),
+        ("zero", "ZERO", lambda: [max(ZERO, amount) for amount in decimals]),
+    ]
+
+    rows: list[list[Any]] = []
+    figures: dict[str, set[str]] = {}
+    for workload, path, func in cases:
+        figures.setdefault(workload, set()).add(str(func()))
+        summary = summarize(measure(func, repeat=args.repeat))
+        rows.append(
+            [
+                workload,
+                path,
+                summary["median_us"] / 1000,
+                summary["median_us"] * 1000 / args.postings,
+            ]
+        )
+    if len(figures["replay"]) != 1 or len(figures["totals"]) != 1:
+        raise SystemExit(f"paths disagree: {figures}")
+
+    report(
+        f"Money over {args.postings} postings",
+        ["workload", "path", "p50 ms", "ns/posting"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Balances of the statement of a month a year back, with and without the
+statement of the month before it stored.
+
+    python -m benchmarks statement_chain --transactions 10000 100000
+
+The ledger spans the last year. "full" has no prior statement: the
+opening balance is replayed back from the live balance, reading every
+posting from the start of the month up to now. "chained" follows from the
+closing balance of the previous month, found by one lookup of
+statement_account_period_idx, and reads the postings of the month only.
+"rows" is what the ledger query of the balances covers.
+"""
+
+import argparse
+import datetime as dt
+from decimal import Decimal
+from typing import Any
+
+from bank_app.application.adapter.persistence.entity.account_statement_entity import (
+    MonthlyStatementEntity,
+    TransactionEntity,
+)
+from bank_app.application.adapter.persistence.entity.bank_account_entity import (
+    BankAccountEntity,
+)
+from bank_app.application.adapter.persistence.repository.account_statement_repository import (  # noqa: E501
+    AccountStatementRepository,
+)
+from bank_app.application.domain.service.account_statement import (
+    AccoutStatementService,
+)
+from benchmarks.bench_statement_reuse import statement_service
+from benchmarks.common import benchmark_database, measure, report, seed, summarize
+
+
+def ledger_rows(entity: BankAccountEntity, month: dt.date) -> int:
+    period_start, period_end = AccoutStatementService.calendar_month(
+        month, dt.timezone.utc
+    )
+    prior = AccountStatementRepository.get_previous(entity.account_number, period_end)
+    bounds = AccoutStatementService.ledger_bounds(
+        period_start, period_end, prior.period_end if prior is not None else None
+    )
+    rows = TransactionEntity.objects.filter(
+        account_id=entity.entity_id, transaction_date__gte=bounds[0]
+    )
+    if bounds[-1] is not None:
+        rows = rows.filter(transaction_date__lt=bounds[-1])
+    return rows.count()
+
+
+def run(count: int, repeat: int) -> list[Any]:
+    rows = []
+    with benchmark_database():
+        entity = BankAccountEntity.objects.create(
+            balance=Decimal("0.00"), overdraft_amount=Decimal("100.00")
+        )
+        now = dt.datetime.now(dt.timezone.utc)
+        seed(entity.entity_id, count, now, days=365)
+        month = (now - dt.timedelta(days=335)).date()
+        previous = (month.replace(day=1) - dt.timedelta(days=1)).replace(day=1)
+        service = statement_service()
+
+        def statement() -> None:
+            MonthlyStatementEntity.objects.filter(
+                period_start__month=month.month
+            ).delete()
+            service.generate_monthly_statement(entity.entity_id, month=month)
+
+        for scenario in ("full", "chained"):
+            MonthlyStatementEntity.objects.all().delete()
+            if scenario == "chained":
+                service.generate_monthly_statement(entity.entity_id, month=previous)
+            timing = summarize(measure(statement, repeat=repeat))
+            rows.append(
+                [
+                    count,
+                    scenario,
+                    timing["median_us"] / 1000,
+                    timing["p99_us"] / 1000,
+                    ledger_rows(entity, month),
+                ]
+            )
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--transactions", type=int, nargs="+", default=[10_000, 100_000]
+    )
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rows = [row for count in args.transactions for row in run(count, args.repeat)]
+    report(
+        "Statement of a month a year back",
+        ["transactions", "scenario", "p50 ms", "p99 ms", "rows"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Cost of saving a statement as its period grows.
+
+    python -m benchmarks statement_membership --transactions 1000 10000 100000
+
+A statement is one row bounding the transactions of its period; it used
+to be that row plus one link row per transaction, copied by an
+INSERT ... SELECT. "save" is a new statement written, "queries" what it
+sent to the database, and "read" iterating the transactions of the stored
+statement, which a range scan of the ledger resolves.
+"""
+
+import argparse
+import datetime as dt
+from decimal import Decimal
+from typing import Any
+from uuid import uuid4
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from bank_app.application.adapter.persistence.entity.account_statement_entity import (
+    MonthlyStatementEntity,
+)
+from bank_app.application.adapter.persistence.entity.bank_account_entity import (
+    BankAccountEntity,
+)
+from bank_app.application.adapter.persistence.repository.account_statement_repository import (  # noqa: E501
+    AccountStatementRepository,
+)
+from bank_app.application.domain.model.account_statement import (
+    MonthlyStatement,
+    MonthlyStatementIdentity,
+)
+from benchmarks.common import benchmark_database, measure, report, seed, summarize
+
+
+def new_statement(
+    entity: BankAccountEntity, period_end: dt.datetime
+) -> MonthlyStatement:
+    return MonthlyStatement(
+        entity_id=MonthlyStatementIdentity(uuid4()),
+        account_id=entity.entity_id,
+        account_type="CURRENT_ACCOUNT",
+        account_number=entity.account_number,
+        period_start=period_end - dt.timedelta(days=30),
+        period_end=period_end,
+        generated_at=period_end,
+        opening_balance=Decimal("0.00"),
+        closing_balance=Decimal("0.00"),
+        transactions=[],
+        is_closed=True,
+    )
+
+
+def run(count: int, repeat: int) -> list[Any]:
+    with benchmark_database():
+        entity = BankAccountEntity.objects.create(
+            balance=Decimal("0.00"), overdraft_amount=Decimal("100.00")
+        )
+        period_end = dt.datetime.now(dt.timezone.utc)
+        seed(entity.entity_id, count, period_end, days=29)
+
+        save = summarize(
+            measure(
+                lambda: AccountStatementRepository.save(
+                    new_statement(entity, period_end)
+                ),
+                repeat=repeat,
+            )
+        )
+        with CaptureQueriesContext(connection) as queries:
+            AccountStatementRepository.save(new_statement(entity, period_end))
+        members = AccountStatementRepository._get_transactions_for_statement(
+            MonthlyStatementEntity.objects.all()[0]
+        )
+        read = summarize(measure(lambda: sum(1 for _ in members), repeat=3))
+        if sum(1 for _ in members) != count:
+            raise SystemExit("statement transactions are missing")
+        return [
+            count,
+            save["median_us"] / 1000,
+            save["p99_us"] / 1000,
+            len(queries),
+            read["median_us"] / 1000,
+        ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--transactions", type=int, nargs="+", default=[1_000, 10_000, 100_000]
+    )
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    rows = [run(count, args.repeat) for count in args.transactions]
+    report(
+        "Saving a statement",
+        ["transactions", "save p50 ms", "save p99 ms", "queries", "read ms"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Repeated statement requests for one closed period.
+
+    python -m benchmarks statement_reuse --transactions 5000 --requests 50
+
+"cold" removes the stored statement before every request, which is what
+every request cost before statements were keyed by period: the ledger
+reads and a new statement row. "reuse" answers from the stored
+statement. "changed" posts a deposit between requests: the balances of a
+stored statement are those at the end of its period, so it is reused all
+the same once the first request has stored it. Each request is
+timed up to the first byte of the body (the statement itself) and until
+the body is sent, which streams the transactions of the period either way.
+"""
+
+import argparse
+import datetime as dt
+from collections.abc import Callable
+from decimal import Decimal
+from typing import Optional
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from bank_app.application.adapter.api.serializers.account_statement import (
+    AccountStatementResultSerializer,
+)
+from bank_app.application.adapter.persistence.entity.account_statement_entity import (
+    MonthlyStatementEntity,
+)
+from bank_app.application.adapter.persistence.entity.bank_account_entity import (
+    BankAccountEntity,
+)
+from bank_app.application.adapter.persistence.repository.account_statement_repository import (  # noqa: E501
+    AccountStatementRepository,
+)
+from bank_app.application.adapter.persistence.repository.bank_account_repository import (  # noqa: E501
+    BankAccountRepository,
+)
+from bank_app.application.adapter.persistence.repository.booklet_account_repository import (  # noqa: E501
+    BookletAccountRepository,
+)
+from bank_app.application.adapter.persistence.repository.transaction_repository import (
+    TransactionRepository,
+)
+from bank_app.application.domain.dtos.account_statement import MonthlyStatementDTO
+from bank_app.application.domain.service.account_statement import (
+    AccoutStatementService,
+)
+from bank_app.application.ports.repositories.i_balance_snapshot import (
+    IBalanceSnapshotRepository,
+)
+from bank_app.application.service.account_statement import (
+    AccountStatementService,
+    StatementReuseStats,
+)
+from benchmarks.common import benchmark_database, measure, report, seed, summarize
+
+
+def statement_service(
+    stats: Optional[StatementReuseStats] = None,
+    balance_snapshot_repository: Optional[IBalanceSnapshotRepository] = None,
+) -> AccountStatementService:
+    """The service as the container wires it, without cache or snapshots"""
+    return AccountStatementService(
+        transaction_repository=TransactionRepository(),
+        account_statement_repository=AccountStatementRepository(),
+        bank_account_repository=BankAccountRepository(),
+        booklet_account_repository=BookletAccountRepository(),
+        account_statement_service=AccoutStatementService(),
+        reuse_stats=stats,
+        balance_snapshot_repository=balance_snapshot_repository,
+    )
+
+
+def requests(
+    scenario: str,
+    service: AccountStatementService,
+    entity: BankAccountEntity,
+    period_end: dt.datetime,
+) -> tuple[Callable[[], MonthlyStatementDTO], Callable[[], int]]:
+    """A statement request of ``scenario``, and the same with its body sent"""
+
+    def before() -> None:
+        if scenario == "cold":
+            MonthlyStatementEntity.objects.all().delete()
+        elif scenario == "changed":
+            account = BankAccountRepository.get_by_bank_account_number(
+                entity.account_number
+            )
+            account.deposit(Decimal("1.00"))
+            BankAccountRepository.save(account)
+
+    def statement() -> MonthlyStatementDTO:
+        before()
+        return service.generate_monthly_statement(
+            entity.entity_id, period_end=period_end
+        )
+
+    def request() -> int:
+        body = AccountStatementResultSerializer(statement()).iter_json()
+        return sum(len(chunk) for chunk in body)
+
+    return statement, request
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--transactions", type=int, default=5000)
+    parser.add_argument("--requests", type=int, default=50)
+    args = parser.parse_args()
+
+    rows = []
+    with benchmark_database():
+        entity = BankAccountEntity.objects.create(
+            balance=Decimal("0.00"), overdraft_amount=Decimal("100.00")
+        )
+        # closed a day ago, the transactions spread over it
+        period_end = dt.datetime.now(dt.timezone.utc) - dt.timedelta(days=1)
+        seed(entity.entity_id, args.transactions, period_end, days=29)
+
+        for scenario in ("cold", "reuse", "changed"):
+            MonthlyStatementEntity.objects.all().delete()
+            if scenario == "reuse":
+                statement_service().generate_monthly_statement(
+                    entity.entity_id, period_end=period_end
+                )
+            stats = StatementReuseStats()
+            service = statement_service(stats)
+
+            statement, request = requests(scenario, service, entity, period_end)
+            first_byte = summarize(measure(statement, repeat=args.requests))
+            whole = summarize(measure(request, repeat=args.requests))
+            with CaptureQueriesContext(connection) as queries:
+                statement()
+            rows.append(
+                [
+                    scenario,
+                    first_byte["median_us"] / 1000,
+                    whole["median_us"] / 1000,
+                    len(queries),
+                    MonthlyStatementEntity.objects.count(),
+                    f"{stats.stats()['hit_rate']:.0%}",
+                ]
+            )
+
+    report(
+        f"{args.requests} requests, period of {args.transactions} transactions",
+        [
+            "scenario",
+            "statement p50 ms",
+            "with body p50 ms",
+            "queries",
+            "stored rows",
+            "hit rate",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
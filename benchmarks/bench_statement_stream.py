@@ -0,0 +1,152 @@
+"""
+Peak memory of a statement request as the period grows, from the read of
+the transactions to the last byte of JSON.
+
+    python -m benchmarks statement_stream --transactions 10000 50000 200000
+
+"buffered" is the statement path as it was: the period read into a list
+of Transaction objects, the statement saved with a link per id, and a
+nested serializer ``.data`` rendered to one JSON document. "streamed" is
+the path the view takes now: a TransactionStream read in chunks, links
+copied by the database, and the body encoded a chunk at a time (consumed
+and dropped here, as the server does once sent). Peaks come from
+tracemalloc, so timings are slower than without it. Both paths must
+produce the same statement, which is checked in a pass of its own.
+"""
+
+import argparse
+import datetime as dt
+import gc
+import json
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from decimal import Decimal
+
+from rest_framework.renderers import JSONRenderer
+
+from bank_app.application.adapter.api.serializers.account_statement import (
+    AccountStatementResultSerializer,
+)
+from bank_app.application.adapter.persistence.entity.account_statement_entity import (
+    MonthlyStatementEntity,
+)
+from bank_app.application.adapter.persistence.entity.bank_account_entity import (
+    BankAccountEntity,
+)
+from bank_app.application.adapter.persistence.repository.account_statement_repository import (  # noqa: E501
+    AccountStatementRepository,
+)
+from bank_app.application.adapter.persistence.repository.bank_account_repository import (  # noqa: E501
+    BankAccountRepository,
+)
+from bank_app.application.adapter.persistence.repository.transaction_repository import (
+    TransactionRepository,
+)
+from bank_app.application.domain.domain_models import AccountIdentity
+from bank_app.application.domain.dtos.account_statement import MonthlyStatementDTO
+from bank_app.application.domain.service.account_statement import (
+    AccoutStatementService,
+)
+from benchmarks.bench_statement_reuse import statement_service
+from benchmarks.common import benchmark_database, report, seed
+
+
+def buffered(account_id: AccountIdentity, period_end: dt.datetime) -> bytes:
+    account = BankAccountRepository.get(account_id)
+    period_start = AccoutStatementService.get_period_start(period_end)
+    statement = AccoutStatementService.generate_monthly_statement(
+        account=account,
+        transactions=TransactionRepository.get_by_account_id_and_date_range(
+            account_id, period_start, period_end
+        ),
+        period_end=period_end,
+        net_amounts=TransactionRepository.get_net_amounts(
+            account_id,
+            AccoutStatementService.ledger_bounds(period_start, period_end),
+        ),
+    )
+    AccountStatementRepository.save(statement)
+    return JSONRenderer().render(
+        AccountStatementResultSerializer(
+            MonthlyStatementDTO.from_entity(statement)
+        ).data
+    )
+
+
+def streamed(account_id: AccountIdentity, period_end: dt.datetime) -> Iterator[bytes]:
+    result = statement_service().generate_monthly_statement(
+        account_id=account_id.uuid, period_end=period_end
+    )
+    return AccountStatementResultSerializer(result).iter_json()
+
+
+def sent(account_id: AccountIdentity, period_end: dt.datetime) -> int:
+    """Bytes of the streamed body, each chunk dropped once counted"""
+    return sum(len(chunk) for chunk in streamed(account_id, period_end))
+
+
+def run(
+    path: Callable[[AccountIdentity, dt.datetime], object],
+    account_id: AccountIdentity,
+    period_end: dt.datetime,
+) -> tuple[float, float]:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    path(account_id, period_end)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def check(account_id: AccountIdentity, period_end: dt.datetime) -> None:
+    statements = [
+        json.loads(buffered(account_id, period_end)),
+        json.loads(b"".join(streamed(account_id, period_end))),
+    ]
+    for statement in statements:
+        del statement["generated_at"]
+    if statements[0] != statements[1]:
+        raise SystemExit("buffered and streamed statements differ")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--transactions", type=int, nargs="+", default=[10_000, 50_000, 200_000]
+    )
+    args = parser.parse_args()
+
+    rows = []
+    for count in args.transactions:
+        with benchmark_database():
+            entity = BankAccountEntity.objects.create(
+                balance=Decimal("0.00"), overdraft_amount=Decimal("100.00")
+            )
+            period_end = dt.datetime.now(dt.timezone.utc)
+            seed(entity.entity_id, count, period_end, days=29)
+            account_id = AccountIdentity(entity.entity_id)
+
+            check(account_id, period_end)
+            for name, path in (("buffered", buffered), ("streamed", sent)):
+                elapsed, peak = run(path, account_id, period_end)
+                rows.append([count, name, peak / 2**20, elapsed])
+            # every save holds every transaction of the period
+            for statement in MonthlyStatementEntity.objects.all():
+                members = AccountStatementRepository._get_transactions_for_statement(
+                    statement
+                )
+                if sum(1 for _ in members) != count:
+                    raise SystemExit("statement transactions are missing")
+
+    report(
+        "Statement request, peak memory",
+        ["transactions", "path", "peak MiB", "seconds"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
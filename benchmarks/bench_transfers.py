@@ -0,0 +1,139 @@
+"""
+Concurrent transfers, in both directions, across a small set of hot
+accounts.
+
+    python -m benchmarks transfers --accounts 4 --threads 8 --transfers 200
+
+Every transfer locks its two rows in entity_id order, so opposite transfers
+between the same accounts queue behind each other instead of deadlocking.
+The run fails if money was created or lost, or if the ledger misses a leg.
+"""
+
+import argparse
+import random
+import threading
+import time
+from collections import Counter
+from decimal import Decimal
+from uuid import UUID
+
+from django.db import OperationalError, connection
+from django.db.models import Sum
+
+from bank_app.application.adapter.persistence.entity.account_statement_entity import (
+    TransactionEntity,
+)
+from bank_app.application.adapter.persistence.entity.bank_account_entity import (
+    BankAccountEntity,
+)
+from bank_app.application.domain.exceptions import BusinessException
+from bank_app.application.service.transfer import TransferService
+from benchmarks.common import benchmark_database, percentile, report, summarize
+from exalt_hexarch.containers import Container
+
+
+def run_worker(
+    service: TransferService,
+    account_ids: list[UUID],
+    transfers: int,
+    durations: list[float],
+    outcomes: Counter[str],
+) -> None:
+    try:
+        for _ in range(transfers):
+            source, target = random.sample(account_ids, 2)
+            amount = Decimal(random.randint(1, 5000)) / 100
+            start = time.perf_counter()
+            try:
+                service.transfer(
+                    source_account_id=source, target_account_id=target, amount=amount
+                )
+                outcomes["done"] += 1
+            except BusinessException:
+                outcomes["refused"] += 1
+            except OperationalError:
+                outcomes["database error"] += 1
+            durations.append(time.perf_counter() - start)
+    finally:
+        connection.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--accounts", type=int, default=4)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--transfers", type=int, default=200, help="per thread")
+    args = parser.parse_args()
+
+    # sqlite takes its write lock up front instead of failing the upgrade
+    connection.settings_dict["OPTIONS"]["transaction_mode"] = "IMMEDIATE"
+    service = Container().transfer_service()
+    rows = []
+    with benchmark_database(on_disk=True):
+        for threads in args.threads:
+            accounts = BankAccountEntity.objects.bulk_create(
+                BankAccountEntity(
+                    balance=Decimal("1000.00"),
+                    overdraft_amount=Decimal("100.00"),
+                    is_allow_overdraft=True,
+                )
+                for _ in range(args.accounts)
+            )
+            account_ids = [account.entity_id for account in accounts]
+            durations: list[float] = []
+            outcomes: Counter[str] = Counter()
+            workers = [
+                threading.Thread(
+                    target=run_worker,
+                    args=(service, account_ids, args.transfers, durations, outcomes),
+                )
+                for _ in range(threads)
+            ]
+            start = time.perf_counter()
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            elapsed = time.perf_counter() - start
+
+            total = BankAccountEntity.objects.filter(
+                entity_id__in=account_ids
+            ).aggregate(total=Sum("balance"))["total"]
+            legs = TransactionEntity.objects.filter(account_id__in=account_ids).count()
+            if total != Decimal("1000.00") * args.accounts:
+                raise SystemExit(f"money was created or lost: total is {total}")
+            if legs != 2 * outcomes["done"]:
+                raise SystemExit(f"{legs} ledger rows for {outcomes['done']} transfers")
+
+            summary = summarize(durations)
+            rows.append(
+                [
+                    threads,
+                    len(durations) / elapsed,
+                    summary["median_us"] / 1000,
+                    summary["p99_us"] / 1000,
+                    percentile(durations, 100) * 1000,
+                    outcomes["done"],
+                    outcomes["refused"],
+                    outcomes["database error"],
+                ]
+            )
+
+    report(
+        f"Transfers across {args.accounts} hot accounts",
+        [
+            "threads",
+            "transfers/s",
+            "p50 ms",
+            "p99 ms",
+            "max ms",
+            "done",
+            "refused",
+            "db errors",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Shared helpers for the benchmark scripts: a throwaway database (in memory
+for sqlite, ``test_<name>`` for postgres), a ledger seeder, timers and a
+stdout report.
+"""
+
+import contextlib
+import datetime as dt
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from collections.abc import Callable, Iterator, Sequence
+from pathlib import Path
+from typing import Any
+
+from django.db import connection, transaction
+
+from bank_app.application.adapter.persistence.entity.account_statement_entity import (
+    TransactionEntity,
+)
+
+
+@contextlib.contextmanager
+def benchmark_database(on_disk: bool = False) -> Iterator[None]:
+    """
+    Create a migrated throwaway database and drop it afterwards.
+    :param on_disk: use a sqlite file rather than memory, needed as soon as
+    another thread writes: shared in-memory sqlite fails concurrent writers
+    with "table is locked" instead of waiting.
+    """
+    old_name = connection.settings_dict["NAME"]
+    with contextlib.ExitStack() as stack:
+        if on_disk and connection.vendor == "sqlite":
+            directory = stack.enter_context(tempfile.TemporaryDirectory())
+            connection.settings_dict["TEST"]["NAME"] = str(
+                Path(directory) / "benchmark.sqlite3"
+            )
+        connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        try:
+            yield
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+def seed(account_id: uuid.UUID, count: int, period_end: dt.datetime, days: int) -> None:
+    """
+    Insert ``count`` ledger rows on the account, spread evenly over the
+    ``days`` before ``period_end``, one in three a withdrawal.
+    """
+    quote = connection.ops.quote_name
+    table = quote(TransactionEntity._meta.db_table)
+    columns = ", ".join(
+        quote(column)
+        for column in (
+            "entity_id",
+            "account_id",
+            "account_type",
+            "transaction_type",
+            "amount",
+            "transaction_date",
+            "sequence",
+        )
+    )
+    step = dt.timedelta(days=days) / count
+    rows = (
+        (
+            uuid.uuid4().hex,
+            account_id.hex,
+            "CURRENT_ACCOUNT",
+            "DEPOSIT" if index % 3 else "WITHDRAWAL",
+            f"{index % 1000}.{index % 100:02d}",
+            (period_end - step * (count - index)).isoformat(sep=" "),
+            index + 1,
+        )
+        for index in range(count)
+    )
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.executemany(
+            f"INSERT INTO {table} ({columns}) VALUES (%s, %s, %s, %s, %s, %s, %s)",  # noqa: S608
+            # a generator, so a million rows are never all held at once
+            rows,  # type: ignore[arg-type]
+        )
+
+
+def measure(func: Callable[[], Any], repeat: int = 200) -> list[float]:
+    """Run ``func`` ``repeat`` times and return every duration in seconds"""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def percentile(durations: Sequence[float], rank: float) -> float:
+    ordered = sorted(durations)
+    index = min(len(ordered) - 1, round(rank / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+def summarize(durations: Sequence[float]) -> dict[str, float]:
+    """Median / p99 in microseconds"""
+    return {
+        "median_us": statistics.median(durations) * 1e6,
+        "p99_us": percentile(durations, 99) * 1e6,
+    }
+
+
+def report(title: str, headers: Sequence[str], rows: Sequence[Sequence[Any]]) -> None:
+    """Write a fixed-width table on stdout"""
+    cells = [[str(h) for h in headers]] + [
+        [f"{c:.1f}" if isinstance(c, float) else str(c) for c in row] for row in rows
+    ]
+    widths = [max(len(row[i]) for row in cells) for i in range(len(headers))]
+    lines = [title, "=" * len(title)]
+    for index, row in enumerate(cells):
+        lines.append("  ".join(c.rjust(w) for c, w in zip(row, widths)))
+        if index == 0:
+            lines.append("  ".join("-" * w for w in widths))
+    sys.stdout.write("\n".join(lines) + "\n\n")
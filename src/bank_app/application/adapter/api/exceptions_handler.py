@@ -2,7 +2,11 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import exception_handler
 
-from bank_app.application.domain.exceptions import BusinessException, NotFound
+from bank_app.application.domain.exceptions import (
+    BusinessException,
+    ConcurrentUpdateException,
+    NotFound,
+)
 
 
 def problem_response(detail: str, status_code: int) -> Response:
@@ -18,6 +22,8 @@ def exceptions_handler(exc, context):
 
     if isinstance(exc, NotFound):
         return problem_response(str(exc.message), status.HTTP_404_NOT_FOUND)
+    if isinstance(exc, ConcurrentUpdateException):
+        return problem_response(str(exc.message), status.HTTP_409_CONFLICT)
     if isinstance(exc, BusinessException):
         return problem_response(str(exc.message), status.HTTP_500_INTERNAL_SERVER_ERROR)
     return problem_response(str(exc), status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -0,0 +1,272 @@
+import datetime as dt
+import functools
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, Optional, cast
+
+import attr
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from bank_app.application.adapter.api.exceptions_handler import problem_response
+from bank_app.application.adapter.persistence.entity.idempotency_key_entity import (
+    IdempotencyKeyEntity,
+)
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+MAX_KEY_LENGTH = 255
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+
+@attr.dataclass(frozen=True, slots=True)
+class StoredResponse:
+    fingerprint: str
+    status_code: int
+    body: Any
+    expires_at: dt.datetime
+
+
+class IdempotencyStore:
+    """
+    Remembers the response of every request sent with an ``Idempotency-Key``
+    header, in the idempotency_key table behind an in-process LRU cache.
+
+    The first request inserts the row of the key in a transaction that also
+    holds everything it posts, and stores its response in that row before
+    committing: the key is used exactly when the posting committed. A crash,
+    an exception or a 5xx answer rolls everything back together, so the
+    client may retry. A duplicate never runs while the first may still
+    commit. In this process it waits for the answer, then gets a 409 after
+    ``wait_timeout``; from another process its own insert waits on the
+    database for the first transaction to end.
+
+    Inside that transaction the postings run on the request's connection,
+    never through the group committer (see ``run_grouped``).
+    """
+
+    def __init__(
+        self,
+        ttl: dt.timedelta = dt.timedelta(hours=24),
+        cache_size: int = 10_000,
+        wait_timeout: float = 10.0,
+        poll_interval: float = 0.05,
+    ) -> None:
+        self.ttl = ttl
+        self.cache_size = cache_size
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+        self._cache: OrderedDict[tuple[str, str], StoredResponse] = OrderedDict()
+        self._running: dict[tuple[str, str], threading.Event] = {}
+        self._lock = threading.Lock()
+
+    def execute(
+        self,
+        scope: str,
+        key: str,
+        fingerprint: str,
+        handler: Callable[[], Response],
+    ) -> Response:
+        deadline = time.monotonic() + self.wait_timeout
+        while True:
+            stored = self._get_cached(scope, key)
+            if stored is not None:
+                return self._replay(stored, fingerprint)
+
+            done = threading.Event()
+            with self._lock:
+                running = self._running.setdefault((scope, key), done)
+            if running is done:
+                try:
+                    response = self._run(scope, key, fingerprint, handler)
+                finally:
+                    with self._lock:
+                        self._running.pop((scope, key), None)
+                    done.set()
+                if response is not None:
+                    return response
+            # still running, or answered by a request of another process
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return problem_response(
+                    "A request with this Idempotency-Key is still in progress",
+                    status.HTTP_409_CONFLICT,
+                )
+            self._wait(scope, key, remaining)
+
+    def purge_expired(self) -> int:
+        """Delete expired keys, return how many were removed"""
+        now = timezone.now()
+        with self._lock:
+            for cache_key in [k for k, v in self._cache.items() if v.expires_at <= now]:
+                del self._cache[cache_key]
+        deleted, _ = IdempotencyKeyEntity.objects.filter(expires_at__lte=now).delete()
+        return deleted
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def _run(
+        self,
+        scope: str,
+        key: str,
+        fingerprint: str,
+        handler: Callable[[], Response],
+    ) -> Optional[Response]:
+        """
+        Run ``handler`` and store its response in the row of the key, in one
+        transaction, unless the key is used already.
+        :return: The response, replayed when the key was used already, or
+        None when its row is not answered yet.
+        """
+        with transaction.atomic():
+            entity = self._used(scope, key)
+            if entity is None:
+                try:
+                    # waits on the insert of a concurrent duplicate in
+                    # another process, until its transaction ends
+                    with transaction.atomic():
+                        entity = IdempotencyKeyEntity.objects.create(
+                            scope=scope,
+                            key=key,
+                            fingerprint=fingerprint,
+                            expires_at=timezone.now() + self.ttl,
+                        )
+                except IntegrityError:
+                    entity = self._used(scope, key)
+                    if entity is None:
+                        return None
+                else:
+                    response = handler()
+                    if response.status_code >= status.HTTP_500_INTERNAL_SERVER_ERROR:
+                        transaction.set_rollback(True)
+                        return response
+                    entity.status_code = response.status_code
+                    entity.response_body = response.data
+                    entity.save(update_fields=["status_code", "response_body"])
+                    transaction.on_commit(lambda: self._remember(scope, key, entity))
+                    return response
+        if entity.fingerprint != fingerprint:
+            return self._conflicting_key()
+        if entity.status_code is None:
+            return None
+        return self._replay(self._remember(scope, key, entity), fingerprint)
+
+    @staticmethod
+    def _used(scope: str, key: str) -> Optional[IdempotencyKeyEntity]:
+        """The row of the key, after removing it when it has expired"""
+        entity = IdempotencyKeyEntity.objects.filter(scope=scope, key=key).first()
+        if entity is not None and entity.expires_at <= timezone.now():
+            IdempotencyKeyEntity.objects.filter(pk=entity.pk).delete()
+            return None
+        return entity
+
+    def _wait(self, scope: str, key: str, remaining: float) -> None:
+        with self._lock:
+            running = self._running.get((scope, key))
+        if running is not None:
+            running.wait(remaining)
+        else:
+            time.sleep(min(remaining, self.poll_interval))
+
+    def _get_cached(self, scope: str, key: str) -> Optional[StoredResponse]:
+        with self._lock:
+            stored = self._cache.get((scope, key))
+            if stored is None:
+                return None
+            if stored.expires_at <= timezone.now():
+                del self._cache[(scope, key)]
+                return None
+            self._cache.move_to_end((scope, key))
+            return stored
+
+    def _remember(
+        self, scope: str, key: str, entity: IdempotencyKeyEntity
+    ) -> StoredResponse:
+        stored = StoredResponse(
+            fingerprint=entity.fingerprint,
+            status_code=cast("int", entity.status_code),
+            body=entity.response_body,
+            expires_at=entity.expires_at,
+        )
+        with self._lock:
+            self._cache[(scope, key)] = stored
+            self._cache.move_to_end((scope, key))
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return stored
+
+    def _replay(self, stored: StoredResponse, fingerprint: str) -> Response:
+        if stored.fingerprint != fingerprint:
+            return self._conflicting_key()
+        return Response(
+            stored.body, status=stored.status_code, headers={REPLAYED_HEADER: "true"}
+        )
+
+    def _conflicting_key(self) -> Response:
+        return problem_response(
+            "Idempotency-Key already used with a different request",
+            status.HTTP_422_UNPROCESSABLE_ENTITY,
+        )
+
+
+_store: Optional[IdempotencyStore] = None
+_store_lock = threading.Lock()
+
+
+def get_idempotency_store() -> IdempotencyStore:
+    global _store
+    with _store_lock:
+        if _store is None:
+            options = getattr(settings, "IDEMPOTENCY", {})
+            _store = IdempotencyStore(
+                ttl=dt.timedelta(hours=options.get("TTL_HOURS", 24)),
+                cache_size=options.get("CACHE_SIZE", 10_000),
+                wait_timeout=options.get("WAIT_TIMEOUT_MS", 10_000) / 1000,
+            )
+        return _store
+
+
+def request_fingerprint(request: Request) -> str:
+    data = request.data
+    if request.query_params:
+        # e.g. the bulk posting mode: same body, different request
+        data = {"data": data, "query": request.query_params}
+    payload = json.dumps(data, sort_keys=True, cls=DjangoJSONEncoder)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def idempotent(view_method: Callable[..., Response]) -> Callable[..., Response]:
+    """
+    Make a money-moving view method safe to retry: a request repeating the
+    ``Idempotency-Key`` header of a previous one gets its response back
+    instead of posting again. Requests without the header are unaffected.
+    """
+
+    @functools.wraps(view_method)
+    def wrapper(self: Any, request: Request, *args: Any, **kwargs: Any) -> Response:
+        key = request.headers.get(IDEMPOTENCY_HEADER)
+        if not key:
+            return view_method(self, request, *args, **kwargs)
+        if len(key) > MAX_KEY_LENGTH:
+            return problem_response(
+                "Idempotency-Key is too long", status.HTTP_400_BAD_REQUEST
+            )
+        return get_idempotency_store().execute(
+            scope=f"{request.method} {request.path}",
+            key=key,
+            fingerprint=request_fingerprint(request),
+            handler=lambda: view_method(self, request, *args, **kwargs),
+        )
+
+    return wrapper
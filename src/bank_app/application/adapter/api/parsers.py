@@ -0,0 +1,49 @@
+import json
+from collections.abc import Mapping
+from typing import Any, Optional
+
+from django.conf import settings
+from rest_framework import status
+from rest_framework.exceptions import APIException, ParseError
+from rest_framework.parsers import BaseParser
+
+
+class TooManyLines(APIException):
+    status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    default_detail = "Too many lines in the request body."
+    default_code = "too_many_lines"
+
+
+class NDJSONParser(BaseParser):
+    """
+    Newline delimited JSON, one document per line, parsed while the body is
+    read instead of once it is fully buffered. Blank lines are ignored.
+
+    A view with a ``max_lines`` attribute caps the number of documents: the
+    parser stops reading and raises TooManyLines (413) on the first one
+    over the limit, before the rest of the body is read or parsed.
+    """
+
+    media_type = "application/x-ndjson"
+
+    def parse(
+        self,
+        stream: Any,
+        media_type: Optional[str] = None,
+        parser_context: Optional[Mapping[str, Any]] = None,
+    ) -> Any:
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        max_lines = getattr(parser_context.get("view"), "max_lines", None)
+        documents: list[Any] = []
+        for number, raw in enumerate(stream or (), start=1):
+            line = raw.decode(encoding).strip()
+            if not line:
+                continue
+            if max_lines is not None and len(documents) >= max_lines:
+                raise TooManyLines(f"at most {max_lines} lines per request")
+            try:
+                documents.append(json.loads(line))
+            except ValueError as ex:
+                raise ParseError(f"NDJSON parse error on line {number} - {ex}") from ex
+        return documents
@@ -1,4 +1,7 @@
 import datetime
+import json
+from collections.abc import Iterator
+from typing import Any
 
 from rest_framework import serializers
 
@@ -13,9 +16,19 @@ class AccountStatementSerializer(serializers.Serializer):
         default=AccountType.CURRENT_ACCOUNT.value,
     )
     period_end = serializers.DateTimeField(required=False, allow_null=True)
+    # a calendar month, "2025-10", instead of the 30 days up to period_end
+    month = serializers.DateField(
+        input_formats=["%Y-%m"], required=False, allow_null=True
+    )
 
     def validate(self, attrs):
-        if "period_end" not in attrs or attrs["period_end"] is None:
+        if attrs.get("month") is not None:
+            if attrs.get("period_end") is not None:
+                raise serializers.ValidationError(
+                    "Give either period_end or month, not both"
+                )
+            attrs["period_end"] = None
+        elif "period_end" not in attrs or attrs["period_end"] is None:
             from django.utils import timezone
 
             attrs["period_end"] = timezone.now()
@@ -35,9 +48,13 @@ class TransactionSerializer(serializers.Serializer):
     account_id = serializers.UUIDField()
     transaction_type = serializers.CharField()
     amount = serializers.DecimalField(max_digits=19, decimal_places=2)
+    sequence = serializers.IntegerField(allow_null=True)
+    balance_after = serializers.DecimalField(
+        max_digits=19, decimal_places=2, allow_null=True
+    )
     transaction_date = serializers.DateTimeField()
 
-    def to_representation(self, instance):
+    def to_representation(self, instance: Any) -> Any:
         if isinstance(instance, Transaction):
             return {
                 "entity_id": str(instance.entity_id.uuid)
@@ -49,6 +66,10 @@ class TransactionSerializer(serializers.Serializer):
                 "transaction_type": instance.transaction_type,
                 "account_type": instance.account_type,
                 "amount": str(instance.amount),
+                "sequence": instance.sequence,
+                "balance_after": str(instance.balance_after)
+                if instance.balance_after is not None
+                else None,
                 "transaction_date": instance.transaction_date.isoformat()
                 if isinstance(instance.transaction_date, datetime.datetime)
                 else instance.transaction_date,
@@ -60,24 +81,83 @@ class AccountStatementResultSerializer(serializers.Serializer):
     account_id = serializers.UUIDField()
     account_type = serializers.CharField()
     account_number = serializers.UUIDField()
+    period_start = serializers.DateTimeField()
+    period_end = serializers.DateTimeField()
     generated_at = serializers.DateTimeField()
     opening_balance = serializers.DecimalField(max_digits=19, decimal_places=2)
     closing_balance = serializers.DecimalField(max_digits=19, decimal_places=2)
     transactions = TransactionSerializer(many=True)
 
+    # transactions encoded per chunk of a streamed body
+    STREAM_CHUNK = 500
+
+    @staticmethod
+    def _summary(instance: Any) -> dict[str, Any]:
+        return {
+            "account_id": str(instance.account_id),
+            "account_type": instance.account_type,
+            "account_number": str(instance.account_number),
+            "period_start": instance.period_start.isoformat(),
+            "period_end": instance.period_end.isoformat(),
+            "generated_at": instance.generated_at.isoformat()
+            if isinstance(instance.generated_at, datetime.datetime)
+            else instance.generated_at,
+            "opening_balance": str(instance.opening_balance),
+            "closing_balance": str(instance.closing_balance),
+        }
+
     def to_representation(self, instance):
         if hasattr(instance, "account_id"):
             return {
-                "account_id": str(instance.account_id),
-                "account_type": instance.account_type,
-                "account_number": str(instance.account_number),
-                "generated_at": instance.generated_at.isoformat()
-                if isinstance(instance.generated_at, datetime.datetime)
-                else instance.generated_at,
-                "opening_balance": str(instance.opening_balance),
-                "closing_balance": str(instance.closing_balance),
+                **self._summary(instance),
                 "transactions": TransactionSerializer(
                     instance.transactions, many=True
                 ).data,
             }
         return super().to_representation(instance)
+
+    def iter_json(self) -> Iterator[bytes]:
+        """
+        The representation as compact JSON, encoded a chunk of transactions
+        at a time for a streaming response: transactions are drawn from
+        the statement as they are written and never all held.
+        """
+        statement: Any = self.instance
+        encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+        summary = encode(self._summary(statement))
+        yield (summary[:-1] + ',"transactions":[').encode()
+        transaction_serializer = TransactionSerializer()
+        separator, parts = "", []
+        for transaction in statement.transactions:
+            parts.append(encode(transaction_serializer.to_representation(transaction)))
+            if len(parts) == self.STREAM_CHUNK:
+                yield (separator + ",".join(parts)).encode()
+                separator, parts = ",", []
+        if parts:
+            yield (separator + ",".join(parts) + "]}").encode()
+        else:
+            yield b"]}"
+
+
+class AccountBalanceSerializer(serializers.Serializer[Any]):
+    account_id = serializers.UUIDField()
+    type_account = serializers.ChoiceField(
+        choices=[(acc_type.value, acc_type.name) for acc_type in AccountType],
+        default=AccountType.CURRENT_ACCOUNT.value,
+    )
+    timestamp = serializers.DateTimeField()
+
+    def validate_type_account(self, value: str) -> AccountType:
+        try:
+            return AccountType(value)
+        except ValueError as ex:
+            choices = [t.value for t in AccountType]
+            raise serializers.ValidationError(
+                f"Invalid account type. Must be one of: {choices}"
+            ) from ex
+
+
+class AccountBalanceResultSerializer(serializers.Serializer[Any]):
+    account_id = serializers.UUIDField()
+    timestamp = serializers.DateTimeField()
+    balance = serializers.DecimalField(max_digits=19, decimal_places=2)
@@ -0,0 +1,106 @@
+from decimal import Decimal, InvalidOperation
+from typing import Any
+from uuid import UUID
+
+from rest_framework import serializers
+
+from bank_app.application.domain.dtos.posting import (
+    INVALID,
+    PostingDTO,
+    PostingResultDTO,
+)
+from bank_app.application.util.util import AccountType
+
+ATOMIC = "atomic"
+BEST_EFFORT = "best_effort"
+TRANSACTION_TYPES = ("DEPOSIT", "WITHDRAWAL")
+MAX_AMOUNT_DIGITS = 19
+
+
+class BulkPostingModeSerializer(serializers.Serializer[Any]):
+    mode = serializers.ChoiceField(choices=[ATOMIC, BEST_EFFORT], default=ATOMIC)
+
+
+def _parse_amount(value: Any) -> Decimal:
+    if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+        raise ValueError("amount must be a decimal number")
+    try:
+        amount = Decimal(str(value))
+    except InvalidOperation as ex:
+        raise ValueError("amount must be a decimal number") from ex
+    if not amount.is_finite() or amount <= 0:
+        raise ValueError("negative or null amount is not allow")
+    exponent = amount.as_tuple().exponent
+    if not isinstance(exponent, int) or exponent < -2:
+        raise ValueError("amount has more than 2 decimal places")
+    if amount.adjusted() >= MAX_AMOUNT_DIGITS - 2:
+        raise ValueError(f"amount has more than {MAX_AMOUNT_DIGITS} digits")
+    return amount
+
+
+def _parse_posting(line: int, document: Any) -> PostingDTO:
+    if not isinstance(document, dict):
+        raise ValueError("a posting must be a JSON object")
+    try:
+        account_number = UUID(str(document["account_number"]))
+    except KeyError as ex:
+        raise ValueError("account_number is required") from ex
+    except ValueError as ex:
+        raise ValueError("account_number must be a valid UUID") from ex
+    try:
+        account_type = AccountType(
+            document.get("account_type", AccountType.CURRENT_ACCOUNT.value)
+        )
+    except ValueError as ex:
+        raise ValueError(
+            f"Invalid account type. Must be one of: {[t.value for t in AccountType]}"
+        ) from ex
+    transaction_type = document.get("transaction_type")
+    if transaction_type not in TRANSACTION_TYPES:
+        raise ValueError(f"transaction_type must be one of: {list(TRANSACTION_TYPES)}")
+    if "amount" not in document:
+        raise ValueError("amount is required")
+    return PostingDTO(
+        line=line,
+        account_number=account_number,
+        account_type=account_type,
+        transaction_type=transaction_type,
+        amount=_parse_amount(document["amount"]),
+    )
+
+
+def parse_postings(
+    documents: list[Any],
+) -> tuple[list[PostingDTO], list[PostingResultDTO]]:
+    """
+    Validate every line of a bulk request in a single pass, lines numbered
+    from 1. Plain checks rather than a DRF serializer per line, whose field
+    machinery would cost more than applying the posting itself.
+    :return: The valid postings and an INVALID result for every other line.
+    """
+    postings = []
+    invalid = []
+    for line, document in enumerate(documents, start=1):
+        try:
+            postings.append(_parse_posting(line, document))
+        except ValueError as ex:
+            invalid.append(PostingResultDTO(line=line, status=INVALID, detail=str(ex)))
+    return postings, invalid
+
+
+class PostingResultSerializer(serializers.Serializer[PostingResultDTO]):
+    line = serializers.IntegerField()
+    status = serializers.CharField()
+    account_number = serializers.UUIDField(allow_null=True)
+    balance = serializers.DecimalField(max_digits=19, decimal_places=2, allow_null=True)
+    detail = serializers.CharField(allow_null=True)
+
+    def to_representation(self, instance: PostingResultDTO) -> dict[str, Any]:
+        data: dict[str, Any] = {"line": instance.line, "status": instance.status}
+        if instance.account_number is not None:
+            data["account_number"] = str(instance.account_number)
+        if instance.balance is not None:
+            data["balance"] = str(instance.balance)
+        if instance.detail is not None:
+            data["detail"] = instance.detail
+        return data
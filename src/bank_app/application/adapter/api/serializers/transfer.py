@@ -0,0 +1,45 @@
+from decimal import Decimal
+from typing import Any
+
+import attr
+from rest_framework import serializers
+
+from bank_app.application.domain.dtos.transfer import TransferDTO
+from bank_app.application.util.util import AccountType
+
+ACCOUNT_TYPE_CHOICES = [(acc_type.value, acc_type.name) for acc_type in AccountType]
+
+
+class TransferSerializer(serializers.Serializer[Any]):
+    source_account_id = serializers.UUIDField()
+    source_type = serializers.ChoiceField(
+        choices=ACCOUNT_TYPE_CHOICES, default=AccountType.CURRENT_ACCOUNT.value
+    )
+    target_account_id = serializers.UUIDField()
+    target_type = serializers.ChoiceField(
+        choices=ACCOUNT_TYPE_CHOICES, default=AccountType.CURRENT_ACCOUNT.value
+    )
+    amount = serializers.DecimalField(
+        max_digits=19, decimal_places=2, min_value=Decimal("0.00")
+    )
+
+    def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
+        if attrs["amount"] <= 0:
+            raise serializers.ValidationError("negative or null amount is not allow")
+        if attrs["source_account_id"] == attrs["target_account_id"]:
+            raise serializers.ValidationError("cannot transfer to the same account")
+        attrs["source_type"] = AccountType(attrs["source_type"])
+        attrs["target_type"] = AccountType(attrs["target_type"])
+        validated: dict[str, Any] = super().validate(attrs)
+        return validated
+
+
+class TransferResultSerializer(serializers.Serializer[TransferDTO]):
+    source_account_id = serializers.UUIDField()
+    source_balance = serializers.DecimalField(max_digits=19, decimal_places=2)
+    target_account_id = serializers.UUIDField()
+    target_balance = serializers.DecimalField(max_digits=19, decimal_places=2)
+    amount = serializers.DecimalField(max_digits=19, decimal_places=2)
+
+    def to_representation(self, instance: TransferDTO) -> dict[str, str]:
+        return {k: str(v) for k, v in attr.asdict(instance).items()}
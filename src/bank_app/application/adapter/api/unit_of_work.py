@@ -0,0 +1,28 @@
+import functools
+from collections.abc import Callable
+from typing import Any
+
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from bank_app.application.util.retry import retry_on_conflict
+from exalt_hexarch.containers import Container
+
+
+def in_unit_of_work(view_method: Callable[..., Response]) -> Callable[..., Response]:
+    """
+    Run a view method in a unit of work of its own, taken from the
+    container: accounts are loaded once per request and the saves are
+    written together after the view has answered. A save losing its
+    compare-and-swap at that point runs the whole view again: this is the
+    only place conflicts are retried, the use cases let them through since
+    their saves are only written here.
+    """
+
+    @functools.wraps(view_method)
+    @retry_on_conflict()
+    def wrapper(self: Any, request: Request, *args: Any, **kwargs: Any) -> Response:
+        with Container.unit_of_work():
+            return view_method(self, request, *args, **kwargs)
+
+    return wrapper
@@ -1,13 +1,17 @@
 from dependency_injector.wiring import Provide, inject
+from django.http import StreamingHttpResponse
 from rest_framework import status
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from bank_app.application.adapter.api.serializers.account_statement import (
+    AccountBalanceResultSerializer,
+    AccountBalanceSerializer,
     AccountStatementResultSerializer,
     AccountStatementSerializer,
 )
+from bank_app.application.adapter.api.unit_of_work import in_unit_of_work
 from bank_app.application.service.account_statement import (
     AccountStatementService as AccountStatementUseCase,
 )
@@ -16,13 +20,14 @@ from exalt_hexarch.containers import Container
 
 class BankAccountStatementView(APIView):
     @inject
+    @in_unit_of_work
     def post(
         self,
         request: Request,
         account_statement_service: AccountStatementUseCase = Provide[
             Container.account_statement_service
         ],
-    ) -> Response:
+    ) -> StreamingHttpResponse:
         serializer = AccountStatementSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         account_id = serializer.validated_data["account_id"]
@@ -32,8 +37,34 @@ class BankAccountStatementView(APIView):
             account_id=account_id,
             type_account=type_account,
             period_end=period_end,
+            month=serializer.validated_data.get("month"),
+        )
+        # the transactions are read from the database as the body is sent
+        return StreamingHttpResponse(
+            AccountStatementResultSerializer(result).iter_json(),
+            status=status.HTTP_200_OK,
+            content_type="application/json",
+        )
+
+
+class AccountBalanceAtView(APIView):
+    @inject
+    @in_unit_of_work
+    def get(
+        self,
+        request: Request,
+        account_statement_service: AccountStatementUseCase = Provide[
+            Container.account_statement_service
+        ],
+    ) -> Response:
+        serializer = AccountBalanceSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        result = account_statement_service.get_balance_at(
+            account_id=serializer.validated_data["account_id"],
+            timestamp=serializer.validated_data["timestamp"],
+            type_account=serializer.validated_data["type_account"],
         )
         return Response(
-            data=AccountStatementResultSerializer(result).data,
+            data=AccountBalanceResultSerializer(result).data,
             status=status.HTTP_200_OK,
         )
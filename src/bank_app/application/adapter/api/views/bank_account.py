@@ -11,6 +11,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.viewsets import GenericViewSet
 
+from bank_app.application.adapter.api.idempotency import idempotent
 from bank_app.application.adapter.api.serializers.bank_account import (
     BankAccountCreateSerializer,
     BankAccountDetailSerializer,
@@ -23,12 +24,12 @@ from bank_app.application.adapter.persistence.entity.bank_account_entity import
 from bank_app.application.ports.api.bank_account_use_case import (
     BankAccount as BankAccountUseCase,
 )
-from bank_app.signals import transaction_occurred
 from exalt_hexarch.containers import Container
 
 
 class BankAccountDepositView(APIView):
     @inject
+    @idempotent
     def post(
         self,
         request: Request,
@@ -44,18 +45,12 @@ class BankAccountDepositView(APIView):
             account_number=account_number, amount=amount
         )
         data = BankAccountResultSerializer(result).data
-        transaction_occurred.send(
-            sender=self.__class__,
-            operation_type="DEPOSIT",
-            account_id=data.get("entity_id"),
-            account_type="CURRENT_ACCOUNT",
-            amount=amount,
-        )
         return Response(data, status=status.HTTP_200_OK)
 
 
 class BankAccountRedrawView(APIView):
     @inject
+    @idempotent
     def post(
         self,
         request: Request,
@@ -71,13 +66,6 @@ class BankAccountRedrawView(APIView):
             account_number=account_number, amount=amount
         )
         data = BankAccountResultSerializer(result).data
-        transaction_occurred.send(
-            sender=self.__class__,
-            operation_type="WITHDRAWAL",
-            account_id=data.get("entity_id"),
-            account_type="CURRENT_ACCOUNT",
-            amount=amount,
-        )
         return Response(data, status=status.HTTP_200_OK)
 
 
@@ -4,19 +4,21 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from bank_app.application.adapter.api.idempotency import idempotent
 from bank_app.application.adapter.api.serializers.bank_account import (
     BankAccountResultSerializer,
     BankAccountSerializer,
 )
+from bank_app.application.adapter.api.unit_of_work import in_unit_of_work
 from bank_app.application.service.bank_acount_overdraft import (
     BankAccountOverdraftService as BankAccountOverdraftUseCase,
 )
-from bank_app.signals import transaction_occurred
 from exalt_hexarch.containers import Container
 
 
 class BankAccountOverdraftRedrawView(APIView):
     @inject
+    @idempotent
     def post(
         self,
         request: Request,
@@ -32,18 +34,12 @@ class BankAccountOverdraftRedrawView(APIView):
             account_number=account_number, amount=amount
         )
         data = BankAccountResultSerializer(result).data
-        transaction_occurred.send(
-            sender=self.__class__,
-            operation_type="WITHDRAWAL",
-            account_id=data.get("entity_id"),
-            account_type="CURRENT_ACCOUNT",
-            amount=amount,
-        )
         return Response(data, status=status.HTTP_200_OK)
 
 
 class BankAccountOverdraftSetAmountView(APIView):
     @inject
+    @in_unit_of_work
     def post(
         self,
         request: Request,
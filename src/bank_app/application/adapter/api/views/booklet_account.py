@@ -10,24 +10,26 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.viewsets import GenericViewSet
 
+from bank_app.application.adapter.api.idempotency import idempotent
 from bank_app.application.adapter.api.serializers.booklet_account import (
     BookletAccountCreateSerializer,
     BookletAccountResultSerializer,
     BookletAccountSerializer,
     BookletDetailSerializer,
 )
+from bank_app.application.adapter.api.unit_of_work import in_unit_of_work
 from bank_app.application.adapter.persistence.entity.booklet_account_entity import (
     BookletAccountEntity,
 )
 from bank_app.application.service.booklet_account import (
     BookletAccountService as BookletAccountUseCase,
 )
-from bank_app.signals import transaction_occurred
 from exalt_hexarch.containers import Container
 
 
 class BookletDepositView(APIView):
     @inject
+    @idempotent
     def post(
         self,
         request: Request,
@@ -43,18 +45,12 @@ class BookletDepositView(APIView):
             account_number=account_number, amount=amount
         )
         data = BookletAccountResultSerializer(result).data
-        transaction_occurred.send(
-            sender=self.__class__,
-            operation_type="DEPOSIT",
-            account_id=data.get("entity_id"),
-            account_type="BOOKLET_ACCOUNT",
-            amount=amount,
-        )
         return Response(data, status=status.HTTP_200_OK)
 
 
 class BookletRedrawView(APIView):
     @inject
+    @idempotent
     def post(
         self,
         request: Request,
@@ -70,18 +66,12 @@ class BookletRedrawView(APIView):
             account_number=account_number, amount=amount
         )
         data = BookletAccountResultSerializer(result).data
-        transaction_occurred.send(
-            sender=self.__class__,
-            operation_type="WITHDRAWAL",
-            account_id=data.get("entity_id"),
-            account_type="BOOKLET_ACCOUNT",
-            amount=amount,
-        )
         return Response(data, status=status.HTTP_200_OK)
 
 
 class BookletSetDepositLimitView(APIView):
     @inject
+    @in_unit_of_work
     def post(
         self,
         request: Request,
@@ -0,0 +1,99 @@
+from dependency_injector.wiring import Provide, inject
+from django.conf import settings
+from rest_framework import status
+from rest_framework.parsers import JSONParser
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from bank_app.application.adapter.api.exceptions_handler import problem_response
+from bank_app.application.adapter.api.idempotency import idempotent
+from bank_app.application.adapter.api.parsers import NDJSONParser
+from bank_app.application.adapter.api.serializers.posting import (
+    ATOMIC,
+    BulkPostingModeSerializer,
+    PostingResultSerializer,
+    parse_postings,
+)
+from bank_app.application.domain.dtos.posting import (
+    APPLIED,
+    SKIPPED,
+    PostingResultDTO,
+)
+from bank_app.application.service.bulk_posting import (
+    BulkPostingService as BulkPostingUseCase,
+)
+from exalt_hexarch.containers import Container
+
+
+class BulkPostingView(APIView):
+    """
+    Deposits and withdrawals on many accounts in one request, sent as a JSON
+    array or as NDJSON (``Content-Type: application/x-ndjson``). Every line
+    gets a result. ``?mode=atomic`` (default) applies all lines or none and
+    answers 422 if any is invalid or refused, ``?mode=best_effort`` applies
+    the valid lines and reports the others. More than ``max_lines``
+    postings answer 413, NDJSON bodies as soon as the parser reads one line
+    too many.
+    """
+
+    parser_classes = [JSONParser, NDJSONParser]
+
+    @property
+    def max_lines(self) -> int:
+        return int(getattr(settings, "BULK_POSTINGS", {}).get("MAX_LINES", 10_000))
+
+    @inject
+    @idempotent
+    def post(
+        self,
+        request: Request,
+        bulk_posting_service: BulkPostingUseCase = Provide[
+            Container.bulk_posting_service
+        ],
+    ) -> Response:
+        mode_serializer = BulkPostingModeSerializer(data=request.query_params)
+        mode_serializer.is_valid(raise_exception=True)
+        atomic = mode_serializer.validated_data["mode"] == ATOMIC
+
+        documents = request.data
+        if not isinstance(documents, list):
+            return problem_response(
+                "expected a JSON array or NDJSON lines of postings",
+                status.HTTP_400_BAD_REQUEST,
+            )
+        if len(documents) > self.max_lines:
+            return problem_response(
+                f"at most {self.max_lines} postings per request",
+                status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            )
+
+        postings, invalid = parse_postings(documents)
+        if atomic and invalid:
+            results = invalid + [
+                PostingResultDTO(
+                    line=posting.line,
+                    status=SKIPPED,
+                    account_number=posting.account_number,
+                )
+                for posting in postings
+            ]
+        else:
+            results = invalid + bulk_posting_service.post_bulk(
+                postings=postings, atomic=atomic
+            )
+        results.sort(key=lambda result: result.line)
+
+        applied = sum(1 for result in results if result.status == APPLIED)
+        failed = atomic and applied < len(results)
+        return Response(
+            {
+                "mode": mode_serializer.validated_data["mode"],
+                "applied": applied,
+                "not_applied": len(results) - applied,
+                "results": PostingResultSerializer(results, many=True).data,
+            },
+            status=(
+                status.HTTP_422_UNPROCESSABLE_ENTITY if failed else status.HTTP_200_OK
+            ),
+        )
@@ -0,0 +1,37 @@
+from dependency_injector.wiring import Provide, inject
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from bank_app.application.adapter.api.idempotency import idempotent
+from bank_app.application.adapter.api.serializers.transfer import (
+    TransferResultSerializer,
+    TransferSerializer,
+)
+from bank_app.application.service.transfer import (
+    TransferService as TransferUseCase,
+)
+from exalt_hexarch.containers import Container
+
+
+class TransferView(APIView):
+    @inject
+    @idempotent
+    def post(
+        self,
+        request: Request,
+        transfer_service: TransferUseCase = Provide[Container.transfer_service],
+    ) -> Response:
+        serializer = TransferSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        result = transfer_service.transfer(
+            source_account_id=serializer.validated_data["source_account_id"],
+            target_account_id=serializer.validated_data["target_account_id"],
+            amount=serializer.validated_data["amount"],
+            source_type=serializer.validated_data["source_type"],
+            target_type=serializer.validated_data["target_type"],
+        )
+        return Response(
+            TransferResultSerializer(result).data, status=status.HTTP_200_OK
+        )
@@ -0,0 +1,200 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from typing import Any, Optional, TypeVar, cast
+from uuid import UUID
+
+from django.conf import settings
+from django.db import models, transaction
+
+from bank_app.application.domain.exceptions import NotFound
+
+ModelT = TypeVar("ModelT", bound=models.Model)
+
+
+class AccountCache:
+    """
+    In-process LRU of the columns of accounts that hardly ever change
+    (identity, overdraft settings, deposit limit, active flag), reachable by
+    entity_id and by account_number. Entries expire after ``ttl`` seconds,
+    which bounds how long a change made by another process goes unseen;
+    changes made here are invalidated by the repositories as they write.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10_000,
+        ttl: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[UUID, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._by_account_number: dict[UUID, UUID] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(
+        self, entity_id: Optional[UUID] = None, account_number: Optional[UUID] = None
+    ) -> Optional[dict[str, Any]]:
+        with self._lock:
+            if entity_id is None and account_number is not None:
+                entity_id = self._by_account_number.get(account_number)
+            entry = self._entries.get(entity_id) if entity_id is not None else None
+            if entity_id is None or entry is None:
+                self.misses += 1
+                return None
+            if entry[0] <= self._clock():
+                self._remove(entity_id)
+                self.evictions += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(entity_id)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, fields: dict[str, Any]) -> None:
+        entity_id = fields["entity_id"]
+        with self._lock:
+            self._remove(entity_id)
+            self._entries[entity_id] = (self._clock() + self.ttl, fields)
+            self._by_account_number[fields["account_number"]] = entity_id
+            while len(self._entries) > self.max_size:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(
+        self, entity_id: Optional[UUID] = None, account_number: Optional[UUID] = None
+    ) -> None:
+        with self._lock:
+            if entity_id is None and account_number is not None:
+                entity_id = self._by_account_number.get(account_number)
+            if entity_id is not None and self._remove(entity_id):
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_account_number.clear()
+
+    def stats(self) -> dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+    def _remove(self, entity_id: UUID) -> bool:
+        entry = self._entries.pop(entity_id, None)
+        if entry is None:
+            return False
+        self._by_account_number.pop(entry[1]["account_number"], None)
+        return True
+
+
+_caches: dict[str, AccountCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_account_cache(name: str) -> Optional[AccountCache]:
+    """
+    The process wide cache of one kind of account.
+    :return: None unless ``ACCOUNT_CACHE["ENABLED"]`` is set.
+    """
+    options = getattr(settings, "ACCOUNT_CACHE", {})
+    if not options.get("ENABLED", False):
+        return None
+    with _caches_lock:
+        cache = _caches.get(name)
+        if cache is None:
+            cache = _caches[name] = AccountCache(
+                max_size=options.get("MAX_SIZE", 10_000),
+                ttl=options.get("TTL_SECONDS", 30),
+            )
+        return cache
+
+
+def invalidate_account(
+    cache: AccountCache,
+    entity_id: Optional[UUID] = None,
+    account_number: Optional[UUID] = None,
+) -> None:
+    """
+    Forget an account about to be written, and again once the write has
+    committed, so a read racing with the transaction cannot put the old
+    columns back for good.
+    """
+    cache.invalidate(entity_id=entity_id, account_number=account_number)
+    transaction.on_commit(
+        lambda: cache.invalidate(entity_id=entity_id, account_number=account_number)
+    )
+
+
+def load_account(
+    cache: Optional[AccountCache],
+    model: type[ModelT],
+    cached_fields: Sequence[str],
+    not_found: str,
+    **lookup: UUID,
+) -> ModelT:
+    """
+    Read one account by ``entity_id`` or ``account_number``. On a cache hit
+    only the columns outside ``cached_fields`` (balance, version, ...) are
+    read from the database, otherwise the whole row is and the cache filled.
+    :raise NotFound: with the ``not_found`` message.
+    """
+    manager = model._default_manager
+    cached = cache.get(**lookup) if cache is not None else None
+    if cached is not None:
+        names = [field.attname for field in model._meta.concrete_fields]
+        row = (
+            manager.filter(entity_id=cached["entity_id"])
+            .values(*(name for name in names if name not in cached_fields))
+            .first()
+        )
+        if row is not None:
+            row.update(cached)
+            return model.from_db(manager.db, names, [row[name] for name in names])
+        cache.invalidate(entity_id=cached["entity_id"])  # type: ignore[union-attr]
+    try:
+        entity = manager.get(**lookup)
+    except model.DoesNotExist as ex:  # type: ignore[attr-defined]
+        raise NotFound(not_found) from ex
+    if cache is not None:
+        cache.put({field: getattr(entity, field) for field in cached_fields})
+    return entity
+
+
+def account_number_of(
+    cache: Optional[AccountCache],
+    model: type[models.Model],
+    cached_fields: Sequence[str],
+    entity_id: UUID,
+) -> Optional[UUID]:
+    """The account number of an account, None when there is no such account"""
+    if cache is None:
+        return (
+            model._default_manager.filter(entity_id=entity_id)
+            .values_list("account_number", flat=True)
+            .first()
+        )
+    cached = cache.get(entity_id=entity_id)
+    if cached is None:
+        cached = (
+            model._default_manager.filter(entity_id=entity_id)
+            .values(*cached_fields)
+            .first()
+        )
+        if cached is None:
+            return None
+        cache.put(cached)
+    return cast("UUID", cached["account_number"])
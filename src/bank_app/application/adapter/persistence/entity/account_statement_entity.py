@@ -23,9 +23,23 @@ class TransactionEntity(models.Model):
     transaction_type = models.CharField(max_length=25, choices=TRANSACTION_TYPES)
     amount = models.DecimalField(max_digits=19, decimal_places=2)
     transaction_date = models.DateTimeField(auto_now=True)
+    sequence = models.PositiveBigIntegerField(null=True)
+    balance_after = models.DecimalField(max_digits=19, decimal_places=2, null=True)
 
     class Meta:
         db_table = "transaction"
+        indexes = [
+            models.Index(
+                fields=["account_id", "-transaction_date"],
+                name="transaction_account_date_idx",
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["account_id", "sequence"],
+                name="transaction_account_sequence_uniq",
+            ),
+        ]
 
     def __str__(self):
         return f"TransactionEntity Number {self.entity_id}"
@@ -41,10 +55,24 @@ class MonthlyStatementEntity(models.Model):
     generated_at = models.DateTimeField(auto_now=True)
     opening_balance = models.DecimalField(max_digits=19, decimal_places=2)
     closing_balance = models.DecimalField(max_digits=19, decimal_places=2)
-    transactions = models.ManyToManyField(TransactionEntity)
+    # the period had ended when the statement was generated
+    is_closed = models.BooleanField(default=False)
+    # its transactions are those of the account dated from period_start to
+    # this, read by a range scan of transaction_account_date_idx
+    transactions_until = models.DateTimeField()
 
     class Meta:
         db_table = "monthlystatement"
+        indexes = [
+            models.Index(
+                fields=["account_number", "-period_end"],
+                name="statement_account_period_idx",
+            ),
+            models.Index(
+                fields=["account_id", "period_start", "period_end"],
+                name="statement_period_key_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"MonthlyStatementEntity Number {self.entity_id}"
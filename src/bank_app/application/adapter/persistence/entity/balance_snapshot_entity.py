@@ -0,0 +1,25 @@
+from django.db import models
+
+
+class DailyBalanceSnapshotEntity(models.Model):
+    """Balance of an account at the end of a UTC day, see DailyBalanceSnapshot"""
+
+    account_id = models.UUIDField()
+    account_type = models.CharField(max_length=25)
+    date = models.DateField()
+    closing_balance = models.DecimalField(max_digits=19, decimal_places=2)
+    deposit_total = models.DecimalField(max_digits=19, decimal_places=2)
+    withdrawal_total = models.DecimalField(max_digits=19, decimal_places=2)
+    transaction_count = models.PositiveIntegerField()
+
+    class Meta:
+        db_table = "daily_balance_snapshot"
+        constraints = [
+            # also the index of the range reads of an account
+            models.UniqueConstraint(
+                fields=["account_id", "date"], name="snapshot_account_date_uniq"
+            ),
+        ]
+
+    def __str__(self):
+        return f"Balance snapshot of {self.account_id} on {self.date}"
@@ -5,16 +5,57 @@ from django.db import models
 
 class BankAccountEntity(models.Model):
     entity_id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
-    account_number = models.UUIDField(default=uuid4)
+    account_number = models.UUIDField(default=uuid4, unique=True)
     balance = models.DecimalField(max_digits=19, decimal_places=2)
     overdraft_amount = models.DecimalField(max_digits=19, decimal_places=2)
     is_allow_overdraft = models.BooleanField(default=True)
     is_active = models.BooleanField(default=True)
+    ledger_sequence = models.PositiveBigIntegerField(default=0)
+    version = models.PositiveBigIntegerField(default=0)
+    # > 0: deposits land on that many BalanceStripeEntity rows, the balance
+    # is this column plus the stripes. What is posted meanwhile has neither
+    # sequence nor balance_after in the ledger
+    balance_stripes = models.PositiveSmallIntegerField(default=0)
     created_at = models.DateTimeField(auto_now=True)
     updated_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         db_table = "bank_account"
+        indexes = [
+            models.Index(
+                fields=["entity_id"],
+                condition=models.Q(is_active=True),
+                name="bank_account_active_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"Bank Account Number {self.account_number}"
+
+
+class BalanceStripeEntity(models.Model):
+    """
+    Sub-balance of a hot bank account. Deposits pick a stripe at random
+    instead of all updating the bank_account row; withdrawals and the
+    consolidation job fold the stripes back into it.
+    """
+
+    account = models.ForeignKey(
+        BankAccountEntity, on_delete=models.CASCADE, related_name="stripes"
+    )
+    account_number = models.UUIDField()
+    stripe = models.PositiveSmallIntegerField()
+    stripe_count = models.PositiveSmallIntegerField()
+    balance = models.DecimalField(max_digits=19, decimal_places=2, default=0)
+
+    class Meta:
+        db_table = "bank_account_balance_stripe"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["account_number", "stripe"],
+                name="balance_stripe_account_stripe_uniq",
+            ),
+        ]
+
+    def __str__(self):
+        return f"Stripe {self.stripe} of bank account {self.account_number}"
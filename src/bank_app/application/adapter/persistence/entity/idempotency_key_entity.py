@@ -0,0 +1,29 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+
+class IdempotencyKeyEntity(models.Model):
+    """
+    Outcome of a request sent with an ``Idempotency-Key`` header, committed
+    with the postings of that request. A row without status_code stands for
+    a request that may still commit: it is never run again.
+    """
+
+    scope = models.CharField(max_length=100)
+    key = models.CharField(max_length=255)
+    fingerprint = models.CharField(max_length=64)
+    status_code = models.PositiveSmallIntegerField(null=True)
+    response_body = models.JSONField(null=True, encoder=DjangoJSONEncoder)
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        db_table = "idempotency_key"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["scope", "key"], name="idempotency_scope_key_uniq"
+            ),
+        ]
+
+    def __str__(self):
+        return f"Idempotency key {self.key} on {self.scope}"
@@ -0,0 +1,199 @@
+import atexit
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable
+from typing import Any, Generic, Optional, TypeVar, cast
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+
+from bank_app.application.domain.exceptions import InfrastructureException
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_STOP = object()
+
+
+class _Job(Generic[T]):
+    __slots__ = ("func", "done", "result", "error")
+
+    def __init__(self, func: Callable[[], T]) -> None:
+        self.func = func
+        self.done = threading.Event()
+        self.result: Optional[T] = None
+        self.error: Optional[BaseException] = None
+
+
+class GroupCommitter:
+    """
+    Runs postings submitted by concurrent request threads in shared
+    transactions, so they pay for one commit instead of one each.
+
+    A single worker waits for the first job, gathers what arrives in the
+    next ``window`` seconds (at most ``max_batch`` jobs), then runs them in
+    one transaction, each in its own savepoint: a job that raises is rolled
+    back alone and its caller gets the exception. Callers are released once
+    the transaction has committed, never before, and all of them get the
+    error if the commit itself fails. Whatever a job raises, even a
+    BaseException, is handed to its caller, which is always released.
+
+    Jobs run on the worker thread, without the caller's context variables:
+    a grouped posting sees no unit of work, so it neither reads the
+    request's identity map nor maps what it loads into it, and it commits
+    with its group whatever the request's unit of work does afterwards.
+    """
+
+    def __init__(
+        self,
+        window: float = 0.002,
+        max_batch: int = 64,
+        max_queue_size: int = 10_000,
+        put_timeout: float = 1.0,
+    ) -> None:
+        self.window = window
+        self.max_batch = max_batch
+        self.put_timeout = put_timeout
+        self._queue: queue.Queue[object] = queue.Queue(maxsize=max_queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.committed_jobs = 0
+        self.failed_jobs = 0
+        self.batches = 0
+        self.max_batch_seen = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        with self._lock:
+            if self.is_running:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="group-commit", daemon=True
+            )
+            self._thread.start()
+
+    def submit(self, func: Callable[[], T]) -> T:
+        """Run ``func`` in the next group transaction and wait for the commit"""
+        job = _Job(func)
+        try:
+            self._queue.put(job, timeout=self.put_timeout)
+        except queue.Full as ex:
+            raise InfrastructureException("Group commit queue is full") from ex
+        job.done.wait()
+        if job.error is not None:
+            raise job.error
+        return cast("T", job.result)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Run what is still queued, then stop the worker"""
+        with self._lock:
+            thread = self._thread
+            if thread is None or not thread.is_alive():
+                return
+            self._queue.put(_STOP)
+            thread.join(timeout)
+            self._thread = None
+
+    def stats(self) -> dict[str, float]:
+        return {
+            "queue_depth": self._queue.qsize(),
+            "committed_jobs": self.committed_jobs,
+            "failed_jobs": self.failed_jobs,
+            "batches": self.batches,
+            "avg_batch": self.committed_jobs / self.batches if self.batches else 0.0,
+            "max_batch": self.max_batch_seen,
+        }
+
+    def _run(self) -> None:
+        try:
+            stopping = False
+            while not stopping:
+                items = [self._queue.get()]
+                deadline = time.monotonic() + self.window
+                while len(items) < self.max_batch and items[-1] is not _STOP:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        items.append(self._queue.get(timeout=remaining))
+                    except queue.Empty:
+                        break
+                stopping = items[-1] is _STOP
+                self._commit([item for item in items if isinstance(item, _Job)])
+        finally:
+            connection.close()
+
+    def _commit(self, batch: list[_Job[Any]]) -> None:
+        if not batch:
+            return
+        try:
+            close_old_connections()
+            with transaction.atomic():
+                for job in batch:
+                    try:
+                        with transaction.atomic():
+                            job.result = job.func()
+                    except BaseException as ex:  # noqa: BLE001 raised to the caller
+                        job.error = ex
+        except BaseException as ex:
+            logger.exception("Group commit of %s postings failed", len(batch))
+            for job in batch:
+                if job.error is None:
+                    job.result, job.error = None, ex
+        finally:
+            self._release(batch)
+
+    def _release(self, batch: list[_Job[Any]]) -> None:
+        self.batches += 1
+        self.max_batch_seen = max(self.max_batch_seen, len(batch))
+        for job in batch:
+            if job.error is None:
+                self.committed_jobs += 1
+            else:
+                self.failed_jobs += 1
+            job.done.set()
+
+
+_committer: Optional[GroupCommitter] = None
+_committer_lock = threading.Lock()
+
+
+def get_group_committer() -> Optional[GroupCommitter]:
+    """
+    The process wide committer, started on first use.
+    :return: None unless ``GROUP_COMMIT["ENABLED"]`` is set.
+    """
+    global _committer
+    options = getattr(settings, "GROUP_COMMIT", {})
+    if not options.get("ENABLED", False):
+        return None
+    with _committer_lock:
+        if _committer is None:
+            _committer = GroupCommitter(
+                window=options.get("WINDOW_MS", 2) / 1000,
+                max_batch=options.get("MAX_BATCH", 64),
+                max_queue_size=options.get("QUEUE_SIZE", 10_000),
+                put_timeout=options.get("PUT_TIMEOUT_MS", 1000) / 1000,
+            )
+            atexit.register(_committer.stop)
+        _committer.start()
+        return _committer
+
+
+def run_grouped(func: Callable[[], T]) -> T:
+    """
+    Run a posting through the group committer when it is enabled. Inside a
+    transaction already (a transfer, a bulk request, a test) the posting
+    runs right here: handing it to the worker's connection would split that
+    transaction and could wait on its own locks.
+    """
+    committer = get_group_committer()
+    if committer is None or connection.in_atomic_block:
+        return func()
+    return committer.submit(func)
@@ -0,0 +1,46 @@
+"""
+Executors for batch commands. Nothing here imports models: a spawned
+worker loads this module to run its initializer before Django is set up.
+"""
+
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Any, Callable
+
+import django
+from django.db import connection, connections
+
+
+class InlineExecutor(Executor):
+    """Runs each call when it is submitted, in this process"""
+
+    def submit(
+        self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any
+    ) -> Future[Any]:
+        future: Future[Any] = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as ex:  # noqa: BLE001 raised by result()
+            future.set_exception(ex)
+        return future
+
+
+def _start_worker(database_name: Any) -> None:
+    django.setup()
+    connections["default"].settings_dict["NAME"] = database_name
+
+
+def worker_pool(workers: int) -> Executor:
+    """
+    ``workers`` processes, spawned rather than forked so none inherits the
+    connection of this one: each opens its own, to the database this
+    process uses. A single worker is this process.
+    """
+    if workers == 1:
+        return InlineExecutor()
+    return ProcessPoolExecutor(
+        workers,
+        mp_context=get_context("spawn"),
+        initializer=_start_worker,
+        initargs=(connection.settings_dict["NAME"],),
+    )
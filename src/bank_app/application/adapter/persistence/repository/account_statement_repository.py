@@ -1,19 +1,28 @@
-from typing import Any
+import datetime as dt
+from collections.abc import Sequence
+from typing import Any, Optional
 from uuid import UUID
 
-from django.db import transaction
-
 from bank_app.application.adapter.persistence.entity.account_statement_entity import (
     MonthlyStatementEntity,
-    TransactionEntity,
 )
-from bank_app.application.domain.domain_models import Entity, EntityIdentity
+from bank_app.application.adapter.persistence.repository.transaction_repository import (
+    TransactionRepository,
+)
+from bank_app.application.adapter.persistence.unit_of_work import (
+    current_unit_of_work,
+)
+from bank_app.application.domain.domain_models import (
+    AccountIdentity,
+    Entity,
+    EntityIdentity,
+)
 from bank_app.application.domain.exceptions import NotFound
 from bank_app.application.domain.model.account_statement import (
     MonthlyStatement,
     MonthlyStatementIdentity,
-    Transaction,
 )
+from bank_app.application.domain.model.transaction_stream import TransactionStream
 from bank_app.application.ports.repositories.i_account_statement import (
     IAccountStatementRepository,
 )
@@ -32,24 +41,30 @@ class AccountStatementRepository(IAccountStatementRepository):
     @classmethod
     def _get_transactions_for_statement(
         cls, statement_entity: MonthlyStatementEntity
-    ) -> list[Transaction]:
-        transaction_entities = statement_entity.transactions.all()
-        transactions = []
-        for trans_entity in transaction_entities:
-            transaction = Transaction(
-                entity_id=trans_entity.entity_id,
-                account_id=trans_entity.account_id,
-                account_type=trans_entity.account_type,
-                transaction_type=trans_entity.transaction_type,
-                amount=trans_entity.amount,
-                transaction_date=trans_entity.transaction_date,
-            )
-            transactions.append(transaction)
-        return transactions
+    ) -> TransactionStream:
+        """
+        The transactions of the statement, resolved from its bounds by a
+        range scan of the ledger each time they are iterated
+        """
+        return TransactionRepository.stream_by_account_id_and_date_range(
+            AccountIdentity(statement_entity.account_id),
+            statement_entity.period_start,
+            statement_entity.transactions_until,
+        )
+
+    @classmethod
+    def _transactions_until(cls, domain: MonthlyStatement) -> dt.datetime:
+        """
+        Upper bound of the transactions of the statement: the whole period
+        once closed, otherwise what was posted by now, since postings are
+        dated when written
+        """
+        if domain.is_closed:
+            return domain.period_end
+        return min(domain.period_end, dt.datetime.now(domain.period_end.tzinfo))
 
     @classmethod
     def _to_domain(cls, entity: MonthlyStatementEntity) -> MonthlyStatement:
-        transactions = cls._get_transactions_for_statement(entity)
         return MonthlyStatement(
             entity_id=MonthlyStatementIdentity(entity.entity_id),
             account_id=entity.account_id,
@@ -60,7 +75,8 @@ class AccountStatementRepository(IAccountStatementRepository):
             generated_at=entity.generated_at,
             opening_balance=entity.opening_balance,
             closing_balance=entity.closing_balance,
-            transactions=transactions,
+            transactions=cls._get_transactions_for_statement(entity),
+            is_closed=entity.is_closed,
         )
 
     @classmethod
@@ -74,37 +90,41 @@ class AccountStatementRepository(IAccountStatementRepository):
             entity.period_end = domain.period_end
             entity.opening_balance = domain.opening_balance
             entity.closing_balance = domain.closing_balance
+            entity.is_closed = domain.is_closed
+            entity.transactions_until = cls._transactions_until(domain)
             return entity
         except MonthlyStatementEntity.DoesNotExist:
-            return MonthlyStatementEntity(
-                entity_id=domain.entity_id.uuid,
-                account_id=domain.account_id,
-                account_type=domain.account_type,
-                account_number=domain.account_number,
-                period_start=domain.period_start,
-                period_end=domain.period_end,
-                opening_balance=domain.opening_balance,
-                closing_balance=domain.closing_balance,
-            )
+            return cls._new_entity(domain)
 
     @classmethod
-    def _link_transactions_to_statement(
-        cls, statement_entity: MonthlyStatementEntity, transactions: list[Transaction]
-    ) -> None:
-        transaction_uuids = [t.entity_id.uuid for t in transactions]
-        transaction_entities = TransactionEntity.objects.filter(
-            entity_id__in=transaction_uuids
+    def _new_entity(cls, domain: MonthlyStatement) -> MonthlyStatementEntity:
+        return MonthlyStatementEntity(
+            entity_id=domain.entity_id.uuid,
+            account_id=domain.account_id,
+            account_type=domain.account_type,
+            account_number=domain.account_number,
+            period_start=domain.period_start,
+            period_end=domain.period_end,
+            opening_balance=domain.opening_balance,
+            closing_balance=domain.closing_balance,
+            is_closed=domain.is_closed,
+            transactions_until=cls._transactions_until(domain),
         )
-        statement_entity.transactions.clear()
-        statement_entity.transactions.add(*transaction_entities)
 
     @classmethod
     def get(cls, entity_id: EntityIdentity) -> MonthlyStatement:
         if not isinstance(entity_id, MonthlyStatementIdentity):
             raise ValueError("entity_id must be an MonthlyStatementIdentity")
 
-        statement_entity = cls._get_statement_by_id(entity_id)
-        return cls._to_domain(statement_entity)
+        unit_of_work = current_unit_of_work()
+        if unit_of_work is not None:
+            statement = unit_of_work.get(("monthly_statement", entity_id.uuid))
+            if statement is not None:
+                return statement  # type: ignore[return-value]
+        statement = cls._to_domain(cls._get_statement_by_id(entity_id))
+        if unit_of_work is not None:
+            unit_of_work.remember(statement, ("monthly_statement", entity_id.uuid))
+        return statement
 
     @classmethod
     def get_by_account_number(cls, account_number: UUID) -> list[MonthlyStatement]:
@@ -113,6 +133,51 @@ class AccountStatementRepository(IAccountStatementRepository):
         ).order_by("-period_end")
         return [cls._to_domain(entity) for entity in statement_entities]
 
+    @classmethod
+    def get_by_period(
+        cls,
+        account_id: UUID,
+        period_start: dt.datetime,
+        period_end: dt.datetime,
+    ) -> Optional[MonthlyStatement]:
+        entity = (
+            MonthlyStatementEntity.objects.filter(
+                account_id=account_id, period_start=period_start, period_end=period_end
+            )
+            .order_by("-generated_at")
+            .first()
+        )
+        if entity is None:
+            return None
+        statement = cls._to_domain(entity)
+        unit_of_work = current_unit_of_work()
+        if unit_of_work is not None:
+            # saved again once regenerated: an update, not a second row
+            unit_of_work.remember(statement, ("monthly_statement", entity.entity_id))
+        return statement
+
+    @classmethod
+    def get_previous(
+        cls, account_number: UUID, period_end: dt.datetime
+    ) -> Optional[MonthlyStatement]:
+        # the newest entries of statement_account_period_idx first
+        entity = (
+            MonthlyStatementEntity.objects.filter(
+                account_number=account_number,
+                period_end__lt=period_end,
+                is_closed=True,
+            )
+            .order_by("-period_end")
+            .first()
+        )
+        return cls._to_domain(entity) if entity is not None else None
+
+    @classmethod
+    def insert_many(cls, statements: Sequence[MonthlyStatement]) -> None:
+        MonthlyStatementEntity.objects.bulk_create(
+            [cls._new_entity(statement) for statement in statements]
+        )
+
     @classmethod
     def delete(cls, entity_id: EntityIdentity, **kwargs: Any) -> None:
         if not isinstance(entity_id, MonthlyStatementIdentity):
@@ -126,7 +191,22 @@ class AccountStatementRepository(IAccountStatementRepository):
         if not isinstance(entity, MonthlyStatement):
             raise ValueError("entity must be a MonthlyStatement")
 
-        statement_entity = cls._to_entity(entity)
-        with transaction.atomic():
-            statement_entity.save()
-            cls._link_transactions_to_statement(statement_entity, entity.transactions)
+        unit_of_work = current_unit_of_work()
+        if unit_of_work is not None:
+            unit_of_work.register_save(
+                ("monthly_statement", entity.entity_id.uuid),
+                entity,
+                cls._insert,
+                cls._write,
+            )
+            return
+        cls._write(entity)
+
+    @classmethod
+    def _insert(cls, entity: MonthlyStatement) -> None:
+        """A statement known to be new: no lookup"""
+        cls._new_entity(entity).save(force_insert=True)
+
+    @classmethod
+    def _write(cls, entity: MonthlyStatement) -> None:
+        cls._to_entity(entity).save()
@@ -0,0 +1,218 @@
+import datetime as dt
+from typing import Any, Optional, Union
+from uuid import UUID
+
+from django.db import models
+from django.db.models import (
+    Case,
+    Count,
+    DecimalField,
+    Exists,
+    OuterRef,
+    Subquery,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce
+
+from bank_app.application.adapter.persistence.entity.account_statement_entity import (
+    TransactionEntity,
+)
+from bank_app.application.adapter.persistence.entity.balance_snapshot_entity import (
+    DailyBalanceSnapshotEntity,
+)
+from bank_app.application.adapter.persistence.entity.bank_account_entity import (
+    BalanceStripeEntity,
+    BankAccountEntity,
+)
+from bank_app.application.adapter.persistence.entity.booklet_account_entity import (
+    BookletAccountEntity,
+)
+from bank_app.application.adapter.persistence.repository.transaction_repository import (
+    TransactionRepository,
+)
+from bank_app.application.domain.model.balance_snapshot import (
+    DailyBalanceSnapshot,
+    start_of_day,
+)
+from bank_app.application.domain.model.money import ZERO
+from bank_app.application.ports.repositories.i_balance_snapshot import (
+    IBalanceSnapshotRepository,
+)
+from bank_app.application.util.util import AccountType
+
+_AMOUNT = DecimalField(max_digits=19, decimal_places=2)
+
+
+class BalanceSnapshotRepository(IBalanceSnapshotRepository):
+    _ENTITIES: dict[
+        AccountType, Union[type[BankAccountEntity], type[BookletAccountEntity]]
+    ] = {
+        AccountType.CURRENT_ACCOUNT: BankAccountEntity,
+        AccountType.BOOKLET_ACCOUNT: BookletAccountEntity,
+    }
+    _BATCH_SIZE = 1000
+
+    @classmethod
+    def _to_domain(cls, entity: DailyBalanceSnapshotEntity) -> DailyBalanceSnapshot:
+        return DailyBalanceSnapshot(
+            account_id=entity.account_id,
+            account_type=entity.account_type,
+            date=entity.date,
+            closing_balance=entity.closing_balance,
+            deposit_total=entity.deposit_total,
+            withdrawal_total=entity.withdrawal_total,
+            transaction_count=entity.transaction_count,
+        )
+
+    @classmethod
+    def get_range(
+        cls, account_id: UUID, first: dt.date, last: dt.date
+    ) -> list[DailyBalanceSnapshot]:
+        return [
+            cls._to_domain(entity)
+            for entity in DailyBalanceSnapshotEntity.objects.filter(
+                account_id=account_id, date__gte=first, date__lte=last
+            ).order_by("date")
+        ]
+
+    @classmethod
+    def get_latest(
+        cls, account_id: UUID, before: dt.date
+    ) -> Optional[DailyBalanceSnapshot]:
+        entity = (
+            DailyBalanceSnapshotEntity.objects.filter(
+                account_id=account_id, date__lt=before
+            )
+            .order_by("-date")
+            .first()
+        )
+        return cls._to_domain(entity) if entity is not None else None
+
+    @classmethod
+    def take_snapshots(cls, day: dt.date) -> int:
+        written = 0
+        for account_type, model in cls._ENTITIES.items():
+            pending = []
+            for row in cls._day_of_accounts(model, day).iterator(
+                chunk_size=cls._BATCH_SIZE
+            ):
+                pending.append(cls._new_entity(account_type, day, row))
+                if len(pending) == cls._BATCH_SIZE:
+                    DailyBalanceSnapshotEntity.objects.bulk_create(pending)
+                    written += len(pending)
+                    pending = []
+            DailyBalanceSnapshotEntity.objects.bulk_create(pending)
+            written += len(pending)
+        return written
+
+    @classmethod
+    def _day_of_accounts(
+        cls,
+        model: Union[type[BankAccountEntity], type[BookletAccountEntity]],
+        day: dt.date,
+    ) -> "models.QuerySet[Any]":
+        """
+        One row per account of ``model`` without a snapshot of ``day``, with
+        what its snapshot is computed from: the closing balance of the day
+        before when it has one, the live balance and what was posted since
+        the day otherwise, and the postings of the day.
+        """
+        day_start, day_end = (
+            start_of_day(day),
+            start_of_day(day + dt.timedelta(days=1)),
+        )
+        postings = TransactionEntity.objects.filter(account_id=OuterRef("entity_id"))
+        of_day = postings.filter(
+            transaction_date__gte=day_start, transaction_date__lt=day_end
+        )
+
+        def total(rows: "models.QuerySet[Any]", aggregate: Any) -> Coalesce:
+            value = rows.values("account_id").annotate(total=aggregate).values("total")
+            return Coalesce(Subquery(value), Value(ZERO), output_field=_AMOUNT)
+
+        snapshots = DailyBalanceSnapshotEntity.objects.filter(
+            account_id=OuterRef("entity_id")
+        )
+        previous = snapshots.filter(date=day - dt.timedelta(days=1))
+        accounts = (
+            model.objects.exclude(Exists(snapshots.filter(date=day)))
+            .annotate(
+                previous_closing_balance=Subquery(
+                    previous.values("closing_balance")[:1]
+                ),
+                deposit_total=total(
+                    of_day.filter(transaction_type="DEPOSIT"), Sum("amount")
+                ),
+                withdrawal_total=total(
+                    of_day.filter(transaction_type="WITHDRAWAL"), Sum("amount")
+                ),
+                net_amount_of_day=total(
+                    of_day, Sum(TransactionRepository.signed_amount())
+                ),
+                # only read without a snapshot of the day before
+                net_amount_since=Case(
+                    When(Exists(previous), then=Value(ZERO)),
+                    default=total(
+                        postings.filter(transaction_date__gte=day_end),
+                        Sum(TransactionRepository.signed_amount()),
+                    ),
+                    output_field=_AMOUNT,
+                ),
+                transaction_count=Coalesce(
+                    Subquery(
+                        of_day.values("account_id")
+                        .annotate(count=Count("entity_id"))
+                        .values("count")
+                    ),
+                    0,
+                ),
+            )
+            .order_by()
+        )
+        if model is BankAccountEntity:
+            striped = (
+                BalanceStripeEntity.objects.filter(account_id=OuterRef("entity_id"))
+                .values("account_id")
+                .annotate(total=Sum("balance"))
+                .values("total")
+            )
+            # as BankAccountRepository._to_domain_with_stripes
+            accounts = accounts.annotate(
+                live_balance=Coalesce(
+                    Subquery(striped), Value(ZERO), output_field=_AMOUNT
+                )
+                + models.F("balance")
+            )
+        else:
+            accounts = accounts.annotate(live_balance=models.F("balance"))
+        return accounts.values(
+            "entity_id",
+            "live_balance",
+            "previous_closing_balance",
+            "deposit_total",
+            "withdrawal_total",
+            "net_amount_of_day",
+            "net_amount_since",
+            "transaction_count",
+        )
+
+    @classmethod
+    def _new_entity(
+        cls, account_type: AccountType, day: dt.date, row: dict[str, Any]
+    ) -> DailyBalanceSnapshotEntity:
+        if row["previous_closing_balance"] is not None:
+            closing_balance = row["previous_closing_balance"] + row["net_amount_of_day"]
+        else:
+            # replayed back from the live balance
+            closing_balance = row["live_balance"] - row["net_amount_since"]
+        return DailyBalanceSnapshotEntity(
+            account_id=row["entity_id"],
+            account_type=account_type.value,
+            date=day,
+            closing_balance=closing_balance,
+            deposit_total=row["deposit_total"],
+            withdrawal_total=row["withdrawal_total"],
+            transaction_count=row["transaction_count"],
+        )
@@ -1,16 +1,51 @@
+import random
+from collections.abc import Sequence
 from decimal import Decimal
-from typing import Any
+from typing import Any, Optional
 from uuid import UUID
 
+from django.db import transaction
+from django.db.models import Case, F, Sum, Value, When
+
+from bank_app.application.adapter.persistence.account_cache import (
+    AccountCache,
+    account_number_of,
+    get_account_cache,
+    invalidate_account,
+    load_account,
+)
+from bank_app.application.adapter.persistence.entity.account_statement_entity import (
+    TransactionEntity,
+)
 from bank_app.application.adapter.persistence.entity.bank_account_entity import (
+    BalanceStripeEntity,
     BankAccountEntity,
 )
+from bank_app.application.adapter.persistence.group_commit import run_grouped
+from bank_app.application.adapter.persistence.sql import (
+    decimal_param,
+    exact_compare,
+    exact_difference,
+    exact_sum,
+    execute_posting,
+    execute_returning,
+    insert_many,
+    prep_value,
+    returning_columns,
+)
+from bank_app.application.adapter.persistence.unit_of_work import (
+    current_unit_of_work,
+)
 from bank_app.application.domain.domain_models import (
     AccountIdentity,
     Entity,
     EntityIdentity,
 )
-from bank_app.application.domain.exceptions import NotFound
+from bank_app.application.domain.exceptions import (
+    ConcurrentUpdateException,
+    NotFound,
+)
+from bank_app.application.domain.model.account_statement import LedgerEntry
 from bank_app.application.domain.model.bank_account import BankAccount
 from bank_app.application.ports.repositories.i_bank_account import (
     IBankAccountRepository,
@@ -18,23 +53,177 @@ from bank_app.application.ports.repositories.i_bank_account import (
 
 
 class BankAccountRepository(IBankAccountRepository):
+    # the fields of BankAccount, in order, as read by from_row; statement_run
+    # selects them next to its own annotations
+    COLUMNS = (
+        "entity_id",
+        "account_number",
+        "balance",
+        "overdraft_amount",
+        "is_allow_overdraft",
+        "is_active",
+        "created_at",
+        "updated_at",
+        "version",
+    )
+    # kept in the account cache when it is enabled, the balance and the
+    # other columns are read from the database every time
+    _CACHED_FIELDS = (
+        "entity_id",
+        "account_number",
+        "overdraft_amount",
+        "is_allow_overdraft",
+        "is_active",
+        "created_at",
+        "updated_at",
+    )
+    # {balance} and {guard} are the exact expressions of the posting, see
+    # _execute_posting. Striped accounts take their deposits on a stripe
+    # instead, see _STRIPE_DEPOSIT_SQL
+    _POSTING_SQL = """
+        UPDATE {table} SET balance = {balance},
+            ledger_sequence = ledger_sequence + 1, version = version + 1
+        WHERE account_number = %s AND {guard} AND {fits}
+        RETURNING {columns}
+    """
+    _STRIPE_DEPOSIT_SQL = """
+        UPDATE {table} SET balance = {balance}
+        WHERE account_number = %s AND stripe = %s %% stripe_count
+        RETURNING {columns}
+    """
+    _OVERDRAFT = "CASE WHEN is_allow_overdraft THEN overdraft_amount ELSE 0 END"
+
+    @classmethod
+    def _execute_posting(
+        cls, entry: LedgerEntry, account_number: Any
+    ) -> Optional[BankAccountEntity]:
+        amount = prep_value(BankAccountEntity, "balance", entry.amount)
+        if entry.transaction_type == "DEPOSIT":
+            balance = exact_sum("balance", decimal_param())
+            guard, params = "balance_stripes = 0", [amount, account_number]
+            change = entry.amount
+        else:
+            balance = exact_difference("balance", decimal_param())
+            guard = exact_compare(
+                exact_sum("balance", cls._OVERDRAFT), ">=", decimal_param()
+            )
+            params = [amount, account_number, amount]
+            change = -entry.amount
+        return execute_posting(
+            BankAccountEntity,
+            cls._POSTING_SQL,
+            params,
+            account_number,
+            change,
+            balance=balance,
+            guard=guard,
+        )
+
+    @classmethod
+    def _execute_stripe_deposit(
+        cls, entry: LedgerEntry, account_number: Any
+    ) -> Optional[BalanceStripeEntity]:
+        return execute_returning(
+            BalanceStripeEntity,
+            cls._STRIPE_DEPOSIT_SQL.format(
+                table=BalanceStripeEntity._meta.db_table,
+                columns=returning_columns(BalanceStripeEntity),
+                balance=exact_sum("balance", decimal_param()),
+            ),
+            [
+                prep_value(BalanceStripeEntity, "balance", entry.amount),
+                account_number,
+                random.randrange(1 << 15),
+            ],
+        )
+
+    @classmethod
+    def take_stripes(cls, account_id: UUID) -> Decimal:
+        """
+        Lock the stripes of an account and empty them. The caller holds the
+        lock on the bank_account row (always taken first) and adds the
+        amount returned to its balance in the same transaction.
+        """
+        stripes = list(
+            BalanceStripeEntity.objects.select_for_update()
+            .filter(account_id=account_id)
+            .order_by("stripe")
+            .values_list("stripe", "balance")
+        )
+        total = sum((balance for _, balance in stripes), Decimal("0.00"))
+        if total:
+            BalanceStripeEntity.objects.filter(
+                account_id=account_id, stripe__in=[s for s, b in stripes if b]
+            ).update(balance=0)
+        return total
+
+    @classmethod
+    def _fold_stripes(cls, account_number: UUID) -> Decimal:
+        """Move the stripes of a striped account back to its balance"""
+        with transaction.atomic():
+            account_id = (
+                BankAccountEntity.objects.select_for_update()
+                .filter(account_number=account_number, balance_stripes__gt=0)
+                .values_list("entity_id", flat=True)
+                .first()
+            )
+            if account_id is None:
+                return Decimal("0.00")
+            total = cls.take_stripes(account_id)
+            if total:
+                BankAccountEntity.objects.filter(entity_id=account_id).update(
+                    balance=F("balance") + total, version=F("version") + 1
+                )
+            return total
+
+    @classmethod
+    def _to_domain_with_stripes(cls, entity: BankAccountEntity) -> BankAccount:
+        account = cls._to_domain(entity)
+        if entity.balance_stripes:
+            striped = BalanceStripeEntity.objects.filter(
+                account_id=entity.entity_id
+            ).aggregate(total=Sum("balance"))["total"]
+            account.balance += striped or 0
+            account.mark_clean()
+        return account
+
+    @classmethod
+    def _cache(cls) -> Optional[AccountCache]:
+        return get_account_cache("bank_account")
+
     @classmethod
     def _get_bank_account_by_id(cls, entity_id: AccountIdentity) -> BankAccountEntity:
-        try:
-            return BankAccountEntity.objects.get(entity_id=entity_id.uuid)
-        except BankAccountEntity.DoesNotExist as ex:
-            raise NotFound(f"bank account {entity_id.uuid} does not exist") from ex
+        return load_account(
+            cls._cache(),
+            BankAccountEntity,
+            cls._CACHED_FIELDS,
+            f"bank account {entity_id.uuid} does not exist",
+            entity_id=entity_id.uuid,
+        )
 
     @classmethod
     def _get_bank_account_by_account_number(
         cls, account_number: UUID
     ) -> BankAccountEntity:
-        try:
-            return BankAccountEntity.objects.get(account_number=account_number)
-        except BankAccountEntity.DoesNotExist as ex:
-            raise NotFound(
-                f"Bank account with number {account_number} does not exist"
-            ) from ex
+        return load_account(
+            cls._cache(),
+            BankAccountEntity,
+            cls._CACHED_FIELDS,
+            f"Bank account with number {account_number} does not exist",
+            account_number=account_number,
+        )
+
+    @classmethod
+    def get_account_number(cls, entity_id: UUID) -> Optional[UUID]:
+        return account_number_of(
+            cls._cache(), BankAccountEntity, cls._CACHED_FIELDS, entity_id
+        )
+
+    @classmethod
+    def _invalidate(cls, entity_id: UUID) -> None:
+        cache = cls._cache()
+        if cache is not None:
+            invalidate_account(cache, entity_id=entity_id)
 
     @classmethod
     def _to_entity(cls, entity: BankAccount) -> BankAccountEntity:
@@ -51,29 +240,56 @@ class BankAccountRepository(IBankAccountRepository):
 
     @classmethod
     def _to_domain(cls, entity: BankAccountEntity) -> BankAccount:
-        return BankAccount(
-            entity_id=AccountIdentity(entity.entity_id),
-            account_number=entity.account_number,
-            balance=entity.balance,
-            overdraft_amount=entity.overdraft_amount,
-            is_allow_overdraft=entity.is_allow_overdraft,
-            is_active=entity.is_active,
-            created_at=entity.created_at,
-            updated_at=entity.updated_at,
-        )
+        return cls.from_row([getattr(entity, column) for column in cls.COLUMNS])
+
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> BankAccount:
+        """A bank account from the values of ``COLUMNS``, stored so trusted"""
+        return BankAccount.hydrate(AccountIdentity(row[0]), *row[1:])
 
     @classmethod
     def get(cls, entity_id: EntityIdentity) -> BankAccount:
         if not isinstance(entity_id, AccountIdentity):
             raise ValueError("entity_id must be an AccountIdentity")
 
-        bank_account_entity = cls._get_bank_account_by_id(entity_id)
-        return cls._to_domain(bank_account_entity)
+        unit_of_work = current_unit_of_work()
+        if unit_of_work is not None:
+            account = unit_of_work.get(("bank_account", entity_id.uuid))
+            if account is not None:
+                return account  # type: ignore[return-value]
+        return cls._remember(
+            cls._to_domain_with_stripes(cls._get_bank_account_by_id(entity_id))
+        )
 
     @classmethod
     def get_by_bank_account_number(cls, account_number: UUID) -> BankAccount:
-        bank_account_entity = cls._get_bank_account_by_account_number(account_number)
-        return cls._to_domain(bank_account_entity)
+        unit_of_work = current_unit_of_work()
+        if unit_of_work is not None:
+            account = unit_of_work.get(("bank_account_number", account_number))
+            if account is not None:
+                return account  # type: ignore[return-value]
+        return cls._remember(
+            cls._to_domain_with_stripes(
+                cls._get_bank_account_by_account_number(account_number)
+            )
+        )
+
+    @classmethod
+    def _remember(cls, account: BankAccount) -> BankAccount:
+        unit_of_work = current_unit_of_work()
+        if unit_of_work is not None:
+            unit_of_work.remember(
+                account,
+                ("bank_account", account.entity_id.uuid),
+                ("bank_account_number", account.account_number),
+            )
+        return account
+
+    @classmethod
+    def _forget(cls, account_number: UUID) -> None:
+        unit_of_work = current_unit_of_work()
+        if unit_of_work is not None:
+            unit_of_work.forget(("bank_account_number", account_number))
 
     @classmethod
     def delete(cls, entity_id: EntityIdentity, **kwargs: Any) -> None:
@@ -82,23 +298,60 @@ class BankAccountRepository(IBankAccountRepository):
 
         bank_account_entity = cls._get_bank_account_by_id(entity_id)
         bank_account_entity.delete()
+        cls._forget(bank_account_entity.account_number)
+        cls._invalidate(entity_id.uuid)
 
     @classmethod
     def save(cls, entity: Entity) -> None:
         if not isinstance(entity, BankAccount):
             raise ValueError("entity must be a BankAccount")
-        try:
-            existing_entity = cls._get_bank_account_by_id(entity_id=entity.entity_id)
-            existing_entity.account_number = entity.account_number
-            existing_entity.balance = entity.balance
-            existing_entity.overdraft_amount = entity.overdraft_amount
-            existing_entity.is_allow_overdraft = entity.is_allow_overdraft
-            existing_entity.is_active = entity.is_active
-            existing_entity.updated_at = entity.updated_at
-            existing_entity.save()
-        except BankAccountEntity.DoesNotExist:
-            bank_account_entity = cls._to_entity(entity)
-            bank_account_entity.save()
+
+        unit_of_work = current_unit_of_work()
+        if unit_of_work is not None:
+            unit_of_work.register_save(
+                ("bank_account", entity.entity_id.uuid), entity, cls._write, cls._write
+            )
+            return
+        cls._write(entity)
+
+    @classmethod
+    def _write(cls, entity: BankAccount) -> None:
+        # a loaded account writes only the fields assigned since, and
+        # nothing at all when none were
+        changed = entity.changed_fields
+        if changed is not None and not changed:
+            return
+        cls._invalidate(entity.entity_id.uuid)
+        # compare-and-swap on the version read with the account: a posting
+        # or another save in between bumped it and nothing is overwritten.
+        # The balance of a striped account includes its stripes and is only
+        # ever moved by postings, never written back.
+        columns = {
+            "account_number": entity.account_number,
+            "balance": Case(
+                When(balance_stripes=0, then=Value(entity.balance)),
+                default=F("balance"),
+            ),
+            "overdraft_amount": entity.overdraft_amount,
+            "is_allow_overdraft": entity.is_allow_overdraft,
+            "is_active": entity.is_active,
+            "updated_at": entity.updated_at,
+        }
+        if changed is not None:
+            columns = {name: columns[name] for name in columns if name in changed}
+        updated = BankAccountEntity.objects.filter(
+            entity_id=entity.entity_id.uuid, version=entity.version
+        ).update(**columns, version=F("version") + 1)
+        if updated:
+            entity.version += 1
+            entity.mark_clean()
+            return
+        if BankAccountEntity.objects.filter(entity_id=entity.entity_id.uuid).exists():
+            raise ConcurrentUpdateException(
+                f"bank account {entity.entity_id.uuid} was modified concurrently"
+            )
+        cls._to_entity(entity).save(force_insert=True)
+        entity.mark_clean()
 
     @classmethod
     def update_overdraft_amount(
@@ -106,13 +359,136 @@ class BankAccountRepository(IBankAccountRepository):
     ) -> None:
         if overdraft_amount < 0:
             raise ValueError("Overdraft amount cannot be negative")
-        try:
-            bank_account_entity = cls._get_bank_account_by_account_number(
-                account_number
+        cls._forget(account_number)
+        cache = cls._cache()
+        if cache is not None:
+            invalidate_account(cache, account_number=account_number)
+        updated = BankAccountEntity.objects.filter(
+            account_number=account_number
+        ).update(overdraft_amount=overdraft_amount, version=F("version") + 1)
+        if not updated:
+            raise NotFound(f"Bank account with number {account_number} does not exist")
+
+    @classmethod
+    def stripe_account(cls, account_number: UUID, stripes: int) -> None:
+        """
+        Spread the deposits of a hot account over ``stripes`` sub-balances,
+        or stop striping it with 0. Whatever sits on the old stripes is
+        folded back into the balance first.
+        :raise NotFound: when there is no such account.
+        """
+        if stripes < 0:
+            raise ValueError("Stripe count cannot be negative")
+        with transaction.atomic():
+            account_id = (
+                BankAccountEntity.objects.select_for_update()
+                .filter(account_number=account_number)
+                .values_list("entity_id", flat=True)
+                .first()
+            )
+            if account_id is None:
+                raise NotFound(
+                    f"Bank account with number {account_number} does not exist"
+                )
+            total = cls.take_stripes(account_id)
+            BalanceStripeEntity.objects.filter(account_id=account_id).delete()
+            BalanceStripeEntity.objects.bulk_create(
+                BalanceStripeEntity(
+                    account_id=account_id,
+                    account_number=account_number,
+                    stripe=stripe,
+                    stripe_count=stripes,
+                )
+                for stripe in range(stripes)
             )
-            bank_account_entity.overdraft_amount = overdraft_amount
-            bank_account_entity.save()
-        except BankAccountEntity.DoesNotExist as ex:
-            raise NotFound(
-                f"Bank account with number {account_number} does not exist"
-            ) from ex
+            BankAccountEntity.objects.filter(entity_id=account_id).update(
+                balance=F("balance") + total,
+                balance_stripes=stripes,
+                version=F("version") + 1,
+            )
+
+    @classmethod
+    def consolidate_stripes(cls, account_number: Optional[UUID] = None) -> int:
+        """
+        Fold the stripes of every striped account (or just ``account_number``)
+        back into its balance, one short transaction per account.
+        :return: The number of accounts that had something to fold.
+        """
+        accounts = BankAccountEntity.objects.filter(balance_stripes__gt=0)
+        if account_number is not None:
+            accounts = accounts.filter(account_number=account_number)
+        return sum(
+            1
+            for number in accounts.values_list("account_number", flat=True)
+            if cls._fold_stripes(number)
+        )
+
+    @classmethod
+    def apply_postings(
+        cls, account_number: UUID, entries: Sequence[LedgerEntry]
+    ) -> Optional[BankAccount]:
+        cls._forget(account_number)
+        return run_grouped(lambda: cls._apply_postings(account_number, entries))
+
+    @classmethod
+    def _apply_postings(
+        cls, account_number: UUID, entries: Sequence[LedgerEntry]
+    ) -> Optional[BankAccount]:
+        db_account_number = prep_value(
+            BankAccountEntity, "account_number", account_number
+        )
+        bank_account_entity = None
+        striped = False
+        ledger = []
+        with transaction.atomic():
+            for entry in entries:
+                bank_account_entity = cls._execute_posting(entry, db_account_number)
+                if bank_account_entity is None and entry.transaction_type == "DEPOSIT":
+                    stripe = cls._execute_stripe_deposit(entry, db_account_number)
+                    if stripe is not None:
+                        striped = True
+                        ledger.append(
+                            TransactionEntity(
+                                account_id=stripe.account_id,
+                                account_type="CURRENT_ACCOUNT",
+                                transaction_type=entry.transaction_type,
+                                amount=entry.amount,
+                            )
+                        )
+                        continue
+                elif bank_account_entity is None and cls._fold_stripes(account_number):
+                    # refused on the balance alone: borrow from the stripes
+                    bank_account_entity = cls._execute_posting(entry, db_account_number)
+                if bank_account_entity is None:
+                    transaction.set_rollback(True)
+                    return None
+                if bank_account_entity.balance_stripes:
+                    # like its stripe deposits, which never touch the
+                    # account row: the stripes move under concurrent
+                    # deposits, so there is no exact place in the ledger
+                    striped = True
+                    ledger.append(
+                        TransactionEntity(
+                            account_id=bank_account_entity.entity_id,
+                            account_type="CURRENT_ACCOUNT",
+                            transaction_type=entry.transaction_type,
+                            amount=entry.amount,
+                        )
+                    )
+                    continue
+                ledger.append(
+                    TransactionEntity(
+                        account_id=bank_account_entity.entity_id,
+                        account_type="CURRENT_ACCOUNT",
+                        transaction_type=entry.transaction_type,
+                        amount=entry.amount,
+                        sequence=bank_account_entity.ledger_sequence,
+                        balance_after=bank_account_entity.balance,
+                    )
+                )
+            insert_many(TransactionEntity, ledger)
+            if striped:
+                return cls.get_by_bank_account_number(account_number)
+        if bank_account_entity is None:
+            return None
+        return cls._to_domain(bank_account_entity)
@@ -1,15 +1,45 @@
-from typing import Any
+from collections.abc import Sequence
+from typing import Any, Optional
 from uuid import UUID
 
+from django.db import transaction
+from django.db.models import F
+
+from bank_app.application.adapter.persistence.account_cache import (
+    AccountCache,
+    account_number_of,
+    get_account_cache,
+    invalidate_account,
+    load_account,
+)
+from bank_app.application.adapter.persistence.entity.account_statement_entity import (
+    TransactionEntity,
+)
 from bank_app.application.adapter.persistence.entity.booklet_account_entity import (
     BookletAccountEntity,
 )
+from bank_app.application.adapter.persistence.group_commit import run_grouped
+from bank_app.application.adapter.persistence.sql import (
+    decimal_param,
+    exact_compare,
+    exact_difference,
+    exact_sum,
+    execute_posting,
+    insert_many,
+    prep_value,
+)
+from bank_app.application.adapter.persistence.unit_of_work import (
+    current_unit_of_work,
+)
 from bank_app.application.domain.domain_models import (
     AccountIdentity,
     Entity,
     EntityIdentity,
 )
-from bank_app.application.domain.exceptions import NotFound
+from bank_app.application.domain.exceptions import (
+    ConcurrentUpdateException,
+)
+from bank_app.application.domain.model.account_statement import LedgerEntry
 from bank_app.application.domain.model.booklet_account import BookletAccount
 from bank_app.application.ports.repositories.i_booklet_account import (
     IBookletAccountRepository,
@@ -17,70 +47,158 @@ from bank_app.application.ports.repositories.i_booklet_account import (
 
 
 class BookletAccountRepository(IBookletAccountRepository):
+    # the fields of BookletAccount, in order, as read by from_row; statement_run
+    # selects them next to its own annotations
+    COLUMNS = (
+        "entity_id",
+        "account_number",
+        "balance",
+        "deposit_limit",
+        "is_active",
+        "created_at",
+        "updated_at",
+        "version",
+    )
+    # kept in the account cache when it is enabled, the balance and the
+    # other columns are read from the database every time
+    _CACHED_FIELDS = (
+        "entity_id",
+        "account_number",
+        "deposit_limit",
+        "is_active",
+        "created_at",
+        "updated_at",
+    )
+    # {balance} and {guard} are the exact expressions of the posting, see
+    # _execute_posting
+    _POSTING_SQL = """
+        UPDATE {table} SET balance = {balance},
+            ledger_sequence = ledger_sequence + 1, version = version + 1
+        WHERE account_number = %s AND {guard} AND {fits}
+        RETURNING {columns}
+    """
+
+    @classmethod
+    def _execute_posting(
+        cls, entry: LedgerEntry, account_number: Any
+    ) -> Optional[BookletAccountEntity]:
+        amount = prep_value(BookletAccountEntity, "balance", entry.amount)
+        if entry.transaction_type == "DEPOSIT":
+            balance = exact_sum("balance", decimal_param())
+            guard = exact_compare(balance, "<=", "deposit_limit")
+            change = entry.amount
+        else:
+            balance = exact_difference("balance", decimal_param())
+            guard = exact_compare("balance", ">=", decimal_param())
+            change = -entry.amount
+        return execute_posting(
+            BookletAccountEntity,
+            cls._POSTING_SQL,
+            [amount, account_number, amount],
+            account_number,
+            change,
+            balance=balance,
+            guard=guard,
+        )
+
+    @classmethod
+    def _cache(cls) -> Optional[AccountCache]:
+        return get_account_cache("booklet_account")
+
     @classmethod
     def _get_booklet_account_by_id(
         cls, entity_id: AccountIdentity
     ) -> BookletAccountEntity:
-        try:
-            return BookletAccountEntity.objects.get(entity_id=entity_id.uuid)
-        except BookletAccountEntity.DoesNotExist as ex:
-            raise NotFound(f"Booklet account {entity_id.uuid} does not exist") from ex
+        return load_account(
+            cls._cache(),
+            BookletAccountEntity,
+            cls._CACHED_FIELDS,
+            f"Booklet account {entity_id.uuid} does not exist",
+            entity_id=entity_id.uuid,
+        )
 
     @classmethod
     def _get_booklet_account_by_account_number(
         cls, account_number: UUID
     ) -> BookletAccountEntity:
-        try:
-            return BookletAccountEntity.objects.get(account_number=account_number)
-        except BookletAccountEntity.DoesNotExist as ex:
-            raise NotFound(
-                f"Booklet account with number {account_number} does not exist"
-            ) from ex
+        return load_account(
+            cls._cache(),
+            BookletAccountEntity,
+            cls._CACHED_FIELDS,
+            f"Booklet account with number {account_number} does not exist",
+            account_number=account_number,
+        )
 
     @classmethod
-    def _to_domain(cls, entity: BookletAccountEntity) -> BookletAccount:
-        return BookletAccount(
-            entity_id=AccountIdentity(entity.entity_id),
-            account_number=entity.account_number,
-            balance=entity.balance,
-            deposit_limit=entity.deposit_limit,
-            is_active=entity.is_active,
-            created_at=entity.created_at,
-            updated_at=entity.updated_at,
+    def get_account_number(cls, entity_id: UUID) -> Optional[UUID]:
+        return account_number_of(
+            cls._cache(), BookletAccountEntity, cls._CACHED_FIELDS, entity_id
         )
 
+    @classmethod
+    def _invalidate(cls, entity_id: UUID) -> None:
+        cache = cls._cache()
+        if cache is not None:
+            invalidate_account(cache, entity_id=entity_id)
+
+    @classmethod
+    def _to_domain(cls, entity: BookletAccountEntity) -> BookletAccount:
+        return cls.from_row([getattr(entity, column) for column in cls.COLUMNS])
+
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> BookletAccount:
+        """A booklet account from the values of ``COLUMNS``, stored so trusted"""
+        return BookletAccount.hydrate(AccountIdentity(row[0]), *row[1:])
+
     @classmethod
     def _to_entity(cls, domain: BookletAccount) -> BookletAccountEntity:
-        try:
-            entity = BookletAccountEntity.objects.get(entity_id=domain.entity_id.uuid)
-            entity.account_number = domain.account_number
-            entity.balance = domain.balance
-            entity.deposit_limit = domain.deposit_limit
-            entity.is_active = domain.is_active
-            return entity
-        except BookletAccountEntity.DoesNotExist:
-            return BookletAccountEntity(
-                entity_id=domain.entity_id.uuid,
-                account_number=domain.account_number,
-                balance=domain.balance,
-                deposit_limit=domain.deposit_limit,
-                is_active=domain.is_active,
-            )
+        return BookletAccountEntity(
+            entity_id=domain.entity_id.uuid,
+            account_number=domain.account_number,
+            balance=domain.balance,
+            deposit_limit=domain.deposit_limit,
+            is_active=domain.is_active,
+        )
 
     @classmethod
     def get(cls, entity_id: EntityIdentity) -> BookletAccount:
         if not isinstance(entity_id, AccountIdentity):
             raise ValueError("entity_id must be an AccountIdentity")
 
-        booklet_account_entity = cls._get_booklet_account_by_id(entity_id)
-        return cls._to_domain(booklet_account_entity)
+        unit_of_work = current_unit_of_work()
+        if unit_of_work is not None:
+            account = unit_of_work.get(("booklet_account", entity_id.uuid))
+            if account is not None:
+                return account  # type: ignore[return-value]
+        return cls._remember(cls._to_domain(cls._get_booklet_account_by_id(entity_id)))
 
     @classmethod
     def get_by_booklet_account_number(cls, account_number: UUID) -> BookletAccount:
-        booklet_account_entity = cls._get_booklet_account_by_account_number(
-            account_number
+        unit_of_work = current_unit_of_work()
+        if unit_of_work is not None:
+            account = unit_of_work.get(("booklet_account_number", account_number))
+            if account is not None:
+                return account  # type: ignore[return-value]
+        return cls._remember(
+            cls._to_domain(cls._get_booklet_account_by_account_number(account_number))
         )
-        return cls._to_domain(booklet_account_entity)
+
+    @classmethod
+    def _remember(cls, account: BookletAccount) -> BookletAccount:
+        unit_of_work = current_unit_of_work()
+        if unit_of_work is not None:
+            unit_of_work.remember(
+                account,
+                ("booklet_account", account.entity_id.uuid),
+                ("booklet_account_number", account.account_number),
+            )
+        return account
+
+    @classmethod
+    def _forget(cls, account_number: UUID) -> None:
+        unit_of_work = current_unit_of_work()
+        if unit_of_work is not None:
+            unit_of_work.forget(("booklet_account_number", account_number))
 
     @classmethod
     def delete(cls, entity_id: EntityIdentity, **kwargs: Any) -> None:
@@ -89,11 +207,92 @@ class BookletAccountRepository(IBookletAccountRepository):
 
         booklet_account_entity = cls._get_booklet_account_by_id(entity_id)
         booklet_account_entity.delete()
+        cls._forget(booklet_account_entity.account_number)
+        cls._invalidate(entity_id.uuid)
 
     @classmethod
     def save(cls, entity: Entity) -> None:
         if not isinstance(entity, BookletAccount):
             raise ValueError("entity must be a BookletAccount")
 
-        booklet_account_entity = cls._to_entity(entity)
-        booklet_account_entity.save()
+        unit_of_work = current_unit_of_work()
+        if unit_of_work is not None:
+            unit_of_work.register_save(
+                ("booklet_account", entity.entity_id.uuid),
+                entity,
+                cls._write,
+                cls._write,
+            )
+            return
+        cls._write(entity)
+
+    @classmethod
+    def _write(cls, entity: BookletAccount) -> None:
+        # a loaded account writes only the fields assigned since, and
+        # nothing at all when none were
+        changed = entity.changed_fields
+        if changed is not None and not changed:
+            return
+        cls._invalidate(entity.entity_id.uuid)
+        # compare-and-swap on the version read with the account: a posting
+        # or another save in between bumped it and nothing is overwritten
+        columns = {
+            "account_number": entity.account_number,
+            "balance": entity.balance,
+            "deposit_limit": entity.deposit_limit,
+            "is_active": entity.is_active,
+        }
+        if changed is not None:
+            columns = {name: columns[name] for name in columns if name in changed}
+        updated = BookletAccountEntity.objects.filter(
+            entity_id=entity.entity_id.uuid, version=entity.version
+        ).update(**columns, version=F("version") + 1)
+        if updated:
+            entity.version += 1
+            entity.mark_clean()
+            return
+        if BookletAccountEntity.objects.filter(
+            entity_id=entity.entity_id.uuid
+        ).exists():
+            raise ConcurrentUpdateException(
+                f"Booklet account {entity.entity_id.uuid} was modified concurrently"
+            )
+        cls._to_entity(entity).save(force_insert=True)
+        entity.mark_clean()
+
+    @classmethod
+    def apply_postings(
+        cls, account_number: UUID, entries: Sequence[LedgerEntry]
+    ) -> Optional[BookletAccount]:
+        cls._forget(account_number)
+        return run_grouped(lambda: cls._apply_postings(account_number, entries))
+
+    @classmethod
+    def _apply_postings(
+        cls, account_number: UUID, entries: Sequence[LedgerEntry]
+    ) -> Optional[BookletAccount]:
+        db_account_number = prep_value(
+            BookletAccountEntity, "account_number", account_number
+        )
+        booklet_account_entity = None
+        ledger = []
+        with transaction.atomic():
+            for entry in entries:
+                booklet_account_entity = cls._execute_posting(entry, db_account_number)
+                if booklet_account_entity is None:
+                    transaction.set_rollback(True)
+                    return None
+                ledger.append(
+                    TransactionEntity(
+                        account_id=booklet_account_entity.entity_id,
+                        account_type="BOOKLET_ACCOUNT",
+                        transaction_type=entry.transaction_type,
+                        amount=entry.amount,
+                        sequence=booklet_account_entity.ledger_sequence,
+                        balance_after=booklet_account_entity.balance,
+                    )
+                )
+            insert_many(TransactionEntity, ledger)
+        if booklet_account_entity is None:
+            return None
+        return cls._to_domain(booklet_account_entity)
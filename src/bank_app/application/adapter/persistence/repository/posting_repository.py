@@ -0,0 +1,189 @@
+import itertools
+from collections import defaultdict
+from collections.abc import Callable, Sequence
+from typing import Any, Union
+from uuid import UUID
+
+import attr
+from django.db import models, transaction
+
+from bank_app.application.adapter.persistence.entity.account_statement_entity import (
+    TransactionEntity,
+)
+from bank_app.application.adapter.persistence.entity.bank_account_entity import (
+    BankAccountEntity,
+)
+from bank_app.application.adapter.persistence.entity.booklet_account_entity import (
+    BookletAccountEntity,
+)
+from bank_app.application.adapter.persistence.repository.bank_account_repository import (  # noqa: E501
+    BankAccountRepository,
+)
+from bank_app.application.adapter.persistence.repository.booklet_account_repository import (  # noqa: E501
+    BookletAccountRepository,
+)
+from bank_app.application.adapter.persistence.sql import in_lock_order, insert_many
+from bank_app.application.domain.domain_models import Account
+from bank_app.application.domain.dtos.posting import (
+    APPLIED,
+    REJECTED,
+    SKIPPED,
+    PostingDTO,
+    PostingResultDTO,
+)
+from bank_app.application.domain.exceptions import BusinessException
+from bank_app.application.domain.model.account_statement import LedgerEntry
+from bank_app.application.ports.repositories.i_posting import IPostingRepository
+from bank_app.application.util.util import AccountType
+
+
+class PostingRepository(IPostingRepository):
+    _ENTITIES: dict[AccountType, type[models.Model]] = {
+        AccountType.CURRENT_ACCOUNT: BankAccountEntity,
+        AccountType.BOOKLET_ACCOUNT: BookletAccountEntity,
+    }
+    _REPOSITORIES: dict[
+        AccountType, type[Union[BankAccountRepository, BookletAccountRepository]]
+    ] = {
+        AccountType.CURRENT_ACCOUNT: BankAccountRepository,
+        AccountType.BOOKLET_ACCOUNT: BookletAccountRepository,
+    }
+
+    @classmethod
+    def _lock_order(
+        cls, postings: Sequence[PostingDTO]
+    ) -> list[tuple[AccountType, UUID, UUID]]:
+        """
+        The accounts of ``postings`` as (account type, account number,
+        entity_id), in the order of in_lock_order as for transfers
+        """
+        account_numbers = defaultdict(set)
+        for posting in postings:
+            account_numbers[posting.account_type].add(posting.account_number)
+
+        accounts: list[tuple[AccountType, UUID, UUID]] = []
+        for account_type, numbers in account_numbers.items():
+            accounts.extend(
+                (account_type, account_number, entity_id)
+                for account_number, entity_id in cls._ENTITIES[account_type]
+                ._default_manager.filter(account_number__in=numbers)
+                .values_list("account_number", "entity_id")
+            )
+        return in_lock_order(accounts, lambda account: account[2])
+
+    @classmethod
+    def _lock_accounts(
+        cls, postings: Sequence[PostingDTO]
+    ) -> dict[tuple[AccountType, UUID], Any]:
+        entities: dict[tuple[AccountType, UUID], Any] = {}
+        entity: Any
+        # one statement per run of accounts of the same type, which locks
+        # its rows in entity_id order too
+        for account_type, run in itertools.groupby(
+            cls._lock_order(postings), key=lambda account: account[0]
+        ):
+            for entity in (
+                cls._ENTITIES[account_type]
+                ._default_manager.select_for_update()
+                .filter(entity_id__in=[entity_id for _, _, entity_id in run])
+                .order_by("entity_id")
+            ):
+                entities[(account_type, entity.account_number)] = entity
+        return entities
+
+    @classmethod
+    def apply_bulk(
+        cls,
+        postings: Sequence[PostingDTO],
+        apply_entry: Callable[[Account, LedgerEntry], None],
+        atomic: bool = True,
+    ) -> list[PostingResultDTO]:
+        results = []
+        refused = False
+        with transaction.atomic():
+            entities = cls._lock_accounts(postings)
+            accounts: dict[tuple[AccountType, UUID], Account] = {}
+            changed = {}
+            ledger = []
+            for posting in postings:
+                key = (posting.account_type, posting.account_number)
+                entity = entities.get(key)
+                if entity is None:
+                    refused = True
+                    results.append(
+                        PostingResultDTO(
+                            line=posting.line,
+                            status=REJECTED,
+                            account_number=posting.account_number,
+                            detail=f"account {posting.account_number} does not exist",
+                        )
+                    )
+                    continue
+                account = accounts.get(key)
+                if account is None:
+                    if getattr(entity, "balance_stripes", 0):
+                        # locked after the account row, like every fold
+                        entity.balance += BankAccountRepository.take_stripes(
+                            entity.entity_id
+                        )
+                        changed[key] = entity
+                    account = cls._REPOSITORIES[posting.account_type]._to_domain(entity)
+                    accounts[key] = account
+                entry = LedgerEntry(
+                    transaction_type=posting.transaction_type, amount=posting.amount
+                )
+                try:
+                    apply_entry(account, entry)
+                except (BusinessException, ValueError) as ex:
+                    refused = True
+                    results.append(
+                        PostingResultDTO(
+                            line=posting.line,
+                            status=REJECTED,
+                            account_number=posting.account_number,
+                            detail=str(getattr(ex, "message", ex)),
+                        )
+                    )
+                    continue
+
+                entity.balance = account.balance
+                entity.ledger_sequence += 1
+                entity.version += 1
+                changed[key] = entity
+                ledger.append(
+                    TransactionEntity(
+                        account_id=entity.entity_id,
+                        account_type=posting.account_type.value,
+                        transaction_type=entry.transaction_type,
+                        amount=entry.amount,
+                        sequence=entity.ledger_sequence,
+                        balance_after=entity.balance,
+                    )
+                )
+                results.append(
+                    PostingResultDTO(
+                        line=posting.line,
+                        status=APPLIED,
+                        account_number=posting.account_number,
+                        balance=account.balance,
+                    )
+                )
+
+            if atomic and refused:
+                transaction.set_rollback(True)
+                return [
+                    attr.evolve(result, status=SKIPPED, balance=None)
+                    if result.status == APPLIED
+                    else result
+                    for result in results
+                ]
+
+            by_type = defaultdict(list)
+            for (account_type, _), entity in changed.items():
+                by_type[account_type].append(entity)
+            for account_type, rows in by_type.items():
+                cls._ENTITIES[account_type]._default_manager.bulk_update(
+                    rows, ["balance", "ledger_sequence", "version"]
+                )
+            insert_many(TransactionEntity, ledger)
+        return results
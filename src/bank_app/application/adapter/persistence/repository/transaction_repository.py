@@ -1,5 +1,9 @@
 import datetime
-from typing import Any
+from collections.abc import Sequence
+from decimal import Decimal
+from typing import Any, Optional
+
+from django.db.models import Case, DecimalField, F, Q, QuerySet, Sum, Value, When
 
 from bank_app.application.adapter.persistence.entity.account_statement_entity import (
     TransactionEntity,
@@ -14,12 +18,30 @@ from bank_app.application.domain.model.account_statement import (
     Transaction,
     TransactionIdentity,
 )
+from bank_app.application.domain.model.money import ZERO
+from bank_app.application.domain.model.transaction_stream import TransactionStream
 from bank_app.application.ports.repositories.i_transaction import ITransactionRepository
 
 
 class TransactionRepository(ITransactionRepository):
+    # the fields of Transaction, in order, as read by from_row
+    COLUMNS = (
+        "entity_id",
+        "account_id",
+        "account_type",
+        "transaction_type",
+        "amount",
+        "transaction_date",
+        "sequence",
+        "balance_after",
+    )
+    # rows fetched per round trip while streaming
+    _CHUNK_SIZE = 2000
+
     @classmethod
-    def _get_transaction_by_id(cls, entity_id: TransactionIdentity) -> TransactionEntity:
+    def _get_transaction_by_id(
+        cls, entity_id: TransactionIdentity
+    ) -> TransactionEntity:
         try:
             return TransactionEntity.objects.get(entity_id=entity_id.uuid)
         except TransactionEntity.DoesNotExist as ex:
@@ -27,15 +49,27 @@ class TransactionRepository(ITransactionRepository):
 
     @classmethod
     def _to_domain(cls, entity: TransactionEntity) -> Transaction:
-        return Transaction(
-            entity_id=TransactionIdentity(entity.entity_id),
-            account_id=AccountIdentity(entity.account_id),
-            transaction_type=entity.transaction_type,
-            account_type=entity.account_type,
-            amount=entity.amount,
-            transaction_date=entity.transaction_date,
+        return cls.from_row([getattr(entity, column) for column in cls.COLUMNS])
+
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> Transaction:
+        """A transaction from the values of ``COLUMNS``, stored so trusted"""
+        return Transaction.hydrate(
+            TransactionIdentity(row[0]), AccountIdentity(row[1]), *row[2:]
         )
 
+    @classmethod
+    def _to_domain_list(
+        cls, queryset: "QuerySet[TransactionEntity]"
+    ) -> list[Transaction]:
+        """
+        The transactions of ``queryset``, built from its rows as tuples
+        rather than through model instances
+        """
+        return [
+            cls.from_row(row) for row in queryset.values_list(*cls.COLUMNS).iterator()
+        ]
+
     @classmethod
     def _to_entity(cls, domain: Transaction) -> TransactionEntity:
         try:
@@ -45,6 +79,8 @@ class TransactionRepository(ITransactionRepository):
             entity.amount = domain.amount
             entity.transaction_date = domain.transaction_date
             entity.account_type = domain.account_type
+            entity.sequence = domain.sequence
+            entity.balance_after = domain.balance_after
             return entity
         except TransactionEntity.DoesNotExist:
             return TransactionEntity(
@@ -54,6 +90,8 @@ class TransactionRepository(ITransactionRepository):
                 amount=domain.amount,
                 transaction_date=domain.transaction_date,
                 account_type=domain.account_type,
+                sequence=domain.sequence,
+                balance_after=domain.balance_after,
             )
 
     @classmethod
@@ -66,10 +104,9 @@ class TransactionRepository(ITransactionRepository):
 
     @classmethod
     def get_by_account_id(cls, account_id: AccountIdentity) -> list[Transaction]:
-        transactions_entities = TransactionEntity.objects.filter(
-            account_id=account_id.uuid
+        return cls._to_domain_list(
+            TransactionEntity.objects.filter(account_id=account_id.uuid)
         )
-        return [cls._to_domain(entity) for entity in transactions_entities]
 
     @classmethod
     def get_by_account_id_and_date_range(
@@ -78,12 +115,94 @@ class TransactionRepository(ITransactionRepository):
         start_date: datetime.datetime,
         end_date: datetime.datetime,
     ) -> list[Transaction]:
-        transactions_entities = TransactionEntity.objects.filter(
-            account_id=account_id.uuid,
-            transaction_date__gte=start_date,
-            transaction_date__lte=end_date,
-        ).order_by("-transaction_date")
-        return [cls._to_domain(entity) for entity in transactions_entities]
+        return cls._to_domain_list(
+            TransactionEntity.objects.filter(
+                account_id=account_id.uuid,
+                transaction_date__gte=start_date,
+                transaction_date__lte=end_date,
+            ).order_by("-transaction_date")
+        )
+
+    @classmethod
+    def stream_by_account_id_and_date_range(
+        cls,
+        account_id: AccountIdentity,
+        start_date: datetime.datetime,
+        end_date: datetime.datetime,
+    ) -> TransactionStream:
+        rows = (
+            TransactionEntity.objects.filter(
+                account_id=account_id.uuid,
+                transaction_date__gte=start_date,
+                transaction_date__lte=end_date,
+            )
+            .order_by("-transaction_date", "-sequence")
+            .values_list(*cls.COLUMNS)
+        )
+        return TransactionStream(
+            account_id,
+            lambda: map(cls.from_row, rows.iterator(chunk_size=cls._CHUNK_SIZE)),
+        )
+
+    @classmethod
+    def get_net_amount_since(
+        cls, account_id: AccountIdentity, start_date: datetime.datetime
+    ) -> Decimal:
+        net_amount = TransactionEntity.objects.filter(
+            account_id=account_id.uuid, transaction_date__gte=start_date
+        ).aggregate(net_amount=Sum(cls.signed_amount()))["net_amount"]
+        return net_amount if net_amount is not None else ZERO
+
+    @classmethod
+    def get_net_amounts(
+        cls,
+        account_id: AccountIdentity,
+        bounds: Sequence[Optional[datetime.datetime]],
+    ) -> list[Decimal]:
+        sums = {}
+        for index, (start, end) in enumerate(zip(bounds, bounds[1:])):
+            dated = Q(transaction_date__gte=start)
+            if end is not None:
+                dated &= Q(transaction_date__lt=end)
+            sums[f"net_amount_{index}"] = Sum(cls.signed_amount(), filter=dated)
+        # one range scan of transaction_account_date_idx over all the ranges
+        postings = TransactionEntity.objects.filter(
+            account_id=account_id.uuid, transaction_date__gte=bounds[0]
+        )
+        if bounds[-1] is not None:
+            postings = postings.filter(transaction_date__lt=bounds[-1])
+        net_amounts = postings.aggregate(**sums)
+        return [
+            net_amounts[f"net_amount_{index}"] or ZERO for index in range(len(sums))
+        ]
+
+    @classmethod
+    def signed_amount(cls) -> Case:
+        """
+        The amount of a posting as it moved the balance, to sum in a query:
+        ``Sum(TransactionRepository.signed_amount())``
+        """
+        return Case(
+            When(transaction_type="DEPOSIT", then=F("amount")),
+            When(transaction_type="WITHDRAWAL", then=-F("amount")),
+            default=Value(ZERO),
+            output_field=DecimalField(max_digits=19, decimal_places=2),
+        )
+
+    @classmethod
+    def balance_at(
+        cls, account_id: AccountIdentity, timestamp: datetime.datetime
+    ) -> Optional[Decimal]:
+        # the last posting only: a later one without a running balance
+        # (a legacy row, a striped deposit) makes any earlier one stale
+        return (
+            TransactionEntity.objects.filter(
+                account_id=account_id.uuid, transaction_date__lt=timestamp
+            )
+            .order_by("-transaction_date", "-sequence")
+            .values_list("balance_after", flat=True)
+            .first()
+        )
 
     @classmethod
     def delete(cls, entity_id: EntityIdentity, **kwargs: Any) -> None:
@@ -98,5 +217,17 @@ class TransactionRepository(ITransactionRepository):
         if not isinstance(entity, Transaction):
             raise ValueError("entity must be a Transaction")
 
-        transaction_entity = cls._to_entity(entity)
-        transaction_entity.save()
+        changed = entity.changed_fields
+        if changed is None:
+            cls._to_entity(entity).save()
+        elif changed:
+            if "transaction_date" in changed:
+                raise ValueError("the date of a stored transaction cannot change")
+            # loaded: update the assigned columns without reading the row
+            columns = {name: getattr(entity, name) for name in changed}
+            if "account_id" in columns:
+                columns["account_id"] = entity.account_id.uuid
+            TransactionEntity.objects.filter(entity_id=entity.entity_id.uuid).update(
+                **columns
+            )
+        entity.mark_clean()
@@ -0,0 +1,65 @@
+from decimal import Decimal
+from typing import Optional, Union
+
+from django.db import transaction
+
+from bank_app.application.adapter.persistence.repository.bank_account_repository import (  # noqa: E501
+    BankAccountRepository,
+)
+from bank_app.application.adapter.persistence.repository.booklet_account_repository import (  # noqa: E501
+    BookletAccountRepository,
+)
+from bank_app.application.adapter.persistence.sql import in_lock_order
+from bank_app.application.domain.domain_models import Account, AccountIdentity
+from bank_app.application.domain.model.account_statement import LedgerEntry
+from bank_app.application.ports.repositories.i_transfer import ITransferRepository
+from bank_app.application.util.util import AccountType
+
+
+class TransferRepository(ITransferRepository):
+    _REPOSITORIES: dict[
+        AccountType, type[Union[BankAccountRepository, BookletAccountRepository]]
+    ] = {
+        AccountType.CURRENT_ACCOUNT: BankAccountRepository,
+        AccountType.BOOKLET_ACCOUNT: BookletAccountRepository,
+    }
+
+    @classmethod
+    def apply_transfer(
+        cls,
+        source_id: AccountIdentity,
+        source_type: AccountType,
+        target_id: AccountIdentity,
+        target_type: AccountType,
+        amount: Decimal,
+    ) -> Optional[tuple[Account, Account]]:
+        legs = [
+            (source_id, source_type, LedgerEntry.withdrawal(amount)),
+            (target_id, target_type, LedgerEntry.deposit(amount)),
+        ]
+        # resolve the account numbers first (from the account cache when it
+        # has them), then post the legs in entity_id order whatever the
+        # direction: each posting locks its row, so two opposite transfers
+        # lock in the same order and cannot wait on each other
+        account_numbers = {}
+        for account_id, account_type, _ in legs:
+            account_number = cls._REPOSITORIES[account_type].get_account_number(
+                account_id.uuid
+            )
+            if account_number is None:
+                return None
+            account_numbers[account_id] = account_number
+
+        accounts = {}
+        with transaction.atomic():
+            for account_id, account_type, entry in in_lock_order(
+                legs, lambda leg: leg[0].uuid
+            ):
+                account = cls._REPOSITORIES[account_type].apply_postings(
+                    account_numbers[account_id], [entry]
+                )
+                if account is None:
+                    transaction.set_rollback(True)
+                    return None
+                accounts[account_id] = account
+        return accounts[source_id], accounts[target_id]
@@ -0,0 +1,257 @@
+import itertools
+from collections.abc import Callable, Iterable, Sequence
+from decimal import Context, Decimal
+from typing import Any, Optional, TypeVar, Union
+from uuid import UUID
+
+from django.db import connection, models
+from django.utils import timezone
+
+ModelT = TypeVar("ModelT", bound=models.Model)
+T = TypeVar("T")
+
+# SQLite stores decimals as binary floats and does its arithmetic on them:
+# 0.10 + 0.20 > 0.30 there. The guards and updates of the postings go
+# through these functions instead, computed on Decimal.
+_SQLITE_DIGITS = Context(prec=15)
+
+
+def _to_decimal(value: Union[float, str, Decimal]) -> Decimal:
+    # repr is the shortest text that reads back as the same float, which is
+    # the decimal the column was given when it holds 15 digits or less
+    return Decimal(repr(value)) if isinstance(value, float) else Decimal(value)
+
+
+def _decimal_sum(left: Any, right: Any) -> Optional[str]:
+    if left is None or right is None:
+        return None
+    return str(_to_decimal(left) + _to_decimal(right))
+
+
+def _decimal_difference(left: Any, right: Any) -> Optional[str]:
+    if left is None or right is None:
+        return None
+    return str(_to_decimal(left) - _to_decimal(right))
+
+
+def _decimal_compare(left: Any, right: Any) -> Optional[int]:
+    if left is None or right is None:
+        return None
+    return int(_to_decimal(left).compare(_to_decimal(right)))
+
+
+def _decimal_fits(value: Any) -> Optional[bool]:
+    if value is None:
+        return None
+    exact = _to_decimal(value)
+    return bool(_SQLITE_DIGITS.plus(exact) == exact)
+
+
+def register_decimal_functions(sender: Any, connection: Any, **kwargs: Any) -> None:
+    """``connection_created`` receiver adding the functions above to SQLite"""
+    if connection.vendor != "sqlite":
+        return
+    for name, arity, function in (
+        ("decimal_sum", 2, _decimal_sum),
+        ("decimal_difference", 2, _decimal_difference),
+        ("decimal_compare", 2, _decimal_compare),
+        ("decimal_fits", 1, _decimal_fits),
+    ):
+        connection.connection.create_function(name, arity, function, deterministic=True)
+
+
+def decimal_param() -> str:
+    """
+    Placeholder of a decimal parameter of the expressions below. SQLite gets
+    the text as it is, a cast would turn it into a float.
+    """
+    return "%s" if connection.vendor == "sqlite" else "CAST(%s AS NUMERIC)"
+
+
+def exact_sum(left: str, right: str) -> str:
+    if connection.vendor == "sqlite":
+        return f"decimal_sum({left}, {right})"
+    return f"({left} + {right})"
+
+
+def exact_difference(left: str, right: str) -> str:
+    if connection.vendor == "sqlite":
+        return f"decimal_difference({left}, {right})"
+    return f"({left} - {right})"
+
+
+def exact_compare(left: str, operator: str, right: str) -> str:
+    if connection.vendor == "sqlite":
+        return f"decimal_compare({left}, {right}) {operator} 0"
+    return f"{left} {operator} {right}"
+
+
+def in_lock_order(items: Iterable[T], entity_id: Callable[[T], UUID]) -> list[T]:
+    """
+    ``items`` in the order their account rows are to be locked: entity_id
+    order whatever the account type, so that two transactions locking some
+    of the same rows queue behind each other instead of deadlocking.
+    """
+    return sorted(items, key=entity_id)
+
+
+def returning_columns(model: type[models.Model]) -> str:
+    """Quoted column list of ``model`` usable in a ``RETURNING`` clause"""
+    quote_name = connection.ops.quote_name
+    return ", ".join(
+        quote_name(field.column)  # type: ignore[arg-type]
+        for field in model._meta.concrete_fields
+    )
+
+
+def prep_value(model: type[models.Model], field_name: str, value: Any) -> Any:
+    """Adapt ``value`` the way ``field_name`` would before hitting the database"""
+    field = model._meta.get_field(field_name)
+    return field.get_db_prep_value(value, connection)  # type: ignore[union-attr]
+
+
+def execute_returning(
+    model: type[ModelT],
+    sql: str,
+    params: Sequence[Any],
+    known: Optional[dict[str, Any]] = None,
+) -> Optional[ModelT]:
+    """
+    Run a single ``... RETURNING <returning_columns(model)>`` statement and
+    hydrate the returned row, applying the same converters as the ORM. The
+    fields in ``known`` take the value given there instead.
+    :return: The model instance, or None when no row was affected.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        row = cursor.fetchone()
+    if row is None:
+        return None
+
+    fields = model._meta.concrete_fields
+    values = []
+    for field, value in zip(fields, row):
+        if known and field.attname in known:
+            values.append(known[field.attname])
+            continue
+        expression = field.get_col(model._meta.db_table)
+        converters = connection.ops.get_db_converters(
+            expression
+        ) + field.get_db_converters(connection)
+        for converter in converters:
+            value = converter(value, expression, connection)
+        values.append(value)
+    return model.from_db(connection.alias, [field.attname for field in fields], values)
+
+
+def execute_posting(
+    model: type[ModelT],
+    sql: str,
+    params: Sequence[Any],
+    account_number: Any,
+    change: Decimal,
+    **expressions: str,
+) -> Optional[ModelT]:
+    """
+    Run a posting moving the balance by ``change``, built on the exact
+    expressions above with ``{fits}`` ending its condition.
+
+    SQLite keeps 15 significant digits of a decimal: when the new balance
+    has more, the posting is run again against the balance read just before
+    (again when another posting moved it in between), and the balance
+    returned is computed from it: the column only holds it rounded, as it
+    did with the ORM.
+    :return: The model instance, or None when the posting was refused.
+    """
+
+    def run(
+        fits: str, *extra: Any, known: Optional[dict[str, Any]] = None
+    ) -> Optional[ModelT]:
+        return execute_returning(
+            model,
+            sql.format(
+                table=model._meta.db_table,
+                columns=returning_columns(model),
+                fits=fits,
+                **expressions,
+            ),
+            [*params, *extra],
+            known,
+        )
+
+    if connection.vendor != "sqlite":
+        return run("1 = 1")
+    entity = run(
+        "decimal_fits(decimal_sum(balance, %s))",
+        prep_value(model, "balance", change),
+    )
+    if entity is not None:
+        return entity
+
+    # identifiers come from the model meta, values are all parameters
+    table = connection.ops.quote_name(model._meta.db_table)
+    select = f"SELECT balance FROM {table} WHERE account_number = %s"  # noqa: S608
+    previous = None
+    while True:
+        with connection.cursor() as cursor:
+            cursor.execute(select, [account_number])
+            row = cursor.fetchone()
+        if (
+            row is None
+            or row == previous
+            or _decimal_fits(_to_decimal(row[0]) + change)
+        ):
+            # refused by the posting itself, not for its digits
+            return None
+        previous = row
+        entity = run(
+            "balance = %s",
+            row[0],
+            known={"balance": _to_decimal(row[0]) + change},
+        )
+        if entity is not None:
+            return entity
+
+
+def insert_many(model: type[models.Model], objs: Sequence[models.Model]) -> None:
+    """
+    INSERT ``objs`` with multi-row statements, without the per-object
+    compilation of ``bulk_create``: each field prepares a given value only
+    once and auto_now fields get one timestamp for the whole batch. No
+    signals and nothing read back, so only for append-only tables whose
+    primary key has a Python default.
+    """
+    if not objs:
+        return
+    fields = model._meta.concrete_fields
+    now = timezone.now()
+    columns = []
+    for field in fields:
+        if getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False):
+            for obj in objs:
+                setattr(obj, field.attname, now)
+        prepared: dict[Any, Any] = {}
+        column = []
+        for obj in objs:
+            value = getattr(obj, field.attname)
+            if value not in prepared:
+                prepared[value] = field.get_db_prep_save(value, connection)
+            column.append(prepared[value])
+        columns.append(column)
+    rows = list(zip(*columns))
+
+    # identifiers come from the model meta, values are all parameters
+    quote_name = connection.ops.quote_name
+    head = "INSERT INTO {} ({}) VALUES ".format(  # noqa: S608
+        quote_name(model._meta.db_table),
+        ", ".join(quote_name(field.column) for field in fields),  # type: ignore[arg-type]
+    )
+    placeholder = "({})".format(", ".join(["%s"] * len(fields)))
+    batch_size = max(1, connection.ops.bulk_batch_size(list(fields), objs))
+    with connection.cursor() as cursor:
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start : start + batch_size]
+            cursor.execute(
+                head + ", ".join([placeholder] * len(batch)),
+                list(itertools.chain.from_iterable(batch)),
+            )
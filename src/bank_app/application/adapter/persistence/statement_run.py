@@ -0,0 +1,219 @@
+"""
+Statements of every active account for one period, generated chunk by
+chunk by the ``generate_statements`` command. A chunk is a range of
+account ids of one account type: one query reads what the statements of
+its accounts need, one bulk insert writes them. Chunks are independent,
+so they run in any order on any number of worker processes.
+"""
+
+import datetime as dt
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, Optional, Union
+from uuid import UUID
+
+from django.db.models import DecimalField, Exists, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+from bank_app.application.adapter.persistence.entity.account_statement_entity import (
+    MonthlyStatementEntity,
+    TransactionEntity,
+)
+from bank_app.application.adapter.persistence.entity.bank_account_entity import (
+    BalanceStripeEntity,
+    BankAccountEntity,
+)
+from bank_app.application.adapter.persistence.entity.booklet_account_entity import (
+    BookletAccountEntity,
+)
+from bank_app.application.adapter.persistence.repository.account_statement_repository import (  # noqa: E501
+    AccountStatementRepository,
+)
+from bank_app.application.adapter.persistence.repository.bank_account_repository import (  # noqa: E501
+    BankAccountRepository,
+)
+from bank_app.application.adapter.persistence.repository.booklet_account_repository import (  # noqa: E501
+    BookletAccountRepository,
+)
+from bank_app.application.adapter.persistence.repository.transaction_repository import (
+    TransactionRepository,
+)
+from bank_app.application.domain.model.money import ZERO
+from bank_app.application.domain.service.account_statement import (
+    AccoutStatementService,
+)
+from bank_app.application.util.util import AccountType
+
+_AMOUNT = DecimalField(max_digits=19, decimal_places=2)
+
+
+def _accounts(
+    account_type: AccountType,
+) -> tuple[
+    Union[type[BankAccountEntity], type[BookletAccountEntity]],
+    Union[type[BankAccountRepository], type[BookletAccountRepository]],
+]:
+    if account_type is AccountType.CURRENT_ACCOUNT:
+        return BankAccountEntity, BankAccountRepository
+    return BookletAccountEntity, BookletAccountRepository
+
+
+def count_accounts(account_type: AccountType, after: Optional[UUID] = None) -> int:
+    """Active accounts of ``account_type`` with an id above ``after``"""
+    model, _ = _accounts(account_type)
+    active = model.objects.filter(is_active=True)
+    if after is not None:
+        active = active.filter(entity_id__gt=after)
+    return active.count()
+
+
+def account_chunks(
+    account_type: AccountType, size: int, after: Optional[UUID] = None
+) -> Iterator[list[UUID]]:
+    """
+    Ids of the active accounts of ``account_type`` in key order, ``size`` at
+    a time, from the first above ``after``. Each chunk is one range read of
+    the partial index on active accounts, however far the run has gone.
+    """
+    model, _ = _accounts(account_type)
+    active = model.objects.filter(is_active=True).order_by("entity_id")
+    while True:
+        page = active if after is None else active.filter(entity_id__gt=after)
+        ids = list(page.values_list("entity_id", flat=True)[:size])
+        if not ids:
+            return
+        yield ids
+        after = ids[-1]
+
+
+def generate_chunk(
+    account_type: AccountType,
+    first: UUID,
+    last: UUID,
+    period_start: dt.datetime,
+    period_end: dt.datetime,
+) -> int:
+    """
+    Statements of the period from ``period_start`` to ``period_end`` for the
+    active accounts of ``account_type`` with ids from ``first`` to ``last``
+    which have none yet, so a chunk run twice writes nothing the second time.
+    :return: the number of statements written.
+    """
+    as_of = dt.datetime.now(period_end.tzinfo)
+    model, repository = _accounts(account_type)
+    after_period = period_end + AccoutStatementService.TICK
+
+    # the latest closed statement before the period, as the prior statement
+    # of AccountStatementRepository.get_previous when they do not overlap
+    prior = MonthlyStatementEntity.objects.filter(
+        account_number=OuterRef("account_number"),
+        period_end__lt=period_start,
+        is_closed=True,
+    ).order_by("-period_end")
+    postings = TransactionEntity.objects.filter(account_id=OuterRef("entity_id"))
+
+    def net_amount(**dated: Any) -> Coalesce:
+        total = (
+            postings.filter(**dated)
+            .values("account_id")
+            .annotate(total=Sum(TransactionRepository.signed_amount()))
+            .values("total")
+        )
+        return Coalesce(Subquery(total), Value(ZERO), output_field=_AMOUNT)
+
+    stored = MonthlyStatementEntity.objects.filter(
+        account_id=OuterRef("entity_id"),
+        period_start=period_start,
+        period_end=period_end,
+    )
+    accounts = (
+        model.objects.filter(is_active=True, entity_id__gte=first, entity_id__lte=last)
+        .exclude(Exists(stored))
+        .annotate(
+            prior_end=Subquery(prior.values("period_end")[:1]),
+            prior_closing_balance=Subquery(prior.values("closing_balance")[:1]),
+        )
+        .annotate(
+            # the net amounts of AccoutStatementService.ledger_bounds
+            net_amount_between=net_amount(
+                transaction_date__gt=OuterRef("prior_end"),
+                transaction_date__lt=period_start,
+            ),
+            net_amount_of_period=net_amount(
+                transaction_date__gte=period_start, transaction_date__lt=after_period
+            ),
+            net_amount_since=net_amount(transaction_date__gte=after_period),
+        )
+    )
+    columns = [
+        *repository.COLUMNS,
+        "prior_end",
+        "prior_closing_balance",
+        "net_amount_between",
+        "net_amount_of_period",
+        "net_amount_since",
+    ]
+    if model is BankAccountEntity:
+        striped = (
+            BalanceStripeEntity.objects.filter(account_id=OuterRef("entity_id"))
+            .values("account_id")
+            .annotate(total=Sum("balance"))
+            .values("total")
+        )
+        accounts = accounts.annotate(
+            striped=Coalesce(Subquery(striped), Value(ZERO), output_field=_AMOUNT)
+        )
+        columns += ["balance_stripes", "striped"]
+
+    width = len(repository.COLUMNS)
+    statements = []
+    for row in accounts.values_list(*columns):
+        account = repository.from_row(row[:width])
+        prior_end, prior_closing_balance, between, period, since, *stripes = row[width:]
+        if stripes and stripes[0]:
+            # as BankAccountRepository._to_domain_with_stripes
+            account.balance += stripes[1]
+        statements.append(
+            AccoutStatementService.generate_monthly_statement(
+                account=account,
+                # lazy: a stored statement holds the transactions of its
+                # period by range, nothing is read here
+                transactions=TransactionRepository.stream_by_account_id_and_date_range(
+                    account.entity_id, period_start, period_end
+                ),
+                period_end=period_end,
+                net_amounts=[between, period, since]
+                if prior_end is not None
+                else [period, since],
+                period_start=period_start,
+                prior_end=prior_end,
+                prior_closing_balance=prior_closing_balance,
+                as_of=as_of,
+            )
+        )
+    AccountStatementRepository.insert_many(statements)
+    return len(statements)
+
+
+class Checkpoint:
+    """
+    Where a run stands, in a JSON file: its period, whether it finished and,
+    per account type, the id up to which every chunk is written. The file
+    is replaced whole, so an interrupted run leaves the previous state.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def load(self) -> Optional[dict[str, Any]]:
+        try:
+            state: dict[str, Any] = json.loads(self.path.read_text())
+        except FileNotFoundError:
+            return None
+        return state
+
+    def save(self, state: dict[str, Any]) -> None:
+        pending = self.path.with_name(self.path.name + ".tmp")
+        pending.write_text(json.dumps(state))
+        pending.replace(self.path)
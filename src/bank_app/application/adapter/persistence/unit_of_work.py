@@ -0,0 +1,109 @@
+import contextvars
+from collections.abc import Callable, Hashable
+from types import TracebackType
+from typing import Any, Optional
+
+from django.db import transaction
+
+from bank_app.application.domain.domain_models import Entity
+
+Writer = Callable[[Any], None]
+
+_current: contextvars.ContextVar[Optional["UnitOfWork"]] = contextvars.ContextVar(
+    "unit_of_work", default=None
+)
+
+
+class UnitOfWork:
+    """
+    What one request loaded and changed. While it is active, repositories
+    hand out the entity they already loaded instead of querying it again
+    (identity map) and queue saves instead of writing them; leaving the
+    block commits everything queued in one transaction, or drops it all if
+    the block raised.
+
+    Entities saved without having been loaded here are new and inserted
+    directly, loaded ones are updated. Postings are never queued: they are
+    guarded statements and run at once, dropping the account from the map.
+    """
+
+    def __init__(self) -> None:
+        self._identity: dict[Hashable, Entity] = {}
+        self._new: dict[Hashable, tuple[Entity, Writer]] = {}
+        self._dirty: dict[Hashable, tuple[Entity, Writer]] = {}
+        self._token: Optional[contextvars.Token[Optional[UnitOfWork]]] = None
+
+    def __enter__(self) -> "UnitOfWork":  # noqa: PYI034 not subclassed
+        self.rollback()
+        self._identity.clear()
+        self._token = _current.set(self)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if self._token is not None:
+            _current.reset(self._token)
+            self._token = None
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+
+    def get(self, key: Hashable) -> Optional[Entity]:
+        return self._identity.get(key)
+
+    def remember(self, entity: Entity, *keys: Hashable) -> None:
+        """Map ``entity`` under each of ``keys`` (its id, its account number)"""
+        for key in keys:
+            self._identity[key] = entity
+
+    def forget(self, key: Hashable) -> None:
+        """Drop the entity mapped under ``key``, whatever key it was mapped by"""
+        entity = self._identity.pop(key, None)
+        if entity is not None:
+            for other in [k for k, v in self._identity.items() if v is entity]:
+                del self._identity[other]
+
+    def register_save(
+        self, key: Hashable, entity: Entity, insert: Writer, update: Writer
+    ) -> None:
+        """
+        Queue the save of ``entity``: ``update`` when it was loaded in this
+        unit of work, ``insert`` otherwise. Saving it again changes nothing,
+        the entity is written once with its last state.
+        """
+        if key in self._new or key in self._dirty:
+            return
+        if self._identity.get(key) is entity:
+            self._dirty[key] = (entity, update)
+        else:
+            self._new[key] = (entity, insert)
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self._new or self._dirty)
+
+    def commit(self) -> None:
+        if not self.has_changes:
+            return
+        try:
+            with transaction.atomic():
+                for entity, insert in self._new.values():
+                    insert(entity)
+                for entity, update in self._dirty.values():
+                    update(entity)
+        finally:
+            self.rollback()
+
+    def rollback(self) -> None:
+        self._new.clear()
+        self._dirty.clear()
+
+
+def current_unit_of_work() -> Optional[UnitOfWork]:
+    """The unit of work of the running request, None outside of one"""
+    return _current.get()
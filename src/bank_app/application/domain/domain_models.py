@@ -1,7 +1,9 @@
 import abc
 import datetime
+import functools
+from collections.abc import Callable
 from decimal import Decimal
-from typing import Any, Optional
+from typing import Any, Optional, TypeVar
 from uuid import UUID
 
 import attr
@@ -20,6 +22,8 @@ class ValueSerializer:
 
 
 class ValueObject(abc.ABC):
+    __slots__ = ()
+
     def __eq__(self, other: object) -> bool:
         raise NotImplementedError
 
@@ -28,6 +32,8 @@ class ValueObject(abc.ABC):
 
 
 class EntityIdentity(ValueObject):
+    __slots__ = ()
+
     def serialize(self) -> dict[str, Any]:
         raise NotImplementedError("Subclasses must implement serialize()")
 
@@ -38,12 +44,86 @@ class EntityIdentity(ValueObject):
         return cls(**payload)
 
 
+def track_changes(instance: Any, attribute: "attr.Attribute[Any]", value: Any) -> Any:
+    """
+    ``on_setattr`` hook of entities: once loaded (``mark_clean``), every
+    field assigned is remembered so the repository writes only those.
+    """
+    if instance._changed_fields is not None:
+        instance._changed_fields.add(attribute.name)
+    return value
+
+
+def changes_field() -> Any:
+    """The ``_changed_fields`` attribute of an entity using ``track_changes``"""
+    return attr.ib(
+        default=None, init=False, repr=False, eq=False, on_setattr=attr.setters.NO_OP
+    )
+
+
+EntityT = TypeVar("EntityT", bound="Entity")
+
+
+Setter = Callable[[Any, Any], None]
+
+
+@functools.cache
+def _slot_setters(cls: type) -> tuple[tuple[Setter, ...], Optional[Setter]]:
+    """
+    The slot setters of the ``__init__`` fields of an attrs entity, in order,
+    and of its ``_changed_fields`` when it tracks changes. Setting slots
+    directly skips the ``on_setattr`` hooks.
+    """
+    setters = tuple(
+        getattr(cls, field.name).__set__ for field in attr.fields(cls) if field.init
+    )
+    changes = getattr(cls, "_changed_fields", None)
+    return setters, changes.__set__ if changes is not None else None
+
+
 class Entity(abc.ABC):
-    def __init__(
-        self, *args: Any, entity_id: Optional[EntityIdentity] = None, **kwargs: Any
-    ) -> None:
-        self.entity_id = entity_id
-        super().__init__(*args, **kwargs)
+    # no instance __dict__ anywhere in the hierarchy: the attrs subclasses
+    # declare the slots of their fields, the bases declare none
+    __slots__ = ()
+
+    entity_id: EntityIdentity
+
+    @property
+    def changed_fields(self) -> Optional[frozenset[str]]:
+        """
+        Fields assigned since the entity was loaded, None when it was not
+        loaded from the database (new, or built by hand).
+        """
+        changed = getattr(self, "_changed_fields", None)
+        return None if changed is None else frozenset(changed)
+
+    def mark_clean(self) -> None:
+        """The entity matches the database: start tracking changes from here"""
+        set_changes = _slot_setters(type(self))[1]
+        if set_changes is not None:
+            set_changes(self, set())
+
+    @classmethod
+    def hydrate(cls: type[EntityT], *values: Any) -> EntityT:  # noqa: PYI019 no Self before 3.11
+        """
+        Build an entity from the values of its fields, in declaration order,
+        without running ``__init__`` and its validation: for rows read back
+        from our own database, which were valid when written. The entity
+        starts clean.
+        :raise TypeError: when not given exactly one value per field.
+        """
+        setters, set_changes = _slot_setters(cls)
+        if len(values) != len(setters):
+            raise TypeError(
+                f"{cls.__name__}.hydrate takes {len(setters)} values, "
+                f"{len(values)} given"
+            )
+        instance = object.__new__(cls)
+        for set_field, value in zip(setters, values):
+            set_field(instance, value)
+        if set_changes is not None:
+            set_changes(instance, set())
+        return instance
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, self.__class__):
@@ -98,6 +178,8 @@ class AccountIdentity(EntityIdentity):
 
 
 class Account(Entity):
+    __slots__ = ()
+
     entity_id: AccountIdentity
     account_number: UUID
     balance: Decimal
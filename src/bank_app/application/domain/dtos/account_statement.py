@@ -1,5 +1,6 @@
 import datetime
 from decimal import Decimal
+from typing import Union
 from uuid import UUID
 
 import attr
@@ -9,6 +10,7 @@ from bank_app.application.domain.model.account_statement import (
     MonthlyStatement,
     Transaction,
 )
+from bank_app.application.domain.model.transaction_stream import TransactionStream
 
 
 @attr.dataclass(frozen=True, slots=True)
@@ -16,10 +18,12 @@ class MonthlyStatementDTO(DTO):
     account_id: UUID
     account_type: str
     account_number: UUID
+    period_start: datetime.datetime
+    period_end: datetime.datetime
     generated_at: datetime.datetime
     opening_balance: Decimal
     closing_balance: Decimal
-    transactions: list[Transaction]
+    transactions: Union[list[Transaction], TransactionStream]
 
     @classmethod
     def from_entity(cls, monthly_statement: MonthlyStatement) -> "MonthlyStatementDTO":
@@ -27,8 +31,17 @@ class MonthlyStatementDTO(DTO):
             account_id=monthly_statement.account_id,
             account_type=monthly_statement.account_type,
             account_number=monthly_statement.account_number,
+            period_start=monthly_statement.period_start,
+            period_end=monthly_statement.period_end,
             generated_at=monthly_statement.generated_at,
             opening_balance=monthly_statement.opening_balance,
             closing_balance=monthly_statement.closing_balance,
             transactions=monthly_statement.transactions,
         )
+
+
+@attr.dataclass(frozen=True, slots=True)
+class AccountBalanceDTO(DTO):
+    account_id: UUID
+    timestamp: datetime.datetime
+    balance: Decimal
@@ -0,0 +1,31 @@
+from decimal import Decimal
+from typing import Optional
+from uuid import UUID
+
+import attr
+
+from bank_app.application.domain.dtos.queries import DTO
+from bank_app.application.util.util import AccountType
+
+APPLIED = "APPLIED"
+REJECTED = "REJECTED"  # refused by the account rules, or unknown account
+INVALID = "INVALID"  # malformed line, never reached an account
+SKIPPED = "SKIPPED"  # valid, but not applied because the batch was rolled back
+
+
+@attr.dataclass(frozen=True, slots=True)
+class PostingDTO(DTO):
+    line: int
+    account_number: UUID
+    account_type: AccountType
+    transaction_type: str  # "DEPOSIT", "WITHDRAWAL"
+    amount: Decimal
+
+
+@attr.dataclass(frozen=True, slots=True)
+class PostingResultDTO(DTO):
+    line: int
+    status: str
+    account_number: Optional[UUID] = None
+    balance: Optional[Decimal] = None
+    detail: Optional[str] = None
@@ -3,4 +3,4 @@ class DTO:
     Data Transfer Object : only contains declaration of primitive fields.
     """
 
-    pass
+    __slots__ = ()
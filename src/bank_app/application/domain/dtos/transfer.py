@@ -0,0 +1,15 @@
+from decimal import Decimal
+from uuid import UUID
+
+import attr
+
+from bank_app.application.domain.dtos.queries import DTO
+
+
+@attr.dataclass(frozen=True, slots=True)
+class TransferDTO(DTO):
+    source_account_id: UUID
+    source_balance: Decimal
+    target_account_id: UUID
+    target_balance: Decimal
+    amount: Decimal
@@ -13,6 +13,14 @@ class NotFound(Exception):
         super().__init__(**kwargs)
 
 
+class ConcurrentUpdateException(Exception):
+    """the entity changed since it was read, the write was refused"""
+
+    def __init__(self, message: str, **kwargs: object) -> None:
+        self.message = message
+        super().__init__(**kwargs)
+
+
 class OverdraftLimitExceededException(BusinessException):
     pass
 
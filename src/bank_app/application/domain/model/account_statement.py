@@ -1,5 +1,6 @@
 import datetime
 from decimal import Decimal
+from typing import TYPE_CHECKING, Optional, Union
 from uuid import UUID
 
 import attr
@@ -8,7 +9,15 @@ from bank_app.application.domain.domain_models import (
     AccountIdentity,
     Entity,
     EntityIdentity,
+    changes_field,
+    track_changes,
 )
+from bank_app.application.domain.model.money import check_amount
+
+if TYPE_CHECKING:
+    from bank_app.application.domain.model.transaction_stream import (
+        TransactionStream,
+    )
 
 
 @attr.dataclass(frozen=True, slots=True)
@@ -27,7 +36,7 @@ class AccountType:
     BOOKLET_ACCOUNT = "BOOKLET_ACCOUNT"  # LIVRET A
 
 
-@attr.dataclass(slots=True, hash=False, eq=False)
+@attr.dataclass(slots=True, hash=False, eq=False, on_setattr=track_changes)
 class Transaction(Entity):
     entity_id: "TransactionIdentity"
     account_id: "AccountIdentity"
@@ -35,6 +44,29 @@ class Transaction(Entity):
     transaction_type: str  # "DEPOSIT", "WITHDRAWAL"
     amount: Decimal
     transaction_date: datetime.datetime
+    sequence: Optional[int] = None  # per account, in posting order
+    balance_after: Optional[Decimal] = None
+    _changed_fields: Optional[set[str]] = changes_field()
+
+
+@attr.dataclass(frozen=True, slots=True)
+class LedgerEntry:
+    """
+    Domain event raised by a posting. The repository applies it to the
+    balance and records the matching ledger row in the same transaction.
+    """
+
+    transaction_type: str  # "DEPOSIT", "WITHDRAWAL"
+    # whole cents the columns hold: nothing gets rounded when it is posted
+    amount: Decimal = attr.ib(validator=lambda _, __, amount: check_amount(amount))
+
+    @classmethod
+    def deposit(cls, amount: Decimal) -> "LedgerEntry":
+        return cls(transaction_type="DEPOSIT", amount=amount)
+
+    @classmethod
+    def withdrawal(cls, amount: Decimal) -> "LedgerEntry":
+        return cls(transaction_type="WITHDRAWAL", amount=amount)
 
 
 @attr.dataclass(slots=True, hash=False, eq=False)
@@ -52,10 +84,14 @@ class MonthlyStatement(Entity):
     generated_at: datetime.datetime
     opening_balance: Decimal
     closing_balance: Decimal
-    transactions: list[Transaction]
+    transactions: Union[list[Transaction], "TransactionStream"]
+    # the period had ended when it was generated, see AccoutStatementService
+    is_closed: bool = False
 
     @property
     def total_deposits(self) -> Decimal:
+        if not isinstance(self.transactions, list):
+            return self.transactions.total_deposits
         return sum(
             (t.amount for t in self.transactions if t.transaction_type == "DEPOSIT"),
             Decimal(0),
@@ -63,6 +99,8 @@ class MonthlyStatement(Entity):
 
     @property
     def total_withdrawals(self) -> Decimal:
+        if not isinstance(self.transactions, list):
+            return self.transactions.total_withdrawals
         return sum(
             (t.amount for t in self.transactions if t.transaction_type == "WITHDRAWAL"),
             Decimal(0),
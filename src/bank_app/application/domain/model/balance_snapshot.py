@@ -0,0 +1,34 @@
+import datetime as dt
+from decimal import Decimal
+from uuid import UUID
+
+import attr
+
+from bank_app.application.domain.domain_models import ValueObject
+
+
+def start_of_day(day: dt.date) -> dt.datetime:
+    """First instant of ``day``: snapshot days are UTC days"""
+    return dt.datetime.combine(day, dt.time(), dt.timezone.utc)
+
+
+@attr.dataclass(frozen=True, slots=True)
+class DailyBalanceSnapshot(ValueObject):
+    """
+    Balance of an account at the end of a day, and what the ledger recorded
+    on it. A historical balance is the one of the last snapshot before it,
+    moved by the postings since ``closed_at`` only.
+    """
+
+    account_id: UUID
+    account_type: str  # CURRENT_ACCOUNT, BOOKLET_ACCOUNT
+    date: dt.date
+    closing_balance: Decimal
+    deposit_total: Decimal
+    withdrawal_total: Decimal
+    transaction_count: int
+
+    @property
+    def closed_at(self) -> dt.datetime:
+        """The snapshot holds every posting dated before this"""
+        return start_of_day(self.date + dt.timedelta(days=1))
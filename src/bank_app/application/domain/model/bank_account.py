@@ -1,13 +1,20 @@
 import datetime
 from decimal import Decimal
+from typing import Optional
 from uuid import UUID
 
 import attr
 
-from bank_app.application.domain.domain_models import Account, AccountIdentity
+from bank_app.application.domain.domain_models import (
+    Account,
+    AccountIdentity,
+    changes_field,
+    track_changes,
+)
+from bank_app.application.domain.model.money import ZERO
 
 
-@attr.dataclass(slots=True, hash=False, eq=False)
+@attr.dataclass(slots=True, hash=False, eq=False, on_setattr=track_changes)
 class BankAccount(Account):
     entity_id: "AccountIdentity"
     account_number: UUID
@@ -17,6 +24,8 @@ class BankAccount(Account):
     is_active: bool = True
     created_at: datetime.datetime = datetime.datetime.now()
     updated_at: datetime.datetime = datetime.datetime.now()
+    version: int = 0  # bumped by every write, checked by save
+    _changed_fields: Optional[set[str]] = changes_field()
 
     def __attrs_post_init__(self):
         if not self.is_allow_overdraft:
@@ -43,9 +52,7 @@ class BankAccount(Account):
         return self.balance < 0
 
     def get_overdraft_used(self) -> Decimal:
-        return (
-            max(Decimal("0.00"), -self.balance) if self.balance < 0 else Decimal("0.00")
-        )
+        return -self.balance if self.balance < 0 else ZERO
 
     @property
     def available_balance(self) -> Decimal:
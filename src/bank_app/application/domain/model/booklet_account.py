@@ -1,18 +1,25 @@
 import datetime
 from decimal import Decimal
+from typing import Optional
 from uuid import UUID
 
 import attr
 
-from bank_app.application.domain.domain_models import Account, AccountIdentity
+from bank_app.application.domain.domain_models import (
+    Account,
+    AccountIdentity,
+    changes_field,
+    track_changes,
+)
 from bank_app.application.domain.exceptions import (
     BusinessException,
     DepositLimitExceededException,
     InsufficientFundsException,
 )
+from bank_app.application.domain.model.money import ZERO
 
 
-@attr.dataclass(slots=True, hash=False, eq=False)
+@attr.dataclass(slots=True, hash=False, eq=False, on_setattr=track_changes)
 class BookletAccount(Account):
     entity_id: "AccountIdentity"
     account_number: UUID
@@ -21,6 +28,8 @@ class BookletAccount(Account):
     is_active: bool = True
     created_at: datetime.datetime = datetime.datetime.now()
     updated_at: datetime.datetime = datetime.datetime.now()
+    version: int = 0  # bumped by every write, checked by save
+    _changed_fields: Optional[set[str]] = changes_field()
 
     def __attrs_post_init__(self) -> None:
         super().__attrs_post_init__()
@@ -66,4 +75,4 @@ class BookletAccount(Account):
         self.deposit_limit = new_limit
 
     def get_remaining_deposit_capacity(self) -> Decimal:
-        return max(Decimal("0.00"), self.deposit_limit - self.balance)
+        return max(ZERO, self.deposit_limit - self.balance)
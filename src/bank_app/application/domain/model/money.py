@@ -0,0 +1,121 @@
+from collections.abc import Iterable
+from decimal import Decimal
+
+import attr
+
+from bank_app.application.domain.domain_models import ValueObject
+
+# every amount column is a DecimalField(max_digits=19, decimal_places=2),
+# which holds any signed 64-bit count of cents
+MAX_CENTS = 2**63 - 1
+MIN_CENTS = -(2**63)
+
+# shared rather than parsed from "0.00" on every call: Decimal is immutable
+ZERO = Decimal("0.00")
+# the widest amount the columns hold, past the range of Money
+MAX_AMOUNT = Decimal("99999999999999999.99")
+CENT = Decimal("0.01")
+
+
+def check_cents(cents: int) -> int:
+    """:raise OverflowError: when ``cents`` does not fit in 64 bits."""
+    if not MIN_CENTS <= cents <= MAX_CENTS:
+        raise OverflowError(f"{cents} cents is out of the 64-bit range")
+    return cents
+
+
+def to_cents(amount: Decimal) -> int:
+    """
+    The exact number of cents of ``amount``.
+    :raise ValueError: when it is not finite or holds a fraction of a cent,
+    nothing is ever rounded.
+    :raise OverflowError: when it does not fit in 64 bits.
+    """
+    if not amount.is_finite():
+        raise ValueError(f"{amount} is not an amount")
+    # exponents this far out would build huge integers below
+    if amount.adjusted() > 18:
+        raise OverflowError(f"{amount} is out of the 64-bit range")
+    if amount and amount.adjusted() < -2:
+        raise ValueError(f"{amount} holds a fraction of a cent")
+    # exact, where scaling by 100 would round past the context precision
+    numerator, denominator = amount.as_integer_ratio()
+    cents, remainder = divmod(numerator * 100, denominator)
+    if remainder:
+        raise ValueError(f"{amount} holds a fraction of a cent")
+    return check_cents(cents)
+
+
+def check_amount(amount: Decimal) -> Decimal:
+    """
+    :raise ValueError: when ``amount`` is not finite or holds a fraction of
+    a cent, nothing is ever rounded.
+    :raise OverflowError: when it is wider than the columns.
+    """
+    if not amount.is_finite():
+        raise ValueError(f"{amount} is not an amount")
+    if abs(amount) > MAX_AMOUNT:
+        raise OverflowError(f"{amount} is wider than the amount columns")
+    if amount != amount.quantize(CENT):
+        raise ValueError(f"{amount} holds a fraction of a cent")
+    return amount
+
+
+def to_amount(cents: int) -> Decimal:
+    """``cents`` as a Decimal with two places, as stored in the columns"""
+    return Decimal(cents).scaleb(-2)
+
+
+@attr.dataclass(frozen=True, slots=True, order=True)
+class Money(ValueObject):
+    """
+    An amount as a signed 64-bit count of cents. Arithmetic is exact and
+    checked: a result out of range raises OverflowError instead of
+    wrapping or losing precision.
+
+    Each operation allocates a Money, which CPython makes slower than the
+    C Decimal it replaces one operation at a time: Money is for strict
+    conversions and for totals, where whole columns of cents are summed as
+    plain ints (see ``sum``).
+    """
+
+    cents: int = attr.ib(validator=lambda _, __, cents: check_cents(cents))
+
+    @classmethod
+    def from_decimal(cls, amount: Decimal) -> "Money":
+        """:raise ValueError, OverflowError: see ``to_cents``."""
+        return cls(to_cents(amount))
+
+    @classmethod
+    def sum(cls, cents: Iterable[int]) -> "Money":
+        """The total of amounts given in cents, checked once at the end"""
+        return cls(sum(cents))
+
+    def to_decimal(self) -> Decimal:
+        return to_amount(self.cents)
+
+    def __add__(self, other: "Money") -> "Money":
+        if not isinstance(other, Money):
+            return NotImplemented
+        return Money(self.cents + other.cents)
+
+    def __sub__(self, other: "Money") -> "Money":
+        if not isinstance(other, Money):
+            return NotImplemented
+        return Money(self.cents - other.cents)
+
+    def __neg__(self) -> "Money":
+        return Money(-self.cents)
+
+    def __mul__(self, factor: int) -> "Money":
+        if not isinstance(factor, int):
+            return NotImplemented
+        return Money(self.cents * factor)
+
+    __rmul__ = __mul__
+
+    def __bool__(self) -> bool:
+        return self.cents != 0
+
+    def __str__(self) -> str:
+        return str(self.to_decimal())
@@ -0,0 +1,80 @@
+import datetime as dt
+import itertools
+from collections.abc import Callable, Iterable, Iterator
+from decimal import Decimal
+from uuid import UUID
+
+from bank_app.application.domain.domain_models import AccountIdentity
+from bank_app.application.domain.model.account_statement import Transaction
+from bank_app.application.domain.model.money import Money, to_cents
+
+
+class TransactionStream:
+    """
+    The transactions of one account as a generator pipeline, newest first.
+    Nothing is held: each iteration draws them again from ``source``, which
+    the repository backs with a chunked read of the database, so a
+    statement costs the same memory however long its period is.
+    """
+
+    __slots__ = ("account_id", "_source")
+
+    def __init__(
+        self,
+        account_id: AccountIdentity,
+        source: Callable[[], Iterable[Transaction]],
+    ) -> None:
+        """:param source: called on every iteration for a fresh iterable"""
+        self.account_id = account_id
+        self._source = source
+
+    def __iter__(self) -> Iterator[Transaction]:
+        return iter(self._source())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (TransactionStream, list)):
+            # pairwise, so comparing holds no more than one transaction
+            return all(
+                mine == theirs
+                for mine, theirs in itertools.zip_longest(self, other, fillvalue=None)
+            )
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment] compares by content
+
+    def __repr__(self) -> str:
+        return f"TransactionStream({self.account_id!r})"
+
+    def between(self, start: dt.datetime, end: dt.datetime) -> "TransactionStream":
+        """The transactions dated from ``start`` to ``end``, both included"""
+        source = self._source
+
+        def period() -> Iterator[Transaction]:
+            for transaction in source():
+                if start <= transaction.transaction_date <= end:
+                    yield transaction
+
+        return TransactionStream(self.account_id, period)
+
+    @property
+    def ids(self) -> Iterator[UUID]:
+        """The ids, drawn from a new pass over the source"""
+        return (transaction.entity_id.uuid for transaction in self)
+
+    def _totals(self) -> tuple[Money, Money]:
+        """Deposits and withdrawals, summed in one pass"""
+        deposits = withdrawals = 0
+        for transaction in self:
+            if transaction.transaction_type == "DEPOSIT":
+                deposits += to_cents(transaction.amount)
+            else:
+                withdrawals += to_cents(transaction.amount)
+        return Money(deposits), Money(withdrawals)
+
+    @property
+    def total_deposits(self) -> Decimal:
+        return self._totals()[0].to_decimal()
+
+    @property
+    def total_withdrawals(self) -> Decimal:
+        return self._totals()[1].to_decimal()
@@ -1,7 +1,8 @@
 import datetime
 import uuid
+from collections.abc import Sequence
 from decimal import Decimal
-from typing import Union
+from typing import Optional, Union
 
 from bank_app.application.domain.domain_models import DomainService
 from bank_app.application.domain.model.account_statement import (
@@ -11,30 +12,114 @@ from bank_app.application.domain.model.account_statement import (
 )
 from bank_app.application.domain.model.bank_account import BankAccount
 from bank_app.application.domain.model.booklet_account import BookletAccount
+from bank_app.application.domain.model.transaction_stream import TransactionStream
 from bank_app.application.util.util import AccountType
 
 
 class AccoutStatementService(DomainService):
+    PERIOD = datetime.timedelta(days=30)
+    # postings are dated when written and committed moments later: a period
+    # is only taken as closed once this long has passed since its end
+    SETTLE_TIME = datetime.timedelta(seconds=5)
+    # postings are dated to the microsecond: what is dated up to t inclusive
+    # is what is dated before t + TICK
+    TICK = datetime.timedelta(microseconds=1)
+
+    @classmethod
+    def get_period_start(cls, period_end: datetime.datetime) -> datetime.datetime:
+        return period_end - cls.PERIOD
+
+    @classmethod
+    def calendar_month(
+        cls, month: datetime.date, tzinfo: Optional[datetime.tzinfo] = None
+    ) -> tuple[datetime.datetime, datetime.datetime]:
+        """First and last instant of the month of ``month``, in ``tzinfo``"""
+        start = datetime.datetime(month.year, month.month, 1, tzinfo=tzinfo)
+        next_month = (start + datetime.timedelta(days=31)).replace(day=1)
+        return start, next_month - cls.TICK
+
+    @classmethod
+    def ledger_bounds(
+        cls,
+        period_start: datetime.datetime,
+        period_end: datetime.datetime,
+        prior_end: Optional[datetime.datetime] = None,
+    ) -> list[Optional[datetime.datetime]]:
+        """
+        Where the ledger is cut to compute the balances of a statement (see
+        ``ITransactionRepository.get_net_amounts``). Without a prior
+        statement that is the period and what was posted since, up to now.
+        After one ending at ``prior_end``, only what follows it is read: what
+        was posted between both and the period, or what both hold and the
+        rest of the period when they overlap.
+        """
+        bounds = sorted(
+            [period_start, period_end + cls.TICK]
+            + ([prior_end + cls.TICK] if prior_end is not None else [])
+        )
+        if prior_end is None:
+            return [*bounds, None]
+        return list(bounds)
+
     @classmethod
     def generate_monthly_statement(
         cls,
         account: Union[BankAccount, BookletAccount],
-        transactions: list[Transaction],
+        transactions: Union[list[Transaction], TransactionStream],
         period_end: datetime.datetime,
+        net_amounts: Sequence[Decimal],
+        period_start: Optional[datetime.datetime] = None,
+        prior_end: Optional[datetime.datetime] = None,
+        prior_closing_balance: Optional[Decimal] = None,
+        as_of: Optional[datetime.datetime] = None,
+        previous: Optional[MonthlyStatement] = None,
     ) -> "MonthlyStatement":
-        period_start = period_end - datetime.timedelta(days=30)
-        period_transactions = [
-            t for t in transactions if period_start <= t.transaction_date <= period_end
-        ]
-        period_transactions.sort(key=lambda x: x.transaction_date, reverse=True)
+        """
+        :param transactions: transactions of the period, as objects, or as a
+        stream already ordered newest first which stays lazy.
+        :param net_amounts: deposits minus withdrawals between the
+        ``ledger_bounds`` of the statement.
+        :param period_start: start of the period, by default ``PERIOD``
+        before its end.
+        :param prior_end: end of the latest closed statement of the account
+        before this one, whose closing balance is ``prior_closing_balance``:
+        the balances follow from it rather than from the whole ledger.
+        :param as_of: when the ledger was read, to tell a closed period.
+        :param previous: statement stored for the same period, regenerated in
+        place so it keeps its identity.
+        """
+        if period_start is None:
+            period_start = cls.get_period_start(period_end)
+        period_transactions: Union[list[Transaction], TransactionStream]
+        if isinstance(transactions, TransactionStream):
+            period_transactions = transactions.between(period_start, period_end)
+        else:
+            period_transactions = [
+                t
+                for t in transactions
+                if period_start <= t.transaction_date <= period_end
+            ]
+            period_transactions.sort(key=lambda x: x.transaction_date, reverse=True)
         account_type = (
             AccountType.CURRENT_ACCOUNT
             if isinstance(account, BankAccount)
             else AccountType.BOOKLET_ACCOUNT
         )
-        opening_balance = cls._calculate_opening_balance(
-            account, transactions, period_start
+        opening_balance, closing_balance = cls._calculate_balances(
+            account,
+            period_start,
+            net_amounts,
+            prior_end,
+            prior_closing_balance,
         )
+        is_closed = as_of is not None and period_end <= as_of - cls.SETTLE_TIME
+        if previous is not None:
+            previous.generated_at = datetime.datetime.now()
+            previous.opening_balance = opening_balance
+            previous.closing_balance = closing_balance
+            previous.transactions = period_transactions
+            previous.is_closed = is_closed
+            return previous
         return MonthlyStatement(
             entity_id=MonthlyStatementIdentity(uuid.uuid4()),
             account_id=account.entity_id.uuid,
@@ -44,29 +129,40 @@ class AccoutStatementService(DomainService):
             period_end=period_end,
             generated_at=datetime.datetime.now(),
             opening_balance=opening_balance,
-            closing_balance=account.balance,
+            closing_balance=closing_balance,
             transactions=period_transactions,
+            is_closed=is_closed,
         )
 
     @classmethod
-    def _calculate_opening_balance(
+    def can_reuse(cls, statement: MonthlyStatement) -> bool:
+        """
+        Whether a stored statement still holds. Once its period is closed it
+        does: transactions are dated when written and keep that date (see
+        ``ITransactionRepository.save``), so nothing enters or leaves a
+        period that has ended, and the balances at its start and end stay.
+        """
+        return statement.is_closed
+
+    @classmethod
+    def _calculate_balances(
         cls,
         account: Union[BankAccount, BookletAccount],
-        transactions: list[Transaction],
         period_start: datetime.datetime,
-    ) -> Decimal:
-        """Calculate balance at the start of the period"""
-        previous_transactions = [
-            t for t in transactions if t.transaction_date < period_start
-        ]
-        previous_transactions.sort(key=lambda x: x.transaction_date)
-
-        current_balance = account.balance
-
-        for transaction in reversed(previous_transactions):
-            if transaction.transaction_type == "DEPOSIT":
-                current_balance -= transaction.amount
-            elif transaction.transaction_type == "WITHDRAWAL":
-                current_balance += transaction.amount
-
-        return current_balance
+        net_amounts: Sequence[Decimal],
+        prior_end: Optional[datetime.datetime] = None,
+        prior_closing_balance: Optional[Decimal] = None,
+    ) -> tuple[Decimal, Decimal]:
+        """Balances at the start and at the end of the period"""
+        if prior_end is None or prior_closing_balance is None:
+            # replayed back from the live balance
+            period, since = net_amounts[0], net_amounts[1]
+            opening_balance = account.balance - period - since
+        elif prior_end + cls.TICK <= period_start:
+            between, period = net_amounts[0], net_amounts[1]
+            opening_balance = prior_closing_balance + between
+        else:
+            shared, rest = net_amounts[0], net_amounts[1]
+            opening_balance = prior_closing_balance - shared
+            period = shared + rest
+        return opening_balance, opening_balance + period
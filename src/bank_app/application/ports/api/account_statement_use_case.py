@@ -3,7 +3,10 @@ from typing import Optional
 from uuid import UUID
 
 from bank_app.application.domain.domain_models import DomainService
-from bank_app.application.domain.dtos.account_statement import MonthlyStatementDTO
+from bank_app.application.domain.dtos.account_statement import (
+    AccountBalanceDTO,
+    MonthlyStatementDTO,
+)
 from bank_app.application.util.util import AccountType
 
 
@@ -13,6 +16,19 @@ class AccountStatementUseCase(DomainService):
         account_id: UUID,
         type_account: AccountType = AccountType.CURRENT_ACCOUNT,
         period_end: Optional[datetime.datetime] = None,
+        month: Optional[datetime.date] = None,
     ) -> MonthlyStatementDTO:
-        """generate a monthly report of current account or booklet account"""
+        """
+        generate a monthly report of current account or booklet account, over
+        the 30 days up to period_end or over the calendar month of month (UTC)
+        """
+        raise NotImplementedError
+
+    def get_balance_at(
+        self,
+        account_id: UUID,
+        timestamp: datetime.datetime,
+        type_account: AccountType = AccountType.CURRENT_ACCOUNT,
+    ) -> AccountBalanceDTO:
+        """balance held by the account at a past point in time"""
         raise NotImplementedError
@@ -0,0 +1,16 @@
+from collections.abc import Sequence
+
+from bank_app.application.domain.domain_models import DomainService
+from bank_app.application.domain.dtos.posting import PostingDTO, PostingResultDTO
+
+
+class BulkPostingUseCase(DomainService):
+    def post_bulk(
+        self, postings: Sequence[PostingDTO], atomic: bool = True
+    ) -> list[PostingResultDTO]:
+        """
+        apply many deposits / withdrawals, on current and booklet accounts,
+        in one transaction. All-or-nothing when atomic, otherwise refused
+        lines are reported and the others applied.
+        """
+        raise NotImplementedError
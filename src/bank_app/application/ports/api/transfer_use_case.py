@@ -0,0 +1,19 @@
+from decimal import Decimal
+from uuid import UUID
+
+from bank_app.application.domain.domain_models import DomainService
+from bank_app.application.domain.dtos.transfer import TransferDTO
+from bank_app.application.util.util import AccountType
+
+
+class TransferUseCase(DomainService):
+    def transfer(
+        self,
+        source_account_id: UUID,
+        target_account_id: UUID,
+        amount: Decimal,
+        source_type: AccountType = AccountType.CURRENT_ACCOUNT,
+        target_type: AccountType = AccountType.CURRENT_ACCOUNT,
+    ) -> TransferDTO:
+        """move money between two accounts, current or booklet, atomically"""
+        raise NotImplementedError
@@ -1,5 +1,7 @@
 import abc
-from typing import Any
+import datetime as dt
+from collections.abc import Sequence
+from typing import Any, Optional
 from uuid import UUID
 
 from bank_app.application.domain.domain_models import (
@@ -26,6 +28,42 @@ class IAccountStatementRepository(AbstractRepository):
     def get_by_account_number(cls, account_number: UUID) -> MonthlyStatement:
         raise NotImplementedError
 
+    @classmethod
+    @abc.abstractmethod
+    def get_by_period(
+        cls,
+        account_id: UUID,
+        period_start: dt.datetime,
+        period_end: dt.datetime,
+    ) -> Optional[MonthlyStatement]:
+        """
+        The statement stored for exactly this period of the account, read
+        with one indexed query: its transactions are streamed when iterated.
+        :return: None when the period has no statement yet.
+        """
+        raise NotImplementedError
+
+    @classmethod
+    @abc.abstractmethod
+    def get_previous(
+        cls, account_number: UUID, period_end: dt.datetime
+    ) -> Optional[MonthlyStatement]:
+        """
+        The closed statement of the account ending last before
+        ``period_end``, read with one indexed query.
+        :return: None when the account has none.
+        """
+        raise NotImplementedError
+
+    @classmethod
+    @abc.abstractmethod
+    def insert_many(cls, statements: Sequence[MonthlyStatement]) -> None:
+        """
+        Write statements known to be new with multi-row inserts, outside any
+        unit of work: for batch runs generating many at once.
+        """
+        raise NotImplementedError
+
     @classmethod
     @abc.abstractmethod
     def delete(cls, entity_id: EntityIdentity, **kwargs: Any) -> None:
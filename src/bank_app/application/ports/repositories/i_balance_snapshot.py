@@ -0,0 +1,46 @@
+import abc
+import datetime as dt
+from typing import Optional
+from uuid import UUID
+
+from bank_app.application.domain.model.balance_snapshot import DailyBalanceSnapshot
+
+
+class IBalanceSnapshotRepository(abc.ABC):
+    @classmethod
+    @abc.abstractmethod
+    def get_range(
+        cls, account_id: UUID, first: dt.date, last: dt.date
+    ) -> list[DailyBalanceSnapshot]:
+        """
+        Snapshots of the account from ``first`` to ``last`` included, oldest
+        first, read by one range scan of the (account, date) key. Days
+        without a snapshot are left out.
+        """
+        raise NotImplementedError
+
+    @classmethod
+    @abc.abstractmethod
+    def get_latest(
+        cls, account_id: UUID, before: dt.date
+    ) -> Optional[DailyBalanceSnapshot]:
+        """
+        The last snapshot of the account dated before ``before``, read with
+        one indexed query.
+        :return: None when the account has none.
+        """
+        raise NotImplementedError
+
+    @classmethod
+    @abc.abstractmethod
+    def take_snapshots(cls, day: dt.date) -> int:
+        """
+        Snapshot of ``day`` for every account which has none yet, so running
+        it twice writes nothing the second time. Each closing balance is the
+        one of the snapshot of the day before moved by the postings of
+        ``day``. An account without a snapshot of the day before, even with
+        older ones, has it replayed back from its live balance. All the
+        accounts of a type are read by one query.
+        :return: the number of snapshots written.
+        """
+        raise NotImplementedError
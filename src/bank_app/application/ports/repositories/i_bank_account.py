@@ -1,6 +1,7 @@
 import abc
+from collections.abc import Sequence
 from decimal import Decimal
-from typing import Any
+from typing import Any, Optional
 from uuid import UUID
 
 from bank_app.application.domain.domain_models import (
@@ -9,6 +10,7 @@ from bank_app.application.domain.domain_models import (
     Entity,
     EntityIdentity,
 )
+from bank_app.application.domain.model.account_statement import LedgerEntry
 from bank_app.application.domain.model.bank_account import BankAccount
 
 
@@ -35,6 +37,11 @@ class IBankAccountRepository(AbstractRepository):
     @classmethod
     @abc.abstractmethod
     def save(cls, entity: Entity) -> None:
+        """
+        Insert the account, or update it if it still has the version it was
+        read with.
+        :raise ConcurrentUpdateException: The account was written since.
+        """
         if not isinstance(entity, BankAccount):
             raise ValueError("entity must be a BankAccount")
         raise NotImplementedError
@@ -45,3 +52,18 @@ class IBankAccountRepository(AbstractRepository):
         cls, account_number: UUID, overdraft_amount: Decimal
     ) -> None:
         raise NotImplementedError
+
+    @classmethod
+    @abc.abstractmethod
+    def apply_postings(
+        cls, account_number: UUID, entries: Sequence[LedgerEntry]
+    ) -> Optional[BankAccount]:
+        """
+        Apply every entry to the balance in a single guarded statement and
+        record its ledger row, all in one transaction. Withdrawals are
+        guarded by the available balance (overdraft included when allowed);
+        nothing is written when any entry is refused.
+        :return: The updated account, or None when no account matched or an
+        entry was refused.
+        """
+        raise NotImplementedError
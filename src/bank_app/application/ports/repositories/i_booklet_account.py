@@ -1,5 +1,6 @@
 import abc
-from typing import Any
+from collections.abc import Sequence
+from typing import Any, Optional
 from uuid import UUID
 
 from bank_app.application.domain.domain_models import (
@@ -8,6 +9,7 @@ from bank_app.application.domain.domain_models import (
     Entity,
     EntityIdentity,
 )
+from bank_app.application.domain.model.account_statement import LedgerEntry
 from bank_app.application.domain.model.booklet_account import BookletAccount
 
 
@@ -34,6 +36,26 @@ class IBookletAccountRepository(AbstractRepository):
     @classmethod
     @abc.abstractmethod
     def save(cls, entity: Entity) -> None:
+        """
+        Insert the account, or update it if it still has the version it was
+        read with.
+        :raise ConcurrentUpdateException: The account was written since.
+        """
         if not isinstance(entity, BookletAccount):
             raise ValueError("entity must be a BookletAccount")
         raise NotImplementedError
+
+    @classmethod
+    @abc.abstractmethod
+    def apply_postings(
+        cls, account_number: UUID, entries: Sequence[LedgerEntry]
+    ) -> Optional[BookletAccount]:
+        """
+        Apply every entry to the balance in a single guarded statement and
+        record its ledger row, all in one transaction. Deposits are guarded
+        by the deposit limit, withdrawals by the balance; nothing is written
+        when any entry is refused.
+        :return: The updated account, or None when no account matched or an
+        entry was refused.
+        """
+        raise NotImplementedError
@@ -0,0 +1,29 @@
+import abc
+from collections.abc import Callable, Sequence
+
+from bank_app.application.domain.domain_models import Account
+from bank_app.application.domain.dtos.posting import PostingDTO, PostingResultDTO
+from bank_app.application.domain.model.account_statement import LedgerEntry
+
+
+class IPostingRepository(abc.ABC):
+    @classmethod
+    @abc.abstractmethod
+    def apply_bulk(
+        cls,
+        postings: Sequence[PostingDTO],
+        apply_entry: Callable[[Account, LedgerEntry], None],
+        atomic: bool = True,
+    ) -> list[PostingResultDTO]:
+        """
+        Lock every account named by the postings, with one IN query per
+        account type, then run ``apply_entry`` on the in-memory accounts in
+        line order. It raises BusinessException or ValueError to refuse a
+        line, which leaves the account untouched. Balances and ledger rows of
+        the applied lines are written with bulk statements, all in the same
+        transaction.
+        :param atomic: roll everything back as soon as one line is refused,
+        the other lines are then reported SKIPPED.
+        :return: One result per posting, in line order.
+        """
+        raise NotImplementedError
@@ -1,5 +1,8 @@
 import abc
-from typing import Any
+import datetime as dt
+from collections.abc import Sequence
+from decimal import Decimal
+from typing import Any, Optional
 
 from bank_app.application.domain.domain_models import (
     AbstractRepository,
@@ -11,6 +14,7 @@ from bank_app.application.domain.model.account_statement import (
     Transaction,
     TransactionIdentity,
 )
+from bank_app.application.domain.model.transaction_stream import TransactionStream
 
 
 class ITransactionRepository(AbstractRepository):
@@ -26,6 +30,71 @@ class ITransactionRepository(AbstractRepository):
     def get_by_account_id(cls, account_id: AccountIdentity) -> list[Transaction]:
         raise NotImplementedError
 
+    @classmethod
+    @abc.abstractmethod
+    def get_by_account_id_and_date_range(
+        cls,
+        account_id: AccountIdentity,
+        start_date: dt.datetime,
+        end_date: dt.datetime,
+    ) -> list[Transaction]:
+        raise NotImplementedError
+
+    @classmethod
+    @abc.abstractmethod
+    def stream_by_account_id_and_date_range(
+        cls,
+        account_id: AccountIdentity,
+        start_date: dt.datetime,
+        end_date: dt.datetime,
+    ) -> TransactionStream:
+        """
+        Transactions of the account dated from start_date to end_date,
+        newest first, read in chunks each time the stream is iterated:
+        nothing is held in memory.
+        """
+        raise NotImplementedError
+
+    @classmethod
+    @abc.abstractmethod
+    def get_net_amount_since(
+        cls, account_id: AccountIdentity, start_date: dt.datetime
+    ) -> Decimal:
+        """
+        Deposits minus withdrawals recorded on the account from start_date,
+        computed by the database.
+        """
+        raise NotImplementedError
+
+    @classmethod
+    @abc.abstractmethod
+    def get_net_amounts(
+        cls,
+        account_id: AccountIdentity,
+        bounds: Sequence[Optional[dt.datetime]],
+    ) -> list[Decimal]:
+        """
+        Deposits minus withdrawals recorded on the account in each range
+        between two consecutive ``bounds``, from the first included to the
+        next excluded, computed by one query. The last bound may be None for
+        a range that runs up to now. Nothing outside the bounds is read.
+        :return: one net amount per range.
+        """
+        raise NotImplementedError
+
+    @classmethod
+    @abc.abstractmethod
+    def balance_at(
+        cls, account_id: AccountIdentity, timestamp: dt.datetime
+    ) -> Optional[Decimal]:
+        """
+        Balance held at timestamp, read from the running balance of the last
+        posting recorded before it.
+        :return: None when no posting precedes it or the last one carries no
+        running balance.
+        """
+        raise NotImplementedError
+
     @classmethod
     @abc.abstractmethod
     def delete(cls, entity_id: EntityIdentity, **kwargs: Any) -> None:
@@ -36,6 +105,12 @@ class ITransactionRepository(AbstractRepository):
     @classmethod
     @abc.abstractmethod
     def save(cls, entity: Entity) -> None:
+        """
+        Transactions are dated when they are written, and a stored one
+        keeps its date: nothing is ever posted into a period that has
+        ended, which statements of closed periods rely on.
+        :raise ValueError: when the date of a stored transaction was changed.
+        """
         if not isinstance(entity, Transaction):
             raise ValueError("entity must be a Transaction")
         raise NotImplementedError
@@ -0,0 +1,28 @@
+import abc
+from decimal import Decimal
+from typing import Optional
+
+from bank_app.application.domain.domain_models import Account, AccountIdentity
+from bank_app.application.util.util import AccountType
+
+
+class ITransferRepository(abc.ABC):
+    @classmethod
+    @abc.abstractmethod
+    def apply_transfer(
+        cls,
+        source_id: AccountIdentity,
+        source_type: AccountType,
+        target_id: AccountIdentity,
+        target_type: AccountType,
+        amount: Decimal,
+    ) -> Optional[tuple[Account, Account]]:
+        """
+        Debit the source and credit the target in one transaction, the legs
+        applied in entity_id order so both rows are always locked in that
+        order. Each leg is guarded like a posting
+        (overdraft for the source, deposit limit for a booklet target).
+        :return: The updated (source, target), or None when an account is
+        missing or a leg was refused; nothing is written then.
+        """
+        raise NotImplementedError
@@ -1,11 +1,17 @@
 import contextlib
 import datetime
+import threading
+from decimal import Decimal
 from typing import TYPE_CHECKING, Optional, Union
 from uuid import UUID
 
 from bank_app.application.domain.domain_models import AccountIdentity
-from bank_app.application.domain.dtos.account_statement import MonthlyStatementDTO
+from bank_app.application.domain.dtos.account_statement import (
+    AccountBalanceDTO,
+    MonthlyStatementDTO,
+)
 from bank_app.application.domain.exceptions import NotFound
+from bank_app.application.domain.model.account_statement import MonthlyStatement
 from bank_app.application.domain.model.bank_account import BankAccount
 from bank_app.application.domain.model.booklet_account import BookletAccount
 from bank_app.application.ports.api.account_statement_use_case import (
@@ -20,6 +26,9 @@ if TYPE_CHECKING:
     from bank_app.application.ports.repositories.i_account_statement import (
         IAccountStatementRepository,
     )
+    from bank_app.application.ports.repositories.i_balance_snapshot import (
+        IBalanceSnapshotRepository,
+    )
     from bank_app.application.ports.repositories.i_bank_account import (
         IBankAccountRepository,
     )
@@ -31,12 +40,46 @@ if TYPE_CHECKING:
     )
 
 
+class StatementReuseStats:
+    """
+    How statement requests were answered, process wide: from a stored
+    statement (hits), by regenerating a stored one that no longer held
+    (stale), or by generating the first one of the period (misses).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.stale = 0
+        self.misses = 0
+
+    def record(self, stored: Optional[MonthlyStatement], reused: bool) -> None:
+        with self._lock:
+            if reused:
+                self.hits += 1
+            elif stored is not None:
+                self.stale += 1
+            else:
+                self.misses += 1
+
+    def stats(self) -> dict[str, float]:
+        requests = self.hits + self.stale + self.misses
+        return {
+            "hits": self.hits,
+            "stale": self.stale,
+            "misses": self.misses,
+            "hit_rate": self.hits / requests if requests else 0.0,
+        }
+
+
 class AccountStatementService(AccountStatementUseCase):
     _transaction_repository: "ITransactionRepository"
     _account_statement_repository: "IAccountStatementRepository"
     _bank_account_repository: "IBankAccountRepository"
     _booklet_account_repository: "IBookletAccountRepository"
     _account_statement_service: "AccoutStatementService"
+    _reuse_stats: Optional[StatementReuseStats]
+    _balance_snapshot_repository: Optional["IBalanceSnapshotRepository"]
 
     def __init__(
         self,
@@ -45,12 +88,16 @@ class AccountStatementService(AccountStatementUseCase):
         bank_account_repository: "IBankAccountRepository",
         booklet_account_repository: "IBookletAccountRepository",
         account_statement_service: "AccoutStatementService",
+        reuse_stats: Optional[StatementReuseStats] = None,
+        balance_snapshot_repository: Optional["IBalanceSnapshotRepository"] = None,
     ) -> None:
         self._transaction_repository = transaction_repository
         self._account_statement_repository = account_statement_repository
         self._bank_account_repository = bank_account_repository
         self._booklet_account_repository = booklet_account_repository
         self._account_statement_service = account_statement_service
+        self._reuse_stats = reuse_stats
+        self._balance_snapshot_repository = balance_snapshot_repository
 
     def _get_account(
         self, account_id: UUID, type_account: AccountType = AccountType.CURRENT_ACCOUNT
@@ -73,18 +120,105 @@ class AccountStatementService(AccountStatementUseCase):
         account_id: UUID,
         type_account: AccountType = AccountType.CURRENT_ACCOUNT,
         period_end: Optional[datetime.datetime] = None,
+        month: Optional[datetime.date] = None,
     ) -> MonthlyStatementDTO:
+        period_start = None
+        if month is not None:
+            period_start, period_end = self._account_statement_service.calendar_month(
+                month, datetime.timezone.utc
+            )
+        # taken before the ledger is read, aware when period_end is
+        as_of = datetime.datetime.now(period_end.tzinfo if period_end else None)
         if period_end is None:
-            period_end = datetime.datetime.now()
+            period_end = as_of
+        if period_start is None:
+            period_start = self._account_statement_service.get_period_start(period_end)
 
         account = self._get_account(account_id=account_id, type_account=type_account)
         if not account:
             raise NotFound(f"Account with id {account_id} does not exist")
-        transactions = self._transaction_repository.get_by_account_id(
-            AccountIdentity(account_id)
+        account_identity = AccountIdentity(account_id)
+        stored = self._account_statement_repository.get_by_period(
+            account_id, period_start, period_end
+        )
+        reused = stored is not None and self._account_statement_service.can_reuse(
+            stored
+        )
+        if self._reuse_stats is not None:
+            self._reuse_stats.record(stored, reused)
+        if stored is not None and reused:
+            return MonthlyStatementDTO.from_entity(stored)
+
+        transactions = self._transaction_repository.stream_by_account_id_and_date_range(
+            account_identity, period_start, period_end
+        )
+        # balances follow from the last closed statement when there is one,
+        # reading the ledger after it only
+        prior = self._account_statement_repository.get_previous(
+            account.account_number, period_end
+        )
+        prior_end = prior.period_end if prior is not None else None
+        net_amounts = self._transaction_repository.get_net_amounts(
+            account_identity,
+            self._account_statement_service.ledger_bounds(
+                period_start, period_end, prior_end
+            ),
         )
         account_statement = self._account_statement_service.generate_monthly_statement(
-            account=account, transactions=transactions, period_end=period_end
+            account=account,
+            transactions=transactions,
+            period_end=period_end,
+            net_amounts=net_amounts,
+            period_start=period_start,
+            prior_end=prior_end,
+            prior_closing_balance=prior.closing_balance if prior is not None else None,
+            as_of=as_of,
+            previous=stored,
         )
         self._account_statement_repository.save(account_statement)
         return MonthlyStatementDTO.from_entity(account_statement)
+
+    def get_balance_at(
+        self,
+        account_id: UUID,
+        timestamp: datetime.datetime,
+        type_account: AccountType = AccountType.CURRENT_ACCOUNT,
+    ) -> AccountBalanceDTO:
+        account_identity = AccountIdentity(account_id)
+        balance = self._transaction_repository.balance_at(account_identity, timestamp)
+        if balance is None:
+            # no posting with a running balance before timestamp (legacy rows or
+            # a quiet account): the last snapshot before it and what follows
+            balance = self._balance_from_snapshot(account_identity, timestamp)
+        if balance is None:
+            # nor a snapshot: replay what happened since from the live balance
+            account = self._get_account(
+                account_id=account_id, type_account=type_account
+            )
+            if not account:
+                raise NotFound(f"Account with id {account_id} does not exist")
+            balance = (
+                account.balance
+                - self._transaction_repository.get_net_amount_since(
+                    account_identity, timestamp
+                )
+            )
+        return AccountBalanceDTO(
+            account_id=account_id, timestamp=timestamp, balance=balance
+        )
+
+    def _balance_from_snapshot(
+        self, account_identity: AccountIdentity, timestamp: datetime.datetime
+    ) -> Optional[Decimal]:
+        if self._balance_snapshot_repository is None:
+            return None
+        snapshot = self._balance_snapshot_repository.get_latest(
+            account_identity.uuid,
+            before=timestamp.astimezone(datetime.timezone.utc).date(),
+        )
+        if snapshot is None:
+            return None
+        (net_amount,) = self._transaction_repository.get_net_amounts(
+            account_identity, [snapshot.closed_at, timestamp]
+        )
+        return snapshot.closing_balance + net_amount
@@ -4,7 +4,8 @@ from uuid import UUID
 
 from bank_app.application.domain.dtos.bank_account import BankAccountDTO
 from bank_app.application.domain.exceptions import BusinessException, NotFound
-from bank_app.application.domain.service.bank_account import BankAccountService
+from bank_app.application.domain.model.account_statement import LedgerEntry
+from bank_app.application.domain.model.bank_account import BankAccount as Account
 from bank_app.application.ports.api.bank_account_use_case import BankAccount
 
 if TYPE_CHECKING:
@@ -19,21 +20,27 @@ class BankAccountRedrawAndDepositService(BankAccount):
     def __init__(self, bank_account_repository: "IBankAccountRepository") -> None:
         self._bank_account_repository = bank_account_repository
 
-    def redraw(self, account_number: UUID, amount: Decimal) -> "BankAccountDTO":
+    def _get_bank_account(self, account_number: UUID) -> Account:
         bank_account = self._bank_account_repository.get_by_bank_account_number(
             account_number=account_number
         )
         if not bank_account:
             raise NotFound(f"Account with number {account_number} not found")
+        return bank_account
 
+    def redraw(self, account_number: UUID, amount: Decimal) -> "BankAccountDTO":
         if amount <= 0:
             raise ValueError("cannot redraw null or negative amount")
 
-        if not BankAccountService.can_withdraw(bank_account, amount) and amount > 0:
+        bank_account = self._bank_account_repository.apply_postings(
+            account_number=account_number, entries=[LedgerEntry.withdrawal(amount)]
+        )
+        if not bank_account:
+            # nothing was debited: either the account is unknown
+            # or the guarded update refused the withdrawal
+            self._get_bank_account(account_number)
             raise BusinessException("Insufficient funds to make this withdrawal")
 
-        bank_account.withdraw(amount=amount)
-        self._bank_account_repository.save(bank_account)
         return BankAccountDTO(
             entity_id=bank_account.entity_id.uuid,
             account_number=bank_account.account_number,
@@ -41,17 +48,16 @@ class BankAccountRedrawAndDepositService(BankAccount):
         )
 
     def deposit_money(self, account_number: UUID, amount: Decimal) -> "BankAccountDTO":
-        bank_account = self._bank_account_repository.get_by_bank_account_number(
-            account_number=account_number
+        if amount <= 0:
+            raise ValueError("cannot deposit null or negative amount")
+
+        bank_account = self._bank_account_repository.apply_postings(
+            account_number=account_number, entries=[LedgerEntry.deposit(amount)]
         )
         if not bank_account:
+            self._get_bank_account(account_number)
             raise NotFound(f"Account with number {account_number} not found")
 
-        if amount <= 0:
-            raise ValueError("cannot deposit null or negative amount")
-
-        bank_account.deposit(amount)
-        self._bank_account_repository.save(bank_account)
         return BankAccountDTO(
             entity_id=bank_account.entity_id.uuid,
             account_number=bank_account.account_number,
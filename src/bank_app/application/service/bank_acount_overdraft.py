@@ -3,7 +3,11 @@ from typing import TYPE_CHECKING
 from uuid import UUID
 
 from bank_app.application.domain.dtos.bank_account import BankAccountDTO
-from bank_app.application.domain.exceptions import NotFound
+from bank_app.application.domain.exceptions import (
+    InsufficientFundsException,
+    NotFound,
+)
+from bank_app.application.domain.model.account_statement import LedgerEntry
 from bank_app.application.ports.api.bank_account_overdraft_use_case import (
     BankAccountOverdraft,
 )
@@ -30,19 +34,27 @@ class BankAccountOverdraftService(BankAccountOverdraft):
     def withdraw_from_account(
         self, account_number: UUID, amount: Decimal
     ) -> "BankAccountDTO":
-        bank_account = self._bank_account_repository.get_by_bank_account_number(
-            account_number=account_number
-        )
-        if not bank_account:
-            raise NotFound(f"Account with number {account_number} not found")
-
         if amount <= 0:
             raise ValueError("cannot redraw null or negative amount")
-        self._bank_account_service.authorize_withdrawal(
-            account=bank_account, amount=amount
+
+        bank_account = self._bank_account_repository.apply_postings(
+            account_number=account_number, entries=[LedgerEntry.withdrawal(amount)]
         )
-        bank_account.withdraw(amount=amount)
-        self._bank_account_repository.save(bank_account)
+        if not bank_account:
+            # the guarded update refused the withdrawal, let the domain
+            # explain why on the current state of the account
+            bank_account = self._bank_account_repository.get_by_bank_account_number(
+                account_number=account_number
+            )
+            if not bank_account:
+                raise NotFound(f"Account with number {account_number} not found")
+            self._bank_account_service.authorize_withdrawal(
+                account=bank_account, amount=amount
+            )
+            raise InsufficientFundsException(
+                f"Insufficient funds for withdrawal of {amount}"
+            )
+
         return BankAccountDTO(
             entity_id=bank_account.entity_id.uuid,
             account_number=bank_account.account_number,
@@ -3,7 +3,15 @@ from typing import TYPE_CHECKING
 from uuid import UUID
 
 from bank_app.application.domain.dtos.booklet_account import BookletAccountDTO
-from bank_app.application.domain.exceptions import NotFound
+from bank_app.application.domain.exceptions import (
+    DepositLimitExceededException,
+    InsufficientFundsException,
+    NotFound,
+)
+from bank_app.application.domain.model.account_statement import LedgerEntry
+from bank_app.application.domain.model.booklet_account import (
+    BookletAccount as Account,
+)
 from bank_app.application.ports.api.booklet_account_use_case import BookletAccount
 
 if TYPE_CHECKING:
@@ -25,7 +33,7 @@ class BookletAccountService(BookletAccount):
         self._booklet_account_repository = booklet_account_repository
         self._booklet_account_service = booklet_account_service
 
-    def redraw(self, account_number: UUID, amount: Decimal) -> BookletAccountDTO:
+    def _get_booklet_account(self, account_number: UUID) -> Account:
         booklet_account = (
             self._booklet_account_repository.get_by_booklet_account_number(
                 account_number
@@ -33,33 +41,36 @@ class BookletAccountService(BookletAccount):
         )
         if not booklet_account:
             raise NotFound(f"Account with number {account_number} not found")
+        return booklet_account
 
+    def redraw(self, account_number: UUID, amount: Decimal) -> BookletAccountDTO:
         if amount <= 0:
             raise ValueError("cannot redraw null or negative amount")
-        self._booklet_account_service.authorize_withdrawal(
-            account=booklet_account, amount=amount
-        )
-        booklet_account.withdraw(amount)
-        self._booklet_account_repository.save(booklet_account)
-        return BookletAccountDTO.from_entity(booklet_account)
 
-    def deposit_money(self, account_number: UUID, amount: Decimal) -> BookletAccountDTO:
-        booklet_account = (
-            self._booklet_account_repository.get_by_booklet_account_number(
-                account_number
-            )
+        booklet_account = self._booklet_account_repository.apply_postings(
+            account_number, [LedgerEntry.withdrawal(amount)]
         )
-
         if not booklet_account:
-            raise NotFound(f"Account with number {account_number} not found")
+            self._booklet_account_service.authorize_withdrawal(
+                account=self._get_booklet_account(account_number), amount=amount
+            )
+            raise InsufficientFundsException(
+                f"Insufficient funds for withdrawal of {amount}"
+            )
+        return BookletAccountDTO.from_entity(booklet_account)
 
+    def deposit_money(self, account_number: UUID, amount: Decimal) -> BookletAccountDTO:
         if amount <= 0:
             raise ValueError("cannot deposit null or negative amount")
-        self._booklet_account_service.authorize_deposit(
-            account=booklet_account, amount=amount
+
+        booklet_account = self._booklet_account_repository.apply_postings(
+            account_number, [LedgerEntry.deposit(amount)]
         )
-        booklet_account.deposit(amount)
-        self._booklet_account_repository.save(booklet_account)
+        if not booklet_account:
+            self._booklet_account_service.authorize_deposit(
+                account=self._get_booklet_account(account_number), amount=amount
+            )
+            raise DepositLimitExceededException("Deposit would exceed deposit limit")
         return BookletAccountDTO.from_entity(booklet_account)
 
     def update_deposit_limit(
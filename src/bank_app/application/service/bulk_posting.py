@@ -0,0 +1,62 @@
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+from bank_app.application.domain.domain_models import Account
+from bank_app.application.domain.dtos.posting import PostingDTO, PostingResultDTO
+from bank_app.application.domain.model.account_statement import LedgerEntry
+from bank_app.application.domain.model.bank_account import BankAccount
+from bank_app.application.domain.model.booklet_account import BookletAccount
+from bank_app.application.ports.api.bulk_posting_use_case import BulkPostingUseCase
+
+if TYPE_CHECKING:
+    from bank_app.application.domain.service.bank_account import BankAccountService
+    from bank_app.application.domain.service.booklet_account import BookletAcountService
+    from bank_app.application.ports.repositories.i_posting import IPostingRepository
+
+
+class BulkPostingService(BulkPostingUseCase):
+    _posting_repository: "IPostingRepository"
+    _bank_account_service: "BankAccountService"
+    _booklet_account_service: "BookletAcountService"
+
+    def __init__(
+        self,
+        posting_repository: "IPostingRepository",
+        bank_account_service: "BankAccountService",
+        booklet_account_service: "BookletAcountService",
+    ) -> None:
+        self._posting_repository = posting_repository
+        self._bank_account_service = bank_account_service
+        self._booklet_account_service = booklet_account_service
+
+    def _apply_entry(self, account: Account, entry: LedgerEntry) -> None:
+        """same rules as the per-call deposit and withdrawal use cases"""
+        if isinstance(account, BookletAccount):
+            if entry.transaction_type == "DEPOSIT":
+                self._booklet_account_service.authorize_deposit(
+                    account=account, amount=entry.amount
+                )
+            else:
+                self._booklet_account_service.authorize_withdrawal(
+                    account=account, amount=entry.amount
+                )
+        elif (
+            isinstance(account, BankAccount) and entry.transaction_type == "WITHDRAWAL"
+        ):
+            self._bank_account_service.authorize_withdrawal(
+                account=account, amount=entry.amount
+            )
+
+        if entry.transaction_type == "DEPOSIT":
+            account.deposit(entry.amount)
+        else:
+            account.withdraw(entry.amount)
+
+    def post_bulk(
+        self, postings: Sequence[PostingDTO], atomic: bool = True
+    ) -> list[PostingResultDTO]:
+        if not postings:
+            return []
+        return self._posting_repository.apply_bulk(
+            postings=postings, apply_entry=self._apply_entry, atomic=atomic
+        )
@@ -0,0 +1,113 @@
+from decimal import Decimal
+from typing import TYPE_CHECKING, Union
+from uuid import UUID
+
+from bank_app.application.domain.domain_models import AccountIdentity
+from bank_app.application.domain.dtos.transfer import TransferDTO
+from bank_app.application.domain.exceptions import InsufficientFundsException
+from bank_app.application.domain.model.bank_account import BankAccount
+from bank_app.application.domain.model.booklet_account import BookletAccount
+from bank_app.application.ports.api.transfer_use_case import TransferUseCase
+from bank_app.application.util.util import AccountType
+
+if TYPE_CHECKING:
+    from bank_app.application.domain.service.bank_account import BankAccountService
+    from bank_app.application.domain.service.booklet_account import BookletAcountService
+    from bank_app.application.ports.repositories.i_bank_account import (
+        IBankAccountRepository,
+    )
+    from bank_app.application.ports.repositories.i_booklet_account import (
+        IBookletAccountRepository,
+    )
+    from bank_app.application.ports.repositories.i_transfer import (
+        ITransferRepository,
+    )
+
+
+class TransferService(TransferUseCase):
+    _transfer_repository: "ITransferRepository"
+    _bank_account_repository: "IBankAccountRepository"
+    _booklet_account_repository: "IBookletAccountRepository"
+    _bank_account_service: "BankAccountService"
+    _booklet_account_service: "BookletAcountService"
+
+    def __init__(
+        self,
+        transfer_repository: "ITransferRepository",
+        bank_account_repository: "IBankAccountRepository",
+        booklet_account_repository: "IBookletAccountRepository",
+        bank_account_service: "BankAccountService",
+        booklet_account_service: "BookletAcountService",
+    ) -> None:
+        self._transfer_repository = transfer_repository
+        self._bank_account_repository = bank_account_repository
+        self._booklet_account_repository = booklet_account_repository
+        self._bank_account_service = bank_account_service
+        self._booklet_account_service = booklet_account_service
+
+    def _get_account(
+        self, account_id: UUID, type_account: AccountType
+    ) -> Union[BankAccount, BookletAccount]:
+        if type_account == AccountType.BOOKLET_ACCOUNT:
+            return self._booklet_account_repository.get(
+                entity_id=AccountIdentity(account_id)
+            )
+        return self._bank_account_repository.get(entity_id=AccountIdentity(account_id))
+
+    def _explain_refusal(
+        self,
+        source: Union[BankAccount, BookletAccount],
+        target: Union[BankAccount, BookletAccount],
+        amount: Decimal,
+    ) -> None:
+        if isinstance(source, BankAccount):
+            self._bank_account_service.authorize_withdrawal(
+                account=source, amount=amount
+            )
+        else:
+            self._booklet_account_service.authorize_withdrawal(
+                account=source, amount=amount
+            )
+        if isinstance(target, BookletAccount):
+            self._booklet_account_service.authorize_deposit(
+                account=target, amount=amount
+            )
+
+    def transfer(
+        self,
+        source_account_id: UUID,
+        target_account_id: UUID,
+        amount: Decimal,
+        source_type: AccountType = AccountType.CURRENT_ACCOUNT,
+        target_type: AccountType = AccountType.CURRENT_ACCOUNT,
+    ) -> TransferDTO:
+        if amount <= 0:
+            raise ValueError("cannot transfer null or negative amount")
+        if source_account_id == target_account_id:
+            raise ValueError("cannot transfer to the same account")
+
+        accounts = self._transfer_repository.apply_transfer(
+            source_id=AccountIdentity(source_account_id),
+            source_type=source_type,
+            target_id=AccountIdentity(target_account_id),
+            target_type=target_type,
+            amount=amount,
+        )
+        if not accounts:
+            # nothing moved: an account is unknown (NotFound below) or a leg
+            # was refused, let the domain explain why on the current state
+            source = self._get_account(source_account_id, source_type)
+            target = self._get_account(target_account_id, target_type)
+            self._explain_refusal(source, target, amount)
+            raise InsufficientFundsException(
+                f"Insufficient funds for transfer of {amount}"
+            )
+
+        source_account, target_account = accounts
+        return TransferDTO(
+            source_account_id=source_account.entity_id.uuid,
+            source_balance=source_account.balance,
+            target_account_id=target_account.entity_id.uuid,
+            target_balance=target_account.balance,
+            amount=amount,
+        )
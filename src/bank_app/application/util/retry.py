@@ -0,0 +1,93 @@
+import functools
+import random
+import threading
+import time
+from collections.abc import Callable
+from typing import Optional, TypeVar, cast
+
+from bank_app.application.domain.exceptions import ConcurrentUpdateException
+
+FuncT = TypeVar("FuncT", bound=Callable[..., object])
+
+
+class RetryBudget:
+    """
+    Token bucket bounding retries to ``ratio`` of the calls made, plus
+    ``min_per_second`` so a quiet service can still retry. When contention
+    spikes the budget runs dry and conflicts surface to the caller instead
+    of every client multiplying its load.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_per_second: float = 10.0,
+        max_tokens: float = 100.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        self._clock = clock
+        self._tokens = max_tokens
+        self._last_refill = clock()
+        self._lock = threading.Lock()
+        self.retries = 0
+        self.exhausted = 0
+
+    def _add(self, tokens: float) -> None:
+        self._tokens = min(self.max_tokens, self._tokens + tokens)
+
+    def record_call(self) -> None:
+        with self._lock:
+            self._add(self.ratio)
+
+    def try_retry(self) -> bool:
+        with self._lock:
+            now = self._clock()
+            self._add((now - self._last_refill) * self.min_per_second)
+            self._last_refill = now
+            if self._tokens < 1:
+                self.exhausted += 1
+                return False
+            self._tokens -= 1
+            self.retries += 1
+            return True
+
+
+def retry_on_conflict(
+    attempts: int = 5,
+    base_delay: float = 0.005,
+    max_delay: float = 0.2,
+    budget: Optional[RetryBudget] = None,
+    sleep: Callable[[float], None] = time.sleep,
+) -> Callable[[FuncT], FuncT]:
+    """
+    Re-run a read-modify-write use case whose save lost a compare-and-swap
+    (ConcurrentUpdateException), so it reads the fresh state and decides
+    again. Waits a random delay up to ``base_delay * 2 ** retry`` (capped at
+    ``max_delay``) between attempts, and gives up after ``attempts`` calls
+    or when the retry budget, shared by every call of the function, is
+    spent.
+    """
+
+    def decorator(func: FuncT) -> FuncT:
+        retry_budget = budget or RetryBudget()
+
+        @functools.wraps(func)
+        def wrapper(*args: object, **kwargs: object) -> object:
+            retry_budget.record_call()
+            for attempt in range(attempts - 1):
+                try:
+                    return func(*args, **kwargs)
+                except ConcurrentUpdateException:
+                    if not retry_budget.try_retry():
+                        raise
+                sleep(random.uniform(0, min(max_delay, base_delay * 2**attempt)))
+            # the last attempt, whose conflict is the caller's
+            return func(*args, **kwargs)
+
+        wrapper.retry_budget = retry_budget  # type: ignore[attr-defined]
+        return cast("FuncT", wrapper)
+
+    return decorator
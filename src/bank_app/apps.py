@@ -6,8 +6,19 @@ class BankAppConfig(AppConfig):
     name = "bank_app"
 
     def ready(self):
+        from django.db import connections
+        from django.db.backends.signals import connection_created
+
+        from bank_app.application.adapter.persistence.sql import (
+            register_decimal_functions,
+        )
         from exalt_hexarch.containers import Container
 
+        connection_created.connect(register_decimal_functions)
+        for connection in connections.all(initialized_only=True):
+            if connection.connection is not None:
+                register_decimal_functions(None, connection)
+
         self.container = Container()
         self.container.wire(
             modules=[
@@ -15,5 +26,7 @@ class BankAppConfig(AppConfig):
                 "bank_app.application.adapter.api.views.bank_account_overdraft",
                 "bank_app.application.adapter.api.views.booklet_account",
                 "bank_app.application.adapter.api.views.account_statement",
+                "bank_app.application.adapter.api.views.transfer",
+                "bank_app.application.adapter.api.views.posting",
             ]
         )
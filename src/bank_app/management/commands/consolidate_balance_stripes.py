@@ -0,0 +1,15 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from bank_app.application.adapter.persistence.repository.bank_account_repository import (  # noqa: E501
+    BankAccountRepository,
+)
+
+
+class Command(BaseCommand):
+    help = "Fold the balance stripes of hot bank accounts back into their balance"
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        folded = BankAccountRepository.consolidate_stripes()
+        self.stdout.write(f"Consolidated the stripes of {folded} accounts")
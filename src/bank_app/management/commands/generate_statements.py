@@ -0,0 +1,202 @@
+import datetime as dt
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from pathlib import Path
+from typing import Any, Optional
+from uuid import UUID
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.utils import timezone
+
+from bank_app.application.adapter.persistence.process_pool import worker_pool
+from bank_app.application.adapter.persistence.statement_run import (
+    Checkpoint,
+    account_chunks,
+    count_accounts,
+    generate_chunk,
+)
+from bank_app.application.domain.service.account_statement import (
+    AccoutStatementService,
+)
+from bank_app.application.util.util import AccountType
+
+
+class Progress:
+    """Accounts done out of those the run started with, and the pace"""
+
+    def __init__(self, total: int) -> None:
+        self.total = total
+        self.done = 0
+        self.written = 0
+        self.started = time.monotonic()
+
+    def advance(self, accounts: int, written: int) -> None:
+        self.done += accounts
+        self.written += written
+
+    def __str__(self) -> str:
+        elapsed = time.monotonic() - self.started
+        rate = self.done / elapsed if elapsed else 0.0
+        eta = (
+            dt.timedelta(seconds=round((self.total - self.done) / rate))
+            if rate
+            else "-"
+        )
+        share = self.done / self.total if self.total else 1.0
+        return (
+            f"{self.done}/{self.total} accounts ({share:.0%}), "
+            f"{self.written} statements, {rate:.0f} accounts/s, ETA {eta}"
+        )
+
+
+class Command(BaseCommand):
+    help = "Generate the monthly statements of every active account"
+
+    # progress is written at most this often, in seconds
+    REPORT_INTERVAL = 1.0
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--period-end",
+            type=dt.datetime.fromisoformat,
+            help="end of a 30-day period, by default the one of an unfinished "
+            "checkpoint, otherwise now",
+        )
+        parser.add_argument(
+            "--month",
+            type=lambda value: dt.datetime.strptime(value, "%Y-%m").date(),
+            help="a calendar month, YYYY-MM in UTC, instead of a 30-day period",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count(),
+            help="worker processes, 1 runs the chunks in this process",
+        )
+        parser.add_argument("--chunk-size", type=int, default=1000)
+        parser.add_argument(
+            "--checkpoint",
+            type=Path,
+            default=Path("generate_statements.checkpoint.json"),
+            help="file the run resumes from",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if options["workers"] < 1 or options["chunk_size"] < 1:
+            raise CommandError("--workers and --chunk-size must be positive")
+        if options["month"] is not None and options["period_end"] is not None:
+            raise CommandError("Give either --period-end or --month, not both")
+        checkpoint = Checkpoint(options["checkpoint"])
+        state = self._resume(checkpoint.load(), options["period_end"], options["month"])
+        period_start = dt.datetime.fromisoformat(state["period_start"])
+        period_end = dt.datetime.fromisoformat(state["period_end"])
+        progress = Progress(
+            sum(
+                count_accounts(account_type, self._after(state, account_type))
+                for account_type in AccountType
+            )
+        )
+        self.stdout.write(
+            f"Statements from {period_start.isoformat()} to "
+            f"{period_end.isoformat()}: "
+            f"{progress.total} accounts to go"
+        )
+
+        with worker_pool(options["workers"]) as executor:
+            for account_type in AccountType:
+                self._run(
+                    executor,
+                    account_type,
+                    (period_start, period_end),
+                    options,
+                    state,
+                    checkpoint,
+                    progress,
+                )
+        state["finished"] = True
+        checkpoint.save(state)
+        self.stdout.write(f"Done: {progress}")
+
+    def _resume(
+        self,
+        state: Optional[dict[str, Any]],
+        period_end: Optional[dt.datetime],
+        month: Optional[dt.date],
+    ) -> dict[str, Any]:
+        """The checkpoint of the period, or a fresh one"""
+        if month is not None:
+            period_start, period_end = AccoutStatementService.calendar_month(
+                month, dt.timezone.utc
+            )
+        else:
+            if period_end is None:
+                if state is not None and not state["finished"]:
+                    return state
+                period_end = timezone.now()
+            if timezone.is_naive(period_end):
+                period_end = timezone.make_aware(period_end)
+            period_start = AccoutStatementService.get_period_start(period_end)
+        period = {
+            "period_start": period_start.isoformat(),
+            "period_end": period_end.isoformat(),
+        }
+        if state is not None and all(state.get(k) == v for k, v in period.items()):
+            return state
+        return {**period, "done": {}, "finished": False}
+
+    @staticmethod
+    def _after(state: dict[str, Any], account_type: AccountType) -> Optional[UUID]:
+        after = state["done"].get(account_type.value)
+        return UUID(after) if after is not None else None
+
+    def _run(
+        self,
+        executor: Executor,
+        account_type: AccountType,
+        period: tuple[dt.datetime, dt.datetime],
+        options: dict[str, Any],
+        state: dict[str, Any],
+        checkpoint: Checkpoint,
+        progress: Progress,
+    ) -> None:
+        """
+        Submits the chunks of ``account_type`` in key order, a few per worker
+        at a time, and moves the checkpoint past a chunk once it and every
+        chunk before it are written: chunks finish in any order.
+        """
+        in_flight: dict[Future[Any], int] = {}
+        chunks: dict[int, tuple[UUID, int]] = {}  # index: last id, accounts
+        written: set[int] = set()
+        next_index = 0
+        reported = time.monotonic()
+
+        def collect(return_when: str) -> None:
+            nonlocal next_index, reported
+            done, _ = wait(in_flight, return_when=return_when)
+            for future in done:
+                index = in_flight.pop(future)
+                progress.advance(chunks[index][1], future.result())
+                written.add(index)
+            while next_index in written:
+                written.remove(next_index)
+                state["done"][account_type.value] = str(chunks.pop(next_index)[0])
+                next_index += 1
+            checkpoint.save(state)
+            if time.monotonic() - reported >= self.REPORT_INTERVAL:
+                reported = time.monotonic()
+                self.stdout.write(str(progress))
+
+        chunk_ids = account_chunks(
+            account_type, options["chunk_size"], self._after(state, account_type)
+        )
+        for index, ids in enumerate(chunk_ids):
+            chunks[index] = (ids[-1], len(ids))
+            future = executor.submit(
+                generate_chunk, account_type, ids[0], ids[-1], *period
+            )
+            in_flight[future] = index
+            if len(in_flight) >= 2 * options["workers"]:
+                collect(FIRST_COMPLETED)
+        if in_flight:
+            collect("ALL_COMPLETED")
@@ -0,0 +1,13 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from bank_app.application.adapter.api.idempotency import get_idempotency_store
+
+
+class Command(BaseCommand):
+    help = "Delete expired Idempotency-Key records"
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        deleted = get_idempotency_store().purge_expired()
+        self.stdout.write(f"Purged {deleted} expired idempotency keys")
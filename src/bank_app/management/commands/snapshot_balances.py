@@ -0,0 +1,29 @@
+import datetime as dt
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.utils import timezone
+
+from bank_app.application.adapter.persistence.repository.balance_snapshot_repository import (  # noqa: E501
+    BalanceSnapshotRepository,
+)
+
+
+class Command(BaseCommand):
+    help = "Snapshot the end-of-day balance of every account"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--date",
+            type=dt.date.fromisoformat,
+            help="a UTC day which has ended, yesterday by default; a missed "
+            "day is best taken before the next one, which then follows from it",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        today = timezone.now().astimezone(dt.timezone.utc).date()
+        day = options["date"] or today - dt.timedelta(days=1)
+        if day >= today:
+            raise CommandError(f"{day} has not ended yet")
+        written = BalanceSnapshotRepository.take_snapshots(day)
+        self.stdout.write(f"Wrote {written} balance snapshots of {day}")
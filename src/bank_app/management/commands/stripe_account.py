@@ -0,0 +1,29 @@
+from typing import Any
+from uuid import UUID
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from bank_app.application.adapter.persistence.repository.bank_account_repository import (  # noqa: E501
+    BankAccountRepository,
+)
+from bank_app.application.domain.exceptions import NotFound
+
+
+class Command(BaseCommand):
+    help = "Spread the deposits of a hot bank account over balance stripes"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("account_number", type=UUID)
+        parser.add_argument("stripes", type=int, help="0 stops striping")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        try:
+            BankAccountRepository.stripe_account(
+                options["account_number"], options["stripes"]
+            )
+        except (NotFound, ValueError) as ex:
+            raise CommandError(getattr(ex, "message", ex)) from ex
+        self.stdout.write(
+            f"Account {options['account_number']} now has "
+            f"{options['stripes']} balance stripes"
+        )
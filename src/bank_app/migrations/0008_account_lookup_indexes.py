@@ -0,0 +1,54 @@
+# Generated by Django 5.2.10 on 2026-10-18 17:33
+
+import uuid
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("bank_app", "0007_rename_transationentity_transactionentity"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="bankaccountentity",
+            name="account_number",
+            field=models.UUIDField(default=uuid.uuid4, unique=True),
+        ),
+        migrations.AlterField(
+            model_name="bookletaccountentity",
+            name="account_number",
+            field=models.UUIDField(default=uuid.uuid4, unique=True),
+        ),
+        migrations.AddIndex(
+            model_name="bankaccountentity",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["entity_id"],
+                name="bank_account_active_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="bookletaccountentity",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["entity_id"],
+                name="booklet_account_active_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="monthlystatemententity",
+            index=models.Index(
+                fields=["account_number", "-period_end"],
+                name="statement_account_period_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="transactionentity",
+            index=models.Index(
+                fields=["account_id", "-transaction_date"],
+                name="transaction_account_date_idx",
+            ),
+        ),
+    ]
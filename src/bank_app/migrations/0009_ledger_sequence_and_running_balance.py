@@ -0,0 +1,39 @@
+# Generated by Django 5.2.10 on 2026-10-18 17:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("bank_app", "0008_account_lookup_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="bankaccountentity",
+            name="ledger_sequence",
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="bookletaccountentity",
+            name="ledger_sequence",
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="transactionentity",
+            name="balance_after",
+            field=models.DecimalField(decimal_places=2, max_digits=19, null=True),
+        ),
+        migrations.AddField(
+            model_name="transactionentity",
+            name="sequence",
+            field=models.PositiveBigIntegerField(null=True),
+        ),
+        migrations.AddConstraint(
+            model_name="transactionentity",
+            constraint=models.UniqueConstraint(
+                fields=("account_id", "sequence"),
+                name="transaction_account_sequence_uniq",
+            ),
+        ),
+    ]
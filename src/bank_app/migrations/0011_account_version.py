@@ -0,0 +1,22 @@
+# Generated by Django 5.2.10 on 2026-10-18 17:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("bank_app", "0010_idempotency_key"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="bankaccountentity",
+            name="version",
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="bookletaccountentity",
+            name="version",
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.2.10 on 2026-10-18 18:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("bank_app", "0011_account_version"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="bankaccountentity",
+            name="balance_stripes",
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.CreateModel(
+            name="BalanceStripeEntity",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("account_number", models.UUIDField()),
+                ("stripe", models.PositiveSmallIntegerField()),
+                ("stripe_count", models.PositiveSmallIntegerField()),
+                (
+                    "balance",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=19),
+                ),
+                (
+                    "account",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="stripes",
+                        to="bank_app.bankaccountentity",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "bank_account_balance_stripe",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("account_number", "stripe"),
+                        name="balance_stripe_account_stripe_uniq",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.10 on 2026-10-18 18:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("bank_app", "0012_balance_stripes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="monthlystatemententity",
+            name="is_closed",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddIndex(
+            model_name="monthlystatemententity",
+            index=models.Index(
+                fields=["account_id", "period_start", "period_end"],
+                name="statement_period_key_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,62 @@
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+from django.db.models.functions import Coalesce, Least
+
+
+def bound_linked_transactions(apps, schema_editor):
+    """
+    The last linked transaction bounds what a statement held; one without
+    links held nothing its period had posted by the time it was generated
+    """
+    MonthlyStatementEntity = apps.get_model("bank_app", "MonthlyStatementEntity")
+    TransactionEntity = apps.get_model("bank_app", "TransactionEntity")
+    last_linked = (
+        TransactionEntity.objects.filter(monthlystatemententity=OuterRef("pk"))
+        .order_by("-transaction_date")
+        .values("transaction_date")[:1]
+    )
+    MonthlyStatementEntity.objects.update(
+        transactions_until=Coalesce(
+            Subquery(last_linked), Least("period_end", "generated_at")
+        )
+    )
+
+
+def link_transactions_in_range(apps, schema_editor):
+    MonthlyStatementEntity = apps.get_model("bank_app", "MonthlyStatementEntity")
+    TransactionEntity = apps.get_model("bank_app", "TransactionEntity")
+    through = MonthlyStatementEntity.transactions.through
+    for statement in MonthlyStatementEntity.objects.iterator():
+        members = TransactionEntity.objects.filter(
+            account_id=statement.account_id,
+            transaction_date__gte=statement.period_start,
+            transaction_date__lte=statement.transactions_until,
+        ).values_list("pk", flat=True)
+        through.objects.bulk_create(
+            through(monthlystatemententity_id=statement.pk, transactionentity_id=pk)
+            for pk in members.iterator()
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("bank_app", "0013_statement_period_key"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="monthlystatemententity",
+            name="transactions_until",
+            field=models.DateTimeField(null=True),
+        ),
+        migrations.RunPython(bound_linked_transactions, link_transactions_in_range),
+        migrations.AlterField(
+            model_name="monthlystatemententity",
+            name="transactions_until",
+            field=models.DateTimeField(),
+        ),
+        migrations.RemoveField(
+            model_name="monthlystatemententity",
+            name="transactions",
+        ),
+    ]
@@ -0,0 +1,59 @@
+from decimal import Decimal
+
+from django.db import migrations
+from django.db.models import (
+    Case,
+    DecimalField,
+    F,
+    OuterRef,
+    Subquery,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce
+
+AMOUNT = DecimalField(max_digits=19, decimal_places=2)
+
+
+def close_on_period_end(apps, schema_editor):
+    """
+    A closing balance was the live balance of the account when the statement
+    was generated; it becomes the balance at the end of the period, the
+    opening balance moved by what the statement holds
+    """
+    MonthlyStatementEntity = apps.get_model("bank_app", "MonthlyStatementEntity")
+    TransactionEntity = apps.get_model("bank_app", "TransactionEntity")
+    net_amount = (
+        TransactionEntity.objects.filter(
+            account_id=OuterRef("account_id"),
+            transaction_date__gte=OuterRef("period_start"),
+            transaction_date__lte=OuterRef("transactions_until"),
+        )
+        .values("account_id")
+        .annotate(
+            total=Sum(
+                Case(
+                    When(transaction_type="DEPOSIT", then=F("amount")),
+                    When(transaction_type="WITHDRAWAL", then=-F("amount")),
+                    default=Value(Decimal("0.00")),
+                    output_field=AMOUNT,
+                )
+            )
+        )
+        .values("total")
+    )
+    MonthlyStatementEntity.objects.update(
+        closing_balance=F("opening_balance")
+        + Coalesce(Subquery(net_amount), Value(Decimal("0.00")), output_field=AMOUNT)
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("bank_app", "0014_statement_transaction_range"),
+    ]
+
+    operations = [
+        migrations.RunPython(close_on_period_end, migrations.RunPython.noop),
+    ]
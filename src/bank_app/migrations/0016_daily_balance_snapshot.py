@@ -0,0 +1,47 @@
+# Generated by Django 5.2.10 on 2026-10-18 19:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("bank_app", "0015_statement_closing_balance_at_period_end"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyBalanceSnapshotEntity",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("account_id", models.UUIDField()),
+                ("account_type", models.CharField(max_length=25)),
+                ("date", models.DateField()),
+                (
+                    "closing_balance",
+                    models.DecimalField(decimal_places=2, max_digits=19),
+                ),
+                ("deposit_total", models.DecimalField(decimal_places=2, max_digits=19)),
+                (
+                    "withdrawal_total",
+                    models.DecimalField(decimal_places=2, max_digits=19),
+                ),
+                ("transaction_count", models.PositiveIntegerField()),
+            ],
+            options={
+                "db_table": "daily_balance_snapshot",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("account_id", "date"), name="snapshot_account_date_uniq"
+                    )
+                ],
+            },
+        ),
+    ]
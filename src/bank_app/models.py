@@ -3,16 +3,26 @@ from bank_app.application.adapter.persistence.entity.account_statement_entity im
     MonthlyStatementEntity,
     TransactionEntity,
 )
+from bank_app.application.adapter.persistence.entity.balance_snapshot_entity import (
+    DailyBalanceSnapshotEntity,
+)
 from bank_app.application.adapter.persistence.entity.bank_account_entity import (
+    BalanceStripeEntity,
     BankAccountEntity,
 )
 from bank_app.application.adapter.persistence.entity.booklet_account_entity import (
     BookletAccountEntity,
 )
+from bank_app.application.adapter.persistence.entity.idempotency_key_entity import (
+    IdempotencyKeyEntity,
+)
 
 __all__ = [
     "TransactionEntity",
     "MonthlyStatementEntity",
     "BankAccountEntity",
+    "BalanceStripeEntity",
     "BookletAccountEntity",
+    "IdempotencyKeyEntity",
+    "DailyBalanceSnapshotEntity",
 ]
@@ -2,6 +2,7 @@ from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
 from bank_app.application.adapter.api.views.account_statement import (
+    AccountBalanceAtView,
     BankAccountStatementView,
 )
 from bank_app.application.adapter.api.views.bank_account import (
@@ -19,6 +20,8 @@ from bank_app.application.adapter.api.views.booklet_account import (
     BookletRedrawView,
     BookletSetDepositLimitView,
 )
+from bank_app.application.adapter.api.views.posting import BulkPostingView
+from bank_app.application.adapter.api.views.transfer import TransferView
 
 router = DefaultRouter()
 router.register(
@@ -72,4 +75,19 @@ urlpatterns = [
         BankAccountStatementView.as_view(),
         name="account-statement",
     ),
+    path(
+        "account/balance",
+        AccountBalanceAtView.as_view(),
+        name="account-balance",
+    ),
+    path(
+        "account/transfer",
+        TransferView.as_view(),
+        name="account-transfer",
+    ),
+    path(
+        "postings/bulk",
+        BulkPostingView.as_view(),
+        name="postings-bulk",
+    ),
 ]
@@ -3,30 +3,48 @@ from dependency_injector import containers, providers
 from bank_app.application.adapter.persistence.repository.account_statement_repository import (
     AccountStatementRepository,
 )
+from bank_app.application.adapter.persistence.repository.balance_snapshot_repository import (  # noqa: E501
+    BalanceSnapshotRepository,
+)
 from bank_app.application.adapter.persistence.repository.bank_account_repository import (
     BankAccountRepository,
 )
 from bank_app.application.adapter.persistence.repository.booklet_account_repository import (
     BookletAccountRepository,
 )
+from bank_app.application.adapter.persistence.repository.posting_repository import (
+    PostingRepository,
+)
 from bank_app.application.adapter.persistence.repository.transaction_repository import (
     TransactionRepository,
 )
+from bank_app.application.adapter.persistence.repository.transfer_repository import (
+    TransferRepository,
+)
+from bank_app.application.adapter.persistence.unit_of_work import UnitOfWork
 from bank_app.application.domain.service.account_statement import AccoutStatementService
 from bank_app.application.domain.service.bank_account import BankAccountService
 from bank_app.application.domain.service.booklet_account import (
     BookletAcountService as BookletAccountDomainService,
 )
-from bank_app.application.service.account_statement import AccountStatementService
+from bank_app.application.service.account_statement import (
+    AccountStatementService,
+    StatementReuseStats,
+)
 from bank_app.application.service.bank_account import BankAccountRedrawAndDepositService
 from bank_app.application.service.bank_acount_overdraft import (
     BankAccountOverdraftService,
 )
 from bank_app.application.service.booklet_account import BookletAccountService
+from bank_app.application.service.bulk_posting import BulkPostingService
+from bank_app.application.service.transfer import TransferService
 
 
 class Container(containers.DeclarativeContainer):
     config = providers.Configuration()
+    # a new one per request, see adapter.api.unit_of_work
+    unit_of_work = providers.Factory(UnitOfWork)
+
     bank_account_repository = providers.Singleton(BankAccountRepository)
     bank_account_service = providers.Factory(
         BankAccountRedrawAndDepositService,
@@ -51,6 +69,8 @@ class Container(containers.DeclarativeContainer):
     account_statement_repository = providers.Singleton(AccountStatementRepository)
     transaction_repository = providers.Singleton(TransactionRepository)
     account_statement_domain_service = providers.Singleton(AccoutStatementService)
+    statement_reuse_stats = providers.Singleton(StatementReuseStats)
+    balance_snapshot_repository = providers.Singleton(BalanceSnapshotRepository)
     account_statement_service = providers.Factory(
         AccountStatementService,
         transaction_repository=transaction_repository,
@@ -58,4 +78,24 @@ class Container(containers.DeclarativeContainer):
         bank_account_repository=bank_account_repository,
         booklet_account_repository=booklet_account_repository,
         account_statement_service=account_statement_domain_service,
+        reuse_stats=statement_reuse_stats,
+        balance_snapshot_repository=balance_snapshot_repository,
+    )
+
+    transfer_repository = providers.Singleton(TransferRepository)
+    transfer_service = providers.Factory(
+        TransferService,
+        transfer_repository=transfer_repository,
+        bank_account_repository=bank_account_repository,
+        booklet_account_repository=booklet_account_repository,
+        bank_account_service=bank_account_domain_service,
+        booklet_account_service=booklet_account_domain_service,
+    )
+
+    posting_repository = providers.Singleton(PostingRepository)
+    bulk_posting_service = providers.Factory(
+        BulkPostingService,
+        posting_repository=posting_repository,
+        bank_account_service=bank_account_domain_service,
+        booklet_account_service=booklet_account_domain_service,
     )
@@ -137,6 +137,45 @@ SPECTACULAR_SETTINGS = {
     # "SERVE_INCLUDE_SCHEMA": True,
 }
 
+# Responses of money-moving requests sent with an Idempotency-Key header are
+# replayed to retries for TTL_HOURS (see the purge_idempotency_keys command).
+# A key is stored in the transaction of its postings, with the response. A
+# duplicate of a request still running waits up to WAIT_TIMEOUT_MS for its
+# answer, then gets a 409: it never runs again while the first may commit.
+IDEMPOTENCY = {
+    "TTL_HOURS": 24,
+    "CACHE_SIZE": 10_000,
+    "WAIT_TIMEOUT_MS": 10_000,
+}
+
+# Group commit: deposits and withdrawals arriving within WINDOW_MS of each
+# other (at most MAX_BATCH) are applied by one worker thread in a single
+# transaction, a savepoint each, and every caller is answered after the
+# commit. Trades a little latency for fewer commits under concurrency.
+GROUP_COMMIT = {
+    "ENABLED": False,
+    "WINDOW_MS": 2,
+    "MAX_BATCH": 64,
+    "QUEUE_SIZE": 10_000,
+    "PUT_TIMEOUT_MS": 1000,
+}
+
+# POST /api/postings/bulk refuses requests of more than MAX_LINES postings,
+# all of them are applied in one transaction holding the account locks.
+BULK_POSTINGS = {
+    "MAX_LINES": 10_000,
+}
+
+# In-process cache of the rarely changing columns of accounts (overdraft
+# settings, deposit limit, active flag), so account reads only fetch the
+# balance and version. Writes made here invalidate it at once, writes made
+# by other processes show after at most TTL_SECONDS.
+ACCOUNT_CACHE = {
+    "ENABLED": False,
+    "MAX_SIZE": 10_000,
+    "TTL_SECONDS": 30,
+}
+
 
 try:
     from .settings_docker import *
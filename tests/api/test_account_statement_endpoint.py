@@ -1,11 +1,25 @@
+import json
 from decimal import Decimal
 from uuid import uuid4
 
 import pytest
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APIClient
 
+from bank_app.application.adapter.api.serializers.account_statement import (
+    AccountStatementResultSerializer,
+)
+from bank_app.application.adapter.persistence.entity.account_statement_entity import (
+    TransactionEntity,
+)
+
+
+def body(response):
+    """The JSON of a streamed response"""
+    return json.loads(b"".join(response.streaming_content))
+
 
 @pytest.mark.django_db
 class TestBankAccountStatementView:
@@ -23,16 +37,14 @@ class TestBankAccountStatementView:
         response = self.api_client.post(self.url, data, format="json")
 
         assert response.status_code == status.HTTP_200_OK
-
-        assert response.data["account_id"] == str(data["account_id"])
-        assert response.data["account_type"] == str(data["type_account"])
-        assert response.data["account_number"] == str(bank_account.account_number)
-        assert response.data["transactions"][0]["account_id"] == str(
-            bank_account.entity_id
-        )
-        assert response.data["transactions"][0]["transaction_type"] == "DEPOSIT"
-        assert response.data["transactions"][0]["account_type"] == "CURRENT_ACCOUNT"
-        assert len(response.data["transactions"]) == 1
+        statement = body(response)
+        assert statement["account_id"] == str(data["account_id"])
+        assert statement["account_type"] == str(data["type_account"])
+        assert statement["account_number"] == str(bank_account.account_number)
+        assert statement["transactions"][0]["account_id"] == str(bank_account.entity_id)
+        assert statement["transactions"][0]["transaction_type"] == "DEPOSIT"
+        assert statement["transactions"][0]["account_type"] == "CURRENT_ACCOUNT"
+        assert len(statement["transactions"]) == 1
 
     def test_generate_statement_bank_account_success(
         self, build_booklet_account, build_transaction
@@ -49,11 +61,59 @@ class TestBankAccountStatementView:
         response = self.api_client.post(self.url, data, format="json")
 
         assert response.status_code == status.HTTP_200_OK
+        statement = body(response)
+        assert statement["account_id"] == str(data["account_id"])
+        assert statement["account_type"] == str(data["type_account"])
+        assert statement["account_number"] == str(booklet_account.account_number)
+        assert len(statement["transactions"]) == 0
+
+    # a last chunk partly filled, then exactly filled
+    @pytest.mark.parametrize("chunk", [2, 5])
+    def test_generate_statement_streams_every_transaction(
+        self, monkeypatch, chunk, build_bank_account, build_transaction
+    ):
+        monkeypatch.setattr(AccountStatementResultSerializer, "STREAM_CHUNK", chunk)
+        bank_account = build_bank_account()
+        for amount in ("1.00", "2.00", "3.00", "4.00", "5.00"):
+            build_transaction(
+                bank_account=bank_account, amount=Decimal(amount), deposit=True
+            )
+        data = {"account_id": bank_account.entity_id, "type_account": "CURRENT_ACCOUNT"}
+        response = self.api_client.post(self.url, data, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming
+        assert response["Content-Type"] == "application/json"
+        assert sorted(t["amount"] for t in body(response)["transactions"]) == [
+            "1.00",
+            "2.00",
+            "3.00",
+            "4.00",
+            "5.00",
+        ]
+
+    def test_generate_statement_of_a_calendar_month(self, build_bank_account):
+        bank_account = build_bank_account()
+        data = {
+            "account_id": bank_account.entity_id,
+            "type_account": "CURRENT_ACCOUNT",
+            "month": "2025-02",
+        }
+        response = self.api_client.post(self.url, data, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        statement = body(response)
+        assert statement["period_start"] == "2025-02-01T00:00:00+00:00"
+        assert statement["period_end"] == "2025-02-28T23:59:59.999999+00:00"
 
-        assert response.data["account_id"] == str(data["account_id"])
-        assert response.data["account_type"] == str(data["type_account"])
-        assert response.data["account_number"] == str(booklet_account.account_number)
-        assert len(response.data["transactions"]) == 0
+    def test_generate_statement_month_or_period_end(self, build_bank_account):
+        data = {
+            "account_id": build_bank_account().entity_id,
+            "month": "2025-02",
+            "period_end": "2025-12-31T23:59:59Z",
+        }
+        response = self.api_client.post(self.url, data, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
 
     def test_generate_statement_invalid_account_id(self):
         data = {"account_id": "invalid-uuid", "type_account": "CURRENT_ACCOUNT"}
@@ -70,3 +130,74 @@ class TestBankAccountStatementView:
         data = {"account_id": str(uuid4()), "type_account": "CURRENT_ACCOUNT"}
         response = self.api_client.post(self.url, data, format="json")
         assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestAccountBalanceAtView:
+    api_client = APIClient()
+    url = reverse("account-balance")
+
+    def test_postings_record_sequence_and_running_balance(self, build_bank_account):
+        bank_account = build_bank_account()
+        data = {"account_number": bank_account.account_number, "amount": "200.00"}
+        self.api_client.post(reverse("bank-account-deposit"), data, format="json")
+        self.api_client.post(reverse("bank-account-redraw"), data, format="json")
+        self.api_client.post(reverse("bank-account-redraw"), data, format="json")
+
+        ledger = TransactionEntity.objects.filter(
+            account_id=bank_account.entity_id
+        ).order_by("sequence")
+        assert [(t.sequence, t.balance_after) for t in ledger] == [
+            (1, Decimal("1200.00")),
+            (2, Decimal("1000.00")),
+            (3, Decimal("800.00")),
+        ]
+
+    def test_balance_at_between_postings(self, build_booklet_account):
+        booklet_account = build_booklet_account()
+        data = {"account_number": booklet_account.account_number, "amount": "300.00"}
+        self.api_client.post(reverse("booklet-account-deposit"), data, format="json")
+        timestamp = timezone.now()
+        self.api_client.post(reverse("booklet-account-redraw"), data, format="json")
+
+        response = self.api_client.get(
+            self.url,
+            {
+                "account_id": booklet_account.entity_id,
+                "type_account": "BOOKLET_ACCOUNT",
+                "timestamp": timestamp.isoformat(),
+            },
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["account_id"] == str(booklet_account.entity_id)
+        assert response.data["balance"] == "1300.00"
+
+    def test_balance_at_without_running_balance(
+        self, build_bank_account, build_transaction
+    ):
+        bank_account = build_bank_account()
+        timestamp = timezone.now()
+        build_transaction(
+            bank_account=bank_account, amount=Decimal("250.00"), deposit=True
+        )
+
+        response = self.api_client.get(
+            self.url,
+            {"account_id": bank_account.entity_id, "timestamp": timestamp.isoformat()},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["balance"] == "750.00"
+
+    def test_balance_at_account_not_found(self):
+        response = self.api_client.get(
+            self.url,
+            {"account_id": str(uuid4()), "timestamp": timezone.now().isoformat()},
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_balance_at_missing_timestamp(self):
+        response = self.api_client.get(self.url, {"account_id": str(uuid4())})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "timestamp" in response.data
@@ -0,0 +1,237 @@
+import json
+from decimal import Decimal
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from bank_app.application.adapter.api.parsers import NDJSONParser, TooManyLines
+from bank_app.application.adapter.persistence.entity.account_statement_entity import (
+    TransactionEntity,
+)
+
+
+@pytest.mark.django_db
+class TestBulkPostingView:
+    api_client = APIClient()
+    url = reverse("postings-bulk")
+
+    def test_bulk_postings_across_account_types(
+        self, build_bank_account, build_booklet_account
+    ):
+        bank_account = build_bank_account()
+        booklet = build_booklet_account()
+        data = [
+            {
+                "account_number": bank_account.account_number,
+                "transaction_type": "DEPOSIT",
+                "amount": "100.00",
+            },
+            {
+                "account_number": booklet.account_number,
+                "account_type": "BOOKLET_ACCOUNT",
+                "transaction_type": "DEPOSIT",
+                "amount": "50.00",
+            },
+            {
+                "account_number": bank_account.account_number,
+                "transaction_type": "WITHDRAWAL",
+                "amount": "30.00",
+            },
+        ]
+        response = self.api_client.post(self.url, data, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["applied"] == 3
+        assert [r["balance"] for r in response.data["results"]] == [
+            "1100.00",
+            "1050.00",
+            "1070.00",
+        ]
+        bank_account.refresh_from_db()
+        booklet.refresh_from_db()
+        assert bank_account.balance == Decimal("1070.00")
+        assert bank_account.ledger_sequence == 2
+        assert booklet.balance == Decimal("1050.00")
+        ledger = TransactionEntity.objects.filter(
+            account_id=bank_account.entity_id
+        ).order_by("sequence")
+        assert [(t.sequence, t.balance_after) for t in ledger] == [
+            (1, Decimal("1100.00")),
+            (2, Decimal("1070.00")),
+        ]
+
+    def test_atomic_batch_with_a_refused_line_applies_nothing(self, build_bank_account):
+        bank_account = build_bank_account(no_overdraft=True)
+        data = [
+            {
+                "account_number": bank_account.account_number,
+                "transaction_type": "DEPOSIT",
+                "amount": "100.00",
+            },
+            {
+                "account_number": bank_account.account_number,
+                "transaction_type": "WITHDRAWAL",
+                "amount": "5000.00",
+            },
+        ]
+        response = self.api_client.post(self.url, data, format="json")
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert [r["status"] for r in response.data["results"]] == [
+            "SKIPPED",
+            "REJECTED",
+        ]
+        assert response.data["results"][1]["detail"] == "You are not allow to overdraft"
+        bank_account.refresh_from_db()
+        assert bank_account.balance == Decimal("1000.00")
+        assert bank_account.ledger_sequence == 0
+        assert not TransactionEntity.objects.exists()
+
+    def test_best_effort_applies_the_valid_lines(self, build_booklet_account):
+        booklet = build_booklet_account(deposit_limit=Decimal("1200.00"))
+        data = [
+            {
+                "account_number": booklet.account_number,
+                "account_type": "BOOKLET_ACCOUNT",
+                "transaction_type": "DEPOSIT",
+                "amount": "150.00",
+            },
+            {
+                "account_number": booklet.account_number,
+                "account_type": "BOOKLET_ACCOUNT",
+                "transaction_type": "DEPOSIT",
+                "amount": "150.00",
+            },
+            {"account_number": "not-a-uuid", "amount": "1"},
+            {
+                "account_number": uuid4(),
+                "transaction_type": "DEPOSIT",
+                "amount": "10.00",
+            },
+        ]
+        response = self.api_client.post(
+            f"{self.url}?mode=best_effort", data, format="json"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["applied"] == 1
+        assert [r["status"] for r in response.data["results"]] == [
+            "APPLIED",
+            "REJECTED",
+            "INVALID",
+            "REJECTED",
+        ]
+        assert response.data["results"][1]["detail"] == (
+            "Deposit would exceed deposit limit"
+        )
+        booklet.refresh_from_db()
+        assert booklet.balance == Decimal("1150.00")
+
+    def test_atomic_batch_with_an_invalid_line(self, build_bank_account):
+        bank_account = build_bank_account()
+        data = [
+            {
+                "account_number": bank_account.account_number,
+                "transaction_type": "DEPOSIT",
+                "amount": "100.00",
+            },
+            {
+                "account_number": bank_account.account_number,
+                "transaction_type": "DEPOSIT",
+                "amount": "0.001",
+            },
+        ]
+        response = self.api_client.post(self.url, data, format="json")
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert response.data["results"][1] == {
+            "line": 2,
+            "status": "INVALID",
+            "detail": "amount has more than 2 decimal places",
+        }
+        bank_account.refresh_from_db()
+        assert bank_account.balance == Decimal("1000.00")
+
+    def test_ndjson_stream(self, build_bank_account):
+        bank_account = build_bank_account()
+        body = "\n".join(
+            json.dumps(
+                {
+                    "account_number": str(bank_account.account_number),
+                    "transaction_type": "DEPOSIT",
+                    "amount": "1.50",
+                }
+            )
+            for _ in range(3)
+        )
+        response = self.api_client.post(
+            self.url, body + "\n", content_type="application/x-ndjson"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["applied"] == 3
+        bank_account.refresh_from_db()
+        assert bank_account.balance == Decimal("1004.50")
+
+    def test_malformed_ndjson_line(self):
+        response = self.api_client.post(
+            self.url, '{"amount": "1"}\n{oops', content_type="application/x-ndjson"
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "line 2" in response.data["detail"]
+
+    def test_too_many_postings(self, settings):
+        settings.BULK_POSTINGS = {"MAX_LINES": 2}
+        data = [{"transaction_type": "DEPOSIT", "amount": "1"}] * 3
+
+        response = self.api_client.post(self.url, data, format="json")
+
+        assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+    def test_too_many_ndjson_lines(self, settings):
+        settings.BULK_POSTINGS = {"MAX_LINES": 2}
+        body = '{"amount": "1"}\n' * 3
+
+        response = self.api_client.post(
+            self.url, body, content_type="application/x-ndjson"
+        )
+
+        assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+        assert response.data["detail"] == "at most 2 lines per request"
+
+    def test_body_must_be_a_list(self):
+        response = self.api_client.post(self.url, {"amount": "1"}, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_unknown_mode(self):
+        response = self.api_client.post(f"{self.url}?mode=maybe", [], format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestNDJSONParser:
+    def test_stops_reading_past_max_lines(self):
+        read = []
+
+        def stream():
+            for number in range(1, 1_000):
+                read.append(number)
+                yield b'{"amount": "1"}\n'
+
+        with pytest.raises(TooManyLines):
+            NDJSONParser().parse(
+                stream(), parser_context={"view": SimpleNamespace(max_lines=2)}
+            )
+
+        assert read == [1, 2, 3]
+
+    def test_no_limit_without_a_view(self):
+        documents = NDJSONParser().parse([b"1\n", b"\n", b"2\n"])
+
+        assert documents == [1, 2]
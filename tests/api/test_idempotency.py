@@ -0,0 +1,218 @@
+import datetime as dt
+import threading
+import uuid
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.test import APIClient
+
+from bank_app.application.adapter.api.idempotency import (
+    IdempotencyStore,
+    get_idempotency_store,
+)
+from bank_app.application.adapter.persistence.entity.account_statement_entity import (
+    TransactionEntity,
+)
+from bank_app.application.adapter.persistence.entity.idempotency_key_entity import (
+    IdempotencyKeyEntity,
+)
+
+
+@pytest.mark.django_db
+class TestIdempotentPostings:
+    api_client = APIClient()
+    url = reverse("bank-account-deposit")
+
+    def post(self, data, key):
+        return self.api_client.post(
+            self.url, data, format="json", HTTP_IDEMPOTENCY_KEY=key
+        )
+
+    def test_retry_replays_the_first_response(self, build_bank_account):
+        bank_account = build_bank_account()
+        data = {"account_number": bank_account.account_number, "amount": "100.00"}
+        key = str(uuid.uuid4())
+
+        first = self.post(data, key)
+        retry = self.post(data, key)
+
+        assert first.status_code == status.HTTP_200_OK
+        assert retry.status_code == status.HTTP_200_OK
+        assert retry.data == first.data
+        assert retry["Idempotent-Replayed"] == "true"
+        bank_account.refresh_from_db()
+        assert bank_account.balance == Decimal("1100.00")
+        assert (
+            TransactionEntity.objects.filter(account_id=bank_account.entity_id).count()
+            == 1
+        )
+
+    def test_retry_replays_from_the_table(self, build_bank_account):
+        bank_account = build_bank_account()
+        data = {"account_number": bank_account.account_number, "amount": "100.00"}
+        key = str(uuid.uuid4())
+
+        first = self.post(data, key)
+        get_idempotency_store().clear_cache()
+        retry = self.post(data, key)
+
+        assert retry.data == first.data
+        bank_account.refresh_from_db()
+        assert bank_account.balance == Decimal("1100.00")
+
+    def test_key_reused_with_another_payload(self, build_bank_account):
+        bank_account = build_bank_account()
+        key = str(uuid.uuid4())
+        self.post({"account_number": bank_account.account_number, "amount": "1"}, key)
+
+        response = self.post(
+            {"account_number": bank_account.account_number, "amount": "2"}, key
+        )
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    def test_failed_request_releases_the_key(self, build_bank_account):
+        key = str(uuid.uuid4())
+        response = self.api_client.post(
+            reverse("bank-account-redraw"),
+            {"account_number": uuid.uuid4(), "amount": "10.00"},
+            format="json",
+            HTTP_IDEMPOTENCY_KEY=key,
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert not IdempotencyKeyEntity.objects.filter(key=key).exists()
+
+    def test_error_after_posting_rolls_the_posting_back(
+        self, bank_account_service_implement, build_bank_account
+    ):
+        bank_account = build_bank_account()
+
+        def handler():
+            bank_account_service_implement.deposit_money(
+                bank_account.account_number, Decimal("100.00")
+            )
+            raise RuntimeError("lost the connection to the client")
+
+        with pytest.raises(RuntimeError):
+            IdempotencyStore().execute("POST /", "key", "fp", handler)
+
+        bank_account.refresh_from_db()
+        assert bank_account.balance == Decimal("1000.00")
+        assert not IdempotencyKeyEntity.objects.exists()
+
+    def test_5xx_after_posting_rolls_the_posting_back(
+        self, bank_account_service_implement, build_bank_account
+    ):
+        bank_account = build_bank_account()
+
+        def handler():
+            bank_account_service_implement.deposit_money(
+                bank_account.account_number, Decimal("100.00")
+            )
+            return Response(status=status.HTTP_503_SERVICE_UNAVAILABLE)
+
+        response = IdempotencyStore().execute("POST /", "key", "fp", handler)
+
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        bank_account.refresh_from_db()
+        assert bank_account.balance == Decimal("1000.00")
+        assert not IdempotencyKeyEntity.objects.exists()
+
+    def test_unanswered_key_is_never_run_again(self):
+        IdempotencyKeyEntity.objects.create(
+            scope="POST /",
+            key="key",
+            fingerprint="fp",
+            expires_at=timezone.now() + dt.timedelta(hours=1),
+        )
+        IdempotencyKeyEntity.objects.update(
+            created_at=timezone.now() - dt.timedelta(hours=1)
+        )
+        calls = []
+
+        response = IdempotencyStore(wait_timeout=0.05).execute(
+            "POST /", "key", "fp", lambda: calls.append(1)
+        )
+
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert not calls
+
+    def test_requests_without_key_are_not_recorded(self, build_bank_account):
+        bank_account = build_bank_account()
+        data = {"account_number": bank_account.account_number, "amount": "100.00"}
+
+        self.api_client.post(self.url, data, format="json")
+        self.api_client.post(self.url, data, format="json")
+
+        bank_account.refresh_from_db()
+        assert bank_account.balance == Decimal("1200.00")
+        assert not IdempotencyKeyEntity.objects.exists()
+
+    def test_purge_expired_keys(self):
+        now = timezone.now()
+        IdempotencyKeyEntity.objects.create(
+            scope="POST /", key="old", fingerprint="", expires_at=now
+        )
+        IdempotencyKeyEntity.objects.create(
+            scope="POST /",
+            key="new",
+            fingerprint="",
+            expires_at=now + dt.timedelta(hours=1),
+        )
+        out = StringIO()
+
+        call_command("purge_idempotency_keys", stdout=out)
+
+        assert "Purged 1" in out.getvalue()
+        assert list(IdempotencyKeyEntity.objects.values_list("key", flat=True)) == [
+            "new"
+        ]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_duplicate_waits_for_the_first_result():
+    started, waiting, release = threading.Event(), threading.Event(), threading.Event()
+
+    class Store(IdempotencyStore):
+        def _wait(self, scope, key, remaining):
+            waiting.set()
+            super()._wait(scope, key, remaining)
+
+    store = Store(wait_timeout=5)
+    calls = []
+
+    def handler():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return Response({"balance": "1"}, status=status.HTTP_200_OK)
+
+    results = {}
+    first = threading.Thread(
+        target=lambda: results.setdefault(
+            "first", store.execute("POST /", "key", "fp", handler)
+        )
+    )
+    first.start()
+    started.wait(5)
+    second = threading.Thread(
+        target=lambda: results.setdefault(
+            "second", store.execute("POST /", "key", "fp", handler)
+        )
+    )
+    second.start()
+    waiting.wait(5)
+    release.set()
+    first.join(5)
+    second.join(5)
+
+    assert len(calls) == 1
+    assert results["second"].data == {"balance": "1"}
+    assert results["second"]["Idempotent-Replayed"] == "true"
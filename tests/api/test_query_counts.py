@@ -0,0 +1,216 @@
+import datetime as dt
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from bank_app.application.adapter.persistence.entity.account_statement_entity import (
+    MonthlyStatementEntity,
+    TransactionEntity,
+)
+
+TRANSACTION_CONTROL = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+
+def statements(queries):
+    """SQL statements run, without the savepoints of nested transactions"""
+    return [
+        query["sql"].split()[0]
+        for query in queries
+        if not query["sql"].startswith(TRANSACTION_CONTROL)
+    ]
+
+
+@pytest.mark.django_db
+class TestQueryCounts:
+    api_client = APIClient()
+
+    def post(self, name, data):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.api_client.post(reverse(name), data, format="json")
+        assert response.status_code == status.HTTP_200_OK, response.data
+        return statements(queries)
+
+    def test_deposit_is_one_update_and_its_ledger_row(self, build_bank_account):
+        bank_account = build_bank_account()
+
+        assert self.post(
+            "bank-account-deposit",
+            {"account_number": str(bank_account.account_number), "amount": "10.00"},
+        ) == ["UPDATE", "INSERT"]
+
+    def test_booklet_withdrawal_is_one_update_and_its_ledger_row(
+        self, build_booklet_account
+    ):
+        booklet = build_booklet_account()
+
+        assert self.post(
+            "booklet-account-redraw",
+            {"account_number": str(booklet.account_number), "amount": "10.00"},
+        ) == ["UPDATE", "INSERT"]
+
+    def test_setting_the_deposit_limit_reads_once(self, build_booklet_account):
+        booklet = build_booklet_account()
+
+        assert self.post(
+            "booklet-account-deposit-limit",
+            {"account_number": str(booklet.account_number), "amount": "9000.00"},
+        ) == ["SELECT", "UPDATE"]
+
+    def test_setting_the_overdraft_reads_once(self, build_bank_account):
+        bank_account = build_bank_account()
+
+        assert self.post(
+            "bank-account-overdraft-modify",
+            {"account_number": str(bank_account.account_number), "amount": "100.00"},
+        ) == ["SELECT", "UPDATE"]
+
+    def test_transfer_is_two_postings(self, build_bank_account):
+        source, target = build_bank_account(), build_bank_account()
+
+        executed = self.post(
+            "account-transfer",
+            {
+                "source_account_id": str(source.entity_id),
+                "target_account_id": str(target.entity_id),
+                "amount": "10.00",
+            },
+        )
+
+        # the account numbers, then an update and a ledger row per leg
+        assert executed == ["SELECT", "SELECT", "UPDATE", "INSERT", "UPDATE", "INSERT"]
+
+    def test_statement_is_inserted_with_its_links(
+        self, build_bank_account, build_transaction
+    ):
+        bank_account = build_bank_account()
+        for _ in range(3):
+            build_transaction(
+                bank_account=bank_account, amount=Decimal("10.00"), deposit=True
+            )
+
+        executed = self.post(
+            "account-statement",
+            {
+                "account_id": str(bank_account.entity_id),
+                "type_account": "CURRENT_ACCOUNT",
+            },
+        )
+
+        # account, stored statement of the period, prior statement, net
+        # amounts, then the statement alone, whatever its transactions: they
+        # are only read while the response streams
+        assert executed == ["SELECT"] * 4 + ["INSERT"]
+        assert MonthlyStatementEntity.objects.count() == 1
+
+    def test_closed_statement_is_read_back_once_stored(
+        self, build_bank_account, build_transaction
+    ):
+        bank_account = build_bank_account()
+        transaction = build_transaction(
+            bank_account=bank_account, amount=Decimal("10.00"), deposit=True
+        )
+        period_end = timezone.now() - dt.timedelta(hours=1)
+        TransactionEntity.objects.filter(entity_id=transaction.entity_id).update(
+            transaction_date=period_end - dt.timedelta(hours=1)
+        )
+        data = {
+            "account_id": str(bank_account.entity_id),
+            "type_account": "CURRENT_ACCOUNT",
+            "period_end": period_end.isoformat(),
+        }
+        self.post("account-statement", data)
+
+        # account and the stored statement, nothing written
+        assert self.post("account-statement", data) == ["SELECT", "SELECT"]
+        stored = MonthlyStatementEntity.objects.get()
+        assert stored.transactions_until == dt.datetime.fromisoformat(
+            data["period_end"]
+        )
+
+    def test_closed_statement_is_reused_once_the_balance_moves(
+        self, build_bank_account
+    ):
+        bank_account = build_bank_account()
+        data = {
+            "account_id": str(bank_account.entity_id),
+            "type_account": "CURRENT_ACCOUNT",
+            "period_end": (timezone.now() - dt.timedelta(hours=1)).isoformat(),
+        }
+        self.post("account-statement", data)
+        self.post(
+            "bank-account-deposit",
+            {"account_number": str(bank_account.account_number), "amount": "10.00"},
+        )
+
+        # its closing balance is the one at the end of the period
+        assert self.post("account-statement", data) == ["SELECT", "SELECT"]
+        assert MonthlyStatementEntity.objects.get().closing_balance == Decimal(
+            "1000.00"
+        )
+
+    def test_open_statement_is_regenerated_in_place(self, build_bank_account):
+        bank_account = build_bank_account()
+        data = {
+            "account_id": str(bank_account.entity_id),
+            "type_account": "CURRENT_ACCOUNT",
+            "period_end": (timezone.now() + dt.timedelta(hours=1)).isoformat(),
+        }
+        self.post("account-statement", data)
+        self.post(
+            "bank-account-deposit",
+            {"account_number": str(bank_account.account_number), "amount": "10.00"},
+        )
+
+        executed = self.post("account-statement", data)
+
+        assert "UPDATE" in executed
+        assert MonthlyStatementEntity.objects.get().closing_balance == Decimal(
+            "1010.00"
+        )
+
+    def test_statement_follows_from_the_previous_month(
+        self, build_bank_account, build_transaction
+    ):
+        bank_account = build_bank_account()
+        this_month = timezone.now().replace(
+            day=1, hour=0, minute=0, second=0, microsecond=0
+        )
+        last_month = (this_month - dt.timedelta(days=1)).replace(day=1)
+        month_before = (last_month - dt.timedelta(days=1)).replace(day=1)
+        for month, amount in ((month_before, "10.00"), (last_month, "20.00")):
+            transaction = build_transaction(
+                bank_account=bank_account, amount=Decimal(amount), deposit=True
+            )
+            TransactionEntity.objects.filter(entity_id=transaction.entity_id).update(
+                transaction_date=month + dt.timedelta(days=1)
+            )
+        data = {
+            "account_id": str(bank_account.entity_id),
+            "type_account": "CURRENT_ACCOUNT",
+        }
+        self.post(
+            "account-statement", {**data, "month": month_before.strftime("%Y-%m")}
+        )
+
+        executed = self.post(
+            "account-statement", {**data, "month": last_month.strftime("%Y-%m")}
+        )
+
+        # account, stored statement of the period, prior statement, and the
+        # net amounts posted since the prior one ended
+        assert executed == ["SELECT"] * 4 + ["INSERT"]
+        before, last = MonthlyStatementEntity.objects.order_by("period_end")
+        assert (before.opening_balance, before.closing_balance) == (
+            Decimal("970.00"),
+            Decimal("980.00"),
+        )
+        assert (last.opening_balance, last.closing_balance) == (
+            Decimal("980.00"),
+            Decimal("1000.00"),
+        )
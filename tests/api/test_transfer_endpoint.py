@@ -0,0 +1,104 @@
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from bank_app.application.adapter.persistence.entity.account_statement_entity import (
+    TransactionEntity,
+)
+
+
+@pytest.mark.django_db
+class TestTransferView:
+    api_client = APIClient()
+    url = reverse("account-transfer")
+
+    def test_transfer_bank_to_booklet_success(
+        self, build_bank_account, build_booklet_account
+    ):
+        source = build_bank_account()
+        target = build_booklet_account()
+        data = {
+            "source_account_id": source.entity_id,
+            "target_account_id": target.entity_id,
+            "target_type": "BOOKLET_ACCOUNT",
+            "amount": "400.00",
+        }
+        response = self.api_client.post(self.url, data, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["source_balance"] == "600.00"
+        assert response.data["target_balance"] == "1400.00"
+        source.refresh_from_db()
+        target.refresh_from_db()
+        assert source.balance == Decimal("600.00")
+        assert target.balance == Decimal("1400.00")
+        ledger = TransactionEntity.objects.filter(
+            account_id__in=[source.entity_id, target.entity_id]
+        )
+        assert sorted((t.transaction_type, t.balance_after) for t in ledger) == [
+            ("DEPOSIT", Decimal("1400.00")),
+            ("WITHDRAWAL", Decimal("600.00")),
+        ]
+
+    def test_transfer_insufficient_funds(self, build_bank_account):
+        source = build_bank_account(no_overdraft=True)
+        target = build_bank_account()
+        data = {
+            "source_account_id": source.entity_id,
+            "target_account_id": target.entity_id,
+            "amount": "1500.00",
+        }
+        response = self.api_client.post(self.url, data, format="json")
+
+        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+        assert response.data["detail"] == "You are not allow to overdraft"
+        target.refresh_from_db()
+        assert target.balance == Decimal("1000.00")
+
+    def test_transfer_over_deposit_limit_rolls_back_the_debit(
+        self, build_bank_account, build_booklet_account
+    ):
+        source = build_bank_account()
+        target = build_booklet_account(deposit_limit=Decimal("1200.00"))
+        data = {
+            "source_account_id": source.entity_id,
+            "target_account_id": target.entity_id,
+            "target_type": "BOOKLET_ACCOUNT",
+            "amount": "300.00",
+        }
+        response = self.api_client.post(self.url, data, format="json")
+
+        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+        assert response.data["detail"] == "Deposit would exceed deposit limit"
+        source.refresh_from_db()
+        assert source.balance == Decimal("1000.00")
+        assert source.ledger_sequence == 0
+        assert not TransactionEntity.objects.exists()
+
+    def test_transfer_unknown_target(self, build_bank_account):
+        source = build_bank_account()
+        data = {
+            "source_account_id": source.entity_id,
+            "target_account_id": uuid4(),
+            "amount": "10.00",
+        }
+        response = self.api_client.post(self.url, data, format="json")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        source.refresh_from_db()
+        assert source.balance == Decimal("1000.00")
+
+    def test_transfer_to_same_account(self, build_bank_account):
+        account = build_bank_account()
+        data = {
+            "source_account_id": account.entity_id,
+            "target_account_id": account.entity_id,
+            "amount": "10.00",
+        }
+        response = self.api_client.post(self.url, data, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,135 @@
+import datetime as dt
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from bank_app.application.adapter.persistence.entity.account_statement_entity import (
+    TransactionEntity,
+)
+from bank_app.application.adapter.persistence.entity.balance_snapshot_entity import (
+    DailyBalanceSnapshotEntity,
+)
+from bank_app.application.adapter.persistence.entity.bank_account_entity import (
+    BankAccountEntity,
+)
+from bank_app.application.adapter.persistence.repository.balance_snapshot_repository import (  # noqa: E501
+    BalanceSnapshotRepository,
+)
+
+
+def at(day, hour):
+    return dt.datetime.combine(day, dt.time(hour), dt.timezone.utc)
+
+
+@pytest.mark.django_db
+class TestBalanceSnapshots:
+    @pytest.fixture
+    def days(self):
+        today = timezone.now().date()
+        return today - dt.timedelta(days=3), today - dt.timedelta(days=2)
+
+    @pytest.fixture
+    def bank_account(self, build_bank_account, build_transaction, days):
+        bank_account = build_bank_account()
+        first, second = days
+        for amount, transaction_type, date in [
+            (Decimal("50.00"), "DEPOSIT", at(first, 9)),
+            (Decimal("20.00"), "WITHDRAWAL", at(first, 18)),
+            (Decimal("5.00"), "DEPOSIT", at(second, 12)),
+            # after both days: replayed back from the live balance
+            (Decimal("100.00"), "DEPOSIT", timezone.now()),
+        ]:
+            posted = build_transaction(
+                bank_account=bank_account,
+                amount=amount,
+                transaction_type=transaction_type,
+            )
+            TransactionEntity.objects.filter(entity_id=posted.entity_id).update(
+                transaction_date=date
+            )
+        return bank_account
+
+    def snapshot(self, *args):
+        out = StringIO()
+        call_command("snapshot_balances", *args, stdout=out)
+        return out.getvalue()
+
+    def test_every_account_gets_its_snapshot(
+        self, bank_account, build_booklet_account, days
+    ):
+        booklet_account = build_booklet_account()
+
+        out = self.snapshot(f"--date={days[0].isoformat()}")
+
+        assert f"Wrote 2 balance snapshots of {days[0]}" in out
+        (snapshot,) = BalanceSnapshotRepository.get_range(bank_account.entity_id, *days)
+        assert snapshot.closing_balance == Decimal("895.00")
+        assert (snapshot.deposit_total, snapshot.withdrawal_total) == (
+            Decimal("50.00"),
+            Decimal("20.00"),
+        )
+        assert snapshot.transaction_count == 2
+        booklet = DailyBalanceSnapshotEntity.objects.get(
+            account_id=booklet_account.entity_id
+        )
+        assert booklet.closing_balance == booklet_account.balance
+        assert booklet.transaction_count == 0
+
+    def test_a_day_follows_from_the_day_before(self, bank_account, days):
+        self.snapshot(f"--date={days[0].isoformat()}")
+        # moved outside the ledger: only the first snapshot replays it
+        BankAccountEntity.objects.filter(entity_id=bank_account.entity_id).update(
+            balance=Decimal("0.00")
+        )
+
+        self.snapshot(f"--date={days[1].isoformat()}")
+
+        snapshots = BalanceSnapshotRepository.get_range(bank_account.entity_id, *days)
+        assert [(s.date, s.closing_balance) for s in snapshots] == [
+            (days[0], Decimal("895.00")),
+            (days[1], Decimal("900.00")),
+        ]
+
+    def test_a_second_run_writes_nothing(self, bank_account, days):
+        self.snapshot(f"--date={days[0].isoformat()}")
+
+        assert "Wrote 0 balance snapshots" in self.snapshot(
+            f"--date={days[0].isoformat()}"
+        )
+
+    def test_a_day_which_has_not_ended(self):
+        with pytest.raises(CommandError):
+            self.snapshot(f"--date={timezone.now().date().isoformat()}")
+
+    def test_a_day_is_one_read_and_one_insert_per_account_type(
+        self, bank_account, build_booklet_account, days
+    ):
+        build_booklet_account()
+
+        with CaptureQueriesContext(connection) as queries:
+            BalanceSnapshotRepository.take_snapshots(days[0])
+
+        assert [q["sql"].split()[0] for q in queries] == ["SELECT", "INSERT"] * 2
+
+    def test_balance_at_follows_from_the_last_snapshot(self, bank_account, days):
+        self.snapshot(f"--date={days[0].isoformat()}")
+        BankAccountEntity.objects.filter(entity_id=bank_account.entity_id).update(
+            balance=Decimal("0.00")
+        )
+
+        response = APIClient().get(
+            reverse("account-balance"),
+            {
+                "account_id": bank_account.entity_id,
+                "timestamp": at(days[1], 13).isoformat(),
+            },
+        )
+
+        assert response.data["balance"] == "900.00"
@@ -0,0 +1,237 @@
+import datetime as dt
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db.models import Sum
+from django.utils import timezone
+
+from bank_app.application.adapter.persistence.entity.account_statement_entity import (
+    TransactionEntity,
+)
+from bank_app.application.adapter.persistence.entity.bank_account_entity import (
+    BalanceStripeEntity,
+    BankAccountEntity,
+)
+from bank_app.application.adapter.persistence.repository.bank_account_repository import (  # noqa: E501
+    BankAccountRepository,
+)
+from bank_app.application.adapter.persistence.repository.posting_repository import (
+    PostingRepository,
+)
+from bank_app.application.adapter.persistence.repository.transaction_repository import (
+    TransactionRepository,
+)
+from bank_app.application.domain.domain_models import AccountIdentity
+from bank_app.application.domain.dtos.posting import APPLIED, PostingDTO
+from bank_app.application.domain.model.account_statement import LedgerEntry
+from bank_app.application.util.util import AccountType
+from exalt_hexarch.containers import Container
+
+
+def stripe_total(account):
+    return BalanceStripeEntity.objects.filter(account=account).aggregate(
+        total=Sum("balance")
+    )["total"]
+
+
+@pytest.mark.django_db
+class TestBalanceStripes:
+    @pytest.fixture
+    def account(self):
+        account = BankAccountEntity.objects.create(
+            balance=Decimal("100.00"),
+            overdraft_amount=Decimal("0.00"),
+            is_allow_overdraft=False,
+        )
+        BankAccountRepository.stripe_account(account.account_number, 4)
+        return account
+
+    def test_deposits_land_on_the_stripes(self, account):
+        for _ in range(10):
+            result = BankAccountRepository.apply_postings(
+                account.account_number, [LedgerEntry.deposit(Decimal("5.00"))]
+            )
+
+        account.refresh_from_db()
+        assert account.balance == Decimal("100.00")
+        assert stripe_total(account) == Decimal("50.00")
+        assert result.balance == Decimal("150.00")
+        assert BankAccountRepository.get_by_bank_account_number(
+            account.account_number
+        ).balance == Decimal("150.00")
+        assert not TransactionEntity.objects.filter(
+            account_id=account.entity_id, balance_after__isnull=False
+        ).exists()
+
+    def test_withdrawal_borrows_from_the_stripes(self, account):
+        BankAccountRepository.apply_postings(
+            account.account_number, [LedgerEntry.deposit(Decimal("50.00"))]
+        )
+
+        result = BankAccountRepository.apply_postings(
+            account.account_number, [LedgerEntry.withdrawal(Decimal("120.00"))]
+        )
+
+        account.refresh_from_db()
+        assert result.balance == Decimal("30.00")
+        assert account.balance == Decimal("30.00")
+        assert stripe_total(account) == Decimal("0.00")
+        assert (
+            BankAccountRepository.apply_postings(
+                account.account_number, [LedgerEntry.withdrawal(Decimal("31.00"))]
+            )
+            is None
+        )
+
+    def test_save_does_not_overwrite_a_striped_balance(self, account):
+        BankAccountRepository.apply_postings(
+            account.account_number, [LedgerEntry.deposit(Decimal("50.00"))]
+        )
+        bank_account = BankAccountRepository.get_by_bank_account_number(
+            account.account_number
+        )
+        bank_account.is_active = False
+
+        BankAccountRepository.save(bank_account)
+
+        account.refresh_from_db()
+        assert account.balance == Decimal("100.00")
+        assert not account.is_active
+        assert BankAccountRepository.get_by_bank_account_number(
+            account.account_number
+        ).balance == Decimal("150.00")
+
+    def test_consolidation_folds_the_stripes(self, account):
+        BankAccountRepository.apply_postings(
+            account.account_number, [LedgerEntry.deposit(Decimal("50.00"))]
+        )
+        out = StringIO()
+
+        call_command("consolidate_balance_stripes", stdout=out)
+
+        account.refresh_from_db()
+        assert "1 accounts" in out.getvalue()
+        assert account.balance == Decimal("150.00")
+        assert stripe_total(account) == Decimal("0.00")
+
+    def test_unstriping_keeps_the_balance(self, account):
+        BankAccountRepository.apply_postings(
+            account.account_number, [LedgerEntry.deposit(Decimal("50.00"))]
+        )
+
+        call_command(
+            "stripe_account", str(account.account_number), "0", stdout=StringIO()
+        )
+        result = BankAccountRepository.apply_postings(
+            account.account_number, [LedgerEntry.deposit(Decimal("1.00"))]
+        )
+
+        account.refresh_from_db()
+        assert account.balance_stripes == 0
+        assert not BalanceStripeEntity.objects.filter(account=account).exists()
+        assert result.balance == account.balance == Decimal("151.00")
+
+    def test_bulk_postings_fold_the_stripes(self, account):
+        BankAccountRepository.apply_postings(
+            account.account_number, [LedgerEntry.deposit(Decimal("50.00"))]
+        )
+        posting = PostingDTO(
+            line=1,
+            account_number=account.account_number,
+            account_type=AccountType.CURRENT_ACCOUNT,
+            transaction_type="WITHDRAWAL",
+            amount=Decimal("150.00"),
+        )
+
+        results = PostingRepository.apply_bulk(
+            [posting], lambda bank_account, entry: bank_account.withdraw(entry.amount)
+        )
+
+        account.refresh_from_db()
+        assert results[0].status == APPLIED
+        assert account.balance == Decimal("0.00")
+        assert stripe_total(account) == Decimal("0.00")
+
+    def test_striped_postings_have_no_place_in_the_ledger(self, account):
+        BankAccountRepository.apply_postings(
+            account.account_number, [LedgerEntry.deposit(Decimal("50.00"))]
+        )
+        BankAccountRepository.apply_postings(
+            account.account_number, [LedgerEntry.withdrawal(Decimal("120.00"))]
+        )
+
+        ledger = TransactionEntity.objects.filter(account_id=account.entity_id)
+        assert ledger.count() == 2
+        assert not ledger.filter(sequence__isnull=False).exists()
+        assert not ledger.filter(balance_after__isnull=False).exists()
+
+    def test_balance_at_and_statement_across_a_consolidation(self):
+        account = BankAccountEntity.objects.create(
+            balance=Decimal("100.00"),
+            overdraft_amount=Decimal("0.00"),
+            is_allow_overdraft=False,
+        )
+        service = Container().account_statement_service()
+
+        def day(number):
+            return dt.datetime(2025, 1, number, 12, tzinfo=dt.timezone.utc)
+
+        def post(entry, number):
+            before = list(TransactionEntity.objects.values_list("entity_id", flat=True))
+            BankAccountRepository.apply_postings(account.account_number, [entry])
+            TransactionEntity.objects.exclude(entity_id__in=before).update(
+                transaction_date=day(number)
+            )
+
+        post(LedgerEntry.withdrawal(Decimal("10.00")), 2)
+        BankAccountRepository.stripe_account(account.account_number, 2)
+        post(LedgerEntry.deposit(Decimal("5.00")), 3)
+        BankAccountRepository.consolidate_stripes()
+        post(LedgerEntry.deposit(Decimal("1.00")), 4)
+        post(LedgerEntry.withdrawal(Decimal("50.00")), 5)
+        BankAccountRepository.stripe_account(account.account_number, 0)
+        post(LedgerEntry.deposit(Decimal("2.00")), 6)
+
+        balances = [
+            service.get_balance_at(
+                account.entity_id, day(number) + dt.timedelta(hours=1)
+            ).balance
+            for number in range(1, 7)
+        ]
+        assert balances == [
+            Decimal("100.00"),
+            Decimal("90.00"),
+            Decimal("95.00"),
+            Decimal("96.00"),
+            Decimal("46.00"),
+            Decimal("48.00"),
+        ]
+        statement = service.generate_monthly_statement(
+            account.entity_id, month=dt.date(2025, 1, 1)
+        )
+        assert statement.opening_balance == Decimal("100.00")
+        assert statement.closing_balance == Decimal("48.00")
+
+    def test_balance_at_has_no_running_balance_after_a_striped_deposit(self):
+        account = BankAccountEntity.objects.create(
+            balance=Decimal("100.00"),
+            overdraft_amount=Decimal("0.00"),
+            is_allow_overdraft=False,
+        )
+        BankAccountRepository.apply_postings(
+            account.account_number, [LedgerEntry.withdrawal(Decimal("10.00"))]
+        )
+        BankAccountRepository.stripe_account(account.account_number, 2)
+        BankAccountRepository.apply_postings(
+            account.account_number, [LedgerEntry.deposit(Decimal("5.00"))]
+        )
+
+        assert (
+            TransactionRepository.balance_at(
+                AccountIdentity(account.entity_id),
+                timezone.now() + dt.timedelta(seconds=1),
+            )
+            is None
+        )
@@ -0,0 +1,88 @@
+import datetime as dt
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from bank_app.application.adapter.persistence.entity.account_statement_entity import (
+    TransactionEntity,
+)
+from bank_app.application.adapter.persistence.repository.bank_account_repository import (  # noqa: E501
+    BankAccountRepository,
+)
+from bank_app.application.adapter.persistence.repository.booklet_account_repository import (  # noqa: E501
+    BookletAccountRepository,
+)
+from bank_app.application.adapter.persistence.repository.transaction_repository import (
+    TransactionRepository,
+)
+from bank_app.application.domain.model.account_statement import TransactionIdentity
+
+
+def updates(queries):
+    return [q["sql"] for q in queries if q["sql"].startswith("UPDATE")]
+
+
+@pytest.mark.django_db
+class TestDirtySaves:
+    def test_only_changed_columns_are_updated(self, build_booklet_account):
+        booklet = build_booklet_account()
+        account = BookletAccountRepository.get_by_booklet_account_number(
+            booklet.account_number
+        )
+        account.set_deposit_limit(Decimal("8000.00"))
+
+        with CaptureQueriesContext(connection) as queries:
+            BookletAccountRepository.save(account)
+
+        (sql,) = updates(queries)
+        assert '"deposit_limit"' in sql
+        assert '"version"' in sql
+        assert '"balance"' not in sql
+        assert '"account_number" =' not in sql.split("WHERE")[0]
+        booklet.refresh_from_db()
+        assert booklet.deposit_limit == Decimal("8000.00")
+        assert booklet.version == 1
+        assert account.changed_fields == frozenset()
+
+    def test_unchanged_account_is_not_written(self, build_bank_account):
+        bank_account = build_bank_account()
+        account = BankAccountRepository.get_by_bank_account_number(
+            bank_account.account_number
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            BankAccountRepository.save(account)
+
+        assert len(queries) == 0
+
+    def test_loaded_transaction_is_updated_without_reading_it(
+        self, build_bank_account, build_transaction
+    ):
+        entity = build_transaction(bank_account=build_bank_account())
+        transaction = TransactionRepository.get(TransactionIdentity(entity.entity_id))
+        transaction.balance_after = Decimal("42.00")
+
+        with CaptureQueriesContext(connection) as queries:
+            TransactionRepository.save(transaction)
+
+        assert [q["sql"].split()[0] for q in queries] == ["UPDATE"]
+        assert TransactionEntity.objects.get(
+            entity_id=entity.entity_id
+        ).balance_after == Decimal("42.00")
+
+    def test_loaded_transaction_keeps_its_date(
+        self, build_bank_account, build_transaction
+    ):
+        entity = build_transaction(bank_account=build_bank_account())
+        transaction = TransactionRepository.get(TransactionIdentity(entity.entity_id))
+        transaction.transaction_date -= dt.timedelta(days=40)
+
+        with pytest.raises(ValueError, match="cannot change"):
+            TransactionRepository.save(transaction)
+
+        assert (
+            TransactionEntity.objects.get(entity_id=entity.entity_id).transaction_date
+            == entity.transaction_date
+        )
@@ -0,0 +1,102 @@
+from decimal import Decimal
+
+import pytest
+
+from bank_app.application.adapter.persistence.entity.bank_account_entity import (
+    BankAccountEntity,
+)
+from bank_app.application.adapter.persistence.entity.booklet_account_entity import (
+    BookletAccountEntity,
+)
+from bank_app.application.adapter.persistence.repository.bank_account_repository import (  # noqa: E501
+    BankAccountRepository,
+)
+from bank_app.application.adapter.persistence.repository.booklet_account_repository import (  # noqa: E501
+    BookletAccountRepository,
+)
+from bank_app.application.domain.model.account_statement import LedgerEntry
+
+
+@pytest.mark.django_db
+class TestExactPostings:
+    """Guards at their exact boundary, where binary floats would refuse"""
+
+    def test_deposit_up_to_the_deposit_limit(self):
+        account = BookletAccountEntity.objects.create(
+            balance=Decimal("0.10"), deposit_limit=Decimal("0.30")
+        )
+
+        posted = BookletAccountRepository.apply_postings(
+            account.account_number, [LedgerEntry.deposit(Decimal("0.20"))]
+        )
+
+        assert posted is not None
+        assert posted.balance == Decimal("0.30")
+
+    def test_deposit_past_the_deposit_limit(self):
+        account = BookletAccountEntity.objects.create(
+            balance=Decimal("0.10"), deposit_limit=Decimal("0.30")
+        )
+
+        assert (
+            BookletAccountRepository.apply_postings(
+                account.account_number, [LedgerEntry.deposit(Decimal("0.21"))]
+            )
+            is None
+        )
+
+    def test_booklet_withdrawal_of_the_whole_balance(self):
+        account = BookletAccountEntity.objects.create(
+            balance=Decimal("0.30"), deposit_limit=Decimal("100.00")
+        )
+        BookletAccountRepository.apply_postings(
+            account.account_number, [LedgerEntry.withdrawal(Decimal("0.10"))]
+        )
+
+        posted = BookletAccountRepository.apply_postings(
+            account.account_number, [LedgerEntry.withdrawal(Decimal("0.20"))]
+        )
+
+        assert posted is not None
+        assert posted.balance == Decimal("0.00")
+
+    def test_withdrawal_up_to_the_overdraft_limit(self):
+        account = BankAccountEntity.objects.create(
+            balance=Decimal("0.10"),
+            overdraft_amount=Decimal("0.20"),
+            is_allow_overdraft=True,
+        )
+
+        posted = BankAccountRepository.apply_postings(
+            account.account_number, [LedgerEntry.withdrawal(Decimal("0.30"))]
+        )
+
+        assert posted is not None
+        assert posted.balance == Decimal("-0.20")
+
+    def test_withdrawal_past_the_overdraft_limit(self):
+        account = BankAccountEntity.objects.create(
+            balance=Decimal("0.10"),
+            overdraft_amount=Decimal("0.20"),
+            is_allow_overdraft=True,
+        )
+
+        assert (
+            BankAccountRepository.apply_postings(
+                account.account_number, [LedgerEntry.withdrawal(Decimal("0.31"))]
+            )
+            is None
+        )
+
+    def test_widest_amount_is_kept_whole(self):
+        account = BankAccountEntity.objects.create(
+            balance=Decimal("0.00"), overdraft_amount=Decimal("0.00")
+        )
+        amount = Decimal("99999999999999999.99")
+
+        posted = BankAccountRepository.apply_postings(
+            account.account_number, [LedgerEntry.deposit(amount)]
+        )
+
+        assert posted is not None
+        assert posted.balance == amount
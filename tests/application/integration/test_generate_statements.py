@@ -0,0 +1,176 @@
+import datetime as dt
+import json
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from bank_app.application.adapter.persistence.entity.account_statement_entity import (
+    MonthlyStatementEntity,
+    TransactionEntity,
+)
+from bank_app.application.adapter.persistence.repository.transaction_repository import (
+    TransactionRepository,
+)
+from bank_app.application.adapter.persistence.statement_run import generate_chunk
+from bank_app.application.domain.domain_models import AccountIdentity
+from bank_app.application.domain.service.account_statement import (
+    AccoutStatementService,
+)
+from bank_app.application.util.util import AccountType
+
+
+@pytest.mark.django_db
+class TestGenerateStatements:
+    @pytest.fixture
+    def period_end(self):
+        return timezone.now() - dt.timedelta(hours=1)
+
+    @pytest.fixture
+    def accounts(self, build_bank_account, build_booklet_account, build_transaction):
+        bank_accounts = [build_bank_account() for _ in range(3)]
+        booklet_accounts = [build_booklet_account() for _ in range(2)]
+        build_bank_account(is_active=False)
+        for bank_account in bank_accounts[:2]:
+            build_transaction(
+                bank_account=bank_account, amount=Decimal("10.00"), deposit=True
+            )
+        # before the period: moves the opening balance, not the net amount
+        old = build_transaction(
+            bank_account=bank_accounts[0], amount=Decimal("5.00"), deposit=False
+        )
+        TransactionEntity.objects.filter(entity_id=old.entity_id).update(
+            transaction_date=timezone.now() - dt.timedelta(days=60)
+        )
+        return sorted(bank_accounts, key=lambda a: a.entity_id), booklet_accounts
+
+    def generate(self, tmp_path, *args):
+        out = StringIO()
+        call_command(
+            "generate_statements",
+            "--workers=1",
+            "--chunk-size=2",
+            f"--checkpoint={tmp_path / 'checkpoint.json'}",
+            *args,
+            stdout=out,
+        )
+        return out.getvalue()
+
+    def test_every_active_account_gets_its_statement(
+        self, tmp_path, period_end, accounts
+    ):
+        bank_accounts, booklet_accounts = accounts
+
+        self.generate(tmp_path, f"--period-end={period_end.isoformat()}")
+
+        statements = {s.account_id: s for s in MonthlyStatementEntity.objects.all()}
+        assert statements.keys() == {
+            a.entity_id for a in [*bank_accounts, *booklet_accounts]
+        }
+        period_start = AccoutStatementService.get_period_start(period_end)
+        bounds = AccoutStatementService.ledger_bounds(period_start, period_end)
+        for account in bank_accounts:
+            statement = statements[account.entity_id]
+            period, since = TransactionRepository.get_net_amounts(
+                AccountIdentity(account.entity_id), bounds
+            )
+            assert statement.account_type == "CURRENT_ACCOUNT"
+            assert statement.period_end == period_end
+            assert statement.closing_balance == account.balance - since
+            assert statement.opening_balance == account.balance - since - period
+            assert statement.is_closed
+        assert {statements[a.entity_id].account_type for a in booklet_accounts} == {
+            "BOOKLET_ACCOUNT"
+        }
+
+    def test_a_month_follows_from_the_previous_one(
+        self, tmp_path, build_bank_account, build_transaction
+    ):
+        bank_account = build_bank_account()
+        for amount, date in [
+            (Decimal("10.00"), dt.datetime(2025, 1, 20)),
+            (Decimal("20.00"), dt.datetime(2025, 2, 10)),
+            (Decimal("40.00"), dt.datetime(2025, 3, 1)),
+        ]:
+            posted = build_transaction(bank_account=bank_account, amount=amount)
+            TransactionEntity.objects.filter(entity_id=posted.entity_id).update(
+                transaction_date=timezone.make_aware(date)
+            )
+
+        out = self.generate(tmp_path, "--month=2025-01")
+        self.generate(tmp_path, "--month=2025-02")
+
+        assert (
+            "from 2025-01-01T00:00:00+00:00 to 2025-01-31T23:59:59.999999+00:00" in out
+        )
+        january, february = MonthlyStatementEntity.objects.order_by("period_end")
+        assert (january.opening_balance, january.closing_balance) == (
+            Decimal("930.00"),
+            Decimal("940.00"),
+        )
+        assert (february.opening_balance, february.closing_balance) == (
+            Decimal("940.00"),
+            Decimal("960.00"),
+        )
+
+    def test_month_or_period_end(self, tmp_path, period_end):
+        with pytest.raises(CommandError):
+            self.generate(
+                tmp_path, "--month=2025-01", f"--period-end={period_end.isoformat()}"
+            )
+
+    def test_a_second_run_writes_nothing(self, tmp_path, period_end, accounts):
+        self.generate(tmp_path, f"--period-end={period_end.isoformat()}")
+        (tmp_path / "checkpoint.json").unlink()
+
+        out = self.generate(tmp_path, f"--period-end={period_end.isoformat()}")
+
+        assert MonthlyStatementEntity.objects.count() == 5
+        assert "0 statements" in out
+
+    def test_an_interrupted_run_resumes_from_its_checkpoint(
+        self, tmp_path, period_end, accounts
+    ):
+        bank_accounts, _ = accounts
+        (tmp_path / "checkpoint.json").write_text(
+            json.dumps(
+                {
+                    "period_start": AccoutStatementService.get_period_start(
+                        period_end
+                    ).isoformat(),
+                    "period_end": period_end.isoformat(),
+                    "done": {"CURRENT_ACCOUNT": str(bank_accounts[1].entity_id)},
+                    "finished": False,
+                }
+            )
+        )
+
+        out = self.generate(tmp_path)
+
+        assert "3 accounts to go" in out
+        assert not MonthlyStatementEntity.objects.filter(
+            account_id__in=[a.entity_id for a in bank_accounts[:2]]
+        ).exists()
+        assert MonthlyStatementEntity.objects.filter(period_end=period_end).count() == 3
+        checkpoint = json.loads((tmp_path / "checkpoint.json").read_text())
+        assert checkpoint["finished"]
+        assert checkpoint["done"]["CURRENT_ACCOUNT"] == str(bank_accounts[2].entity_id)
+
+    def test_a_chunk_is_one_read_and_one_insert(self, period_end, accounts):
+        bank_accounts, _ = accounts
+
+        with CaptureQueriesContext(connection) as queries:
+            written = generate_chunk(
+                AccountType.CURRENT_ACCOUNT,
+                bank_accounts[0].entity_id,
+                bank_accounts[-1].entity_id,
+                AccoutStatementService.get_period_start(period_end),
+                period_end,
+            )
+
+        assert written == 3
+        assert [q["sql"].split()[0] for q in queries] == ["SELECT", "INSERT"]
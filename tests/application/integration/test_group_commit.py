@@ -0,0 +1,184 @@
+import threading
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from django.db import connection, transaction
+
+from bank_app.application.adapter.persistence import group_commit
+from bank_app.application.adapter.persistence.entity.account_statement_entity import (
+    TransactionEntity,
+)
+from bank_app.application.adapter.persistence.entity.bank_account_entity import (
+    BankAccountEntity,
+)
+from bank_app.application.adapter.persistence.group_commit import (
+    GroupCommitter,
+    run_grouped,
+)
+from bank_app.application.adapter.persistence.repository.bank_account_repository import (  # noqa: E501
+    BankAccountRepository,
+)
+from bank_app.application.adapter.persistence.unit_of_work import (
+    UnitOfWork,
+    current_unit_of_work,
+)
+from bank_app.application.domain.exceptions import InsufficientFundsException
+
+
+class Aborted(BaseException):
+    pass
+
+
+def submit_all(committer, funcs):
+    results = [None] * len(funcs)
+
+    def call(index, func):
+        try:
+            results[index] = committer.submit(func)
+        except BaseException as ex:  # noqa: BLE001
+            results[index] = ex
+        finally:
+            connection.close()
+
+    threads = [
+        threading.Thread(target=call, args=(index, func))
+        for index, func in enumerate(funcs)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    return results
+
+
+@pytest.mark.django_db(transaction=True)
+class TestGroupCommitter:
+    @pytest.fixture
+    def committer(self):
+        committer = GroupCommitter(window=0.5, max_batch=3)
+        committer.start()
+        yield committer
+        committer.stop()
+
+    def test_concurrent_postings_share_one_transaction(self, committer):
+        accounts = [
+            BankAccountEntity.objects.create(
+                balance=Decimal("0.00"), overdraft_amount=Decimal("100.00")
+            )
+            for _ in range(3)
+        ]
+
+        def deposit(account):
+            return lambda: BankAccountEntity.objects.filter(pk=account.pk).update(
+                balance=Decimal("10.00")
+            )
+
+        results = submit_all(committer, [deposit(account) for account in accounts])
+
+        assert results == [1, 1, 1]
+        assert committer.stats()["batches"] == 1
+        assert committer.stats()["committed_jobs"] == 3
+        assert {account.balance for account in BankAccountEntity.objects.all()} == {
+            Decimal("10.00")
+        }
+
+    def test_failed_posting_is_rolled_back_alone(self, committer):
+        account = BankAccountEntity.objects.create(
+            balance=Decimal("0.00"), overdraft_amount=Decimal("100.00")
+        )
+
+        def refused():
+            BankAccountEntity.objects.filter(pk=account.pk).update(
+                balance=Decimal("-999.00")
+            )
+            raise InsufficientFundsException("Insufficient funds")
+
+        def accepted():
+            return BankAccountEntity.objects.filter(pk=account.pk).update(
+                overdraft_amount=Decimal("200.00")
+            )
+
+        results = submit_all(committer, [refused, accepted])
+
+        assert isinstance(results[0], InsufficientFundsException)
+        assert results[1] == 1
+        account.refresh_from_db()
+        assert account.balance == Decimal("0.00")
+        assert account.overdraft_amount == Decimal("200.00")
+        assert committer.stats()["failed_jobs"] == 1
+
+    def test_caller_gets_a_base_exception_raised_by_its_posting(self, committer):
+        def aborted():
+            raise Aborted
+
+        results = submit_all(committer, [aborted, lambda: 1])
+
+        assert isinstance(results[0], Aborted)
+        assert results[1] == 1
+        assert committer.is_running
+        assert committer.submit(lambda: 2) == 2
+
+    def test_postings_go_through_the_committer_when_enabled(
+        self, settings, bank_account_service_implement, build_bank_account
+    ):
+        settings.GROUP_COMMIT = {"ENABLED": True, "WINDOW_MS": 1}
+        bank_account = build_bank_account()
+        try:
+            result = bank_account_service_implement.deposit_money(
+                bank_account.account_number, Decimal("100.00")
+            )
+
+            assert result.balance == Decimal("1100.00")
+            assert group_commit.get_group_committer().stats()["committed_jobs"] == 1
+            assert TransactionEntity.objects.filter(
+                account_id=bank_account.entity_id
+            ).exists()
+        finally:
+            group_commit.get_group_committer().stop()
+            group_commit._committer = None
+
+    def test_postings_run_outside_the_request_unit_of_work(
+        self, settings, bank_account_service_implement, build_bank_account
+    ):
+        settings.GROUP_COMMIT = {"ENABLED": True, "WINDOW_MS": 1}
+        bank_account = build_bank_account()
+        seen = []
+        apply_postings = BankAccountRepository._apply_postings.__func__
+
+        def spy(cls, *args):
+            seen.append(current_unit_of_work())
+            return apply_postings(cls, *args)
+
+        patched = patch.object(
+            BankAccountRepository, "_apply_postings", classmethod(spy)
+        )
+        try:
+            with patched, pytest.raises(RuntimeError), UnitOfWork() as unit_of_work:
+                bank_account_service_implement.deposit_money(
+                    bank_account.account_number, Decimal("100.00")
+                )
+                number_key = ("bank_account_number", bank_account.account_number)
+                assert unit_of_work.get(number_key) is None
+                raise RuntimeError
+
+            # run by the worker, committed with its group all the same
+            assert seen == [None]
+            assert BankAccountEntity.objects.get(
+                pk=bank_account.entity_id
+            ).balance == Decimal("1100.00")
+        finally:
+            group_commit.get_group_committer().stop()
+            group_commit._committer = None
+
+
+@pytest.mark.django_db
+def test_run_grouped_stays_in_the_current_transaction(settings):
+    settings.GROUP_COMMIT = {"ENABLED": True}
+    try:
+        with transaction.atomic():
+            assert run_grouped(lambda: connection.in_atomic_block)
+        assert group_commit.get_group_committer().stats()["batches"] == 0
+    finally:
+        group_commit.get_group_committer().stop()
+        group_commit._committer = None
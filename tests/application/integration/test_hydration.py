@@ -0,0 +1,76 @@
+import datetime as dt
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+
+from bank_app.application.adapter.persistence.entity.account_statement_entity import (
+    TransactionEntity,
+)
+from bank_app.application.adapter.persistence.entity.bank_account_entity import (
+    BankAccountEntity,
+)
+from bank_app.application.adapter.persistence.repository.bank_account_repository import (  # noqa: E501
+    BankAccountRepository,
+)
+from bank_app.application.adapter.persistence.repository.transaction_repository import (
+    TransactionRepository,
+)
+from bank_app.application.domain.domain_models import AccountIdentity
+from bank_app.application.domain.model.account_statement import TransactionIdentity
+
+
+@pytest.mark.django_db
+class TestHydration:
+    def test_transactions_are_built_from_rows(
+        self, build_bank_account, build_transaction
+    ):
+        bank_account = build_bank_account()
+        stored = [build_transaction(bank_account=bank_account) for _ in range(3)]
+
+        with patch.object(TransactionEntity, "from_db") as from_db:
+            transactions = TransactionRepository.get_by_account_id(
+                AccountIdentity(bank_account.entity_id)
+            )
+
+        from_db.assert_not_called()
+        assert {t.entity_id for t in transactions} == {
+            TransactionIdentity(t.entity_id) for t in stored
+        }
+        assert all(t.changed_fields == frozenset() for t in transactions)
+
+    def test_account_is_loaded_without_validation(self, build_bank_account):
+        bank_account = build_bank_account()
+        # valid once, not anymore under today's rules
+        BankAccountEntity.objects.filter(entity_id=bank_account.entity_id).update(
+            overdraft_amount=Decimal("0.00")
+        )
+
+        account = BankAccountRepository.get_by_bank_account_number(
+            bank_account.account_number
+        )
+
+        assert account.overdraft_amount == Decimal("0.00")
+
+    def test_transactions_are_streamed_in_chunks(
+        self, monkeypatch, build_bank_account, build_transaction
+    ):
+        monkeypatch.setattr(TransactionRepository, "_CHUNK_SIZE", 2)
+        bank_account = build_bank_account()
+        start = dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc)
+        stored = [build_transaction(bank_account=bank_account) for _ in range(5)]
+        for days, transaction in enumerate(stored):
+            TransactionEntity.objects.filter(entity_id=transaction.entity_id).update(
+                transaction_date=start + dt.timedelta(days=days)
+            )
+
+        stream = TransactionRepository.stream_by_account_id_and_date_range(
+            AccountIdentity(bank_account.entity_id),
+            start,
+            start + dt.timedelta(days=3),
+        )
+
+        newest_first = [t.entity_id for t in reversed(stored[:4])]
+        assert list(stream.ids) == newest_first
+        # read again on every pass, nothing kept from the first one
+        assert [t.entity_id.uuid for t in stream] == newest_first
@@ -0,0 +1,107 @@
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from bank_app.application.adapter.persistence import account_cache
+from bank_app.application.adapter.persistence.entity.bank_account_entity import (
+    BankAccountEntity,
+)
+from bank_app.application.adapter.persistence.entity.booklet_account_entity import (
+    BookletAccountEntity,
+)
+from bank_app.application.adapter.persistence.repository.bank_account_repository import (  # noqa: E501
+    BankAccountRepository,
+)
+from bank_app.application.adapter.persistence.repository.booklet_account_repository import (  # noqa: E501
+    BookletAccountRepository,
+)
+from bank_app.application.adapter.persistence.repository.transfer_repository import (
+    TransferRepository,
+)
+from bank_app.application.domain.domain_models import AccountIdentity
+from bank_app.application.domain.model.account_statement import LedgerEntry
+from bank_app.application.util.util import AccountType
+
+
+@pytest.mark.django_db
+class TestAccountCache:
+    @pytest.fixture(autouse=True)
+    def enable_cache(self, settings):
+        settings.ACCOUNT_CACHE = {"ENABLED": True, "MAX_SIZE": 100, "TTL_SECONDS": 60}
+        account_cache._caches = {}
+        yield
+        account_cache._caches = {}
+
+    @pytest.fixture
+    def bank_account(self):
+        return BankAccountEntity.objects.create(
+            balance=Decimal("100.00"), overdraft_amount=Decimal("50.00")
+        )
+
+    @pytest.fixture
+    def booklet_account(self):
+        return BookletAccountEntity.objects.create(
+            balance=Decimal("100.00"), deposit_limit=Decimal("500.00")
+        )
+
+    def test_balance_is_read_on_every_hit(self, bank_account):
+        BankAccountRepository.get_by_bank_account_number(bank_account.account_number)
+        BankAccountRepository.apply_postings(
+            bank_account.account_number, [LedgerEntry.deposit(Decimal("10.00"))]
+        )
+
+        account = BankAccountRepository.get(AccountIdentity(bank_account.entity_id))
+
+        assert account.balance == Decimal("110.00")
+        assert account.overdraft_amount == Decimal("50.00")
+        assert account.version == 1
+        assert account_cache.get_account_cache("bank_account").stats()["hits"] == 1
+
+    def test_saves_invalidate(self, bank_account, booklet_account):
+        BankAccountRepository.update_overdraft_amount(
+            bank_account.account_number, Decimal("20.00")
+        )
+        booklet = BookletAccountRepository.get_by_booklet_account_number(
+            booklet_account.account_number
+        )
+        booklet.set_deposit_limit(Decimal("1000.00"))
+        BookletAccountRepository.save(booklet)
+        BankAccountRepository.get_by_bank_account_number(bank_account.account_number)
+        BankAccountRepository.update_overdraft_amount(
+            bank_account.account_number, Decimal("30.00")
+        )
+
+        assert BankAccountRepository.get_by_bank_account_number(
+            bank_account.account_number
+        ).overdraft_amount == Decimal("30.00")
+        assert BookletAccountRepository.get_by_booklet_account_number(
+            booklet_account.account_number
+        ).deposit_limit == Decimal("1000.00")
+
+    def test_deleted_account_is_not_served(self, bank_account):
+        BankAccountRepository.get_by_bank_account_number(bank_account.account_number)
+        BankAccountEntity.objects.filter(entity_id=bank_account.entity_id).delete()
+
+        with pytest.raises(account_cache.NotFound):
+            BankAccountRepository.get_by_bank_account_number(
+                bank_account.account_number
+            )
+
+    def test_transfer_skips_the_account_lookups(self, bank_account, booklet_account):
+        BankAccountRepository.get_account_number(bank_account.entity_id)
+        BookletAccountRepository.get_account_number(booklet_account.entity_id)
+
+        with CaptureQueriesContext(connection) as queries:
+            source, target = TransferRepository.apply_transfer(
+                source_id=AccountIdentity(bank_account.entity_id),
+                source_type=AccountType.CURRENT_ACCOUNT,
+                target_id=AccountIdentity(booklet_account.entity_id),
+                target_type=AccountType.BOOKLET_ACCOUNT,
+                amount=Decimal("10.00"),
+            )
+
+        assert source.balance == Decimal("90.00")
+        assert target.balance == Decimal("110.00")
+        assert not [q for q in queries if q["sql"].lstrip().startswith("SELECT")]
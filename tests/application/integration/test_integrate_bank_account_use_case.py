@@ -1,97 +1,57 @@
 from decimal import Decimal
+from uuid import uuid4
 
 import pytest
 
-from bank_app.application.domain.exceptions import BusinessException
-from bank_app.application.domain.model.bank_account import BankAccount
-
-
+from bank_app.application.adapter.api.unit_of_work import in_unit_of_work
+from bank_app.application.adapter.persistence.entity.account_statement_entity import (
+    TransactionEntity,
+)
+from bank_app.application.adapter.persistence.repository.bank_account_repository import (  # noqa: E501
+    BankAccountRepository,
+)
+from bank_app.application.domain.exceptions import (
+    BusinessException,
+    ConcurrentUpdateException,
+    NotFound,
+)
+from bank_app.application.domain.model.account_statement import LedgerEntry
+from bank_app.application.domain.service.bank_account import BankAccountService
+from bank_app.application.service.bank_acount_overdraft import (
+    BankAccountOverdraftService,
+)
+
+
+@pytest.mark.django_db
 class TestIntegrationScenarios:
     def test_deposit_then_redraw_balance_calculation(
-        self,
-        bank_account_service,
-        mock_bank_account_repository,
-        sample_entity_id,
-        sample_account_number,
-        monkeypatch,
+        self, bank_account_service_implement, build_bank_account
     ):
         """
         Deposit money then withdraw money and verify balance calculations
         """
-        initial_balance = Decimal("1000.00")
-        deposit_amount = Decimal("500.00")
-        withdraw_amount = Decimal("300.00")
-
-        real_bank_account = BankAccount(
-            entity_id=sample_entity_id,
-            account_number=sample_account_number,
-            balance=initial_balance,
-        )
-
-        mock_bank_account_repository.get_by_bank_account_number.return_value = (
-            real_bank_account
-        )
-        mock_bank_account_repository.save.return_value = None
+        bank_account = build_bank_account()
 
-        monkeypatch.setattr(
-            "bank_app.application.domain.service.bank_account.BankAccountService.can_withdraw",
-            lambda account, withdrawal_amount: True,
-        )
-        deposit_result = bank_account_service.deposit_money(
-            sample_account_number, deposit_amount
+        deposit_result = bank_account_service_implement.deposit_money(
+            bank_account.account_number, Decimal("500.00")
         )
-
         assert deposit_result.balance == Decimal("1500.00")
 
-        mock_bank_account_repository.get_by_bank_account_number.return_value = (
-            real_bank_account
-        )
-
-        withdraw_result = bank_account_service.redraw(
-            sample_account_number, withdraw_amount
+        withdraw_result = bank_account_service_implement.redraw(
+            bank_account.account_number, Decimal("300.00")
         )
         assert withdraw_result.balance == Decimal("1200.00")  # 1500 - 300
 
-        assert mock_bank_account_repository.get_by_bank_account_number.call_count == 2
-        assert mock_bank_account_repository.save.call_count == 2
-
-        mock_calls = (
-            mock_bank_account_repository.get_by_bank_account_number.call_args_list
-        )
-        assert mock_calls[0] == mock_calls[1]
-
-        save_calls = mock_bank_account_repository.save.call_args_list
-        assert len(save_calls) == 2
-        assert save_calls[0][0][0] == real_bank_account  # First save
-        assert save_calls[1][0][0] == real_bank_account  # Second save
+        bank_account.refresh_from_db()
+        assert bank_account.balance == Decimal("1200.00")
 
     def test_multiple_deposits_and_withdrawals_sequence(
-        self,
-        bank_account_service,
-        mock_bank_account_repository,
-        sample_entity_id,
-        sample_account_number,
-        monkeypatch,
+        self, bank_account_service_implement, build_bank_account
     ):
         """
         Integration test: Multiple deposits and withdrawals in sequence
         """
-        initial_balance = Decimal("2000.00")
-        real_bank_account = BankAccount(
-            entity_id=sample_entity_id,
-            account_number=sample_account_number,
-            balance=initial_balance,
-        )
-
-        mock_bank_account_repository.get_by_bank_account_number.return_value = (
-            real_bank_account
-        )
-        mock_bank_account_repository.save.return_value = None
-
-        monkeypatch.setattr(
-            "bank_app.application.domain.service.bank_account.BankAccountService.can_withdraw",
-            lambda account, withdrawal_amount: True,
-        )
+        bank_account = build_bank_account(balance=Decimal("2000.00"))
 
         operations = [
             ("deposit", Decimal("1000.00"), Decimal("3000.00")),  # 2000 + 1000 = 3000
@@ -99,82 +59,176 @@ class TestIntegrationScenarios:
             ("deposit", Decimal("200.00"), Decimal("2700.00")),  # 2500 + 200 = 2700
             ("withdraw", Decimal("700.00"), Decimal("2000.00")),  # 2700 - 700 = 2000
         ]
-        final_balance = initial_balance
-
         for operation_type, amount, expected_balance in operations:
             if operation_type == "deposit":
-                result = bank_account_service.deposit_money(
-                    sample_account_number, amount
+                result = bank_account_service_implement.deposit_money(
+                    bank_account.account_number, amount
                 )
             else:
-                result = bank_account_service.redraw(sample_account_number, amount)
-
+                result = bank_account_service_implement.redraw(
+                    bank_account.account_number, amount
+                )
             assert result.balance == expected_balance
-            final_balance = result.balance
-
-            mock_bank_account_repository.get_by_bank_account_number.return_value = (
-                real_bank_account
-            )
 
-        assert final_balance == Decimal("2000.00")
-        assert (
-            mock_bank_account_repository.get_by_bank_account_number.call_count
-            == len(operations)
-        )
-        assert mock_bank_account_repository.save.call_count == len(operations)
+        bank_account.refresh_from_db()
+        assert bank_account.balance == Decimal("2000.00")
 
     def test_insufficient_funds_after_operations(
-        self,
-        bank_account_service,
-        mock_bank_account_repository,
-        sample_entity_id,
-        sample_account_number,
-        monkeypatch,
+        self, bank_account_service_implement, build_bank_account
     ):
         """
         Verify BusinessException is raised when trying to withdraw
         more than available balance after a series of operations
         """
-        initial_balance = Decimal("1000.00")
-        real_bank_account = BankAccount(
-            entity_id=sample_entity_id,
-            account_number=sample_account_number,
-            balance=initial_balance,
+        bank_account = build_bank_account(no_overdraft=True)
+
+        deposit_result = bank_account_service_implement.deposit_money(
+            bank_account.account_number, Decimal("200.00")
         )
+        assert deposit_result.balance == Decimal("1200.00")
 
-        mock_bank_account_repository.get_by_bank_account_number.return_value = (
-            real_bank_account
+        withdraw_result = bank_account_service_implement.redraw(
+            bank_account.account_number, Decimal("800.00")
         )
-        mock_bank_account_repository.save.return_value = None
+        assert withdraw_result.balance == Decimal("400.00")
 
-        def really_can_withdraw_mock(account, withdrawal_amount):
-            return account.balance >= withdrawal_amount
+        with pytest.raises(BusinessException) as exc_info:
+            bank_account_service_implement.redraw(
+                bank_account.account_number, Decimal("500.00")
+            )
 
-        monkeypatch.setattr(
-            "bank_app.application.domain.service.bank_account.BankAccountService.can_withdraw",
-            really_can_withdraw_mock,
+        assert "Insufficient funds to make this withdrawal" in str(
+            exc_info.value.message
         )
-        deposit_result = bank_account_service.deposit_money(
-            sample_account_number, Decimal("200.00")
+        bank_account.refresh_from_db()
+        assert bank_account.balance == Decimal("400.00")
+
+    def test_redraw_within_overdraft_is_guarded_by_overdraft_amount(
+        self, bank_account_service_implement, build_bank_account
+    ):
+        bank_account = build_bank_account(
+            is_allow_overdraft=True, overdraft_amount=Decimal("500.00")
         )
-        assert deposit_result.balance == Decimal("1200.00")
 
-        mock_bank_account_repository.get_by_bank_account_number.return_value = (
-            real_bank_account
+        result = bank_account_service_implement.redraw(
+            bank_account.account_number, Decimal("1500.00")
         )
+        assert result.balance == Decimal("-500.00")
+
+        with pytest.raises(BusinessException):
+            bank_account_service_implement.redraw(
+                bank_account.account_number, Decimal("0.01")
+            )
+        bank_account.refresh_from_db()
+        assert bank_account.balance == Decimal("-500.00")
+
+    def test_redraw_unknown_account(self, bank_account_service_implement):
+        with pytest.raises(NotFound):
+            bank_account_service_implement.redraw(uuid4(), Decimal("10.00"))
+
+    def test_refused_redraw_records_no_ledger_entry(
+        self, bank_account_service_implement, build_bank_account
+    ):
+        bank_account = build_bank_account(no_overdraft=True)
 
-        withdraw_result = bank_account_service.redraw(
-            sample_account_number, Decimal("800.00")
+        bank_account_service_implement.deposit_money(
+            bank_account.account_number, Decimal("100.00")
         )
-        assert withdraw_result.balance == Decimal("400.00")
-        mock_bank_account_repository.get_by_bank_account_number.return_value = (
-            real_bank_account
+        with pytest.raises(BusinessException):
+            bank_account_service_implement.redraw(
+                bank_account.account_number, Decimal("5000.00")
+            )
+
+        ledger = TransactionEntity.objects.filter(account_id=bank_account.entity_id)
+        assert [(t.transaction_type, t.balance_after) for t in ledger] == [
+            ("DEPOSIT", Decimal("1100.00"))
+        ]
+
+    def test_apply_postings_is_all_or_nothing(self, build_bank_account):
+        bank_account = build_bank_account(no_overdraft=True)
+
+        result = BankAccountRepository.apply_postings(
+            bank_account.account_number,
+            [
+                LedgerEntry.deposit(Decimal("100.00")),
+                LedgerEntry.withdrawal(Decimal("5000.00")),
+            ],
         )
 
-        with pytest.raises(BusinessException) as exc_info:
-            bank_account_service.redraw(sample_account_number, Decimal("500.00"))
+        assert result is None
+        bank_account.refresh_from_db()
+        assert bank_account.balance == Decimal("1000.00")
+        assert bank_account.ledger_sequence == 0
+        assert not TransactionEntity.objects.filter(
+            account_id=bank_account.entity_id
+        ).exists()
 
-        assert "Insufficient funds to make this withdrawal" in str(
-            exc_info.value.message
+    def test_stale_save_does_not_overwrite_a_posting(self, build_bank_account):
+        bank_account = build_bank_account()
+        account = BankAccountRepository.get_by_bank_account_number(
+            bank_account.account_number
+        )
+        BankAccountRepository.apply_postings(
+            bank_account.account_number, [LedgerEntry.deposit(Decimal("100.00"))]
+        )
+
+        account.set_overdraft_amount(Decimal("300.00"))
+        with pytest.raises(ConcurrentUpdateException):
+            BankAccountRepository.save(account)
+
+        bank_account.refresh_from_db()
+        assert bank_account.balance == Decimal("1100.00")
+        assert bank_account.overdraft_amount == Decimal("500.00")
+        assert bank_account.version == 1
+
+    def test_save_bumps_the_version(self, build_bank_account):
+        bank_account = build_bank_account()
+        account = BankAccountRepository.get_by_bank_account_number(
+            bank_account.account_number
         )
-        assert real_bank_account.balance == Decimal("400.00")
+
+        account.set_overdraft_amount(Decimal("300.00"))
+        BankAccountRepository.save(account)
+        account.set_overdraft_amount(Decimal("200.00"))
+        BankAccountRepository.save(account)
+
+        bank_account.refresh_from_db()
+        assert bank_account.overdraft_amount == Decimal("200.00")
+        assert account.version == bank_account.version == 2
+
+    def test_set_overdraft_amount_is_run_again_after_a_concurrent_posting(
+        self, build_bank_account
+    ):
+        bank_account = build_bank_account()
+        reads = []
+
+        class Repository(BankAccountRepository):
+            @classmethod
+            def get_by_bank_account_number(cls, account_number):
+                account = super().get_by_bank_account_number(account_number)
+                if not reads:
+                    # a deposit lands between the read and the save
+                    BankAccountRepository.apply_postings(
+                        account_number, [LedgerEntry.deposit(Decimal("100.00"))]
+                    )
+                reads.append(account)
+                return account
+
+        service = BankAccountOverdraftService(
+            bank_account_repository=Repository,
+            bank_account_service=BankAccountService,
+        )
+
+        @in_unit_of_work
+        def view(self, request):
+            return service.set_overdraft_amount(
+                bank_account.account_number, Decimal("300.00")
+            )
+
+        result = view(None, None)
+
+        assert len(reads) == 2
+        assert result.balance == Decimal("1100.00")
+        bank_account.refresh_from_db()
+        assert bank_account.balance == Decimal("1100.00")
+        assert bank_account.overdraft_amount == Decimal("300.00")
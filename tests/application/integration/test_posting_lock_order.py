@@ -0,0 +1,78 @@
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from bank_app.application.adapter.persistence.entity.bank_account_entity import (
+    BankAccountEntity,
+)
+from bank_app.application.adapter.persistence.repository.posting_repository import (
+    PostingRepository,
+)
+from bank_app.application.domain.dtos.posting import PostingDTO
+from bank_app.application.util.util import AccountType
+
+
+@pytest.mark.django_db
+class TestPostingLockOrder:
+    """Batches mixing account types lock their rows in one global order"""
+
+    @pytest.fixture
+    def accounts(self, build_bank_account, build_booklet_account):
+        # entity_id order alternates the account types
+        return [
+            build_booklet_account(entity_id=UUID(int=1)),
+            build_bank_account(entity_id=UUID(int=2)),
+            build_booklet_account(entity_id=UUID(int=3)),
+        ]
+
+    @staticmethod
+    def batch(*accounts):
+        return [
+            PostingDTO(
+                line=line,
+                account_number=account.account_number,
+                account_type=AccountType.CURRENT_ACCOUNT
+                if isinstance(account, BankAccountEntity)
+                else AccountType.BOOKLET_ACCOUNT,
+                transaction_type="DEPOSIT",
+                amount=Decimal("1.00"),
+            )
+            for line, account in enumerate(accounts, 1)
+        ]
+
+    @staticmethod
+    def locked_tables(postings):
+        with transaction.atomic(), CaptureQueriesContext(connection) as queries:
+            PostingRepository._lock_accounts(postings)
+        return [
+            query["sql"].split('FROM "')[1].split('"')[0]
+            for query in queries.captured_queries
+            if '"entity_id" IN' in query["sql"]
+        ]
+
+    def test_interleaved_batches_lock_in_the_same_order(self, accounts):
+        booklet, bank_account, other_booklet = accounts
+        bank_first = self.batch(bank_account, booklet, other_booklet)
+        booklet_first = self.batch(other_booklet, booklet, bank_account)
+
+        expected = [
+            (AccountType.BOOKLET_ACCOUNT, booklet.account_number, booklet.entity_id),
+            (
+                AccountType.CURRENT_ACCOUNT,
+                bank_account.account_number,
+                bank_account.entity_id,
+            ),
+            (
+                AccountType.BOOKLET_ACCOUNT,
+                other_booklet.account_number,
+                other_booklet.entity_id,
+            ),
+        ]
+        assert PostingRepository._lock_order(bank_first) == expected
+        assert PostingRepository._lock_order(booklet_first) == expected
+        tables = ["booklet_account", "bank_account", "booklet_account"]
+        assert self.locked_tables(bank_first) == tables
+        assert self.locked_tables(booklet_first) == tables
@@ -0,0 +1,67 @@
+import datetime as dt
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from bank_app.application.adapter.persistence.entity.account_statement_entity import (
+    TransactionEntity,
+)
+from bank_app.application.adapter.persistence.repository.account_statement_repository import (  # noqa: E501
+    AccountStatementRepository,
+)
+from bank_app.application.domain.model.account_statement import (
+    MonthlyStatement,
+    MonthlyStatementIdentity,
+)
+
+
+def statement_of(bank_account, period_end, is_closed):
+    return MonthlyStatement(
+        entity_id=MonthlyStatementIdentity(uuid4()),
+        account_id=bank_account.entity_id,
+        account_type="CURRENT_ACCOUNT",
+        account_number=bank_account.account_number,
+        period_start=period_end - dt.timedelta(days=30),
+        period_end=period_end,
+        generated_at=dt.datetime.now(dt.timezone.utc),
+        opening_balance=Decimal("0.00"),
+        closing_balance=Decimal("0.00"),
+        transactions=[],
+        is_closed=is_closed,
+    )
+
+
+@pytest.mark.django_db
+class TestStatementMembership:
+    def test_closed_statement_holds_its_whole_period(
+        self, build_bank_account, build_transaction
+    ):
+        bank_account = build_bank_account()
+        period_end = dt.datetime(2025, 1, 31, tzinfo=dt.timezone.utc)
+        dates = [period_end - dt.timedelta(days=40), period_end]
+        for date in dates:
+            stored = build_transaction(bank_account=bank_account)
+            TransactionEntity.objects.filter(entity_id=stored.entity_id).update(
+                transaction_date=date
+            )
+        statement = statement_of(bank_account, period_end, is_closed=True)
+
+        AccountStatementRepository.save(statement)
+        found = AccountStatementRepository.get(statement.entity_id)
+
+        assert [t.transaction_date for t in found.transactions] == [period_end]
+
+    def test_open_statement_leaves_out_later_postings(
+        self, build_bank_account, build_transaction
+    ):
+        bank_account = build_bank_account()
+        period_end = dt.datetime.now(dt.timezone.utc) + dt.timedelta(days=1)
+        before = build_transaction(bank_account=bank_account)
+        statement = statement_of(bank_account, period_end, is_closed=False)
+
+        AccountStatementRepository.save(statement)
+        build_transaction(bank_account=bank_account)
+        found = AccountStatementRepository.get(statement.entity_id)
+
+        assert [t.entity_id.uuid for t in found.transactions] == [before.entity_id]
@@ -0,0 +1,166 @@
+import datetime as dt
+from decimal import Decimal
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from bank_app.application.adapter.api.unit_of_work import in_unit_of_work
+from bank_app.application.adapter.persistence.entity.account_statement_entity import (
+    MonthlyStatementEntity,
+)
+from bank_app.application.adapter.persistence.entity.booklet_account_entity import (
+    BookletAccountEntity,
+)
+from bank_app.application.adapter.persistence.repository.account_statement_repository import (  # noqa: E501
+    AccountStatementRepository,
+)
+from bank_app.application.adapter.persistence.repository.bank_account_repository import (  # noqa: E501
+    BankAccountRepository,
+)
+from bank_app.application.adapter.persistence.repository.booklet_account_repository import (  # noqa: E501
+    BookletAccountRepository,
+)
+from bank_app.application.adapter.persistence.unit_of_work import UnitOfWork
+from bank_app.application.domain.domain_models import AccountIdentity
+from bank_app.application.domain.exceptions import ConcurrentUpdateException
+from bank_app.application.domain.model.account_statement import (
+    LedgerEntry,
+    MonthlyStatement,
+    MonthlyStatementIdentity,
+)
+
+
+@pytest.mark.django_db
+class TestUnitOfWork:
+    def test_account_is_loaded_once(self, build_bank_account):
+        bank_account = build_bank_account()
+
+        with UnitOfWork(), CaptureQueriesContext(connection) as queries:
+            by_number = BankAccountRepository.get_by_bank_account_number(
+                bank_account.account_number
+            )
+            by_id = BankAccountRepository.get(AccountIdentity(bank_account.entity_id))
+
+        assert by_number is by_id
+        assert len(queries) == 1
+
+    def test_saves_are_written_when_the_block_ends(self, build_booklet_account):
+        booklet = build_booklet_account()
+
+        with UnitOfWork():
+            account = BookletAccountRepository.get_by_booklet_account_number(
+                booklet.account_number
+            )
+            account.set_deposit_limit(Decimal("9000.00"))
+            BookletAccountRepository.save(account)
+            BookletAccountRepository.save(account)
+            booklet.refresh_from_db()
+            assert booklet.deposit_limit == Decimal("5000.00")
+
+        booklet.refresh_from_db()
+        assert booklet.deposit_limit == Decimal("9000.00")
+        assert booklet.version == 1
+
+    def test_nothing_is_written_when_the_block_raises(self, build_booklet_account):
+        booklet = build_booklet_account()
+
+        with pytest.raises(RuntimeError), UnitOfWork():
+            account = BookletAccountRepository.get_by_booklet_account_number(
+                booklet.account_number
+            )
+            account.set_deposit_limit(Decimal("9000.00"))
+            BookletAccountRepository.save(account)
+            raise RuntimeError
+
+        booklet.refresh_from_db()
+        assert booklet.deposit_limit == Decimal("5000.00")
+
+    def test_postings_drop_the_loaded_account(self, build_bank_account):
+        bank_account = build_bank_account()
+
+        with UnitOfWork():
+            before = BankAccountRepository.get_by_bank_account_number(
+                bank_account.account_number
+            )
+            BankAccountRepository.apply_postings(
+                bank_account.account_number, [LedgerEntry.deposit(Decimal("10.00"))]
+            )
+            after = BankAccountRepository.get_by_bank_account_number(
+                bank_account.account_number
+            )
+
+        assert after is not before
+        assert after.balance == before.balance + Decimal("10.00")
+
+    def test_new_statement_is_inserted_without_lookup(self, build_bank_account):
+        bank_account = build_bank_account()
+        now = timezone.now()
+        statement = MonthlyStatement(
+            entity_id=MonthlyStatementIdentity(uuid4()),
+            account_id=bank_account.entity_id,
+            account_type="CURRENT_ACCOUNT",
+            account_number=bank_account.account_number,
+            period_start=now - dt.timedelta(days=30),
+            period_end=now,
+            generated_at=now,
+            opening_balance=Decimal("0.00"),
+            closing_balance=bank_account.balance,
+            transactions=[],
+        )
+
+        with CaptureQueriesContext(connection) as queries, UnitOfWork():
+            AccountStatementRepository.save(statement)
+
+        assert MonthlyStatementEntity.objects.filter(
+            entity_id=statement.entity_id.uuid
+        ).exists()
+        assert not [q for q in queries if q["sql"].startswith(("SELECT", "DELETE"))]
+
+    def test_view_is_run_again_when_its_save_conflicts(self, build_booklet_account):
+        booklet = build_booklet_account()
+        calls = []
+        write = BookletAccountRepository._write
+
+        def conflict_once(entity):
+            if len(calls) == 1:
+                BookletAccountEntity.objects.filter(entity_id=booklet.entity_id).update(
+                    version=10
+                )
+            write(entity)
+
+        @in_unit_of_work
+        def view(self, request):
+            calls.append(1)
+            account = BookletAccountRepository.get_by_booklet_account_number(
+                booklet.account_number
+            )
+            account.set_deposit_limit(Decimal("7000.00"))
+            BookletAccountRepository.save(account)
+
+        with patch.object(
+            BookletAccountRepository, "_write", side_effect=conflict_once
+        ):
+            view(None, None)
+
+        booklet.refresh_from_db()
+        assert len(calls) == 2
+        assert booklet.deposit_limit == Decimal("7000.00")
+        assert booklet.version == 1
+
+    def test_conflict_without_retry_left_is_raised(self, build_booklet_account):
+        booklet = build_booklet_account()
+        account = BookletAccountRepository.get_by_booklet_account_number(
+            booklet.account_number
+        )
+        BookletAccountEntity.objects.filter(entity_id=booklet.entity_id).update(
+            version=5
+        )
+        account.set_deposit_limit(Decimal("6000.00"))
+
+        with pytest.raises(ConcurrentUpdateException), UnitOfWork() as unit_of_work:
+            unit_of_work.remember(account, ("booklet_account", booklet.entity_id))
+            BookletAccountRepository.save(account)
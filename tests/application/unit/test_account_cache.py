@@ -0,0 +1,54 @@
+from uuid import uuid4
+
+from bank_app.application.adapter.persistence.account_cache import AccountCache
+
+
+def fields():
+    return {"entity_id": uuid4(), "account_number": uuid4(), "is_active": True}
+
+
+class TestAccountCache:
+    def test_reachable_by_entity_id_and_account_number(self):
+        cache = AccountCache()
+        account = fields()
+        cache.put(account)
+
+        assert cache.get(entity_id=account["entity_id"]) == account
+        assert cache.get(account_number=account["account_number"]) == account
+        assert cache.get(account_number=uuid4()) is None
+        assert cache.stats()["hits"] == 2
+        assert cache.stats()["misses"] == 1
+
+    def test_least_recently_used_is_evicted(self):
+        cache = AccountCache(max_size=2)
+        first, second, third = fields(), fields(), fields()
+        cache.put(first)
+        cache.put(second)
+        cache.get(entity_id=first["entity_id"])
+        cache.put(third)
+
+        assert cache.get(account_number=second["account_number"]) is None
+        assert cache.get(entity_id=first["entity_id"]) == first
+        assert cache.stats()["evictions"] == 1
+
+    def test_entries_expire(self):
+        now = [0.0]
+        cache = AccountCache(ttl=10, clock=lambda: now[0])
+        account = fields()
+        cache.put(account)
+
+        now[0] = 9.9
+        assert cache.get(entity_id=account["entity_id"]) == account
+        now[0] = 10.0
+        assert cache.get(entity_id=account["entity_id"]) is None
+        assert cache.stats()["size"] == 0
+
+    def test_invalidate_by_account_number(self):
+        cache = AccountCache()
+        account = fields()
+        cache.put(account)
+
+        cache.invalidate(account_number=account["account_number"])
+
+        assert cache.get(entity_id=account["entity_id"]) is None
+        assert cache.stats()["invalidations"] == 1
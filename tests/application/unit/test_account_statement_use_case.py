@@ -0,0 +1,350 @@
+import datetime as dt
+from decimal import Decimal
+from unittest.mock import create_autospec
+from uuid import uuid4
+
+import pytest
+
+from bank_app.application.domain.domain_models import AccountIdentity
+from bank_app.application.domain.dtos.account_statement import MonthlyStatementDTO
+from bank_app.application.domain.exceptions import NotFound
+from bank_app.application.domain.model.account_statement import (
+    Transaction,
+    TransactionIdentity,
+)
+from bank_app.application.domain.model.bank_account import BankAccount
+from bank_app.application.domain.model.transaction_stream import TransactionStream
+from bank_app.application.domain.service.account_statement import (
+    AccoutStatementService,
+)
+from bank_app.application.ports.repositories.i_account_statement import (
+    IAccountStatementRepository,
+)
+from bank_app.application.ports.repositories.i_bank_account import (
+    IBankAccountRepository,
+)
+from bank_app.application.ports.repositories.i_booklet_account import (
+    IBookletAccountRepository,
+)
+from bank_app.application.ports.repositories.i_transaction import (
+    ITransactionRepository,
+)
+from bank_app.application.service.account_statement import (
+    AccountStatementService,
+    StatementReuseStats,
+)
+
+
+class TestAccountStatementService:
+    @pytest.fixture
+    def mock_transaction_repository(self):
+        return create_autospec(ITransactionRepository)
+
+    @pytest.fixture
+    def mock_account_statement_repository(self):
+        repository = create_autospec(IAccountStatementRepository)
+        repository.get_by_period.return_value = None
+        repository.get_previous.return_value = None
+        return repository
+
+    @pytest.fixture
+    def reuse_stats(self):
+        return StatementReuseStats()
+
+    @pytest.fixture
+    def mock_bank_account_repository(self):
+        return create_autospec(IBankAccountRepository)
+
+    @pytest.fixture
+    def account_statement_service(
+        self,
+        mock_transaction_repository,
+        mock_account_statement_repository,
+        mock_bank_account_repository,
+        reuse_stats,
+    ):
+        return AccountStatementService(
+            transaction_repository=mock_transaction_repository,
+            account_statement_repository=mock_account_statement_repository,
+            bank_account_repository=mock_bank_account_repository,
+            booklet_account_repository=create_autospec(IBookletAccountRepository),
+            account_statement_service=AccoutStatementService,
+            reuse_stats=reuse_stats,
+        )
+
+    @pytest.fixture
+    def bank_account(self):
+        return BankAccount(
+            entity_id=AccountIdentity(uuid4()),
+            account_number=uuid4(),
+            balance=Decimal("1500.00"),
+        )
+
+    @pytest.fixture
+    def period_end(self):
+        return dt.datetime(2025, 10, 31, tzinfo=dt.timezone.utc)
+
+    def build_transaction(self, account, transaction_type, amount, transaction_date):
+        return Transaction(
+            entity_id=TransactionIdentity(uuid4()),
+            account_id=account.entity_id,
+            account_type="CURRENT_ACCOUNT",
+            transaction_type=transaction_type,
+            amount=amount,
+            transaction_date=transaction_date,
+        )
+
+    def test_generate_monthly_statement_reads_only_the_period(
+        self,
+        account_statement_service,
+        mock_transaction_repository,
+        mock_account_statement_repository,
+        mock_bank_account_repository,
+        bank_account,
+        period_end,
+    ):
+        period_start = period_end - dt.timedelta(days=30)
+        older = self.build_transaction(
+            bank_account, "DEPOSIT", Decimal("200.00"), period_end
+        )
+        newer = self.build_transaction(
+            bank_account,
+            "WITHDRAWAL",
+            Decimal("100.00"),
+            period_end - dt.timedelta(days=1),
+        )
+        mock_bank_account_repository.get.return_value = bank_account
+        mock_transaction_repository.stream_by_account_id_and_date_range.return_value = (
+            TransactionStream(bank_account.entity_id, lambda: [older, newer])
+        )
+        mock_transaction_repository.get_net_amounts.return_value = [
+            Decimal("100.00"),
+            Decimal("200.00"),
+        ]
+
+        result = account_statement_service.generate_monthly_statement(
+            account_id=bank_account.entity_id.uuid, period_end=period_end
+        )
+
+        mock_transaction_repository.stream_by_account_id_and_date_range.assert_called_once_with(
+            bank_account.entity_id, period_start, period_end
+        )
+        mock_transaction_repository.get_net_amounts.assert_called_once_with(
+            bank_account.entity_id,
+            [period_start, period_end + AccoutStatementService.TICK, None],
+        )
+        mock_transaction_repository.get_by_account_id.assert_not_called()
+        mock_account_statement_repository.save.assert_called_once()
+
+        assert isinstance(result, MonthlyStatementDTO)
+        assert result.opening_balance == Decimal("1200.00")
+        assert result.closing_balance == Decimal("1300.00")
+        assert result.transactions == [older, newer]
+
+    def test_generate_monthly_statement_follows_from_the_previous_one(
+        self,
+        account_statement_service,
+        mock_transaction_repository,
+        mock_account_statement_repository,
+        mock_bank_account_repository,
+        bank_account,
+        period_end,
+    ):
+        period_start = period_end - dt.timedelta(days=30)
+        prior_end = period_start - dt.timedelta(days=1)
+        mock_bank_account_repository.get.return_value = bank_account
+        mock_transaction_repository.stream_by_account_id_and_date_range.return_value = (
+            TransactionStream(bank_account.entity_id, list)
+        )
+        mock_account_statement_repository.get_previous.return_value = (
+            AccoutStatementService.generate_monthly_statement(
+                account=bank_account,
+                transactions=[],
+                period_end=prior_end,
+                net_amounts=[Decimal("600.00"), Decimal("0.00")],
+            )
+        )
+        mock_transaction_repository.get_net_amounts.return_value = [
+            Decimal("-50.00"),
+            Decimal("25.00"),
+        ]
+
+        result = account_statement_service.generate_monthly_statement(
+            account_id=bank_account.entity_id.uuid, period_end=period_end
+        )
+
+        mock_account_statement_repository.get_previous.assert_called_once_with(
+            bank_account.account_number, period_end
+        )
+        # only the ledger after the previous statement is read
+        mock_transaction_repository.get_net_amounts.assert_called_once_with(
+            bank_account.entity_id,
+            [
+                prior_end + AccoutStatementService.TICK,
+                period_start,
+                period_end + AccoutStatementService.TICK,
+            ],
+        )
+        mock_transaction_repository.balance_at.assert_not_called()
+        assert result.opening_balance == Decimal("1450.00")
+        assert result.closing_balance == Decimal("1475.00")
+
+    def test_generate_monthly_statement_of_a_calendar_month(
+        self,
+        account_statement_service,
+        mock_transaction_repository,
+        mock_bank_account_repository,
+        bank_account,
+    ):
+        mock_bank_account_repository.get.return_value = bank_account
+        mock_transaction_repository.get_net_amounts.return_value = [
+            Decimal("0.00"),
+            Decimal("0.00"),
+        ]
+
+        result = account_statement_service.generate_monthly_statement(
+            account_id=bank_account.entity_id.uuid, month=dt.date(2024, 2, 10)
+        )
+
+        assert result.period_start == dt.datetime(2024, 2, 1, tzinfo=dt.timezone.utc)
+        assert result.period_end == dt.datetime(
+            2024, 2, 29, 23, 59, 59, 999999, tzinfo=dt.timezone.utc
+        )
+
+    def test_generate_monthly_statement_account_not_found(
+        self,
+        account_statement_service,
+        mock_transaction_repository,
+        mock_bank_account_repository,
+    ):
+        mock_bank_account_repository.get.side_effect = NotFound("not found")
+
+        with pytest.raises(NotFound):
+            account_statement_service.generate_monthly_statement(account_id=uuid4())
+
+        mock_transaction_repository.stream_by_account_id_and_date_range.assert_not_called()
+
+    def test_closed_statement_is_reused_once_the_balance_moves(
+        self,
+        account_statement_service,
+        mock_transaction_repository,
+        mock_account_statement_repository,
+        mock_bank_account_repository,
+        bank_account,
+        period_end,
+        reuse_stats,
+    ):
+        mock_bank_account_repository.get.return_value = bank_account
+        stored = AccoutStatementService.generate_monthly_statement(
+            account=bank_account,
+            transactions=[],
+            period_end=period_end,
+            net_amounts=[Decimal("0.00"), Decimal("0.00")],
+            as_of=period_end + dt.timedelta(days=1),
+        )
+        mock_account_statement_repository.get_by_period.return_value = stored
+        bank_account.balance = Decimal("1400.00")
+
+        result = account_statement_service.generate_monthly_statement(
+            account_id=bank_account.entity_id.uuid, period_end=period_end
+        )
+
+        assert result.generated_at == stored.generated_at
+        assert result.closing_balance == Decimal("1500.00")
+        mock_account_statement_repository.get_by_period.assert_called_once_with(
+            bank_account.entity_id.uuid,
+            period_end - dt.timedelta(days=30),
+            period_end,
+        )
+        mock_transaction_repository.stream_by_account_id_and_date_range.assert_not_called()
+        mock_account_statement_repository.save.assert_not_called()
+        assert reuse_stats.stats()["hit_rate"] == 1.0
+
+    def test_open_statement_is_regenerated_in_place(
+        self,
+        account_statement_service,
+        mock_transaction_repository,
+        mock_account_statement_repository,
+        mock_bank_account_repository,
+        bank_account,
+        period_end,
+        reuse_stats,
+    ):
+        mock_bank_account_repository.get.return_value = bank_account
+        stored = AccoutStatementService.generate_monthly_statement(
+            account=bank_account,
+            transactions=[],
+            period_end=period_end,
+            net_amounts=[Decimal("0.00"), Decimal("0.00")],
+        )
+        mock_account_statement_repository.get_by_period.return_value = stored
+        mock_transaction_repository.stream_by_account_id_and_date_range.return_value = (
+            TransactionStream(bank_account.entity_id, list)
+        )
+        mock_transaction_repository.get_net_amounts.return_value = [
+            Decimal("100.00"),
+            Decimal("0.00"),
+        ]
+
+        account_statement_service.generate_monthly_statement(
+            account_id=bank_account.entity_id.uuid, period_end=period_end
+        )
+
+        mock_account_statement_repository.save.assert_called_once_with(stored)
+        assert stored.opening_balance == Decimal("1400.00")
+        assert stored.closing_balance == Decimal("1500.00")
+        assert stored.is_closed
+        assert reuse_stats.stats() == {
+            "hits": 0,
+            "stale": 1,
+            "misses": 0,
+            "hit_rate": 0.0,
+        }
+
+
+class TestStatementPeriods:
+    @pytest.mark.parametrize(
+        "month, last_day",
+        [
+            (dt.date(2024, 2, 1), dt.date(2024, 2, 29)),
+            (dt.date(2025, 2, 14), dt.date(2025, 2, 28)),
+            (dt.date(2025, 12, 31), dt.date(2025, 12, 31)),
+        ],
+    )
+    def test_calendar_month(self, month, last_day):
+        start, end = AccoutStatementService.calendar_month(month)
+
+        assert start == dt.datetime(month.year, month.month, 1)
+        assert end.date() == last_day
+        assert end + AccoutStatementService.TICK == dt.datetime.combine(
+            last_day + dt.timedelta(days=1), dt.time()
+        )
+
+    def test_balances_follow_from_an_overlapping_prior_statement(self):
+        account = BankAccount(
+            entity_id=AccountIdentity(uuid4()),
+            account_number=uuid4(),
+            balance=Decimal("0.00"),
+        )
+        period_end = dt.datetime(2025, 10, 31)
+        prior_end = period_end - dt.timedelta(days=10)
+
+        statement = AccoutStatementService.generate_monthly_statement(
+            account=account,
+            transactions=[],
+            period_end=period_end,
+            # what both statements hold, then the rest of the period
+            net_amounts=[Decimal("30.00"), Decimal("-5.00")],
+            prior_end=prior_end,
+            prior_closing_balance=Decimal("200.00"),
+        )
+
+        assert AccoutStatementService.ledger_bounds(
+            statement.period_start, period_end, prior_end
+        ) == [
+            statement.period_start,
+            prior_end + AccoutStatementService.TICK,
+            period_end + AccoutStatementService.TICK,
+        ]
+        assert statement.opening_balance == Decimal("170.00")
+        assert statement.closing_balance == Decimal("195.00")
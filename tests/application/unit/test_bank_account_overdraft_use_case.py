@@ -6,9 +6,11 @@ import pytest
 
 from bank_app.application.domain.dtos.bank_account import BankAccountDTO
 from bank_app.application.domain.exceptions import (
+    InsufficientFundsException,
     NotFound,
     OverdraftLimitExceededException,
 )
+from bank_app.application.domain.model.account_statement import LedgerEntry
 from bank_app.application.domain.model.bank_account import AccountIdentity, BankAccount
 from bank_app.application.domain.service.bank_account import BankAccountService
 from bank_app.application.service.bank_acount_overdraft import (
@@ -43,27 +45,23 @@ class TestBankAccountOverdraftService:
         self,
         overdraft_service,
         mock_bank_account_repository,
-        mock_bank_account_service,
         mock_bank_account_overdraft,
     ):
         account_number = mock_bank_account_overdraft.account_number
         amount = Decimal("800.00")
-        mock_bank_account_repository.get_by_bank_account_number.return_value = (
+        mock_bank_account_repository.apply_postings.return_value = (
             mock_bank_account_overdraft
         )
         result = overdraft_service.withdraw_from_account(account_number, amount)
-        mock_bank_account_repository.get_by_bank_account_number.assert_called_once_with(
-            account_number=account_number
-        )
-        mock_bank_account_service.authorize_withdrawal(
-            mock_bank_account_overdraft, amount
-        )
-        mock_bank_account_overdraft.withdraw.assert_called_once_with(amount=amount)
-        mock_bank_account_repository.save.assert_called_once_with(
-            mock_bank_account_overdraft
+        mock_bank_account_repository.apply_postings.assert_called_once_with(
+            account_number=account_number,
+            entries=[LedgerEntry.withdrawal(amount)],
         )
+        mock_bank_account_repository.get_by_bank_account_number.assert_not_called()
+        mock_bank_account_repository.save.assert_not_called()
         assert isinstance(result, BankAccountDTO)
         assert result.account_number == mock_bank_account_overdraft.account_number
+        assert result.overdraft_amount == mock_bank_account_overdraft.overdraft_amount
 
     def test_withdraw_from_account_with_overdraft_success(
         self,
@@ -73,28 +71,24 @@ class TestBankAccountOverdraftService:
         account = BankAccount(
             entity_id=AccountIdentity(uuid=uuid4()),
             account_number=uuid4(),
-            balance=Decimal("1000.00"),
+            balance=Decimal("-400.00"),
             overdraft_amount=Decimal("500.00"),
             is_allow_overdraft=True,
         )
-        account_number = account.account_number
         amount = Decimal("1400.00")
 
-        mock_bank_account_repository.get_by_bank_account_number.return_value = account
-        result = overdraft_service.withdraw_from_account(account_number, amount)
+        mock_bank_account_repository.apply_postings.return_value = account
+        result = overdraft_service.withdraw_from_account(account.account_number, amount)
 
-        mock_bank_account_repository.save.assert_called_once_with(account)
         assert isinstance(result, BankAccountDTO)
-
-        expected_balance = Decimal("1000.00") - Decimal("1400.00")  # -400
-        assert result.balance == expected_balance
-        assert account.balance == expected_balance
+        assert result.balance == Decimal("-400.00")
 
     def test_withdraw_from_account_account_not_found(
         self, overdraft_service, mock_bank_account_repository
     ):
         account_number = uuid4()
         amount = Decimal("100.00")
+        mock_bank_account_repository.apply_postings.return_value = None
         mock_bank_account_repository.get_by_bank_account_number.return_value = None
 
         with pytest.raises(NotFound) as exc_info:
@@ -152,6 +146,7 @@ class TestBankAccountOverdraftService:
         account_number = mock_bank_account_overdraft.account_number
         amount = Decimal("2000.00")
 
+        mock_bank_account_repository.apply_postings.return_value = None
         mock_bank_account_repository.get_by_bank_account_number.return_value = (
             mock_bank_account_overdraft
         )
@@ -168,6 +163,30 @@ class TestBankAccountOverdraftService:
         assert f"Withdrawal of {amount} exceeds overdraft limit." in str(
             ex.value.message
         )
+        mock_bank_account_service.authorize_withdrawal.assert_called_once_with(
+            account=mock_bank_account_overdraft, amount=amount
+        )
+
+    def test_withdraw_from_account_refused_without_domain_reason(
+        self,
+        overdraft_service,
+        mock_bank_account_repository,
+        mock_bank_account_overdraft,
+    ):
+        mock_bank_account_service = Mock(spec=BankAccountService)
+        overdraft_service._bank_account_service = mock_bank_account_service
+
+        amount = Decimal("100.00")
+        mock_bank_account_repository.apply_postings.return_value = None
+        mock_bank_account_repository.get_by_bank_account_number.return_value = (
+            mock_bank_account_overdraft
+        )
+
+        with pytest.raises(InsufficientFundsException) as ex:
+            overdraft_service.withdraw_from_account(
+                mock_bank_account_overdraft.account_number, amount
+            )
+        assert ex.value.message == f"Insufficient funds for withdrawal of {amount}"
 
     def test_set_overdraft_amount_success(
         self,
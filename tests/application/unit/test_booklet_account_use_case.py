@@ -5,7 +5,13 @@ from uuid import uuid4
 import pytest
 
 from bank_app.application.domain.dtos.booklet_account import BookletAccountDTO
-from bank_app.application.domain.exceptions import NotFound
+from bank_app.application.domain.exceptions import (
+    ConcurrentUpdateException,
+    DepositLimitExceededException,
+    InsufficientFundsException,
+    NotFound,
+)
+from bank_app.application.domain.model.account_statement import LedgerEntry
 from bank_app.application.domain.model.booklet_account import BookletAccount
 from bank_app.application.domain.service import booklet_account
 from bank_app.application.ports.repositories.i_booklet_account import (
@@ -53,44 +59,47 @@ class TestBookletAccountService:
         self,
         booklet_account_service,
         mock_repository,
-        mock_service,
         sample_booklet_account,
         sample_account_number,
         sample_booklet_account_dto,
     ):
         amount = Decimal("100.50")
-        initial_balance = Decimal("500.00")
-        expected_balance_after_withdraw = Decimal("399.50")
-
-        sample_booklet_account.balance = initial_balance
-
-        def withdraw_side_effect(withdraw_amount):
-            sample_booklet_account.balance -= withdraw_amount
-
-        sample_booklet_account.withdraw.side_effect = withdraw_side_effect
-
-        mock_repository.get_by_booklet_account_number.return_value = (
-            sample_booklet_account
-        )
-        mock_repository.save.return_value = None
+        mock_repository.apply_postings.return_value = sample_booklet_account
         BookletAccountDTO.from_entity = Mock(return_value=sample_booklet_account_dto)
 
         result = booklet_account_service.redraw(sample_account_number, amount)
-        mock_repository.get_by_booklet_account_number.assert_called_once_with(
-            sample_account_number
+        mock_repository.apply_postings.assert_called_once_with(
+            sample_account_number, [LedgerEntry.withdrawal(amount)]
         )
-        mock_service.authorize_withdrawal(sample_booklet_account, amount)
-        sample_booklet_account.withdraw.assert_called_once_with(amount)
-        mock_repository.save.assert_called_once_with(sample_booklet_account)
+        mock_repository.get_by_booklet_account_number.assert_not_called()
+        mock_repository.save.assert_not_called()
         BookletAccountDTO.from_entity.assert_called_once_with(sample_booklet_account)
 
         assert result == sample_booklet_account_dto
-        assert sample_booklet_account.balance == expected_balance_after_withdraw
+
+    def test_redraw_insufficient_funds(
+        self,
+        booklet_account_service,
+        mock_repository,
+        sample_booklet_account,
+        sample_account_number,
+    ):
+        amount = Decimal("2000.00")
+        sample_booklet_account.has_sufficient_funds.return_value = False
+        mock_repository.apply_postings.return_value = None
+        mock_repository.get_by_booklet_account_number.return_value = (
+            sample_booklet_account
+        )
+
+        with pytest.raises(InsufficientFundsException) as ex:
+            booklet_account_service.redraw(sample_account_number, amount)
+        assert ex.value.message == f"Insufficient funds for withdrawal of {amount}"
 
     def test_redraw_account_not_found(
         self, booklet_account_service, mock_repository, sample_account_number
     ):
         amount = Decimal("100.50")
+        mock_repository.apply_postings.return_value = None
         mock_repository.get_by_booklet_account_number.return_value = None
 
         with pytest.raises(NotFound) as ex:
@@ -139,54 +148,46 @@ class TestBookletAccountService:
         self,
         booklet_account_service,
         mock_repository,
-        mock_service,
         sample_booklet_account,
         sample_account_number,
         sample_booklet_account_dto,
     ):
         amount = Decimal("200.75")
-        initial_balance = Decimal("1000.00")
-        deposit_limit = Decimal("5000.00")
-
-        assert initial_balance + amount <= deposit_limit, (
-            "Test setup: deposit would exceed limit"
-        )
-
-        balance_tracker = {"initial": initial_balance, "after_deposit": None}
-
-        def deposit_mock(deposit_amount):
-            new_balance = balance_tracker["initial"] + deposit_amount
-            balance_tracker["after_deposit"] = new_balance
-
-        sample_booklet_account.deposit.side_effect = deposit_mock
-        sample_booklet_account.balance = initial_balance
-        sample_booklet_account.deposit_limit = deposit_limit
-
-        mock_repository.get_by_booklet_account_number.return_value = (
-            sample_booklet_account
-        )
-        mock_repository.save.return_value = None
+        mock_repository.apply_postings.return_value = sample_booklet_account
         BookletAccountDTO.from_entity = Mock(return_value=sample_booklet_account_dto)
 
         result = booklet_account_service.deposit_money(sample_account_number, amount)
 
-        mock_repository.get_by_booklet_account_number.assert_called_once_with(
-            sample_account_number
+        mock_repository.apply_postings.assert_called_once_with(
+            sample_account_number, [LedgerEntry.deposit(amount)]
         )
-        mock_service.authorize_deposit(sample_booklet_account, amount)
-        sample_booklet_account.deposit.assert_called_once_with(amount)
-        mock_repository.save.assert_called_once_with(sample_booklet_account)
+        mock_repository.get_by_booklet_account_number.assert_not_called()
+        mock_repository.save.assert_not_called()
         BookletAccountDTO.from_entity.assert_called_once_with(sample_booklet_account)
         assert result == sample_booklet_account_dto
 
-        expected_final_balance = initial_balance + amount
-        actual_final_balance = balance_tracker["after_deposit"]
-        assert actual_final_balance == expected_final_balance
+    def test_deposit_money_exceed_deposit_limit(
+        self,
+        booklet_account_service,
+        mock_repository,
+        sample_booklet_account,
+        sample_account_number,
+    ):
+        amount = Decimal("4500.00")
+        mock_repository.apply_postings.return_value = None
+        mock_repository.get_by_booklet_account_number.return_value = (
+            sample_booklet_account
+        )
+
+        with pytest.raises(DepositLimitExceededException) as ex:
+            booklet_account_service.deposit_money(sample_account_number, amount)
+        assert ex.value.message == "Deposit would exceed deposit limit"
 
     def test_deposit_money_account_not_found(
         self, booklet_account_service, mock_repository, sample_account_number
     ):
         amount = Decimal("200.75")
+        mock_repository.apply_postings.return_value = None
         mock_repository.get_by_booklet_account_number.return_value = None
 
         with pytest.raises(NotFound) as ex:
@@ -204,24 +205,15 @@ class TestBookletAccountService:
         self,
         booklet_account_service,
         mock_repository,
-        sample_booklet_account,
         sample_account_number,
-        mock_service,
     ):
         amount = Decimal("-100.00")
-        mock_repository.get_by_booklet_account_number.return_value = (
-            sample_booklet_account
-        )
 
         with pytest.raises(ValueError) as ex:
             booklet_account_service.deposit_money(sample_account_number, amount)
 
         assert "cannot deposit null or negative amount" in str(ex.value)
-
-        mock_repository.get_by_booklet_account_number.assert_called_once_with(
-            sample_account_number
-        )
-        sample_booklet_account.deposit.assert_not_called()
+        mock_repository.apply_postings.assert_not_called()
         mock_repository.save.assert_not_called()
 
     def test_update_deposit_limit_success(
@@ -263,6 +255,30 @@ class TestBookletAccountService:
         assert actual_new_limit == new_limit
         assert actual_new_limit > old_limit
 
+    def test_update_deposit_limit_lets_a_lost_race_through(
+        self,
+        booklet_account_service,
+        mock_repository,
+        sample_booklet_account,
+        sample_account_number,
+    ):
+        mock_repository.get_by_booklet_account_number.return_value = (
+            sample_booklet_account
+        )
+        mock_repository.save.side_effect = ConcurrentUpdateException(
+            "modified concurrently"
+        )
+
+        # retried by the unit of work around the view, not here
+        with pytest.raises(ConcurrentUpdateException):
+            booklet_account_service.update_deposit_limit(
+                sample_account_number, Decimal("5000.00")
+            )
+
+        mock_repository.get_by_booklet_account_number.assert_called_once_with(
+            sample_account_number
+        )
+
     def test_update_deposit_limit_account_not_found(
         self, booklet_account_service, mock_repository, sample_account_number
     ):
@@ -0,0 +1,91 @@
+from decimal import Decimal
+from unittest.mock import create_autospec
+from uuid import uuid4
+
+import pytest
+
+from bank_app.application.domain.domain_models import AccountIdentity
+from bank_app.application.domain.dtos.posting import PostingDTO
+from bank_app.application.domain.exceptions import (
+    DepositLimitExceededException,
+    OverdraftPermissionDeniedException,
+)
+from bank_app.application.domain.model.account_statement import LedgerEntry
+from bank_app.application.domain.model.bank_account import BankAccount
+from bank_app.application.domain.model.booklet_account import BookletAccount
+from bank_app.application.domain.service.bank_account import BankAccountService
+from bank_app.application.domain.service.booklet_account import BookletAcountService
+from bank_app.application.ports.repositories.i_posting import IPostingRepository
+from bank_app.application.service.bulk_posting import BulkPostingService
+from bank_app.application.util.util import AccountType
+
+
+class TestBulkPostingService:
+    @pytest.fixture
+    def mock_posting_repository(self):
+        return create_autospec(IPostingRepository)
+
+    @pytest.fixture
+    def bulk_posting_service(self, mock_posting_repository):
+        return BulkPostingService(
+            posting_repository=mock_posting_repository,
+            bank_account_service=BankAccountService,
+            booklet_account_service=BookletAcountService,
+        )
+
+    def test_post_bulk_delegates_to_the_repository(
+        self, bulk_posting_service, mock_posting_repository
+    ):
+        postings = [
+            PostingDTO(
+                line=1,
+                account_number=uuid4(),
+                account_type=AccountType.CURRENT_ACCOUNT,
+                transaction_type="DEPOSIT",
+                amount=Decimal("10.00"),
+            )
+        ]
+        mock_posting_repository.apply_bulk.return_value = []
+
+        bulk_posting_service.post_bulk(postings=postings, atomic=False)
+
+        mock_posting_repository.apply_bulk.assert_called_once_with(
+            postings=postings,
+            apply_entry=bulk_posting_service._apply_entry,
+            atomic=False,
+        )
+
+    def test_post_bulk_without_postings(
+        self, bulk_posting_service, mock_posting_repository
+    ):
+        assert bulk_posting_service.post_bulk(postings=[]) == []
+        mock_posting_repository.apply_bulk.assert_not_called()
+
+    def test_apply_entry_refuses_overdraft(self, bulk_posting_service):
+        account = BankAccount(
+            entity_id=AccountIdentity(uuid4()),
+            account_number=uuid4(),
+            balance=Decimal("100.00"),
+            is_allow_overdraft=False,
+        )
+
+        with pytest.raises(OverdraftPermissionDeniedException):
+            bulk_posting_service._apply_entry(
+                account, LedgerEntry.withdrawal(Decimal("200.00"))
+            )
+        assert account.balance == Decimal("100.00")
+
+    def test_apply_entry_refuses_booklet_deposit_over_limit(self, bulk_posting_service):
+        account = BookletAccount(
+            entity_id=AccountIdentity(uuid4()),
+            account_number=uuid4(),
+            balance=Decimal("900.00"),
+            deposit_limit=Decimal("1000.00"),
+        )
+
+        with pytest.raises(DepositLimitExceededException):
+            bulk_posting_service._apply_entry(
+                account, LedgerEntry.deposit(Decimal("200.00"))
+            )
+        bulk_posting_service._apply_entry(account, LedgerEntry.deposit(Decimal("100")))
+        assert account.balance == Decimal("1000.00")
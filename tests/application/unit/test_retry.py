@@ -0,0 +1,80 @@
+import pytest
+
+from bank_app.application.domain.exceptions import ConcurrentUpdateException
+from bank_app.application.util.retry import RetryBudget, retry_on_conflict
+
+
+class TestRetryOnConflict:
+    def test_retries_until_success(self):
+        delays = []
+        calls = []
+
+        @retry_on_conflict(attempts=3, base_delay=0.01, sleep=delays.append)
+        def update():
+            calls.append(1)
+            if len(calls) < 3:
+                raise ConcurrentUpdateException("conflict")
+            return "done"
+
+        assert update() == "done"
+        assert len(calls) == 3
+        assert 0 <= delays[0] <= 0.01
+        assert 0 <= delays[1] <= 0.02
+
+    def test_gives_up_after_the_last_attempt(self):
+        calls = []
+
+        @retry_on_conflict(attempts=2, sleep=lambda _: None)
+        def update():
+            calls.append(1)
+            raise ConcurrentUpdateException("conflict")
+
+        with pytest.raises(ConcurrentUpdateException):
+            update()
+        assert len(calls) == 2
+
+    def test_other_errors_are_not_retried(self):
+        calls = []
+
+        @retry_on_conflict(sleep=lambda _: None)
+        def update():
+            calls.append(1)
+            raise ValueError("bad amount")
+
+        with pytest.raises(ValueError):
+            update()
+        assert len(calls) == 1
+
+    def test_spent_budget_stops_retrying(self):
+        budget = RetryBudget(ratio=0, min_per_second=0, max_tokens=1, clock=lambda: 0.0)
+        calls = []
+
+        @retry_on_conflict(attempts=5, budget=budget, sleep=lambda _: None)
+        def update():
+            calls.append(1)
+            raise ConcurrentUpdateException("conflict")
+
+        with pytest.raises(ConcurrentUpdateException):
+            update()
+        assert len(calls) == 2
+        assert budget.retries == 1
+        assert budget.exhausted == 1
+
+
+class TestRetryBudget:
+    def test_calls_and_time_refill_the_budget(self):
+        now = [0.0]
+        budget = RetryBudget(
+            ratio=0.5, min_per_second=1, max_tokens=2, clock=lambda: now[0]
+        )
+        assert budget.try_retry()
+        assert budget.try_retry()
+        assert not budget.try_retry()
+
+        budget.record_call()
+        budget.record_call()
+        assert budget.try_retry()
+        assert not budget.try_retry()
+
+        now[0] = 1.0
+        assert budget.try_retry()
@@ -0,0 +1,149 @@
+from decimal import Decimal
+from unittest.mock import create_autospec
+from uuid import uuid4
+
+import pytest
+
+from bank_app.application.domain.domain_models import AccountIdentity
+from bank_app.application.domain.dtos.transfer import TransferDTO
+from bank_app.application.domain.exceptions import (
+    DepositLimitExceededException,
+    InsufficientFundsException,
+)
+from bank_app.application.domain.model.bank_account import BankAccount
+from bank_app.application.domain.model.booklet_account import BookletAccount
+from bank_app.application.domain.service.bank_account import BankAccountService
+from bank_app.application.domain.service.booklet_account import BookletAcountService
+from bank_app.application.ports.repositories.i_bank_account import (
+    IBankAccountRepository,
+)
+from bank_app.application.ports.repositories.i_booklet_account import (
+    IBookletAccountRepository,
+)
+from bank_app.application.ports.repositories.i_transfer import ITransferRepository
+from bank_app.application.service.transfer import TransferService
+from bank_app.application.util.util import AccountType
+
+
+class TestTransferService:
+    @pytest.fixture
+    def mock_transfer_repository(self):
+        return create_autospec(ITransferRepository)
+
+    @pytest.fixture
+    def mock_bank_account_repository(self):
+        return create_autospec(IBankAccountRepository)
+
+    @pytest.fixture
+    def mock_booklet_account_repository(self):
+        return create_autospec(IBookletAccountRepository)
+
+    @pytest.fixture
+    def transfer_service(
+        self,
+        mock_transfer_repository,
+        mock_bank_account_repository,
+        mock_booklet_account_repository,
+    ):
+        return TransferService(
+            transfer_repository=mock_transfer_repository,
+            bank_account_repository=mock_bank_account_repository,
+            booklet_account_repository=mock_booklet_account_repository,
+            bank_account_service=BankAccountService,
+            booklet_account_service=BookletAcountService,
+        )
+
+    @pytest.fixture
+    def source(self):
+        return BankAccount(
+            entity_id=AccountIdentity(uuid4()),
+            account_number=uuid4(),
+            balance=Decimal("1000.00"),
+        )
+
+    @pytest.fixture
+    def target(self):
+        return BookletAccount(
+            entity_id=AccountIdentity(uuid4()),
+            account_number=uuid4(),
+            balance=Decimal("900.00"),
+            deposit_limit=Decimal("1000.00"),
+        )
+
+    def test_transfer_success(
+        self, transfer_service, mock_transfer_repository, source, target
+    ):
+        amount = Decimal("100.00")
+        mock_transfer_repository.apply_transfer.return_value = (source, target)
+
+        result = transfer_service.transfer(
+            source_account_id=source.entity_id.uuid,
+            target_account_id=target.entity_id.uuid,
+            amount=amount,
+            target_type=AccountType.BOOKLET_ACCOUNT,
+        )
+
+        mock_transfer_repository.apply_transfer.assert_called_once_with(
+            source_id=source.entity_id,
+            source_type=AccountType.CURRENT_ACCOUNT,
+            target_id=target.entity_id,
+            target_type=AccountType.BOOKLET_ACCOUNT,
+            amount=amount,
+        )
+        assert result == TransferDTO(
+            source_account_id=source.entity_id.uuid,
+            source_balance=source.balance,
+            target_account_id=target.entity_id.uuid,
+            target_balance=target.balance,
+            amount=amount,
+        )
+
+    def test_transfer_refused_by_deposit_limit(
+        self,
+        transfer_service,
+        mock_transfer_repository,
+        mock_bank_account_repository,
+        mock_booklet_account_repository,
+        source,
+        target,
+    ):
+        mock_transfer_repository.apply_transfer.return_value = None
+        mock_bank_account_repository.get.return_value = source
+        mock_booklet_account_repository.get.return_value = target
+
+        with pytest.raises(DepositLimitExceededException):
+            transfer_service.transfer(
+                source_account_id=source.entity_id.uuid,
+                target_account_id=target.entity_id.uuid,
+                amount=Decimal("200.00"),
+                target_type=AccountType.BOOKLET_ACCOUNT,
+            )
+
+    def test_transfer_refused_without_domain_reason(
+        self,
+        transfer_service,
+        mock_transfer_repository,
+        mock_bank_account_repository,
+        source,
+    ):
+        target = BankAccount(entity_id=AccountIdentity(uuid4()), account_number=uuid4())
+        mock_transfer_repository.apply_transfer.return_value = None
+        mock_bank_account_repository.get.side_effect = [source, target]
+
+        with pytest.raises(InsufficientFundsException):
+            transfer_service.transfer(
+                source_account_id=source.entity_id.uuid,
+                target_account_id=target.entity_id.uuid,
+                amount=Decimal("10.00"),
+            )
+
+    def test_transfer_to_same_account(self, transfer_service, mock_transfer_repository):
+        account_id = uuid4()
+
+        with pytest.raises(ValueError):
+            transfer_service.transfer(
+                source_account_id=account_id,
+                target_account_id=account_id,
+                amount=Decimal("10.00"),
+            )
+        mock_transfer_repository.apply_transfer.assert_not_called()
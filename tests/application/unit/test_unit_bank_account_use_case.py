@@ -4,6 +4,7 @@ import pytest
 
 from bank_app.application.domain.dtos.bank_account import BankAccountDTO
 from bank_app.application.domain.exceptions import BusinessException, NotFound
+from bank_app.application.domain.model.account_statement import LedgerEntry
 from bank_app.application.domain.model.bank_account import BankAccount
 
 
@@ -15,25 +16,17 @@ class TestBankAccountRedrawAndDepositService:
             mock_bank_account_repository,
             mock_bank_account,
             sample_account_number,
-            monkeypatch,
         ):
             amount = Decimal("100.00")
-            mock_bank_account_repository.get_by_bank_account_number.return_value = (
-                mock_bank_account
-            )
-            mock_bank_account_repository.save.return_value = None
-
-            monkeypatch.setattr(
-                "bank_app.application.domain.service.bank_account.BankAccountService.can_withdraw",
-                lambda account, withdrawal_amount: True,
-            )
+            mock_bank_account_repository.apply_postings.return_value = mock_bank_account
             result = bank_account_service.redraw(sample_account_number, amount)
 
-            mock_bank_account_repository.get_by_bank_account_number.assert_called_once_with(
-                account_number=sample_account_number
+            mock_bank_account_repository.apply_postings.assert_called_once_with(
+                account_number=sample_account_number,
+                entries=[LedgerEntry.withdrawal(amount)],
             )
-            mock_bank_account.withdraw.assert_called_once_with(amount=amount)
-            mock_bank_account_repository.save.assert_called_once_with(mock_bank_account)
+            mock_bank_account_repository.get_by_bank_account_number.assert_not_called()
+            mock_bank_account_repository.save.assert_not_called()
 
             assert isinstance(result, BankAccountDTO)
             assert result.entity_id == mock_bank_account.entity_id.uuid
@@ -47,6 +40,7 @@ class TestBankAccountRedrawAndDepositService:
             sample_account_number,
         ):
             amount = Decimal("100.00")
+            mock_bank_account_repository.apply_postings.return_value = None
             mock_bank_account_repository.get_by_bank_account_number.return_value = None
 
             with pytest.raises(NotFound) as ex:
@@ -59,7 +53,6 @@ class TestBankAccountRedrawAndDepositService:
             mock_bank_account_repository.get_by_bank_account_number.assert_called_once_with(
                 account_number=sample_account_number
             )
-            mock_bank_account_repository.save.assert_not_called()
 
         def test_redraw_insufficient_funds(
             self,
@@ -67,24 +60,20 @@ class TestBankAccountRedrawAndDepositService:
             mock_bank_account_repository,
             mock_bank_account,
             sample_account_number,
-            monkeypatch,
         ):
             amount = Decimal("1500.00")
+            mock_bank_account_repository.apply_postings.return_value = None
             mock_bank_account_repository.get_by_bank_account_number.return_value = (
                 mock_bank_account
             )
 
-            monkeypatch.setattr(
-                "bank_app.application.domain.service.bank_account.BankAccountService.can_withdraw",
-                lambda account, withdrawal_amount: False,
-            )
-
             with pytest.raises(BusinessException) as ex:
                 bank_account_service.redraw(sample_account_number, amount)
 
             assert ex.value.message == "Insufficient funds to make this withdrawal"
-            mock_bank_account_repository.get_by_bank_account_number.assert_called_once_with(
-                account_number=sample_account_number
+            mock_bank_account_repository.apply_postings.assert_called_once_with(
+                account_number=sample_account_number,
+                entries=[LedgerEntry.withdrawal(amount)],
             )
             mock_bank_account.withdraw.assert_not_called()
             mock_bank_account_repository.save.assert_not_called()
@@ -104,6 +93,7 @@ class TestBankAccountRedrawAndDepositService:
                 bank_account_service.redraw(sample_account_number, amount)
 
             assert str(ex.value) == "cannot redraw null or negative amount"
+            mock_bank_account_repository.apply_postings.assert_not_called()
 
         def test_redraw_negative_amount_should_fail(
             self,
@@ -128,30 +118,28 @@ class TestBankAccountRedrawAndDepositService:
             sample_entity_id,
             sample_account_number,
         ):
-            initial_balance = Decimal("1000.00")
             amount = Decimal("500.00")
-
-            real_bank_account = BankAccount(
+            updated_bank_account = BankAccount(
                 entity_id=sample_entity_id,
                 account_number=sample_account_number,
-                balance=initial_balance,
+                balance=Decimal("1500.00"),
             )
-            mock_bank_account_repository.get_by_bank_account_number.return_value = (
-                real_bank_account
+            mock_bank_account_repository.apply_postings.return_value = (
+                updated_bank_account
             )
-            mock_bank_account_repository.save.return_value = None
 
             result = bank_account_service.deposit_money(sample_account_number, amount)
 
-            mock_bank_account_repository.get_by_bank_account_number.assert_called_once_with(
-                account_number=sample_account_number
+            mock_bank_account_repository.apply_postings.assert_called_once_with(
+                account_number=sample_account_number,
+                entries=[LedgerEntry.deposit(amount)],
             )
-            mock_bank_account_repository.save.assert_called_once_with(real_bank_account)
+            mock_bank_account_repository.save.assert_not_called()
 
             assert isinstance(result, BankAccountDTO)
-            assert result.entity_id == real_bank_account.entity_id.uuid
-            assert result.account_number == real_bank_account.account_number
-            assert result.balance == real_bank_account.balance == Decimal("1500.00")
+            assert result.entity_id == updated_bank_account.entity_id.uuid
+            assert result.account_number == updated_bank_account.account_number
+            assert result.balance == Decimal("1500.00")
 
         def test_deposit_money_account_not_found(
             self,
@@ -160,6 +148,7 @@ class TestBankAccountRedrawAndDepositService:
             sample_account_number,
         ):
             amount = Decimal("500.00")
+            mock_bank_account_repository.apply_postings.return_value = None
             mock_bank_account_repository.get_by_bank_account_number.return_value = None
 
             with pytest.raises(NotFound) as ex:
@@ -36,3 +36,40 @@ def test_bank_account_cannot_be_create_with_negative_balance(bank_account_identi
             is_allow_overdraft=False,
         )
     assert str(ex.value) == "The balance cannot be negative"
+
+
+def test_changes_are_tracked_once_clean(bank_account_identify):
+    bank_account = BankAccount(
+        entity_id=bank_account_identify,
+        account_number=UUID("7ebd50e7-0000-0000-0000-000000000000"),
+        balance=Decimal(0),
+    )
+    assert bank_account.changed_fields is None
+
+    bank_account.mark_clean()
+    bank_account.deposit(Decimal(10))
+    bank_account.set_overdraft_amount(Decimal(200))
+    assert bank_account.changed_fields == {"balance", "overdraft_amount"}
+
+    bank_account.mark_clean()
+    assert bank_account.changed_fields == frozenset()
+
+
+def test_hydrate_trusts_stored_values(bank_account_identify):
+    bank_account = BankAccount.hydrate(
+        bank_account_identify,
+        UUID("7ebd50e7-0000-0000-0000-000000000000"),
+        Decimal(-50),
+        Decimal(0),
+        True,
+        True,
+        None,
+        None,
+        3,
+    )
+
+    assert bank_account.balance == Decimal(-50)
+    assert bank_account.version == 3
+    assert bank_account.changed_fields == frozenset()
+    with pytest.raises(TypeError):
+        BankAccount.hydrate(bank_account_identify)
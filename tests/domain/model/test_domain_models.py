@@ -0,0 +1,70 @@
+import datetime as dt
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+
+from bank_app.application.domain.domain_models import AccountIdentity
+from bank_app.application.domain.model.account_statement import (
+    MonthlyStatement,
+    MonthlyStatementIdentity,
+    Transaction,
+    TransactionIdentity,
+)
+from bank_app.application.domain.model.bank_account import BankAccount
+from bank_app.application.domain.model.booklet_account import BookletAccount
+
+ENTITY_ID = UUID("4df32c92-0000-0000-0000-000000000000")
+NOW = dt.datetime(2025, 1, 31)
+
+
+def build(model, **fields):
+    if model is BankAccount or model is BookletAccount:
+        return model(
+            entity_id=AccountIdentity(ENTITY_ID), account_number=ENTITY_ID, **fields
+        )
+    if model is Transaction:
+        return Transaction(
+            entity_id=TransactionIdentity(ENTITY_ID),
+            account_id=AccountIdentity(ENTITY_ID),
+            account_type="CURRENT_ACCOUNT",
+            transaction_type="DEPOSIT",
+            amount=Decimal(10),
+            transaction_date=NOW,
+            **fields,
+        )
+    return MonthlyStatement(
+        entity_id=MonthlyStatementIdentity(ENTITY_ID),
+        account_id=ENTITY_ID,
+        account_type="CURRENT_ACCOUNT",
+        account_number=ENTITY_ID,
+        period_start=NOW,
+        period_end=NOW,
+        generated_at=NOW,
+        opening_balance=Decimal(0),
+        closing_balance=Decimal(0),
+        transactions=[],
+        **fields,
+    )
+
+
+@pytest.mark.parametrize(
+    "model", [BankAccount, BookletAccount, Transaction, MonthlyStatement]
+)
+def test_entities_are_slotted(model):
+    entity = build(model)
+
+    assert not hasattr(entity, "__dict__")
+    with pytest.raises(AttributeError):
+        entity.undeclared = 1
+
+
+@pytest.mark.parametrize(
+    "model", [BankAccount, BookletAccount, Transaction, MonthlyStatement]
+)
+def test_entities_are_equal_by_identity(model):
+    first, second = build(model), build(model)
+
+    assert first == second
+    assert hash(first) == hash(second)
+    assert len({first, second}) == 1
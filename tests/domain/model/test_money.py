@@ -0,0 +1,59 @@
+from decimal import Decimal
+
+import pytest
+
+from bank_app.application.domain.model.account_statement import LedgerEntry
+from bank_app.application.domain.model.money import (
+    MAX_AMOUNT,
+    MAX_CENTS,
+    Money,
+    to_amount,
+    to_cents,
+)
+
+
+@pytest.mark.parametrize(
+    ("amount", "cents"),
+    [("12.30", 1230), ("12.3", 1230), ("-0.01", -1), ("0", 0), ("1E+3", 100000)],
+)
+def test_to_cents_is_exact(amount, cents):
+    assert to_cents(Decimal(amount)) == cents
+    assert to_amount(cents) == Decimal(amount)
+
+
+@pytest.mark.parametrize(
+    "amount", ["0.005", "1.0000000000000000000000000001", "NaN", "Infinity"]
+)
+def test_to_cents_never_rounds(amount):
+    with pytest.raises(ValueError):
+        to_cents(Decimal(amount))
+
+
+@pytest.mark.parametrize("amount", ["92233720368547758.08", "1E+999999"])
+def test_to_cents_overflows_past_64_bits(amount):
+    with pytest.raises(OverflowError):
+        to_cents(Decimal(amount))
+
+
+def test_money_arithmetic_is_checked():
+    money = Money.from_decimal(Decimal("10.25"))
+
+    assert money + Money(75) == Money(1100)
+    assert money - Money(2000) == -Money(975)
+    assert 3 * money == money * 3 == Money(3075)
+    assert str(Money.sum([1, 2, 3])) == "0.06"
+    assert not Money(0)
+    with pytest.raises(OverflowError):
+        Money(MAX_CENTS) + Money(1)
+
+
+def test_ledger_entries_hold_whole_cents():
+    assert LedgerEntry.deposit(Decimal("0.01")).amount == Decimal("0.01")
+    with pytest.raises(ValueError):
+        LedgerEntry.withdrawal(Decimal("0.001"))
+
+
+def test_ledger_entries_span_the_amount_columns():
+    assert LedgerEntry.deposit(MAX_AMOUNT).amount == MAX_AMOUNT
+    with pytest.raises(OverflowError):
+        LedgerEntry.deposit(MAX_AMOUNT + Decimal("0.01"))
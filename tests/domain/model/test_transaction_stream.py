@@ -0,0 +1,56 @@
+import datetime as dt
+from decimal import Decimal
+from uuid import UUID, uuid4
+
+from bank_app.application.domain.domain_models import AccountIdentity
+from bank_app.application.domain.model.account_statement import (
+    Transaction,
+    TransactionIdentity,
+)
+from bank_app.application.domain.model.transaction_stream import TransactionStream
+
+ACCOUNT_ID = AccountIdentity(UUID("4df32c92-0000-0000-0000-000000000001"))
+START = dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc)
+
+
+def build_transaction(transaction_type, amount, days):
+    return Transaction(
+        entity_id=TransactionIdentity(uuid4()),
+        account_id=ACCOUNT_ID,
+        account_type="CURRENT_ACCOUNT",
+        transaction_type=transaction_type,
+        amount=Decimal(amount),
+        transaction_date=START + dt.timedelta(days=days),
+    )
+
+
+def test_stream_filters_the_period_lazily():
+    transactions = [
+        build_transaction("DEPOSIT", "0.01", 10),
+        build_transaction("DEPOSIT", "100.10", 3),
+        build_transaction("WITHDRAWAL", "20.05", 1),
+        build_transaction("DEPOSIT", "5.00", 0),
+    ]
+    reads = []
+
+    def source():
+        reads.append(1)
+        yield from transactions
+
+    period = TransactionStream(ACCOUNT_ID, source).between(
+        START + dt.timedelta(days=1), START + dt.timedelta(days=3)
+    )
+
+    assert reads == []
+    assert period == transactions[1:3]
+    assert period.total_deposits == Decimal("100.10")
+    assert period.total_withdrawals == Decimal("20.05")
+    assert list(period.ids) == [t.entity_id.uuid for t in transactions[1:3]]
+    assert len(reads) == 4
+
+
+def test_streams_of_different_lengths_differ():
+    transaction = build_transaction("DEPOSIT", "1.00", 0)
+
+    assert TransactionStream(ACCOUNT_ID, lambda: [transaction]) != []
+    assert TransactionStream(ACCOUNT_ID, list) == []